@@ -23,7 +23,15 @@ Channels:
 INVARIANTS:
 - Events are immutable after publish
 - All events have sha256: checksum
-- JSONL append is atomic (temp -> fsync -> rename)
+- JSONL append is group-committed (one write + fsync per batch)
+- Logs rotate daily ({type}_YYYYMMDD.jsonl); timestamps are monotonic per log
+- Sidecar sparse index ({type}_YYYYMMDD.idx) maps timestamp -> byte offset
+- One bus (process) writes each daily log: index offsets are this bus's
+  running byte count from the log size at its first write. Replay checks
+  every index entry (line start + timestamp) before seeking and falls back
+  to a full scan, so a second writer costs speed, not correctness
+- Durable types (default: trade) are fsynced before publish() returns; the
+  fsync wait happens outside the bus lock so durable events share batches
 - Subscribers receive events in order
 """
 
@@ -33,16 +41,19 @@ import asyncio
 import hashlib
 import json
 import logging
-import os
 import threading
 import time
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from itertools import islice
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 from uuid import uuid4
 
+from core.io_group_commit import GroupCommitConfig, GroupCommitWriter
+
 logger = logging.getLogger(__name__)
 
 
@@ -58,6 +69,14 @@ class EventType(str, Enum):
     SYSTEM = "system"           # System events (start/stop/error)
 
 
+# Event types fsynced before publish() returns (order/trade events)
+DEFAULT_DURABLE_TYPES = frozenset({EventType.TRADE})
+
+# Replay tuning
+DEFAULT_INDEX_INTERVAL = 256        # Events between sparse index entries
+REPLAY_READ_HINT = 1 << 20          # Bytes read per replay chunk
+
+
 @dataclass
 class Event:
     """
@@ -150,6 +169,10 @@ class EventBus:
         self,
         state_dir: Path = Path("state/events"),
         buffer_size: int = 1000,
+        batch_size: int = 256,
+        max_delay_ms: float = 5.0,
+        durable_types: Optional[Set[EventType]] = None,
+        index_interval: int = DEFAULT_INDEX_INTERVAL,
     ):
         """
         Initialize event bus.
@@ -157,9 +180,26 @@ class EventBus:
         Args:
             state_dir: Directory for JSONL event logs
             buffer_size: Max events to buffer in memory
+            batch_size: Max events per group commit
+            max_delay_ms: Max time an event waits for its batch to fill
+            durable_types: Types fsynced before publish() returns
+                (default: DEFAULT_DURABLE_TYPES)
+            index_interval: Events between sparse index entries
         """
         self.state_dir = Path(state_dir)
         self.buffer_size = buffer_size
+        self.durable_types = frozenset(DEFAULT_DURABLE_TYPES if durable_types is None else durable_types)
+
+        # Background group-commit persistence
+        self._writer = GroupCommitWriter(
+            GroupCommitConfig(batch_size=batch_size, max_delay_ms=max_delay_ms),
+            name="ai-event-bus",
+        )
+        self._durable_failures = 0
+
+        # Sparse index state per type: (daily log, [byte offset, events written])
+        self.index_interval = max(1, index_interval)
+        self._log_state: Dict[EventType, Tuple[Path, List[int]]] = {}
 
         # Subscriptions by event type
         self._subscriptions: Dict[EventType, List[Subscription]] = {
@@ -193,6 +233,9 @@ class EventBus:
         """
         Publish event to bus.
 
+        Events are persisted by a background group-commit writer; types in
+        durable_types are fsynced before this returns.
+
         Args:
             event_type: Type of event
             payload: Event data
@@ -201,31 +244,34 @@ class EventBus:
         Returns:
             Published event with ID and checksum
         """
-        # Create event
-        event_id = f"evt:{event_type.value}:{uuid4().hex[:12]}"
-        timestamp = datetime.utcnow().isoformat() + "Z"
-
-        # Compute checksum
-        data = {
-            "type": event_type.value,
-            "timestamp": timestamp,
-            "payload": payload,
-        }
-        canonical = json.dumps(data, sort_keys=True, default=str, ensure_ascii=False)
-        checksum = "sha256:" + hashlib.sha256(canonical.encode()).hexdigest()[:16]
-
-        event = Event(
-            id=event_id,
-            type=event_type,
-            timestamp=timestamp,
-            payload=payload,
-            checksum=checksum,
-            source=source,
-        )
+        # Size of a log this bus has not written yet is read outside the lock
+        log_start = self._log_start(event_type)
 
         with self._lock:
-            # Persist to JSONL
-            self._persist_event(event)
+            # Timestamp under the lock keeps each log sorted for indexed replay
+            event_id = f"evt:{event_type.value}:{uuid4().hex[:12]}"
+            timestamp = datetime.utcnow().isoformat() + "Z"
+
+            # Compute checksum
+            data = {
+                "type": event_type.value,
+                "timestamp": timestamp,
+                "payload": payload,
+            }
+            canonical = json.dumps(data, sort_keys=True, default=str, ensure_ascii=False)
+            checksum = "sha256:" + hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+            event = Event(
+                id=event_id,
+                type=event_type,
+                timestamp=timestamp,
+                payload=payload,
+                checksum=checksum,
+                source=source,
+            )
+
+            # Queue for JSONL (order fixed under the lock; durable wait below)
+            ticket = self._persist_event(event, log_start)
 
             # Buffer in memory
             buf = self._buffer[event_type]
@@ -239,6 +285,11 @@ class EventBus:
             # Deliver to subscribers
             self._deliver(event)
 
+        if ticket is not None and not self._writer.wait(ticket):
+            with self._lock:
+                self._durable_failures += 1
+            logger.error(f"Failed to persist event {event.id}")
+
         return event
 
     async def publish_async(
@@ -345,47 +396,48 @@ class EventBus:
         Returns:
             List of events in chronological order
         """
-        events = []
-        log_path = self._get_log_path(event_type)
+        return list(islice(self.iter_replay(event_type, from_ts, to_ts), limit))
 
-        if not log_path.exists():
-            return events
+    def iter_replay(
+        self,
+        event_type: EventType,
+        from_ts: Optional[str] = None,
+        to_ts: Optional[str] = None,
+    ) -> Iterator[Event]:
+        """
+        Lazily stream historical events in chronological order.
 
-        try:
-            with open(log_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    try:
-                        data = json.loads(line)
-                        event = Event.from_dict(data)
-
-                        # Validate checksum
-                        if not event.is_valid():
-                            logger.warning(f"Invalid checksum for event {event.id}")
-                            continue
+        Only daily logs overlapping [from_ts, to_ts] are opened; each is
+        entered at the sparse-index offset preceding from_ts and read until
+        an event passes to_ts. Checksums are verified per read chunk, and
+        only for events inside the window.
 
-                        # Filter by timestamp
-                        if from_ts and event.timestamp < from_ts:
-                            continue
-                        if to_ts and event.timestamp > to_ts:
-                            continue
+        Args:
+            event_type: Type of events to replay
+            from_ts: Start timestamp (ISO 8601)
+            to_ts: End timestamp (ISO 8601)
 
-                        events.append(event)
+        Yields:
+            Events with valid checksums
+        """
+        self._writer.flush()
 
-                        if len(events) >= limit:
-                            break
+        legacy_path = self.state_dir / f"{event_type.value}.jsonl"
+        if legacy_path.exists():
+            # Pre-rotation log: unindexed, scanned in full
+            yield from self._read_log(legacy_path, 0, from_ts, to_ts, sorted_log=False)
 
-                    except (json.JSONDecodeError, KeyError) as e:
-                        logger.warning(f"Failed to parse event: {e}")
-                        continue
+        for log_path in self._iter_log_paths(event_type, from_ts, to_ts):
+            offset = self._index_offset(log_path, from_ts) if from_ts else 0
+            yield from self._read_log(log_path, offset, from_ts, to_ts, sorted_log=True)
 
-        except Exception as e:
-            logger.error(f"Failed to read event log: {e}")
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every published event is on disk."""
+        return self._writer.flush(timeout)
 
-        return events
+    def close(self) -> None:
+        """Commit queued events and stop the persistence writer."""
+        self._writer.close()
 
     def get_recent(
         self,
@@ -410,28 +462,202 @@ class EventBus:
                 "buffer_sizes": {
                     t.value: len(buf) for t, buf in self._buffer.items()
                 },
+                "persistence": {
+                    **self._writer.get_metrics(),
+                    "durable_failures": self._durable_failures,
+                },
             }
 
-    def _persist_event(self, event: Event) -> None:
-        """Atomically append event to JSONL log."""
-        log_path = self._get_log_path(event.type)
-        tmp_path = log_path.with_suffix(".jsonl.tmp")
+    def _persist_event(self, event: Event, log_start: Optional[Tuple[Path, int]] = None) -> Optional[Any]:
+        """
+        Queue event for group-committed append to its daily JSONL log.
+
+        Called under the bus lock; never waits for disk.
+
+        Returns:
+            Writer ticket to wait on for durable types, else None
+        """
+        try:
+            log_path = self._get_log_path(event.type, event.timestamp)
+            line = json.dumps(event.to_dict(), ensure_ascii=False)
+            self._index_event(event.type, log_path, event.timestamp, len(line.encode("utf-8")) + 1, log_start)
+
+            durable = event.type in self.durable_types
+            queued, ticket = self._writer.submit(log_path, line, durable=durable)
+            if not queued:
+                if durable:
+                    self._durable_failures += 1
+                logger.error(f"Failed to persist event {event.id}")
+            return ticket
+        except Exception as e:
+            logger.error(f"Failed to persist event {event.id}: {e}")
+            return None
+
+    def _log_start(self, event_type: EventType) -> Optional[Tuple[Path, int]]:
+        """
+        (today's log, its size) if this bus has not written to it yet.
 
+        Called without the bus lock. Nothing from this bus is queued for a
+        log it has not written, so the on-disk size is where its lines start.
+        """
+        log_path = self._get_log_path(event_type)
+        current = self._log_state.get(event_type)
+        if current is not None and current[0] == log_path:
+            return None
         try:
-            # Append to existing file
-            line = json.dumps(event.to_dict(), ensure_ascii=False) + "\n"
+            return log_path, log_path.stat().st_size
+        except FileNotFoundError:
+            return log_path, 0
+
+    def _index_event(
+        self,
+        event_type: EventType,
+        log_path: Path,
+        timestamp: str,
+        size: int,
+        log_start: Optional[Tuple[Path, int]] = None,
+    ) -> None:
+        """Track the event's byte offset; every index_interval-th goes to the index."""
+        current = self._log_state.get(event_type)
+        if current is None or current[0] != log_path:
+            # First write to this log from this bus: start at its on-disk size
+            if log_start is not None and log_start[0] == log_path:
+                start = log_start[1]
+            else:
+                start = log_path.stat().st_size if log_path.exists() else 0  # day rolled over meanwhile
+            current = (log_path, [start, 0])
+            self._log_state[event_type] = current
+
+        state = current[1]
+        offset, count = state
+        if count % self.index_interval == 0:
+            self._writer.submit(log_path.with_suffix(".idx"), f"{timestamp}\t{offset}")
+        state[0] = offset + size
+        state[1] = count + 1
+
+    def _get_log_path(self, event_type: EventType, timestamp: Optional[str] = None) -> Path:
+        """Get daily JSONL log path for event type (default: today)."""
+        day = (timestamp or datetime.utcnow().isoformat())[:10].replace("-", "")
+        return self.state_dir / f"{event_type.value}_{day}.jsonl"
+
+    def _iter_log_paths(
+        self,
+        event_type: EventType,
+        from_ts: Optional[str],
+        to_ts: Optional[str],
+    ) -> List[Path]:
+        """Daily logs for event type overlapping [from_ts, to_ts], oldest first."""
+        first_day = from_ts[:10].replace("-", "") if from_ts else ""
+        last_day = to_ts[:10].replace("-", "") if to_ts else "99999999"
+
+        paths = []
+        prefix = f"{event_type.value}_"
+        for path in self.state_dir.glob(f"{prefix}*.jsonl"):
+            day = path.stem[len(prefix):]
+            if len(day) == 8 and day.isdigit() and first_day <= day <= last_day:
+                paths.append(path)
+        return sorted(paths)
+
+    def _load_index(self, log_path: Path) -> Tuple[List[str], List[int]]:
+        """Load sidecar sparse index as parallel (timestamps, offsets) lists."""
+        timestamps: List[str] = []
+        offsets: List[int] = []
+        index_path = log_path.with_suffix(".idx")
+        if not index_path.exists():
+            return timestamps, offsets
+
+        with open(index_path, "r", encoding="utf-8") as f:
+            for line in f:
+                ts, sep, offset = line.rstrip("\n").partition("\t")
+                if sep and offset.isdigit():
+                    timestamps.append(ts)
+                    offsets.append(int(offset))
+        return timestamps, offsets
+
+    def _index_offset(self, log_path: Path, from_ts: str) -> int:
+        """
+        Byte offset of the last indexed event before from_ts.
 
-            with open(log_path, "a", encoding="utf-8", newline="\n") as f:
-                f.write(line)
-                f.flush()
-                os.fsync(f.fileno())
+        The entry is checked against the log (line start + timestamp); a
+        stale or foreign index falls back to a full scan from offset 0.
+        """
+        try:
+            timestamps, offsets = self._load_index(log_path)
+            pos = bisect_left(timestamps, from_ts) - 1
+            if pos < 0:
+                return 0
+
+            offset = offsets[pos]
+            with open(log_path, "rb") as f:
+                if offset > 0:
+                    f.seek(offset - 1)
+                    if f.read(1) != b"\n":
+                        raise ValueError(f"offset {offset} is not a line start")
+                else:
+                    f.seek(0)
+                record = json.loads(f.readline())
+            if record.get("timestamp") != timestamps[pos]:
+                raise ValueError(f"offset {offset} does not match index timestamp")
+            return offset
 
         except Exception as e:
-            logger.error(f"Failed to persist event {event.id}: {e}")
+            logger.warning(f"Ignoring index for {log_path.name}: {e}")
+            return 0
+
+    def _read_log(
+        self,
+        log_path: Path,
+        offset: int,
+        from_ts: Optional[str],
+        to_ts: Optional[str],
+        sorted_log: bool,
+    ) -> Iterator[Event]:
+        """Stream events from offset, filtering by window and verifying per chunk."""
+        try:
+            with open(log_path, "rb") as f:
+                f.seek(offset)
+                while True:
+                    lines = f.readlines(REPLAY_READ_HINT)
+                    if not lines:
+                        return
+
+                    chunk: List[Event] = []
+                    done = False
+                    for line in lines:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            data = json.loads(line)
+                            ts = data["timestamp"]
+
+                            # Filter by timestamp before paying for the checksum
+                            if from_ts and ts < from_ts:
+                                continue
+                            if to_ts and ts > to_ts:
+                                if sorted_log:
+                                    done = True
+                                    break
+                                continue
+
+                            chunk.append(Event.from_dict(data))
+
+                        except (json.JSONDecodeError, UnicodeDecodeError, KeyError, ValueError) as e:
+                            logger.warning(f"Failed to parse event: {e}")
+                            continue
 
-    def _get_log_path(self, event_type: EventType) -> Path:
-        """Get JSONL log path for event type."""
-        return self.state_dir / f"{event_type.value}.jsonl"
+                    valid = [event for event in chunk if event.is_valid()]
+                    if len(valid) != len(chunk):
+                        logger.warning(
+                            f"Invalid checksum for {len(chunk) - len(valid)} events in {log_path.name}"
+                        )
+                    yield from valid
+
+                    if done:
+                        return
+
+        except Exception as e:
+            logger.error(f"Failed to read event log: {e}")
 
     def _deliver(self, event: Event) -> None:
         """Deliver event to synchronous subscribers."""
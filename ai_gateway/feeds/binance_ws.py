@@ -142,13 +142,7 @@ class BinancePriceFeed:
         Args:
             symbols: List of trading pairs (e.g., ["BTCUSDT", "ETHUSDT"])
         """
-        # Normalize symbols (uppercase, add USDT if missing)
-        normalized = []
-        for s in symbols:
-            s = s.upper()
-            if not s.endswith("USDT"):
-                s = s + "USDT"
-            normalized.append(s)
+        normalized = [self._normalize(s) for s in symbols]
 
         new_symbols = set(normalized) - self._symbols
         if not new_symbols:
@@ -164,10 +158,19 @@ class BinancePriceFeed:
     async def unsubscribe(self, symbols: List[str]) -> None:
         """Unsubscribe from symbols."""
         for s in symbols:
-            s = s.upper()
-            if not s.endswith("USDT"):
-                s = s + "USDT"
-            self._symbols.discard(s)
+            self._symbols.discard(self._normalize(s))
+
+    @staticmethod
+    def _normalize(symbol: str) -> str:
+        """Uppercase, add USDT if missing."""
+        symbol = symbol.upper()
+        if not symbol.endswith("USDT"):
+            symbol = symbol + "USDT"
+        return symbol
+
+    def is_subscribed(self, symbol: str) -> bool:
+        """Check if symbol (normalized like subscribe) is subscribed, without copying the set."""
+        return self._normalize(symbol) in self._symbols
 
     def get_price(self, symbol: str) -> Optional[float]:
         """
@@ -15,11 +15,15 @@ Aggregates trade data from Binance WebSocket to calculate:
 - avg_trade_size: Average trade size in USDT
 
 Uses sliding window approach for accurate real-time calculations.
+Each symbol keeps an array-backed ring buffer (timestamp, USDT value, side)
+with running buy/sell counts and volumes that are updated on append and on
+window eviction, so stats are O(1) amortized instead of a scan of the buffer.
 
 INVARIANTS:
 - Data older than window_size is discarded
 - Zero values returned when no data (fail-closed)
 - All calculations are from live data only
+- Trades arrive in timestamp order per symbol (exchange stream order)
 """
 
 from __future__ import annotations
@@ -28,7 +32,7 @@ import asyncio
 import json
 import logging
 import time
-from collections import deque
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple
@@ -38,6 +42,9 @@ logger = logging.getLogger(__name__)
 # Default settings
 DEFAULT_WINDOW_SIZE = 60  # 60 second sliding window
 CLEANUP_INTERVAL = 5.0     # Cleanup old data every 5 seconds
+MAX_TRADES_PER_SYMBOL = 10000  # Ring capacity (oldest trade dropped when full)
+INITIAL_RING_SIZE = 64         # Ring storage grows on demand up to the capacity
+STATS_CALLBACK_INTERVAL = 1.0  # on_stats fires at most once per second per symbol
 
 
 @dataclass
@@ -119,6 +126,101 @@ class TradeStats:
         }
 
 
+class _TradeRing:
+    """
+    Bounded ring of (timestamp, usdt_value, is_buy) with running sums.
+
+    Stored as two float64 arrays and a byte flag array (~17 bytes per trade).
+    Storage starts at INITIAL_RING_SIZE slots and doubles on demand up to
+    `capacity`, so quiet symbols stay small. Sums are adjusted on every
+    append and eviction; volume sums are recomputed exactly on cleanup to
+    bound float drift.
+    """
+
+    __slots__ = (
+        "capacity", "allocated", "timestamps", "values", "buys", "head", "size",
+        "buy_count", "sell_count", "buy_volume", "sell_volume",
+    )
+
+    def __init__(self, capacity: int = MAX_TRADES_PER_SYMBOL):
+        self.capacity = capacity
+        self.allocated = min(INITIAL_RING_SIZE, capacity)
+        self.timestamps = array("d", bytes(8 * self.allocated))
+        self.values = array("d", bytes(8 * self.allocated))
+        self.buys = bytearray(self.allocated)
+        self.head = 0
+        self.size = 0
+        self.buy_count = 0
+        self.sell_count = 0
+        self.buy_volume = 0.0
+        self.sell_volume = 0.0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _grow(self) -> None:
+        """Double storage (up to capacity), unwrapping the ring to start at 0."""
+        allocated = min(self.allocated * 2, self.capacity)
+        order = [(self.head + i) % self.allocated for i in range(self.size)]
+        pad = allocated - self.size
+        self.timestamps = array("d", [self.timestamps[i] for i in order]) + array("d", bytes(8 * pad))
+        self.values = array("d", [self.values[i] for i in order]) + array("d", bytes(8 * pad))
+        self.buys = bytearray(self.buys[i] for i in order) + bytearray(pad)
+        self.allocated = allocated
+        self.head = 0
+
+    def append(self, timestamp: float, value: float, is_buy: bool) -> None:
+        if self.size == self.allocated:
+            if self.allocated < self.capacity:
+                self._grow()
+            else:
+                self._pop()
+        idx = (self.head + self.size) % self.allocated
+        self.timestamps[idx] = timestamp
+        self.values[idx] = value
+        self.buys[idx] = is_buy
+        self.size += 1
+        if is_buy:
+            self.buy_count += 1
+            self.buy_volume += value
+        else:
+            self.sell_count += 1
+            self.sell_volume += value
+
+    def _pop(self) -> None:
+        idx = self.head
+        if self.buys[idx]:
+            self.buy_count -= 1
+            self.buy_volume -= self.values[idx]
+        else:
+            self.sell_count -= 1
+            self.sell_volume -= self.values[idx]
+        self.head = (idx + 1) % self.allocated
+        self.size -= 1
+        if self.size == 0:
+            self.head = 0
+            self.buy_volume = 0.0
+            self.sell_volume = 0.0
+
+    def evict_before(self, cutoff: float) -> None:
+        """Drop trades with timestamp < cutoff from the front."""
+        while self.size and self.timestamps[self.head] < cutoff:
+            self._pop()
+
+    def resum(self) -> None:
+        """Recompute volume sums exactly (clears accumulated rounding)."""
+        buy_volume = 0.0
+        sell_volume = 0.0
+        for i in range(self.size):
+            idx = (self.head + i) % self.allocated
+            if self.buys[idx]:
+                buy_volume += self.values[idx]
+            else:
+                sell_volume += self.values[idx]
+        self.buy_volume = buy_volume
+        self.sell_volume = sell_volume
+
+
 class TradeAggregator:
     """
     Real-time trade aggregator with sliding window.
@@ -152,13 +254,11 @@ class TradeAggregator:
         self.window_size = window_size
         self.on_stats = on_stats
 
-        # Trade buffers by symbol (deque for efficient sliding window)
-        self._trades: Dict[str, deque] = {}
+        # Trade ring buffers with running sums by symbol
+        self._trades: Dict[str, _TradeRing] = {}
 
-        # Cached stats by symbol
-        self._stats_cache: Dict[str, TradeStats] = {}
-        self._cache_time: Dict[str, float] = {}
-        self._cache_ttl = 1.0  # Cache TTL in seconds
+        # Last on_stats emit time per symbol (callback rate limit)
+        self._last_emit: Dict[str, float] = {}
 
         # Cleanup task
         self._running = False
@@ -173,17 +273,13 @@ class TradeAggregator:
         Args:
             trade: TradeEvent from WebSocket
         """
-        symbol = trade.symbol.upper()
-
-        # Initialize deque if needed
-        if symbol not in self._trades:
-            self._trades[symbol] = deque(maxlen=10000)
+        self._append(trade.symbol.upper(), trade.timestamp, trade.usdt_value, trade.is_buy)
 
-        self._trades[symbol].append(trade)
-
-        # Invalidate cache
-        if symbol in self._cache_time:
-            del self._cache_time[symbol]
+    def _append(self, symbol: str, timestamp: float, value: float, is_buy: bool) -> None:
+        ring = self._trades.get(symbol)
+        if ring is None:
+            ring = self._trades[symbol] = _TradeRing()
+        ring.append(timestamp, value, is_buy)
 
     def add_trade_raw(
         self,
@@ -205,15 +301,8 @@ class TradeAggregator:
             timestamp: Unix timestamp (defaults to now)
             trade_id: Optional trade ID
         """
-        trade = TradeEvent(
-            symbol=symbol.upper(),
-            price=price,
-            quantity=quantity,
-            is_buyer_maker=is_buyer_maker,
-            timestamp=timestamp or time.time(),
-            trade_id=trade_id,
-        )
-        self.add_trade(trade)
+        # Hot path: straight into the ring, no TradeEvent allocation
+        self._append(symbol.upper(), timestamp or time.time(), price * quantity, not is_buyer_maker)
 
     def get_stats(self, symbol: str) -> TradeStats:
         """
@@ -225,22 +314,7 @@ class TradeAggregator:
         Returns:
             TradeStats with current statistics
         """
-        symbol = symbol.upper()
-        now = time.time()
-
-        # Check cache
-        if symbol in self._cache_time:
-            if (now - self._cache_time[symbol]) < self._cache_ttl:
-                return self._stats_cache[symbol]
-
-        # Calculate fresh stats
-        stats = self._calculate_stats(symbol, now)
-
-        # Update cache
-        self._stats_cache[symbol] = stats
-        self._cache_time[symbol] = now
-
-        return stats
+        return self._calculate_stats(symbol.upper(), time.time())
 
     def get_buys_per_sec(self, symbol: str) -> float:
         """
@@ -271,7 +345,7 @@ class TradeAggregator:
         return {symbol: self.get_stats(symbol) for symbol in self._trades.keys()}
 
     def _calculate_stats(self, symbol: str, now: float) -> TradeStats:
-        """Calculate statistics from trade buffer."""
+        """Read statistics from the running sums (O(1) amortized)."""
         window_start = now - self.window_size
 
         stats = TradeStats(
@@ -280,57 +354,50 @@ class TradeAggregator:
             window_end=now,
         )
 
-        if symbol not in self._trades:
+        ring = self._trades.get(symbol)
+        if ring is None:
             return stats
 
-        trades = self._trades[symbol]
-        total_value = 0.0
-        valid_count = 0
-
-        for trade in trades:
-            # Skip old trades
-            if trade.timestamp < window_start:
-                continue
+        # Slide window: subtract trades that fell out of it
+        ring.evict_before(window_start)
 
-            valid_count += 1
-            stats.total_trades += 1
-            total_value += trade.usdt_value
-
-            if trade.is_buy:
-                stats.buy_count += 1
-                stats.buy_volume += trade.usdt_value
-            else:
-                stats.sell_count += 1
-                stats.sell_volume += trade.usdt_value
+        stats.buy_count = ring.buy_count
+        stats.sell_count = ring.sell_count
+        stats.buy_volume = max(0.0, ring.buy_volume)
+        stats.sell_volume = max(0.0, ring.sell_volume)
+        stats.total_trades = ring.size
 
         # Calculate average trade size
-        if valid_count > 0:
-            stats.avg_trade_size = total_value / valid_count
+        if ring.size > 0:
+            stats.avg_trade_size = (stats.buy_volume + stats.sell_volume) / ring.size
 
-        # Callback
+        # Callback (at most once per STATS_CALLBACK_INTERVAL per symbol)
         if self.on_stats and stats.total_trades > 0:
-            try:
-                self.on_stats(stats)
-            except Exception as e:
-                logger.error(f"Stats callback error: {e}")
+            if now - self._last_emit.get(symbol, float("-inf")) >= STATS_CALLBACK_INTERVAL:
+                self._last_emit[symbol] = now
+                try:
+                    self.on_stats(stats)
+                except Exception as e:
+                    logger.error(f"Stats callback error: {e}")
 
         return stats
 
     def _cleanup_old_trades(self) -> None:
         """Remove trades older than window from all buffers."""
-        now = time.time()
-        cutoff = now - self.window_size - 10  # Extra 10s buffer
+        cutoff = time.time() - self.window_size
 
         for symbol in list(self._trades.keys()):
-            trades = self._trades[symbol]
+            ring = self._trades[symbol]
 
             # Remove old trades from front
-            while trades and trades[0].timestamp < cutoff:
-                trades.popleft()
+            ring.evict_before(cutoff)
 
             # Remove empty buffers
-            if not trades:
+            if not ring:
                 del self._trades[symbol]
+                self._last_emit.pop(symbol, None)
+            else:
+                ring.resum()
 
     async def start(self) -> None:
         """Start background cleanup task."""
@@ -367,7 +434,7 @@ class TradeAggregator:
             "symbols_tracked": len(self._trades),
             "total_trades_buffered": total_trades,
             "window_size": self.window_size,
-            "cache_size": len(self._stats_cache),
+            "buffer_capacity": MAX_TRADES_PER_SYMBOL,
         }
 
 
@@ -17,6 +17,10 @@ MFE/MAE:
 - MFE (Maximum Favorable Excursion): Best price in our favor
 - MAE (Maximum Adverse Excursion): Worst price against us
 
+Per tick each signal does O(1) work: MFE/MAE are running max/min, a horizon
+outcome is captured on the first tick at or past it, and the price history
+is a bounded array (debugging/audit only, not needed for outcomes).
+
 All outcomes persisted to JSONL for training.
 """
 
@@ -28,6 +32,7 @@ import json
 import logging
 import os
 import time
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -46,6 +51,9 @@ WIN_THRESHOLDS = {
     60: 2.0,  # 2.0% for 60m
 }
 
+# Price points kept per signal (trimmed to this size once it doubles)
+MAX_PRICE_HISTORY = 256
+
 
 @dataclass
 class TrackedSignal:
@@ -57,9 +65,10 @@ class TrackedSignal:
     entry_time: datetime
     signal_data: Dict[str, Any]
 
-    # Price tracking
-    prices: List[float] = field(default_factory=list)
-    timestamps: List[float] = field(default_factory=list)
+    # Price tracking (bounded to the last MAX_PRICE_HISTORY points)
+    prices: array = field(default_factory=lambda: array("d"))
+    timestamps: array = field(default_factory=lambda: array("d"))
+    entry_ts: float = 0.0  # Unix time of entry (horizon reference)
 
     # Computed outcomes
     outcomes: Dict[int, Dict[str, Any]] = field(default_factory=dict)
@@ -126,22 +135,38 @@ class OutcomeTracker:
                         continue
                     try:
                         data = json.loads(line)
-                        signal = TrackedSignal(
-                            signal_id=data["signal_id"],
-                            symbol=data["symbol"],
-                            entry_price=data["entry_price"],
-                            direction=data["direction"],
-                            entry_time=datetime.fromisoformat(data["entry_time"]),
-                            signal_data=data.get("signal_data", {}),
-                            prices=data.get("prices", []),
-                            timestamps=data.get("timestamps", []),
-                        )
-                        self._active[signal.signal_id] = signal
-                    except (KeyError, json.JSONDecodeError) as e:
+                        self._active[data["signal_id"]] = self._signal_from_record(data)
+                    except (KeyError, TypeError, ValueError) as e:
                         logger.warning(f"Failed to load pending signal: {e}")
         except Exception as e:
             logger.error(f"Failed to load pending file: {e}")
 
+    def _signal_from_record(self, data: Dict[str, Any]) -> TrackedSignal:
+        """Rebuild a TrackedSignal from a pending_signals.jsonl record."""
+        prices = data.get("prices", [])
+        timestamps = data.get("timestamps", [])
+        signal = TrackedSignal(
+            signal_id=data["signal_id"],
+            symbol=data["symbol"],
+            entry_price=data["entry_price"],
+            direction=data["direction"],
+            entry_time=datetime.fromisoformat(data["entry_time"]),
+            signal_data=data.get("signal_data", {}),
+            entry_ts=data.get("entry_ts") or (timestamps[0] if timestamps else time.time()),
+        )
+
+        if "outcomes" in data:
+            signal.prices.extend(prices)
+            signal.timestamps.extend(timestamps)
+            signal.mfe = data.get("mfe", 0.0)
+            signal.mae = data.get("mae", 0.0)
+            signal.outcomes = {int(h): o for h, o in data["outcomes"].items()}
+        else:
+            # Legacy record (full history, no running state): replay it once
+            for price, ts in zip(prices, timestamps):
+                self._observe(signal, price, ts)
+        return signal
+
     def _save_pending(self) -> None:
         """Save pending signals to disk (atomic write)."""
         tmp_path = self.pending_file.with_suffix(".tmp")
@@ -155,8 +180,12 @@ class OutcomeTracker:
                         "direction": signal.direction,
                         "entry_time": signal.entry_time.isoformat(),
                         "signal_data": signal.signal_data,
-                        "prices": signal.prices,
-                        "timestamps": signal.timestamps,
+                        "prices": signal.prices.tolist(),
+                        "timestamps": signal.timestamps.tolist(),
+                        "entry_ts": signal.entry_ts,
+                        "mfe": signal.mfe,
+                        "mae": signal.mae,
+                        "outcomes": signal.outcomes,
                     }
                     f.write(json.dumps(data, ensure_ascii=False) + "\n")
                 f.flush()
@@ -205,6 +234,7 @@ class OutcomeTracker:
         direction = signal.get("direction", "Long")
 
         # Create tracked signal
+        now = time.time()
         tracked = TrackedSignal(
             signal_id=signal_id,
             symbol=symbol,
@@ -212,11 +242,12 @@ class OutcomeTracker:
             direction=direction,
             entry_time=datetime.utcnow(),
             signal_data=signal,
+            entry_ts=now,
         )
 
         # Add entry price as first data point
         tracked.prices.append(price)
-        tracked.timestamps.append(time.time())
+        tracked.timestamps.append(now)
 
         self._active[signal_id] = tracked
         self._save_pending()
@@ -243,19 +274,7 @@ class OutcomeTracker:
             if symbol not in prices:
                 continue
 
-            current_price = prices[symbol]
-            signal.prices.append(current_price)
-            signal.timestamps.append(now)
-
-            # Calculate MFE/MAE
-            self._update_excursions(signal)
-
-            # Check if all horizons complete
-            elapsed_minutes = (now - signal.timestamps[0]) / 60
-
-            for horizon in HORIZONS:
-                if horizon not in signal.outcomes and elapsed_minutes >= horizon:
-                    self._compute_horizon_outcome(signal, horizon)
+            elapsed_minutes = self._observe(signal, prices[symbol], now)
 
             # Mark complete if max time reached or all horizons done
             if elapsed_minutes >= self.max_track_minutes:
@@ -270,46 +289,57 @@ class OutcomeTracker:
 
         return completed_count
 
-    def _update_excursions(self, signal: TrackedSignal) -> None:
-        """Update MFE and MAE for signal."""
-        if not signal.prices:
-            return
-
-        entry = signal.entry_price
-        is_long = signal.direction == "Long"
-
-        for price in signal.prices:
-            pnl_pct = ((price - entry) / entry) * 100
-            if not is_long:
-                pnl_pct = -pnl_pct
-
-            if pnl_pct > signal.mfe:
-                signal.mfe = pnl_pct
-            if pnl_pct < signal.mae:
-                signal.mae = pnl_pct
-
-    def _compute_horizon_outcome(self, signal: TrackedSignal, horizon: int) -> None:
-        """Compute outcome for specific horizon."""
-        if not signal.prices or len(signal.prices) < 2:
-            return
-
-        # Find price at horizon
-        target_time = signal.timestamps[0] + (horizon * 60)
-        horizon_price = None
-
-        for i, ts in enumerate(signal.timestamps):
-            if ts >= target_time:
-                horizon_price = signal.prices[i]
-                break
-
-        if horizon_price is None:
-            horizon_price = signal.prices[-1]  # Use latest
+    def _observe(self, signal: TrackedSignal, price: float, ts: float) -> float:
+        """
+        Apply one price tick to a signal.
 
-        # Calculate PnL
+        Returns:
+            Minutes elapsed since entry
+        """
+        self._record_price(signal, price, ts)
+        pnl_pct = self._pnl_pct(signal, price)
+        self._update_excursions(signal, pnl_pct)
+
+        # First tick at or past a horizon is its price (earlier ticks were before it)
+        elapsed_minutes = (ts - signal.entry_ts) / 60
+        for horizon in HORIZONS:
+            if horizon not in signal.outcomes and elapsed_minutes >= horizon:
+                self._compute_horizon_outcome(signal, horizon, price, pnl_pct)
+
+        return elapsed_minutes
+
+    @staticmethod
+    def _record_price(signal: TrackedSignal, price: float, ts: float) -> None:
+        """Append to the bounded price history (amortized O(1) trim)."""
+        signal.prices.append(price)
+        signal.timestamps.append(ts)
+        excess = len(signal.prices) - MAX_PRICE_HISTORY
+        if excess >= MAX_PRICE_HISTORY:
+            del signal.prices[:excess]
+            del signal.timestamps[:excess]
+
+    @staticmethod
+    def _pnl_pct(signal: TrackedSignal, price: float) -> float:
+        """PnL in % from entry, signed for the signal direction."""
+        pnl_pct = ((price - signal.entry_price) / signal.entry_price) * 100
+        return pnl_pct if signal.direction == "Long" else -pnl_pct
+
+    def _update_excursions(self, signal: TrackedSignal, pnl_pct: float) -> None:
+        """Update running MFE and MAE with the latest tick."""
+        if pnl_pct > signal.mfe:
+            signal.mfe = pnl_pct
+        if pnl_pct < signal.mae:
+            signal.mae = pnl_pct
+
+    def _compute_horizon_outcome(
+        self,
+        signal: TrackedSignal,
+        horizon: int,
+        horizon_price: float,
+        pnl_pct: float,
+    ) -> None:
+        """Record outcome for specific horizon at the price that crossed it."""
         entry = signal.entry_price
-        pnl_pct = ((horizon_price - entry) / entry) * 100
-        if signal.direction != "Long":
-            pnl_pct = -pnl_pct
 
         # Determine WIN/LOSS
         threshold = WIN_THRESHOLDS.get(horizon, 0.5)
@@ -10,6 +10,7 @@ HOPE AI Trading Modules.
 
 Modules:
 - technical_indicators: RSI, MACD, Bollinger Bands, ATR
+- indicator_stream: Incremental indicator state for bar-by-bar evaluation
 - signal_engine: Main signal generation engine
 - features: ML feature extraction from MarketData (Phase 4)
 - ml_predictor: ML model wrapper with heuristic fallback (Phase 4)
@@ -21,6 +22,13 @@ from .technical_indicators import (
     MACDResult,
     BollingerResult,
     VolumeProfile,
+    MACDSeries,
+    BollingerSeries,
+)
+from .indicator_stream import (
+    IndicatorStream,
+    ArrayIndicators,
+    indicators_for,
 )
 from .signal_engine import (
     SignalEngine,
@@ -49,6 +57,12 @@ __all__ = [
     "MACDResult",
     "BollingerResult",
     "VolumeProfile",
+    "MACDSeries",
+    "BollingerSeries",
+    # Indicator Stream
+    "IndicatorStream",
+    "ArrayIndicators",
+    "indicators_for",
     # Signal Engine
     "SignalEngine",
     "SignalEngineConfig",
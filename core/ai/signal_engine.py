@@ -7,15 +7,16 @@
 from __future__ import annotations
 import hashlib
 import logging
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Any, Optional
 from enum import Enum
 import numpy as np
 
 logger = logging.getLogger(__name__)
 from core.ai.technical_indicators import (
-    TechnicalIndicators, IndicatorResult, MACDResult, BollingerResult, VolumeProfile,
+    IndicatorResult, MACDResult, BollingerResult, VolumeProfile,
 )
+from core.ai.indicator_stream import indicators_for
 
 class SignalDirection(Enum):
     LONG = 'LONG'
@@ -31,6 +32,8 @@ class MarketData:
     lows: np.ndarray
     closes: np.ndarray
     volumes: np.ndarray
+    # Optional IndicatorStream positioned on this bar (see core.ai.indicator_stream)
+    indicators: Optional[Any] = field(default=None, compare=False, repr=False)
     def __post_init__(self):
         if len(self.closes) < 35:
             raise ValueError('MarketData requires at least 35 candles')
@@ -95,11 +98,12 @@ class SignalEngine:
             return None
     
     def _generate_signal_impl(self, market_data: MarketData, sentiment_score: Optional[float], ml_prediction: Optional[float]) -> Optional[TradingSignal]:
-        rsi_result = TechnicalIndicators.rsi(market_data.closes, self.config.rsi_period)
-        macd_result = TechnicalIndicators.macd(market_data.closes, self.config.macd_fast, self.config.macd_slow, self.config.macd_signal)
-        bb_result = TechnicalIndicators.bollinger_bands(market_data.closes, self.config.bb_period, self.config.bb_std)
-        atr_value = TechnicalIndicators.atr(market_data.highs, market_data.lows, market_data.closes, self.config.atr_period)
-        volume_result = TechnicalIndicators.volume_profile(market_data.volumes, self.config.volume_period)
+        ind = indicators_for(market_data)
+        rsi_result = ind.rsi(self.config.rsi_period)
+        macd_result = ind.macd(self.config.macd_fast, self.config.macd_slow, self.config.macd_signal)
+        bb_result = ind.bollinger_bands(self.config.bb_period, self.config.bb_std)
+        atr_value = ind.atr(self.config.atr_period)
+        volume_result = ind.volume_profile(self.config.volume_period)
         technical_score = self._calc_technical_score(rsi_result, macd_result, bb_result)
         volume_score = self._calc_volume_score(volume_result, technical_score)
         sent_score = max(-1.0, min(1.0, sentiment_score or 0.0))
@@ -9,13 +9,20 @@ Technical Indicators Module.
 
 All indicators implemented in pure numpy without external dependencies.
 Each function is a static method, stateless, thread-safe.
+
+Scalar methods (rsi, macd, ...) return the value for the latest bar.
+The *_series methods return the whole history in one vectorized pass
+(cumulative-sum windows, block-wise closed-form EMA recursion); their
+values match the scalar methods applied to every prefix up to float
+rounding. atr_series/ema_series keep the sequential recursion because
+IndicatorStream and live regime detection rely on them bit-for-bit.
 """
 
 from __future__ import annotations
 
 import numpy as np
 from dataclasses import dataclass
-from typing import Literal
+from typing import Literal, Optional
 
 
 @dataclass(frozen=True)
@@ -45,6 +52,23 @@ class BollingerResult:
     squeeze: bool
 
 
+@dataclass(frozen=True)
+class MACDSeries:
+    macd_line: np.ndarray
+    signal_line: np.ndarray
+    histogram: np.ndarray
+
+
+@dataclass(frozen=True)
+class BollingerSeries:
+    upper: np.ndarray
+    middle: np.ndarray
+    lower: np.ndarray
+    width: np.ndarray
+    position: np.ndarray
+    squeeze: np.ndarray
+
+
 @dataclass(frozen=True)
 class VolumeProfile:
     avg_volume: float
@@ -53,6 +77,47 @@ class VolumeProfile:
     spike: bool
 
 
+# Max growth of decay**-k inside one block of _smooth (bounds precision loss to ~3 digits)
+_SMOOTH_BLOCK_GAIN = 1e3
+
+
+def _smooth(values: np.ndarray, alpha: float, seed: float) -> np.ndarray:
+    """
+    First-order recursion y[k] = (1 - alpha) * y[k-1] + alpha * values[k-1], y[0] = seed.
+
+    Vectorized lfilter equivalent: inside a block y[k] = d^k * (y0 + alpha * cumsum(x / d^i)),
+    with block length chosen so d^-k stays below _SMOOTH_BLOCK_GAIN.
+    Returns len(values) + 1 values (seed first).
+    """
+    out = np.empty(len(values) + 1)
+    out[0] = seed
+    if len(values) == 0:
+        return out
+    decay = 1.0 - alpha
+    if decay <= 0.0:
+        out[1:] = values
+        return out
+
+    block = max(1, int(np.log(_SMOOTH_BLOCK_GAIN) / -np.log(decay)))
+    powers = decay ** np.arange(1, block + 1)
+    y = seed
+    for start in range(0, len(values), block):
+        chunk = values[start:start + block]
+        p = powers[:len(chunk)]
+        res = p * (y + alpha * np.cumsum(chunk / p))
+        out[start + 1:start + 1 + len(chunk)] = res
+        y = res[-1]
+    return out
+
+
+def _ema_vec(values: np.ndarray, period: int) -> np.ndarray:
+    """EMA seeded with SMA(period); values from index period-1 (same layout as ema_series)."""
+    if len(values) < period:
+        return np.array([])
+    seed = float(np.mean(values[:period]))
+    return _smooth(values[period:], 2.0 / (period + 1), seed)
+
+
 class TechnicalIndicators:
 
     @staticmethod
@@ -77,6 +142,10 @@ class TechnicalIndicators:
             rs = avg_gain / avg_loss
             rsi_value = 100 - (100 / (1 + rs))
 
+        return TechnicalIndicators._rsi_result(rsi_value)
+
+    @staticmethod
+    def _rsi_result(rsi_value: float) -> IndicatorResult:
         if rsi_value < 30:
             signal = "BUY"
             strength = (30 - rsi_value) / 30
@@ -115,11 +184,20 @@ class TechnicalIndicators:
 
         macd_array = np.array(macd_series)
         signal_line = TechnicalIndicators._ema(macd_array, signal_period)
-        histogram = macd_line - signal_line
 
         if len(macd_array) >= 2:
             prev_macd = macd_array[-2]
             prev_signal = TechnicalIndicators._ema(macd_array[:-1], signal_period)
+        else:
+            prev_macd = prev_signal = None
+
+        return TechnicalIndicators._macd_result(macd_line, signal_line, prev_macd, prev_signal)
+
+    @staticmethod
+    def _macd_result(macd_line: float, signal_line: float, prev_macd: Optional[float], prev_signal: Optional[float]) -> MACDResult:
+        histogram = macd_line - signal_line
+
+        if prev_macd is not None and prev_signal is not None:
             if prev_macd <= prev_signal and macd_line > signal_line:
                 crossover = "BULLISH"
             elif prev_macd >= prev_signal and macd_line < signal_line:
@@ -260,3 +338,133 @@ class TechnicalIndicators:
             ema_values[i] = (closes[period - 1 + i] - ema_values[i-1]) * multiplier + ema_values[i-1]
 
         return ema_values
+
+    # ------------------------------------------------------------------
+    # Vectorized full-series family
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def sma_series(closes: np.ndarray, period: int) -> np.ndarray:
+        """
+        Simple moving average for all bars via a cumulative-sum window.
+
+        Returns array of SMA values starting from bar `period-1`.
+        Result length = len(closes) - period + 1
+        """
+        values = np.asarray(closes, dtype=float)
+        if period <= 0 or len(values) < period:
+            return np.array([])
+        csum = np.concatenate(([0.0], np.cumsum(values)))
+        return (csum[period:] - csum[:-period]) / period
+
+    @staticmethod
+    def rsi_series(closes: np.ndarray, period: int = 14) -> np.ndarray:
+        """
+        Wilder RSI for all bars (matches rsi() on every prefix).
+
+        Returns array of RSI values starting from bar `period`.
+        Result length = len(closes) - period
+        """
+        values = np.asarray(closes, dtype=float)
+        if len(values) < period + 1:
+            return np.array([])
+
+        deltas = np.diff(values)
+        gains = np.where(deltas > 0, deltas, 0.0)
+        losses = np.where(deltas < 0, -deltas, 0.0)
+
+        alpha = 1.0 / period
+        avg_gain = _smooth(gains[period:], alpha, float(np.mean(gains[:period])))
+        avg_loss = _smooth(losses[period:], alpha, float(np.mean(losses[:period])))
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+        return np.where(avg_loss == 0, 100.0, rsi)
+
+    @staticmethod
+    def macd_series(closes: np.ndarray, fast: int = 12, slow: int = 26, signal_period: int = 9) -> MACDSeries:
+        """
+        MACD line, signal line and histogram for all bars (matches macd() on every prefix).
+
+        All arrays start from bar `slow + signal_period - 2` (first bar with a signal line).
+        Result length = len(closes) - slow - signal_period + 2
+        """
+        values = np.asarray(closes, dtype=float)
+        if len(values) < slow + signal_period - 1:
+            empty = np.array([])
+            return MACDSeries(macd_line=empty, signal_line=empty, histogram=empty)
+
+        fast_ema = _ema_vec(values, fast)
+        slow_ema = _ema_vec(values, slow)
+        macd_line = fast_ema[slow - fast:] - slow_ema  # from bar slow-1
+        signal_line = _ema_vec(macd_line, signal_period)
+        macd_line = macd_line[signal_period - 1:]
+        return MACDSeries(
+            macd_line=macd_line,
+            signal_line=signal_line,
+            histogram=macd_line - signal_line,
+        )
+
+    @staticmethod
+    def bollinger_series(closes: np.ndarray, period: int = 20, std_dev: float = 2.0, squeeze_threshold: float = 0.02) -> BollingerSeries:
+        """
+        Bollinger Bands for all bars (matches bollinger_bands() on every prefix).
+
+        Windows are strided views (no copies); the std is taken per window
+        rather than from a running sum of squares, which cancels badly at
+        crypto price levels.
+
+        All arrays start from bar `period-1`.
+        Result length = len(closes) - period + 1
+        """
+        values = np.asarray(closes, dtype=float)
+        if len(values) < period:
+            empty = np.array([])
+            return BollingerSeries(upper=empty, middle=empty, lower=empty, width=empty, position=empty, squeeze=np.array([], dtype=bool))
+
+        windows = np.lib.stride_tricks.sliding_window_view(values, period)
+        middle = windows.mean(axis=1)
+        std = windows.std(axis=1)
+        upper = middle + (std_dev * std)
+        lower = middle - (std_dev * std)
+        width = (upper - lower) / middle
+
+        band = upper - lower
+        current = values[period - 1:]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            position = np.where(band != 0, (current - lower) / band, 0.5)
+        position = np.clip(position, 0.0, 1.0)
+
+        return BollingerSeries(
+            upper=upper,
+            middle=middle,
+            lower=lower,
+            width=width,
+            position=position,
+            squeeze=width < squeeze_threshold,
+        )
+
+    @staticmethod
+    def volume_ratio_series(volumes: np.ndarray, period: int = 20) -> np.ndarray:
+        """
+        Current volume / SMA(period) volume for all bars (volume_profile().current_ratio).
+
+        Returns array starting from bar `period-1`.
+        Result length = len(volumes) - period + 1
+        """
+        values = np.asarray(volumes, dtype=float)
+        avg = TechnicalIndicators.sma_series(values, period)
+        if len(avg) == 0:
+            return avg
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(avg > 0, values[period - 1:] / avg, 0.0)
+
+    @staticmethod
+    def volume_spike_series(volumes: np.ndarray, period: int = 20, spike_threshold: float = 2.0) -> np.ndarray:
+        """
+        Boolean volume spike flag for all bars (volume_profile().spike).
+
+        Returns array starting from bar `period-1`.
+        Result length = len(volumes) - period + 1
+        """
+        return TechnicalIndicators.volume_ratio_series(volumes, period) >= spike_threshold
@@ -34,6 +34,8 @@ from .auto_tuner import (
     ParameterRange,
     TuneResult,
     TuneReport,
+    TrialLedger,
+    ConfigStrategyFactory,
     # Search spaces
     momentum_search_space,
     breakout_search_space,
@@ -62,6 +64,8 @@ __all__ = [
     "ParameterRange",
     "TuneResult",
     "TuneReport",
+    "TrialLedger",
+    "ConfigStrategyFactory",
     "momentum_search_space",
     "breakout_search_space",
     "mean_reversion_search_space",
@@ -1,6 +1,7 @@
 # === AI SIGNATURE ===
 # Created by: Claude (opus-4)
 # Created at: 2026-01-27T23:30:00Z
+# Modified at: 2026-02-05T18:00:00Z
 # Purpose: Hyperparameter auto-tuning for trading strategies
 # Security: Fail-closed, no external dependencies beyond numpy
 # === END SIGNATURE ===
@@ -12,13 +13,25 @@ Provides automated hyperparameter optimization for trading strategies using:
 2. Random Search - random sampling from parameter distributions
 3. (Future) Bayesian Optimization via Optuna
 
+Large searches: AutoTuneConfig(max_workers=N) spreads trials over worker
+processes, successive_halving=True scores every config on a data prefix and
+promotes only the top fraction to more data, and ledger_path makes an
+interrupted run resume where it stopped.
+
 Fail-closed: returns empty result on errors.
 """
 from __future__ import annotations
 
+import hashlib
 import logging
+import math
+import os
+import pickle
 import random
+import shutil
+import tempfile
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any, Callable, Tuple, Union
 from pathlib import Path
@@ -26,8 +39,10 @@ import json
 
 import numpy as np
 
+from core.ai.indicator_stream import IndicatorStream
 from core.backtest.engine import BacktestEngine, BacktestConfig, BacktestResult
 from core.backtest.data_loader import KlinesResult
+from core.backtest.sweep import share_klines, attach_klines, klines_key
 from core.strategy.orchestrator import StrategyOrchestrator
 from core.strategy.base import BaseStrategy
 
@@ -357,6 +372,19 @@ class TuneResult:
             "score": self.score,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TuneResult":
+        """Rebuild from to_dict() output (score is derived)."""
+        return cls(
+            config=data["config"],
+            sharpe=data["sharpe"],
+            total_return=data["total_return"],
+            max_drawdown=data["max_drawdown"],
+            win_rate=data["win_rate"],
+            total_trades=data["total_trades"],
+            profit_factor=data["profit_factor"],
+        )
+
 
 @dataclass
 class TuneReport:
@@ -368,6 +396,8 @@ class TuneReport:
     best_result: Optional[TuneResult] = None
     all_results: List[TuneResult] = field(default_factory=list)
     elapsed_seconds: float = 0.0
+    trials_pruned: int = 0  # Stopped early by successive halving
+    trials_resumed: int = 0  # Taken from the trial ledger
 
     def add_result(self, result: TuneResult) -> None:
         """Add a trial result."""
@@ -431,6 +461,8 @@ class TuneReport:
             "search_method": self.search_method,
             "n_trials": self.n_trials,
             "elapsed_seconds": self.elapsed_seconds,
+            "trials_pruned": self.trials_pruned,
+            "trials_resumed": self.trials_resumed,
             "best_result": self.best_result.to_dict() if self.best_result else None,
             "top_5": [r.to_dict() for r in self.top_n(5)],
             "all_results_count": len(self.all_results),
@@ -463,6 +495,20 @@ class AutoTuneConfig:
     # Random seed
     seed: Optional[int] = None
 
+    # Parallelism: trial processes (1 = inline, None = os.cpu_count())
+    max_workers: Optional[int] = 1
+
+    # Successive halving: rung 0 runs every config on the first
+    # min_data_fraction of the data, each next rung keeps the top
+    # 1/reduction_factor on reduction_factor times more data, the last rung
+    # runs on all of it
+    successive_halving: bool = False
+    min_data_fraction: float = 0.25
+    reduction_factor: int = 3
+
+    # Resumable trial ledger (JSONL, one line per finished trial)
+    ledger_path: Optional[Path] = None
+
     # Output
     save_results: bool = True
     results_path: Optional[Path] = None
@@ -470,13 +516,158 @@ class AutoTuneConfig:
 
 StrategyFactory = Callable[[Dict[str, Any]], BaseStrategy]
 
+# A rung prefix shorter than this cannot produce regime/indicator signals
+MIN_RUNG_CANDLES = BacktestConfig().min_candles + 30
+
+
+@dataclass(frozen=True)
+class ConfigStrategyFactory:
+    """Picklable strategy factory: strategy_cls(config_cls(**params))."""
+
+    strategy_cls: type
+    config_cls: type
+
+    def __call__(self, config: Dict[str, Any]) -> BaseStrategy:
+        return self.strategy_cls(self.config_cls(**config))
+
+
+def _klines_prefix(klines: KlinesResult, n_bars: int) -> KlinesResult:
+    """First n_bars candles of klines (array views, no copy)."""
+    if n_bars >= klines.candle_count:
+        return klines
+    return KlinesResult(
+        symbol=klines.symbol,
+        timeframe=klines.timeframe,
+        timestamp=klines.timestamp,
+        opens=klines.opens[:n_bars],
+        highs=klines.highs[:n_bars],
+        lows=klines.lows[:n_bars],
+        closes=klines.closes[:n_bars],
+        volumes=klines.volumes[:n_bars],
+        candle_times=klines.candle_times[:n_bars],
+    )
+
+
+def _indicator_stream(klines: KlinesResult) -> IndicatorStream:
+    return IndicatorStream(klines.opens, klines.highs, klines.lows, klines.closes, klines.volumes)
+
+
+def _run_trial(
+    strategy_factory: StrategyFactory,
+    param_config: Dict[str, Any],
+    klines: KlinesResult,
+    indicators: Optional[IndicatorStream],
+    initial_capital: float,
+    commission_pct: float,
+) -> Optional[TuneResult]:
+    """Backtest one configuration (None if data invalid)."""
+    strategy = strategy_factory(param_config)
+    orchestrator = StrategyOrchestrator([strategy])
+    bt_config = BacktestConfig(
+        initial_capital=initial_capital,
+        commission_pct=commission_pct,
+        spot_only=True,
+    )
+    result = BacktestEngine(orchestrator, bt_config).run(klines, indicators=indicators)
+
+    if not result.validation.is_valid:
+        return None
+
+    return TuneResult(
+        config=param_config,
+        sharpe=result.sharpe_ratio,
+        total_return=result.total_return_pct / 100,  # Convert to decimal
+        max_drawdown=result.max_drawdown_pct,
+        win_rate=result.win_rate,
+        total_trades=result.total_trades,
+        profit_factor=result.profit_factor,
+    )
+
+
+# Per-process indicator cache over shared klines (filled lazily in workers)
+_WORKER_STREAMS: Dict[str, IndicatorStream] = {}
+
+
+def _worker_trial(
+    strategy_factory: StrategyFactory,
+    param_config: Dict[str, Any],
+    path: str,
+    symbol: str,
+    timeframe: str,
+    n_bars: int,
+    initial_capital: float,
+    commission_pct: float,
+) -> Optional[TuneResult]:
+    """Process-pool entrypoint (top-level for pickling)."""
+    klines = attach_klines(path, symbol, timeframe)
+    stream = _WORKER_STREAMS.get(path)
+    if stream is None:
+        stream = _WORKER_STREAMS[path] = _indicator_stream(klines)
+    try:
+        return _run_trial(
+            strategy_factory, param_config, _klines_prefix(klines, n_bars), stream,
+            initial_capital, commission_pct,
+        )
+    except Exception as e:
+        logger.debug("Config evaluation failed: %s", e)
+        return None
+
+
+class TrialLedger:
+    """
+    Append-only JSONL of finished trials.
+
+    A trial is keyed by (config, data fingerprint, data length, backtest
+    settings), so an interrupted tune re-run with the same seed/grid skips
+    every trial it already finished. Failed trials are recorded too.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._done: Dict[str, Optional[Dict[str, Any]]] = {}
+        if path.exists():
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        self._done[entry["key"]] = entry.get("result")
+                    except (json.JSONDecodeError, KeyError, TypeError):
+                        continue  # Torn last line after a crash
+
+    @staticmethod
+    def trial_key(param_config: Dict[str, Any], context: Dict[str, Any], n_bars: int) -> str:
+        payload = json.dumps(
+            {"config": param_config, "context": context, "n_bars": n_bars},
+            sort_keys=True, default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._done
+
+    def get(self, key: str) -> Optional[TuneResult]:
+        data = self._done.get(key)
+        return TuneResult.from_dict(data) if data else None
+
+    def record(self, key: str, n_bars: int, result: Optional[TuneResult]) -> None:
+        data = result.to_dict() if result is not None else None
+        self._done[key] = data
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"key": key, "n_bars": n_bars, "result": data}, default=str) + "\n")
+
 
 class AutoTuner:
     """
     Hyperparameter Auto-Tuner.
 
     Searches for optimal strategy parameters using backtesting.
-    Supports grid search and random search.
+    Supports grid search and random search, optionally:
+    - in parallel worker processes (klines shared via memmap, one
+      IndicatorStream per klines set reused by every trial in a process)
+    - with successive halving (cheap rungs on a data prefix, top fraction
+      promoted to more data)
+    - resumable through a trial ledger
     """
 
     def __init__(
@@ -491,6 +682,7 @@ class AutoTuner:
         Args:
             search_space: Parameter search space
             strategy_factory: Function that creates strategy from config dict
+                (must be picklable for max_workers > 1, e.g. ConfigStrategyFactory)
             config: Tuning configuration
         """
         self.search_space = search_space
@@ -506,7 +698,7 @@ class AutoTuner:
             klines: Historical data for backtesting
 
         Returns:
-            TuneReport with results
+            TuneReport with results (final rung only with successive halving)
         """
         import time
         start_time = time.time()
@@ -528,21 +720,32 @@ class AutoTuner:
                 ]
                 logger.info("Random search: %d trials", len(configs))
 
-            for i, param_config in enumerate(configs):
-                try:
-                    result = self._evaluate_config(param_config, klines)
-                    if result is not None:
-                        report.add_result(result)
-
-                        if (i + 1) % 10 == 0:
-                            logger.info(
-                                "Trial %d/%d: score=%.4f",
-                                i + 1, len(configs),
-                                result.score
-                            )
-                except Exception as e:
-                    logger.warning("Trial %d failed: %s", i, e)
-                    continue
+            ledger = TrialLedger(self.config.ledger_path) if self.config.ledger_path else None
+            rungs = self._rung_sizes(klines.candle_count)
+
+            with _TrialRunner(self, klines, ledger) as runner:
+                survivors = configs
+                for rung, n_bars in enumerate(rungs):
+                    results = runner.run(survivors, n_bars)
+                    scored = [(c, r) for c, r in zip(survivors, results) if r is not None]
+
+                    if rung == len(rungs) - 1:
+                        for _, result in scored:
+                            report.add_result(result)
+                        break
+
+                    keep = max(1, math.ceil(len(survivors) / max(2, self.config.reduction_factor)))
+                    scored.sort(key=lambda item: self._rank_value(item[1]), reverse=True)
+                    promoted = [c for c, _ in scored[:keep]]
+                    report.trials_pruned += len(survivors) - len(promoted)
+                    logger.info(
+                        "Rung %d (%d bars): %d configs, promoting %d",
+                        rung, n_bars, len(survivors), len(promoted),
+                    )
+                    survivors = promoted
+                    if not survivors:
+                        break
+                report.trials_resumed = runner.resumed
 
             report.n_trials = len(configs)
             report.elapsed_seconds = time.time() - start_time
@@ -563,42 +766,59 @@ class AutoTuner:
 
         return report
 
+    def _rung_sizes(self, n: int) -> List[int]:
+        """Data length per successive-halving rung (ascending, last = n)."""
+        if not self.config.successive_halving:
+            return [n]
+        eta = max(2, self.config.reduction_factor)
+        sizes = []
+        fraction = max(self.config.min_data_fraction, 1e-3)
+        while fraction < 1.0:
+            size = int(round(n * fraction))
+            if size >= MIN_RUNG_CANDLES:
+                sizes.append(size)
+            fraction *= eta
+        sizes.append(n)
+        return sorted(set(sizes))
+
+    def _rank_value(self, result: TuneResult) -> float:
+        """Promotion key for primary_metric (higher is better)."""
+        metric = self.config.primary_metric
+        if metric == "sharpe":
+            return result.sharpe
+        if metric == "return":
+            return result.total_return
+        if metric == "drawdown":
+            return -result.max_drawdown
+        return result.score
+
+    def _trial_context(self, klines: KlinesResult) -> Dict[str, Any]:
+        """Ledger key context: data fingerprint and backtest settings."""
+        n = klines.candle_count
+        return {
+            "strategy": self.search_space.strategy_name,
+            "symbol": klines.symbol,
+            "timeframe": klines.timeframe,
+            "candles": n,
+            "first_time": float(klines.candle_times[0]) if n else None,
+            "last_time": float(klines.candle_times[-1]) if n else None,
+            "last_close": float(klines.closes[-1]) if n else None,
+            "initial_capital": self.config.initial_capital,
+            "commission_pct": self.config.commission_pct,
+        }
+
     def _evaluate_config(
         self,
         param_config: Dict[str, Any],
         klines: KlinesResult,
+        indicators: Optional[IndicatorStream] = None,
     ) -> Optional[TuneResult]:
         """Evaluate a single configuration."""
         try:
-            # Create strategy with this config
-            strategy = self.strategy_factory(param_config)
-
-            # Setup backtest
-            orchestrator = StrategyOrchestrator([strategy])
-            bt_config = BacktestConfig(
-                initial_capital=self.config.initial_capital,
-                commission_pct=self.config.commission_pct,
-                spot_only=True,
+            return _run_trial(
+                self.strategy_factory, param_config, klines, indicators,
+                self.config.initial_capital, self.config.commission_pct,
             )
-            engine = BacktestEngine(orchestrator, bt_config)
-
-            # Run backtest
-            result = engine.run(klines)
-
-            if not result.validation.is_valid:
-                return None
-
-            # Extract metrics
-            return TuneResult(
-                config=param_config,
-                sharpe=result.sharpe_ratio,
-                total_return=result.total_return_pct / 100,  # Convert to decimal
-                max_drawdown=result.max_drawdown_pct,
-                win_rate=result.win_rate,
-                total_trades=result.total_trades,
-                profit_factor=result.profit_factor,
-            )
-
         except Exception as e:
             logger.debug("Config evaluation failed: %s", e)
             return None
@@ -616,6 +836,7 @@ class AutoTuner:
         except Exception as e:
             logger.warning("Failed to save results: %s", e)
 
+
     def run_check(self, klines: KlinesResult) -> Dict[str, Any]:
         """
         Quick check if tuning improves performance.
@@ -644,6 +865,101 @@ class AutoTuner:
         return result
 
 
+class _TrialRunner:
+    """
+    Runs trials inline or on a process pool, consulting the ledger first.
+
+    Inline, one IndicatorStream over klines serves every trial and rung;
+    with a pool, klines are shared via memmap and each worker keeps its own
+    stream (see _worker_trial).
+    """
+
+    def __init__(self, tuner: AutoTuner, klines: KlinesResult, ledger: Optional[TrialLedger]):
+        self.tuner = tuner
+        self.klines = klines
+        self.ledger = ledger
+        self.context = tuner._trial_context(klines) if ledger else {}
+        self.resumed = 0
+        self.completed = 0
+
+        workers = tuner.config.max_workers or os.cpu_count() or 1
+        if workers > 1:
+            try:
+                pickle.dumps(tuner.strategy_factory)
+            except Exception:
+                logger.warning("strategy_factory is not picklable, running trials inline")
+                workers = 1
+        self.workers = workers
+
+        self._stream: Optional[IndicatorStream] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._share_dir: Optional[Path] = None
+        self._path = ""
+
+    def __enter__(self) -> "_TrialRunner":
+        if self.workers > 1:
+            self._share_dir = Path(tempfile.mkdtemp(prefix="hope_tune_"))
+            key = (self.klines.symbol, self.klines.timeframe)
+            self._path = share_klines({key: self.klines}, self._share_dir)[klines_key(*key)]
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        else:
+            self._stream = _indicator_stream(self.klines)
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+        if self._share_dir is not None:
+            shutil.rmtree(self._share_dir, ignore_errors=True)
+        return False
+
+    def run(self, configs: List[Dict[str, Any]], n_bars: int) -> List[Optional[TuneResult]]:
+        """Evaluate configs on the first n_bars candles (results in config order)."""
+        results: List[Optional[TuneResult]] = [None] * len(configs)
+        keys: List[str] = []
+        pending = []
+        for i, param_config in enumerate(configs):
+            key = TrialLedger.trial_key(param_config, self.context, n_bars) if self.ledger else ""
+            keys.append(key)
+            if self.ledger and key in self.ledger:
+                results[i] = self.ledger.get(key)
+                self.resumed += 1
+            else:
+                pending.append(i)
+
+        def finish(i: int, result: Optional[TuneResult]) -> None:
+            results[i] = result
+            if self.ledger:
+                self.ledger.record(keys[i], n_bars, result)
+            self.completed += 1
+            if result is not None and self.completed % 10 == 0:
+                logger.info("Trial %d (%d bars): score=%.4f", self.completed, n_bars, result.score)
+
+        if self._pool is None:
+            klines = _klines_prefix(self.klines, n_bars)
+            for i in pending:
+                finish(i, self.tuner._evaluate_config(configs[i], klines, self._stream))
+            return results
+
+        cfg = self.tuner.config
+        futures = {
+            self._pool.submit(
+                _worker_trial, self.tuner.strategy_factory, configs[i], self._path,
+                self.klines.symbol, self.klines.timeframe, n_bars,
+                cfg.initial_capital, cfg.commission_pct,
+            ): i
+            for i in pending
+        }
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                finish(i, future.result())
+            except Exception as e:
+                # Worker crash: not recorded, so a resumed run retries it
+                logger.warning("Trial %d failed: %s", i, e)
+        return results
+
+
 # ============================================================================
 # Convenience Functions
 # ============================================================================
@@ -666,8 +982,7 @@ def tune_momentum(
     """
     from core.strategy.momentum import MomentumStrategy, MomentumConfig
 
-    def factory(config: Dict[str, Any]) -> BaseStrategy:
-        return MomentumStrategy(MomentumConfig(**config))
+    factory = ConfigStrategyFactory(MomentumStrategy, MomentumConfig)
 
     space = momentum_search_space()
     tuner_config = AutoTuneConfig(
@@ -688,8 +1003,7 @@ def tune_breakout(
     """Tune BreakoutStrategy hyperparameters."""
     from core.strategy.breakout import BreakoutStrategy, BreakoutConfig
 
-    def factory(config: Dict[str, Any]) -> BaseStrategy:
-        return BreakoutStrategy(BreakoutConfig(**config))
+    factory = ConfigStrategyFactory(BreakoutStrategy, BreakoutConfig)
 
     space = breakout_search_space()
     tuner_config = AutoTuneConfig(
@@ -710,8 +1024,7 @@ def tune_mean_reversion(
     """Tune MeanReversionStrategy hyperparameters."""
     from core.strategy.mean_reversion import MeanReversionStrategy, MeanReversionConfig
 
-    def factory(config: Dict[str, Any]) -> BaseStrategy:
-        return MeanReversionStrategy(MeanReversionConfig(**config))
+    factory = ConfigStrategyFactory(MeanReversionStrategy, MeanReversionConfig)
 
     space = mean_reversion_search_space()
     tuner_config = AutoTuneConfig(
@@ -1,8 +1,9 @@
 # === AI SIGNATURE ===
 # Created by: Claude (opus-4)
 # Created at: 2026-01-27T23:50:00Z
+# Modified at: 2026-10-16T00:00:00Z
 # Purpose: Real-time performance tracking with rolling metrics
-# Security: Fail-closed, atomic state persistence
+# Security: Fail-closed, atomic state persistence, append-only trade log
 # === END SIGNATURE ===
 """
 Performance Tracker.
@@ -14,15 +15,19 @@ Tracks trading performance in real-time with rolling windows:
 - Drawdown: current and historical max
 - Per-strategy breakdown
 
-State is atomically persisted to disk.
+State is persisted write-behind: trades to an append-only log, bounded
+aggregates atomically to a snapshot file (see PerformanceTracker).
 Fail-closed: Any state corruption → reset to defaults.
 """
 from __future__ import annotations
 
+import atexit
 import json
 import logging
 import os
+import threading
 import time
+import weakref
 from collections import deque
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
@@ -134,18 +139,29 @@ class PerformanceTracker:
     - Per-strategy statistics
     - Risk metrics (Sharpe, Sortino, drawdown)
 
-    State persisted atomically to disk.
+    Persistence is write-behind:
+    - Every trade is appended to performance_trades.jsonl (full history)
+    - performance_state.json holds only bounded aggregates (equity, peaks,
+      recent trades, equity curve, strategy stats) plus the trade-log offset
+      it covers; trades past that offset are replayed on load
+    - Updates only mark state dirty; a flush runs flush_interval_sec later,
+      immediately on risk events (drawdown >= RISK_FLUSH_DRAWDOWN,
+      should_reduce_risk), and on close()/interpreter exit
     """
 
     STATE_FILE = "performance_state.json"
+    TRADE_LOG_FILE = "performance_trades.jsonl"
     MAX_TRADES_HISTORY = 100
     MAX_EQUITY_POINTS = 2880  # ~30 days at 15-minute intervals
     EQUITY_SAMPLE_INTERVAL = 900  # 15 minutes
+    FLUSH_INTERVAL_SEC = 5.0
+    RISK_FLUSH_DRAWDOWN = 0.05  # New max drawdown at/above this flushes at once
 
     def __init__(
         self,
         initial_equity: float = 10000.0,
         state_dir: Optional[Path] = None,
+        flush_interval_sec: Optional[float] = None,
     ):
         """
         Initialize performance tracker.
@@ -153,6 +169,8 @@ class PerformanceTracker:
         Args:
             initial_equity: Starting equity value
             state_dir: Directory for state persistence
+            flush_interval_sec: Write-behind delay (0 = flush on every update;
+                default FLUSH_INTERVAL_SEC)
         """
         if state_dir is None:
             state_dir = Path(__file__).resolve().parent.parent.parent / "state"
@@ -160,6 +178,7 @@ class PerformanceTracker:
         self.state_dir.mkdir(parents=True, exist_ok=True)
 
         self.state_path = self.state_dir / self.STATE_FILE
+        self.trade_log_path = self.state_dir / self.TRADE_LOG_FILE
 
         # Core state
         self._initial_equity = initial_equity
@@ -179,8 +198,22 @@ class PerformanceTracker:
         # Per-strategy stats
         self._strategy_stats: Dict[str, StrategyStats] = {}
 
+        # Write-behind state
+        if flush_interval_sec is None:
+            flush_interval_sec = self.FLUSH_INTERVAL_SEC
+        self._flush_interval = flush_interval_sec
+        self._lock = threading.RLock()
+        self._flush_lock = threading.Lock()
+        self._dirty = False
+        self._pending_trades: List[CompletedTrade] = []
+        self._log_offset = 0  # Trade-log bytes written (logged trades)
+        self._state_log_offset = 0  # Trade-log bytes covered by the last state snapshot
+        self._timer: Optional[threading.Timer] = None
+        self._persist_stats = {"flushes": 0, "trades_logged": 0, "last_flush_ms": 0.0}
+
         # Load existing state
         self._load_state()
+        _live_trackers.add(self)
 
     def update_equity(self, new_equity: float, timestamp: Optional[int] = None) -> None:
         """
@@ -193,7 +226,14 @@ class PerformanceTracker:
         if timestamp is None:
             timestamp = int(time.time())
 
+        with self._lock:
+            risk_event = self._apply_equity(new_equity, timestamp)
+        self._mark_dirty(risk_event)
+
+    def _apply_equity(self, new_equity: float, timestamp: int) -> bool:
+        """Apply equity update; True if it set a new max drawdown >= RISK_FLUSH_DRAWDOWN."""
         self._equity = new_equity
+        risk_event = False
 
         # Track peak and drawdown
         if new_equity > self._equity_peak:
@@ -206,6 +246,7 @@ class PerformanceTracker:
             current_dd = (self._equity_peak - new_equity) / self._equity_peak
             if current_dd > self._max_drawdown_pct:
                 self._max_drawdown_pct = current_dd
+                risk_event = current_dd >= self.RISK_FLUSH_DRAWDOWN
 
             if self._drawdown_start_time:
                 duration_hours = (timestamp - self._drawdown_start_time) / 3600
@@ -225,7 +266,7 @@ class PerformanceTracker:
             ))
             self._last_equity_sample = timestamp
 
-        self._persist_state()
+        return risk_event
 
     def record_trade(self, trade: CompletedTrade) -> None:
         """
@@ -234,11 +275,17 @@ class PerformanceTracker:
         Args:
             trade: Completed trade record
         """
+        with self._lock:
+            risk_event = self._apply_trade(trade)
+            self._pending_trades.append(trade)
+        self._mark_dirty(risk_event)
+
+    def _apply_trade(self, trade: CompletedTrade) -> bool:
+        """Apply trade to history, equity and strategy stats."""
         self._trades.append(trade)
 
         # Update equity
-        new_equity = self._equity + trade.pnl
-        self.update_equity(new_equity, trade.exit_time)
+        risk_event = self._apply_equity(self._equity + trade.pnl, trade.exit_time)
 
         # Update strategy stats
         if trade.strategy not in self._strategy_stats:
@@ -254,7 +301,7 @@ class PerformanceTracker:
         else:
             stats.gross_loss += trade.pnl
 
-        self._persist_state()
+        return risk_event
 
     def get_snapshot(self) -> PerformanceSnapshot:
         """Get current performance snapshot."""
@@ -327,8 +374,12 @@ class PerformanceTracker:
             (should_reduce, reason, multiplier)
             multiplier: Position size should be multiplied by this
         """
-        snapshot = self.get_snapshot()
+        should_reduce, reason, multiplier = self._assess_risk(self.get_snapshot())
+        if should_reduce:
+            self.flush()  # Risk event: persist before acting on it
+        return should_reduce, reason, multiplier
 
+    def _assess_risk(self, snapshot: PerformanceSnapshot) -> tuple[bool, str, float]:
         # Severe drawdown: 10%+ → stop trading
         if snapshot.current_drawdown_pct >= 0.10:
             return True, "Drawdown >= 10%: EMERGENCY_STOP", 0.0
@@ -425,79 +476,211 @@ class PerformanceTracker:
 
         return win_rate, avg_win, avg_loss, avg_rr
 
-    def _persist_state(self) -> None:
-        """Atomically persist state to disk."""
-        try:
-            state = {
-                "schema": "performance_v1",
-                "equity": self._equity,
-                "equity_peak": self._equity_peak,
-                "max_drawdown_pct": self._max_drawdown_pct,
-                "max_drawdown_duration": self._max_drawdown_duration,
-                "trades": [t.to_dict() for t in self._trades],
-                "equity_curve": [
-                    {"ts": p.timestamp, "eq": p.equity, "dd": p.drawdown_pct}
-                    for p in self._equity_curve
-                ],
-                "strategy_stats": {
-                    name: asdict(stats)
-                    for name, stats in self._strategy_stats.items()
-                },
-                "updated_at": time.time(),
+    # === Persistence (write-behind) ===
+
+    def _mark_dirty(self, risk_event: bool = False) -> None:
+        """Mark state dirty; flush now on risk events, else schedule a flush."""
+        with self._lock:
+            self._dirty = True
+            if not (risk_event or self._flush_interval <= 0):
+                if self._timer is None:
+                    self._timer = threading.Timer(self._flush_interval, self._timer_flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+        self.flush()
+
+    def _timer_flush(self) -> None:
+        with self._lock:
+            self._timer = None
+        self.flush()
+
+    def flush(self) -> None:
+        """Persist pending trades and aggregates now (no-op if clean)."""
+        with self._flush_lock:
+            start = time.perf_counter()
+            with self._lock:
+                if not self._dirty:
+                    return
+                pending, self._pending_trades = self._pending_trades, []
+                self._dirty = False
+                state = self._build_state()
+
+            if pending:
+                data = "".join(
+                    json.dumps(t.to_dict()) + "\n" for t in pending
+                ).encode("utf-8")
+                try:
+                    with open(self.trade_log_path, "ab") as f:
+                        f.write(data)
+                        f.flush()
+                        os.fsync(f.fileno())
+                except Exception as e:
+                    # Not logged: drop any partial bytes and retry these trades next flush
+                    logger.warning("Failed to append trade log: %s", e)
+                    try:
+                        os.truncate(self.trade_log_path, self._log_offset)
+                    except OSError:
+                        pass
+                    with self._lock:
+                        self._pending_trades[:0] = pending
+                        self._dirty = True
+                    return
+                self._log_offset += len(data)
+                self._persist_stats["trades_logged"] += len(pending)
+
+            # Trades are in the log now; a failed snapshot only needs rewriting
+            # (replay covers the logged trades after a crash)
+            state["trade_log_offset"] = self._log_offset
+            try:
+                self._write_state(state)
+            except Exception as e:
+                logger.warning("Failed to persist state: %s", e)
+                with self._lock:
+                    self._dirty = True
+                return
+            self._state_log_offset = self._log_offset
+
+            self._persist_stats["flushes"] += 1
+            self._persist_stats["last_flush_ms"] = round((time.perf_counter() - start) * 1000, 2)
+
+    def close(self) -> None:
+        """Cancel the pending timer and flush (call on shutdown)."""
+        with self._lock:
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+        self.flush()
+
+    def get_persistence_stats(self) -> Dict[str, Any]:
+        """Flush counters and pending write-behind state."""
+        with self._lock:
+            return {
+                **self._persist_stats,
+                "dirty": self._dirty,
+                "pending_trades": len(self._pending_trades),
+                "trade_log_offset": self._log_offset,
+                "state_log_offset": self._state_log_offset,
             }
 
-            content = json.dumps(state, indent=2)
-            tmp_path = self.state_path.with_suffix(".json.tmp")
+    def _persist_state(self) -> None:
+        """Mark state dirty and flush it synchronously."""
+        with self._lock:
+            self._dirty = True
+        self.flush()
 
-            with open(tmp_path, "w", encoding="utf-8") as f:
-                f.write(content)
-                f.flush()
-                os.fsync(f.fileno())
+    def _build_state(self) -> Dict[str, Any]:
+        """Bounded aggregate snapshot (trade history lives in the trade log)."""
+        return {
+            "schema": "performance_v2",
+            "equity": self._equity,
+            "equity_peak": self._equity_peak,
+            "max_drawdown_pct": self._max_drawdown_pct,
+            "max_drawdown_duration": self._max_drawdown_duration,
+            "recent_trades": [t.to_dict() for t in self._trades],
+            "equity_curve": [
+                {"ts": p.timestamp, "eq": p.equity, "dd": p.drawdown_pct}
+                for p in self._equity_curve
+            ],
+            "strategy_stats": {
+                name: asdict(stats)
+                for name, stats in self._strategy_stats.items()
+            },
+            "updated_at": time.time(),
+        }
 
-            os.replace(tmp_path, self.state_path)
+    def _write_state(self, state: Dict[str, Any]) -> None:
+        """Atomically write the state file."""
+        content = json.dumps(state, separators=(",", ":"))
+        tmp_path = self.state_path.with_suffix(".json.tmp")
 
-        except Exception as e:
-            logger.warning("Failed to persist state: %s", e)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
 
-    def _load_state(self) -> None:
-        """Load state from disk."""
-        if not self.state_path.exists():
-            return
+        os.replace(tmp_path, self.state_path)
 
+    def _load_state(self) -> None:
+        """Load aggregates, then replay trades logged after the state file."""
+        if self.state_path.exists():
+            try:
+                content = self.state_path.read_text(encoding="utf-8")
+                state = json.loads(content)
+                schema = state.get("schema")
+
+                if schema not in ("performance_v1", "performance_v2"):
+                    logger.warning("Unknown state schema, resetting")
+                else:
+                    self._equity = state.get("equity", self._initial_equity)
+                    self._equity_peak = state.get("equity_peak", self._equity)
+                    self._max_drawdown_pct = state.get("max_drawdown_pct", 0.0)
+                    self._max_drawdown_duration = state.get("max_drawdown_duration", 0)
+
+                    # Load trades (v1 kept them under "trades")
+                    trades_key = "recent_trades" if schema == "performance_v2" else "trades"
+                    for t in state.get(trades_key, []):
+                        self._trades.append(CompletedTrade(**t))
+
+                    # Load equity curve
+                    for p in state.get("equity_curve", []):
+                        self._equity_curve.append(EquityPoint(
+                            timestamp=p["ts"],
+                            equity=p["eq"],
+                            drawdown_pct=p["dd"],
+                        ))
+
+                    # Load strategy stats
+                    for name, s in state.get("strategy_stats", {}).items():
+                        self._strategy_stats[name] = StrategyStats(**s)
+
+                    self._log_offset = state.get("trade_log_offset", 0)
+                    if schema == "performance_v1" and self.trade_log_path.exists():
+                        self._log_offset = self.trade_log_path.stat().st_size
+                    self._state_log_offset = self._log_offset
+
+                    logger.info("Loaded performance state: equity=%.2f, trades=%d",
+                                self._equity, len(self._trades))
+
+            except Exception as e:
+                logger.warning("Failed to load state, resetting: %s", e)
+
+        self._replay_trade_log()
+
+    def _replay_trade_log(self) -> None:
+        """Apply trades appended after the state file was written (crash recovery)."""
         try:
-            content = self.state_path.read_text(encoding="utf-8")
-            state = json.loads(content)
-
-            if state.get("schema") != "performance_v1":
-                logger.warning("Unknown state schema, resetting")
-                return
-
-            self._equity = state.get("equity", self._initial_equity)
-            self._equity_peak = state.get("equity_peak", self._equity)
-            self._max_drawdown_pct = state.get("max_drawdown_pct", 0.0)
-            self._max_drawdown_duration = state.get("max_drawdown_duration", 0)
-
-            # Load trades
-            for t in state.get("trades", []):
-                self._trades.append(CompletedTrade(**t))
-
-            # Load equity curve
-            for p in state.get("equity_curve", []):
-                self._equity_curve.append(EquityPoint(
-                    timestamp=p["ts"],
-                    equity=p["eq"],
-                    drawdown_pct=p["dd"],
-                ))
-
-            # Load strategy stats
-            for name, s in state.get("strategy_stats", {}).items():
-                self._strategy_stats[name] = StrategyStats(**s)
-
-            logger.info("Loaded performance state: equity=%.2f, trades=%d",
-                        self._equity, len(self._trades))
+            size = self.trade_log_path.stat().st_size
+        except OSError:
+            self._log_offset = 0
+            return
+        if size < self._log_offset:
+            logger.warning("Trade log shorter than state offset, not replaying")
+            self._log_offset = size
+            return
+        if size == self._log_offset:
+            return
 
-        except Exception as e:
-            logger.warning("Failed to load state, resetting: %s", e)
+        replayed = 0
+        with open(self.trade_log_path, "r+b") as f:
+            f.seek(self._log_offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    f.truncate(self._log_offset)  # Drop torn write
+                    break
+                try:
+                    trade = CompletedTrade(**json.loads(line))
+                except (ValueError, TypeError) as e:
+                    logger.warning("Skipping bad trade log line: %s", e)
+                else:
+                    self._apply_trade(trade)
+                    replayed += 1
+                self._log_offset += len(line)
+
+        if replayed:
+            logger.info("Replayed %d trades from trade log", replayed)
+            self._dirty = True
+            self.flush()
 
     def reset(self, initial_equity: Optional[float] = None) -> None:
         """Reset all performance data."""
@@ -513,6 +696,7 @@ class PerformanceTracker:
         self._equity_curve.clear()
         self._strategy_stats.clear()
         self._last_equity_sample = 0
+        self._pending_trades.clear()
 
         self._persist_state()
 
@@ -555,6 +739,16 @@ class PerformanceTracker:
         }
 
 
+# Trackers flushed at interpreter exit (write-behind safety net)
+_live_trackers: "weakref.WeakSet[PerformanceTracker]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_trackers() -> None:
+    for tracker in list(_live_trackers):
+        tracker.close()
+
+
 # === Singleton ===
 
 _tracker_instance: Optional[PerformanceTracker] = None
@@ -6,6 +6,7 @@ anti_chase_filter.py - Фильтр "не гнаться за ценой"
 === AI SIGNATURE ===
 Created by: Claude (opus-4.5)
 Created at: 2026-02-05T01:30:00Z
+Modified at: 2026-02-05T14:00:00Z
 Purpose: P0 CRITICAL - Eliminate 22 rapid losses (<1 min)
 Module: core/ai/anti_chase_filter.py
 === END SIGNATURE ===
@@ -37,10 +38,12 @@ import asyncio
 import json
 import logging
 import time
+from array import array
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Dict, List, Tuple
+from typing import Optional, Dict, List, Sequence, Tuple
 
 logger = logging.getLogger("hope.anti_chase")
 
@@ -60,6 +63,59 @@ class PricePoint:
         return self.age_seconds / 60
 
 
+class PriceSeries:
+    """
+    Окно цен одного символа: параллельные массивы (timestamp, price).
+
+    - Запись: O(1) append; старые точки отрезаются сдвигом head,
+      массивы компактируются когда мёртвая часть > половины (амортизированно O(1))
+    - Поиск ближайшей к моменту точки: bisect, O(log n)
+    """
+
+    __slots__ = ("timestamps", "prices", "head")
+
+    def __init__(self) -> None:
+        self.timestamps = array("d")
+        self.prices = array("d")
+        self.head = 0
+
+    def __len__(self) -> int:
+        return len(self.timestamps) - self.head
+
+    def append(self, timestamp: float, price: float) -> None:
+        # bisect требует неубывающих меток (защита от скачка часов назад)
+        if len(self) and timestamp < self.timestamps[-1]:
+            timestamp = self.timestamps[-1]
+        self.timestamps.append(timestamp)
+        self.prices.append(price)
+
+    def evict_before(self, cutoff: float) -> None:
+        """Отбросить точки с timestamp <= cutoff."""
+        self.head = bisect_right(self.timestamps, cutoff, self.head)
+        if self.head > len(self.timestamps) // 2:
+            del self.timestamps[:self.head]
+            del self.prices[:self.head]
+            self.head = 0
+
+    def nearest(self, target: float) -> Optional[Tuple[float, float]]:
+        """(price, |diff|) точки, ближайшей к target (при равенстве - более ранней)."""
+        ts = self.timestamps
+        pos = bisect_left(ts, target, self.head)
+        best = None
+        if pos > self.head:
+            best = (self.prices[pos - 1], target - ts[pos - 1])
+        if pos < len(ts) and (best is None or ts[pos] - target < best[1]):
+            best = (self.prices[pos], ts[pos] - target)
+        return best
+
+    def points(self) -> List[PricePoint]:
+        """Точки окна как PricePoint (для отладки/отчётов)."""
+        return [
+            PricePoint(price=p, timestamp=t)
+            for t, p in zip(self.timestamps[self.head:], self.prices[self.head:])
+        ]
+
+
 @dataclass
 class ChaseAnalysis:
     """Результат анализа погони за ценой"""
@@ -106,8 +162,8 @@ class AntiChaseFilter:
         self.threshold_5min = threshold_5min
         self.lookback_minutes = lookback_minutes
         
-        # Хранилище цен: symbol -> list of PricePoint
-        self.price_history: Dict[str, List[PricePoint]] = defaultdict(list)
+        # Хранилище цен: symbol -> окно (timestamp, price)
+        self.price_history: Dict[str, PriceSeries] = defaultdict(PriceSeries)
         
         # Статистика
         self.stats = {
@@ -131,41 +187,32 @@ class AntiChaseFilter:
         
         Вызывать регулярно (каждые 10-30 секунд) из price feed.
         """
-        now = time.time()
-        point = PricePoint(price=price, timestamp=now)
-        
-        self.price_history[symbol].append(point)
+        self._record_price_at(symbol, price, time.time())
+
+    def _record_price_at(self, symbol: str, price: float, now: float) -> None:
+        series = self.price_history[symbol]
+        series.append(now, price)
         
         # Очистить старые записи (оставить только lookback_minutes)
-        cutoff = now - (self.lookback_minutes * 60)
-        self.price_history[symbol] = [
-            p for p in self.price_history[symbol] if p.timestamp > cutoff
-        ]
+        series.evict_before(now - (self.lookback_minutes * 60))
     
     def _get_price_at_time(
         self, 
         symbol: str, 
-        minutes_ago: float
+        minutes_ago: float,
+        now: Optional[float] = None,
     ) -> Optional[float]:
         """Получить цену N минут назад (ближайшую к указанному времени)"""
-        if symbol not in self.price_history:
+        series = self.price_history.get(symbol)
+        if not series:
             return None
         
-        target_time = time.time() - (minutes_ago * 60)
-        
-        # Найти ближайшую точку к target_time
-        best_point = None
-        best_diff = float('inf')
-        
-        for point in self.price_history[symbol]:
-            diff = abs(point.timestamp - target_time)
-            if diff < best_diff:
-                best_diff = diff
-                best_point = point
+        target_time = (now if now is not None else time.time()) - (minutes_ago * 60)
+        best = series.nearest(target_time)
         
         # Если ближайшая точка слишком далеко (> 2 минут), вернуть None
-        if best_point and best_diff < 120:
-            return best_point.price
+        if best and best[1] < 120:
+            return best[0]
         
         return None
     
@@ -184,14 +231,37 @@ class AntiChaseFilter:
         Returns:
             ChaseAnalysis с полными данными
         """
+        return self._analyze_at(symbol, current_price, time.time())
+    
+    def analyze_many(
+        self,
+        symbols: Sequence[str],
+        prices: Sequence[float],
+    ) -> List[ChaseAnalysis]:
+        """
+        Пакетный анализ всей наблюдаемой вселенной за один проход.
+        
+        Одна метка времени на пакет; результат в порядке symbols.
+        """
+        if len(symbols) != len(prices):
+            raise ValueError(
+                f"symbols/prices length mismatch: {len(symbols)} != {len(prices)}"
+            )
+        now = time.time()
+        return [
+            self._analyze_at(symbol, price, now)
+            for symbol, price in zip(symbols, prices)
+        ]
+    
+    def _analyze_at(self, symbol: str, current_price: float, now: float) -> ChaseAnalysis:
         self.stats["signals_checked"] += 1
         
         # Записать текущую цену
-        self.record_price(symbol, current_price)
+        self._record_price_at(symbol, current_price, now)
         
         # Получить исторические цены
-        price_3min = self._get_price_at_time(symbol, 3.0)
-        price_5min = self._get_price_at_time(symbol, 5.0)
+        price_3min = self._get_price_at_time(symbol, 3.0, now)
+        price_5min = self._get_price_at_time(symbol, 5.0, now)
         
         # Рассчитать движение
         move_3min = 0.0
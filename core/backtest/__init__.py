@@ -12,6 +12,9 @@ Modules:
 - engine: Main backtest engine (BacktestEngine, BacktestConfig, BacktestResult)
 - data_loader: Historical data loading (CSV, API, synthetic)
 - metrics: Performance metrics (drawdown, Sharpe, win rate)
+- klines_store: Columnar on-disk klines cache with memmap loading
+- vectorized: Consistency check for the vectorized (candidate-mask) mode
+- sweep: Parallel parameter sweep across symbols/timeframes (ProcessPoolExecutor)
 
 Quick Start:
     from core.backtest import BacktestEngine, BacktestConfig, DataLoader
@@ -56,6 +59,26 @@ from .metrics import (
     TradeStats,
     DrawdownInfo,
 )
+from .klines_store import (
+    KlinesStore,
+    StoreIndex,
+    get_klines_store,
+)
+from .vectorized import (
+    VectorizedConsistency,
+    check_vectorized_consistency,
+)
+from .sweep import (
+    SweepTask,
+    SweepResult,
+    build_grid,
+    run_sweep,
+    rank_results,
+    format_sweep_table,
+    share_klines,
+    attach_klines,
+    klines_key,
+)
 
 __all__ = [
     # Engine
@@ -80,4 +103,21 @@ __all__ = [
     "format_metrics_report",
     "TradeStats",
     "DrawdownInfo",
+    # Klines store
+    "KlinesStore",
+    "StoreIndex",
+    "get_klines_store",
+    # Vectorized mode
+    "VectorizedConsistency",
+    "check_vectorized_consistency",
+    # Sweep
+    "SweepTask",
+    "SweepResult",
+    "build_grid",
+    "run_sweep",
+    "rank_results",
+    "format_sweep_table",
+    "share_klines",
+    "attach_klines",
+    "klines_key",
 ]
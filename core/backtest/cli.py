@@ -16,9 +16,17 @@ Usage:
     # CSV data
     python -m core.backtest.cli --strategy momentum --csv data/BTCUSDT-15m.csv
 
+    # Local klines store (memmap)
+    python -m core.backtest.cli --strategy momentum --store data/klines --timeframe 1m
+
     # All strategies
     python -m core.backtest.cli --all --candles 500
 
+    # Parallel parameter sweep over symbols/timeframes
+    python -m core.backtest.cli --sweep --symbols BTCUSDT,ETHUSDT \
+        --grid momentum.rsi_oversold=25,30,35 --grid position_size_pct=0.01,0.02 \
+        --workers 8 --results-jsonl sweep.jsonl
+
 Output: Backtest report with metrics (Sharpe, MDD, PF, win rate).
 """
 from __future__ import annotations
@@ -29,7 +37,7 @@ import logging
 import sys
 import time
 from pathlib import Path
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 
 from core.backtest.engine import BacktestEngine, BacktestConfig, BacktestResult
 from core.backtest.data_loader import (
@@ -38,6 +46,13 @@ from core.backtest.data_loader import (
     generate_synthetic_klines,
     KlinesResult,
 )
+from core.backtest.klines_store import KlinesStore
+from core.backtest.sweep import (
+    SWEEP_STRATEGIES,
+    build_grid,
+    run_sweep,
+    format_sweep_table,
+)
 from core.strategy.orchestrator import StrategyOrchestrator
 from core.strategy.momentum import MomentumStrategy, MomentumConfig
 from core.strategy.breakout import BreakoutStrategy, BreakoutConfig
@@ -69,7 +84,16 @@ def create_strategy(name: str):
 
 def load_data(args: argparse.Namespace) -> Optional[KlinesResult]:
     """Load data based on CLI arguments."""
-    if args.csv:
+    if args.store:
+        klines = KlinesStore(args.store).load(args.symbol, args.timeframe)
+        if klines is None:
+            logger.error("No stored klines for %s %s in %s", args.symbol, args.timeframe, args.store)
+            return None
+
+        logger.info("Loaded %d candles from store", klines.candle_count)
+        return klines
+
+    elif args.csv:
         csv_path = Path(args.csv)
         if not csv_path.exists():
             logger.error("CSV file not found: %s", csv_path)
@@ -166,6 +190,108 @@ def format_comparison_table(results: List[tuple[str, BacktestResult]]) -> str:
     return "\n".join(lines)
 
 
+def _parse_grid_value(raw: str) -> Any:
+    """Parse a grid value: int, float, bool or plain string."""
+    lowered = raw.strip().lower()
+    if lowered in ("true", "false"):
+        return lowered == "true"
+    for cast in (int, float):
+        try:
+            return cast(raw)
+        except ValueError:
+            continue
+    return raw.strip()
+
+
+def parse_grid_args(
+    specs: List[str],
+) -> Tuple[Dict[str, Dict[str, List[Any]]], Dict[str, List[Any]]]:
+    """
+    Parse --grid specs.
+
+    "strategy.param=v1,v2" -> strategy config grid
+    "param=v1,v2"          -> BacktestConfig grid
+
+    Returns:
+        (strategy_grid, config_grid)
+    """
+    strategy_grid: Dict[str, Dict[str, List[Any]]] = {}
+    config_grid: Dict[str, List[Any]] = {}
+    for spec in specs or []:
+        if "=" not in spec:
+            raise ValueError(f"Invalid grid spec (expected key=v1,v2): {spec}")
+        key, raw_values = spec.split("=", 1)
+        values = [_parse_grid_value(v) for v in raw_values.split(",") if v.strip()]
+        if "." in key:
+            strategy, param = key.split(".", 1)
+            strategy_grid.setdefault(strategy, {})[param] = values
+        else:
+            config_grid[key] = values
+    return strategy_grid, config_grid
+
+
+def load_sweep_data(args: argparse.Namespace) -> Optional[Dict[Tuple[str, str], KlinesResult]]:
+    """Load klines for every (symbol, timeframe) of the sweep."""
+    symbols = [s.strip() for s in args.symbols.split(",") if s.strip()]
+    timeframes = [t.strip() for t in args.timeframes.split(",") if t.strip()]
+    klines_map: Dict[Tuple[str, str], KlinesResult] = {}
+
+    for i, (symbol, timeframe) in enumerate((s, t) for s in symbols for t in timeframes):
+        if args.store:
+            klines = KlinesStore(args.store).load(symbol, timeframe)
+        elif args.csv_dir:
+            csv_path = Path(args.csv_dir) / f"{symbol}-{timeframe}.csv"
+            klines = load_csv(csv_path, symbol=symbol, timeframe=timeframe)
+        else:
+            klines = generate_synthetic_klines(
+                symbol=symbol,
+                timeframe=timeframe,
+                candle_count=args.candles,
+                start_price=args.start_price,
+                trend=args.trend,
+                volatility=args.volatility,
+                seed=None if args.seed is None else args.seed + i,
+            )
+        if klines is None:
+            logger.error("No data for %s %s", symbol, timeframe)
+            return None
+        klines_map[(symbol, timeframe)] = klines
+
+    return klines_map
+
+
+def run_sweep_cli(args: argparse.Namespace, base_config: BacktestConfig) -> int:
+    """Run --sweep mode."""
+    klines_map = load_sweep_data(args)
+    if klines_map is None:
+        return 1
+
+    strategies = [s.strip() for s in args.strategies.split(",") if s.strip()]
+    strategy_grid, config_grid = parse_grid_args(args.grid)
+    tasks = build_grid(
+        symbols=sorted({s for s, _ in klines_map}),
+        timeframes=sorted({t for _, t in klines_map}),
+        strategies=strategies,
+        strategy_grid=strategy_grid,
+        config_grid=config_grid,
+    )
+    logger.info("Sweep: %d tasks over %d datasets", len(tasks), len(klines_map))
+
+    results = run_sweep(
+        klines_map,
+        tasks,
+        max_workers=args.workers,
+        jsonl_path=args.results_jsonl,
+        base_config=base_config,
+    )
+
+    if args.json:
+        print(json.dumps([r.to_dict() for r in results], indent=2, default=str))
+    else:
+        print(format_sweep_table(results, top=args.top))
+    return 0
+
+
 def main() -> int:
     """CLI entrypoint."""
     parser = argparse.ArgumentParser(
@@ -199,6 +325,11 @@ Examples:
         action="store_true",
         help="Run all strategies and compare"
     )
+    strategy_group.add_argument(
+        "--sweep",
+        action="store_true",
+        help="Parallel parameter sweep across symbols/timeframes/params"
+    )
 
     # Data source
     data_group = parser.add_mutually_exclusive_group()
@@ -207,6 +338,11 @@ Examples:
         type=str,
         help="Path to CSV file with OHLCV data"
     )
+    data_group.add_argument(
+        "--store",
+        type=str,
+        help="Load OHLCV from a KlinesStore directory (e.g. data/klines)"
+    )
     data_group.add_argument(
         "--candles", "-n",
         type=int,
@@ -273,6 +409,59 @@ Examples:
         default=0.0005,
         help="Slippage percentage (default: 0.0005 = 0.05%%)"
     )
+    parser.add_argument(
+        "--vectorized",
+        action="store_true",
+        help="Only decide on vectorized candidate bars (same trades, faster screening)"
+    )
+
+    # Sweep options
+    parser.add_argument(
+        "--symbols",
+        type=str,
+        default="BTCUSDT",
+        help="Sweep: comma-separated symbols (default: BTCUSDT)"
+    )
+    parser.add_argument(
+        "--timeframes",
+        type=str,
+        default="15m",
+        help="Sweep: comma-separated timeframes (default: 15m)"
+    )
+    parser.add_argument(
+        "--strategies",
+        type=str,
+        default=",".join(SWEEP_STRATEGIES),
+        help="Sweep: comma-separated strategies (default: all)"
+    )
+    parser.add_argument(
+        "--grid",
+        action="append",
+        default=[],
+        help="Sweep: strategy.param=v1,v2 or backtest_field=v1,v2 (repeatable)"
+    )
+    parser.add_argument(
+        "--csv-dir",
+        type=str,
+        help="Sweep: directory with {SYMBOL}-{timeframe}.csv files (default: synthetic)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Sweep: worker processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "--results-jsonl",
+        type=str,
+        help="Sweep: append one JSON line per finished run"
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=None,
+        help="Sweep: show only the top N rows"
+    )
 
     # Output options
     parser.add_argument(
@@ -296,19 +485,23 @@ Examples:
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    # Load data
-    klines = load_data(args)
-    if klines is None:
-        return 1
-
     # Create backtest config
     bt_config = BacktestConfig(
         initial_capital=args.capital,
         commission_pct=args.commission,
         slippage_pct=args.slippage,
         spot_only=True,
+        vectorized=args.vectorized,
     )
 
+    if args.sweep:
+        return run_sweep_cli(args, bt_config)
+
+    # Load data
+    klines = load_data(args)
+    if klines is None:
+        return 1
+
     # Run backtest(s)
     if args.all:
         results = run_all_strategies(klines, bt_config)
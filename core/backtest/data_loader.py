@@ -10,6 +10,7 @@ Historical Data Loader for Backtesting.
 Provides utilities to load OHLCV data from:
 - CSV files (Binance export format)
 - Binance API (via KlinesProvider)
+- Local columnar KlinesStore (memmap, see klines_store.py)
 - Synthetic data generation (for testing)
 
 All loaders are fail-closed: return None on invalid/missing data.
@@ -22,12 +23,15 @@ import time
 from dataclasses import dataclass
 from datetime import datetime, date
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Union
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Union
 
 import numpy as np
 
 from core.market.klines_provider import KlinesResult, KlinesProvider, get_klines_provider
 
+if TYPE_CHECKING:
+    from .klines_store import KlinesStore
+
 logger = logging.getLogger(__name__)
 
 # Valid timeframes (Binance format)
@@ -358,6 +362,7 @@ async def fetch_historical_klines(
     start_date: date,
     end_date: date,
     provider: Optional[KlinesProvider] = None,
+    store: Optional["KlinesStore"] = None,
 ) -> Optional[KlinesResult]:
     """
     Fetch historical klines from Binance API.
@@ -366,24 +371,40 @@ async def fetch_historical_klines(
     recent data. For true historical data, multiple requests
     may be needed with pagination.
 
+    With a KlinesStore, ranges already on disk are served from the
+    store (memmap) and fresh downloads are appended to it, so the same
+    candles are never downloaded twice.
+
     Args:
         symbol: Trading pair (e.g., "BTCUSDT")
         timeframe: Candle interval (e.g., "15m")
         start_date: Start date
         end_date: End date
         provider: Optional KlinesProvider instance
+        store: Optional KlinesStore used as a persistent cache
 
     Returns:
         KlinesResult or None if fetch fails
     """
-    if provider is None:
-        provider = get_klines_provider()
-
     # Calculate required candles
     interval_ms = TIMEFRAME_MS.get(timeframe, 900_000)
     start_ts = datetime.combine(start_date, datetime.min.time()).timestamp()
     end_ts = datetime.combine(end_date, datetime.max.time()).timestamp()
 
+    if store is not None:
+        # Last candle of the range opens one interval before end_ts, but never
+        # after the last closed candle (a range ending "now" is covered once
+        # the store holds everything up to that candle)
+        interval_sec = interval_ms / 1000
+        last_closed_open = (time.time() // interval_sec - 1) * interval_sec
+        last_open = max(start_ts, min(end_ts - interval_sec, last_closed_open))
+        if store.covers(symbol, timeframe, start_ts, last_open):
+            logger.debug("Klines %s %s served from store", symbol, timeframe)
+            return store.load(symbol, timeframe, start_ts, end_ts)
+
+    if provider is None:
+        provider = get_klines_provider()
+
     duration_ms = (end_ts - start_ts) * 1000
     required_candles = int(duration_ms / interval_ms)
 
@@ -408,6 +429,9 @@ async def fetch_historical_klines(
         logger.error("Failed to fetch klines for %s", symbol)
         return None
 
+    if store is not None:
+        store.append(result)
+
     return result
 
 
@@ -493,13 +517,14 @@ class DataLoader:
         Universal data loader. TZ v1.0 compatibility method.
 
         Args:
-            source: "synthetic" | "csv" | "api"
+            source: "synthetic" | "csv" | "api" | "store"
             symbol: Trading pair
             timeframe: Candle interval
             **kwargs: Source-specific arguments:
                 - synthetic: candle_count, start_price, volatility, trend, seed
                 - csv: path (required)
                 - api: limit
+                - store: store_dir, start, end (seconds)
 
         Returns:
             KlinesResult or None on failure
@@ -526,6 +551,11 @@ class DataLoader:
                 timeframe=timeframe,
                 limit=kwargs.get("limit", 500),
             )
+        elif source == "store":
+            from .klines_store import KlinesStore, get_klines_store
+            store_dir = kwargs.get("store_dir")
+            store = KlinesStore(store_dir) if store_dir else get_klines_store()
+            return store.load(symbol, timeframe, kwargs.get("start"), kwargs.get("end"))
         else:
             logger.error("Unknown source: %s", source)
             return None
@@ -39,8 +39,10 @@ from typing import List, Optional, Dict, Any
 
 import numpy as np
 
+from core.ai.indicator_stream import IndicatorStream
 from core.ai.signal_engine import MarketData, SignalDirection
 from core.strategy.base import Position, PositionSide, TradeResult
+from core.strategy.masks import BarSeries, CandidateMasks
 from core.strategy.orchestrator import (
     StrategyOrchestrator,
     OrchestratorDecision,
@@ -91,6 +93,10 @@ class BacktestConfig:
     # Execution
     fill_on_close: bool = True        # Fill at candle close (vs next open)
 
+    # Performance
+    incremental_indicators: bool = True  # Streaming indicator state (O(n) run, identical results)
+    vectorized: bool = False             # Skip decide() outside vectorized candidate bars (identical trades; decisions only hold evaluated bars)
+
 
 @dataclass
 class BacktestResult:
@@ -179,7 +185,10 @@ class BacktestEngine:
     1. Validate input data
     2. Iterate through each bar (from min_candles to end)
     3. Check stop-loss/take-profit hits
-    4. Call orchestrator.decide() for new signals
+    4. Call orchestrator.decide() for new signals (indicators advanced
+       incrementally via IndicatorStream, one bar at a time). In vectorized
+       mode only bars flagged by orchestrator.candidate_masks() are decided;
+       every other bar is a guaranteed HOLD and only marks equity.
     5. Execute entries/exits with commission/slippage
     6. Track equity curve
     7. Calculate final metrics
@@ -207,13 +216,24 @@ class BacktestEngine:
         self._equity_curve: List[float] = []
         self._decisions: List[OrchestratorDecision] = []
         self._current_bar: int = 0
+        self._indicators: Optional[IndicatorStream] = None
+        self._masks: Optional[CandidateMasks] = None
+        self._evaluated_bars: int = 0
+
+    @property
+    def evaluated_bars(self) -> int:
+        """Bars passed to orchestrator.decide() in the last run."""
+        return self._evaluated_bars
 
-    def run(self, klines: KlinesResult) -> BacktestResult:
+    def run(self, klines: KlinesResult, indicators: Optional[IndicatorStream] = None) -> BacktestResult:
         """
         Run backtest on historical data.
 
         Args:
             klines: KlinesResult with OHLCV data
+            indicators: Shared IndicatorStream built over klines (or over a
+                longer series klines is a prefix of); rewound and reused so
+                repeated runs skip indicator work already done
 
         Returns:
             BacktestResult with trades, equity curve, and metrics
@@ -240,6 +260,21 @@ class BacktestEngine:
         self._equity = self._config.initial_capital
         self._equity_curve.append(self._equity)
 
+        if indicators is not None:
+            if indicators.size < klines.candle_count:
+                raise ValueError(
+                    f"Shared indicators cover {indicators.size} candles, klines has {klines.candle_count}"
+                )
+            indicators.rewind()
+            self._indicators = indicators
+        elif self._config.incremental_indicators:
+            self._indicators = IndicatorStream(
+                klines.opens, klines.highs, klines.lows, klines.closes, klines.volumes,
+            )
+
+        if self._config.vectorized:
+            self._masks = self._orchestrator.candidate_masks(BarSeries.from_klines(klines))
+
         n = klines.candle_count
         start_bar = self._config.min_candles
 
@@ -262,6 +297,12 @@ class BacktestEngine:
             # 1. Check stops on existing positions
             self._check_stops(bar_high, bar_low, bar_close, timestamp)
 
+            if self._masks is not None:
+                candidates = self._masks.exit_long if self._positions else self._masks.entry
+                if not candidates[bar_idx]:
+                    self._update_equity(bar_close)
+                    continue
+
             # 2. Build MarketData slice (0 to current bar inclusive)
             market_data = self._build_market_data(klines, bar_idx)
             if market_data is None:
@@ -277,6 +318,7 @@ class BacktestEngine:
                 timeframe=self._config.timeframe,
             )
             self._decisions.append(decision)
+            self._evaluated_bars += 1
 
             # 4. Execute decision
             if decision.action == DecisionAction.ENTER:
@@ -315,12 +357,17 @@ class BacktestEngine:
         self._equity_curve = []
         self._decisions = []
         self._current_bar = 0
+        self._indicators = None
+        self._masks = None
+        self._evaluated_bars = 0
 
     def _build_market_data(self, klines: KlinesResult, bar_idx: int) -> Optional[MarketData]:
         """Build MarketData slice for orchestrator."""
         try:
             # Slice arrays from start to current bar (inclusive)
             end = bar_idx + 1
+            if self._indicators is not None:
+                self._indicators.advance(end)
 
             return MarketData(
                 symbol=klines.symbol,
@@ -330,6 +377,7 @@ class BacktestEngine:
                 lows=klines.lows[:end],
                 closes=klines.closes[:end],
                 volumes=klines.volumes[:end],
+                indicators=self._indicators,
             )
         except (ValueError, IndexError) as e:
             logger.warning("Failed to build MarketData at bar %d: %s", bar_idx, e)
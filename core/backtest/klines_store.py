@@ -0,0 +1,345 @@
+# === AI SIGNATURE ===
+# Created by: Claude (opus-4)
+# Created at: 2026-02-02T14:00:00Z
+# Purpose: Columnar on-disk klines store with memory-mapped loading
+# Security: Local files only, append-only, fail-closed on corrupt index
+# === END SIGNATURE ===
+"""
+Columnar Klines Store.
+
+Local cache of OHLCV history so backtests never parse CSV or download the
+same candles twice.
+
+Layout (one directory per symbol/timeframe):
+    <root>/<SYMBOL>/<timeframe>/
+        candle_times.f64  opens.f64  highs.f64  lows.f64  closes.f64  volumes.f64
+        index.json        {"count", "first_time", "last_time", "ranges": [[start, end], ...], "generation"}
+
+Column files are raw little-endian float64, sorted by open time. index.json is
+the commit point: it is rewritten atomically after the columns are fsynced, and
+readers only map `count` rows. Bytes past `count` (interrupted append) are
+truncated by the next writer.
+
+Candles newer than the stored tail are appended in place. A backfill (candles
+older than the tail, e.g. filling a gap) is merged by open time into a new
+generation of column files (<column>.<generation>.f64); the index switch
+commits it and the previous generation is removed afterwards.
+
+Loading maps the columns with np.memmap (read-only, zero-copy), so a year of
+1m candles opens in milliseconds regardless of size.
+
+Usage:
+    store = KlinesStore("data/klines")
+    store.append(klines)                                  # only new candles are written (backfill merged)
+    result = store.load("BTCUSDT", "1m", start=t0, end=t1)
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+
+from core.io_atomic import FileLock, atomic_write_json
+from core.market.klines_provider import KlinesResult
+from .data_loader import TIMEFRAME_MS, load_csv
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_DIR = Path("data/klines")
+
+COLUMNS = ("candle_times", "opens", "highs", "lows", "closes", "volumes")
+_DTYPE = np.dtype("<f8")
+_ROW_BYTES = _DTYPE.itemsize
+
+
+@dataclass
+class StoreIndex:
+    """Per symbol/timeframe index (time ranges covered by the column files)."""
+    count: int = 0
+    first_time: float = 0.0
+    last_time: float = 0.0
+    ranges: List[List[float]] = field(default_factory=list)  # contiguous [start, end] candle times
+    generation: int = 0  # column file set in use (bumped by backfill merges)
+
+    def to_dict(self) -> Dict:
+        return {
+            "count": self.count,
+            "first_time": self.first_time,
+            "last_time": self.last_time,
+            "ranges": self.ranges,
+            "generation": self.generation,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "StoreIndex":
+        return cls(
+            count=int(data["count"]),
+            first_time=float(data["first_time"]),
+            last_time=float(data["last_time"]),
+            ranges=[list(map(float, r)) for r in data.get("ranges", [])],
+            generation=int(data.get("generation", 0)),
+        )
+
+
+def _missing(stored_times: np.ndarray, times: np.ndarray) -> np.ndarray:
+    """Mask of `times` not present in sorted `stored_times`."""
+    if len(stored_times) == 0:
+        return np.ones(len(times), dtype=bool)
+    pos = np.searchsorted(stored_times, times)
+    return ~((pos < len(stored_times)) & (stored_times[np.minimum(pos, len(stored_times) - 1)] == times))
+
+
+class KlinesStore:
+    """Append-only columnar klines store with memory-mapped reads."""
+
+    def __init__(self, root: Union[str, Path] = DEFAULT_STORE_DIR):
+        self.root = Path(root)
+
+    def _dir(self, symbol: str, timeframe: str) -> Path:
+        return self.root / symbol.upper() / timeframe
+
+    def _column_path(self, symbol: str, timeframe: str, column: str, generation: int = 0) -> Path:
+        suffix = f".{generation}" if generation else ""
+        return self._dir(symbol, timeframe) / f"{column}{suffix}.f64"
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+
+    def get_index(self, symbol: str, timeframe: str) -> StoreIndex:
+        """Read index (empty index if nothing stored)."""
+        path = self._dir(symbol, timeframe) / "index.json"
+        if not path.exists():
+            return StoreIndex()
+        try:
+            return StoreIndex.from_dict(json.loads(path.read_text(encoding="utf-8")))
+        except (ValueError, KeyError, TypeError) as e:
+            # Fail-closed: a corrupt index must not be silently treated as empty
+            raise ValueError(f"Corrupt klines index {path}: {e}") from e
+
+    def covers(self, symbol: str, timeframe: str, start: float, end: float) -> bool:
+        """True if [start, end] lies inside one contiguous stored range."""
+        index = self.get_index(symbol, timeframe)
+        return any(r[0] <= start and end <= r[1] for r in index.ranges)
+
+    def list_datasets(self) -> List[tuple]:
+        """All stored (symbol, timeframe) pairs."""
+        if not self.root.exists():
+            return []
+        return sorted(
+            (p.parent.parent.name, p.parent.name)
+            for p in self.root.glob("*/*/index.json")
+        )
+
+    # ------------------------------------------------------------------
+    # Write
+    # ------------------------------------------------------------------
+
+    def append(self, klines: KlinesResult) -> int:
+        """
+        Add candles to the store, merged by open time.
+
+        Candles already stored (same open time) are skipped, so appending
+        an overlapping download is idempotent. Candles older than the stored
+        tail (backfill) are merged in and the covered ranges recomputed.
+
+        Returns:
+            Number of candles written
+        """
+        if klines is None or klines.candle_count == 0:
+            return 0
+
+        symbol, timeframe = klines.symbol, klines.timeframe
+        directory = self._dir(symbol, timeframe)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        with FileLock(directory / ".lock"):
+            index = self.get_index(symbol, timeframe)
+            times = np.asarray(klines.candle_times, dtype=_DTYPE)
+
+            order = np.argsort(times, kind="stable")
+            times = times[order]
+            keep = np.concatenate(([True], np.diff(times) > 0))  # drop duplicate timestamps
+            rows = order[keep]
+            new_times = times[keep]
+            new_columns = {
+                column: new_times if column == "candle_times" else np.asarray(getattr(klines, column), dtype=_DTYPE)[rows]
+                for column in COLUMNS
+            }
+
+            written = 0
+            if index.count and new_times[0] <= index.last_time:
+                older = new_times <= index.last_time
+                stored_times = np.memmap(
+                    self._column_path(symbol, timeframe, "candle_times", index.generation),
+                    dtype=_DTYPE, mode="r", shape=(index.count,),
+                )
+                if _missing(stored_times, new_times[older]).any():
+                    # Backfill: rewrite merged columns (tail candles included)
+                    written = self._merge(symbol, timeframe, index, new_columns)
+                    new_columns = None
+                else:
+                    new_columns = {column: values[~older] for column, values in new_columns.items()}
+                del stored_times
+
+            if new_columns is not None and len(new_columns["candle_times"]):
+                written = self._append_tail(symbol, timeframe, index, new_columns)
+
+        if written:
+            logger.debug("KlinesStore: wrote %d candles to %s %s", written, symbol, timeframe)
+        return written
+
+    def _append_tail(self, symbol: str, timeframe: str, index: StoreIndex, new_columns: Dict[str, np.ndarray]) -> int:
+        """Append candles newer than the stored tail to the current column files."""
+        new_times = new_columns["candle_times"]
+        for column in COLUMNS:
+            path = self._column_path(symbol, timeframe, column, index.generation)
+            if index.count and path.stat().st_size < index.count * _ROW_BYTES:
+                raise ValueError(f"Klines column {path} shorter than index count {index.count}")
+            with open(path, "ab") as f:
+                # Drop bytes from an interrupted append before writing
+                f.truncate(index.count * _ROW_BYTES)
+                f.write(new_columns[column].tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+
+        self._extend_ranges(index, new_times, timeframe)
+        if not index.count:
+            index.first_time = float(new_times[0])
+        index.count += len(new_times)
+        index.last_time = float(new_times[-1])
+        atomic_write_json(self._dir(symbol, timeframe) / "index.json", index.to_dict())
+        return len(new_times)
+
+    def _merge(self, symbol: str, timeframe: str, index: StoreIndex, new_columns: Dict[str, np.ndarray]) -> int:
+        """Merge candles overlapping/preceding the stored data into a new column generation."""
+        old_columns = {}
+        for column in COLUMNS:
+            path = self._column_path(symbol, timeframe, column, index.generation)
+            old_columns[column] = np.fromfile(path, dtype=_DTYPE, count=index.count)
+            if len(old_columns[column]) < index.count:
+                raise ValueError(f"Klines column {path} shorter than index count {index.count}")
+
+        old_times = old_columns["candle_times"]
+        new_times = new_columns["candle_times"]
+        fresh = _missing(old_times, new_times)
+        if not fresh.any():
+            return 0
+
+        # Stored candles win on equal open time; stable sort keeps them first
+        merged_times = np.concatenate((old_times, new_times[fresh]))
+        order = np.argsort(merged_times, kind="stable")
+
+        old_generation = index.generation
+        generation = old_generation + 1
+        for column in COLUMNS:
+            values = np.concatenate((old_columns[column], new_columns[column][fresh]))[order]
+            with open(self._column_path(symbol, timeframe, column, generation), "wb") as f:
+                f.write(values.tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+
+        merged_times = merged_times[order]
+        index.generation = generation
+        index.count = len(merged_times)
+        index.first_time = float(merged_times[0])
+        index.last_time = float(merged_times[-1])
+        index.ranges = []
+        self._extend_ranges(index, merged_times, timeframe)
+        atomic_write_json(self._dir(symbol, timeframe) / "index.json", index.to_dict())
+
+        for column in COLUMNS:
+            try:
+                self._column_path(symbol, timeframe, column, old_generation).unlink()
+            except OSError:
+                pass
+        return int(fresh.sum())
+
+    @staticmethod
+    def _extend_ranges(index: StoreIndex, new_times: np.ndarray, timeframe: str) -> None:
+        """Merge new candle times into the contiguous-range list."""
+        step = TIMEFRAME_MS.get(timeframe, 900_000) / 1000
+        tolerance = step * 1.1
+        gaps = np.nonzero(np.diff(new_times) > tolerance)[0]
+        starts = np.concatenate(([0], gaps + 1))
+        ends = np.concatenate((gaps, [len(new_times) - 1]))
+        for s, e in zip(starts, ends):
+            start, end = float(new_times[s]), float(new_times[e])
+            if index.ranges and start - index.ranges[-1][1] <= tolerance:
+                index.ranges[-1][1] = end
+            else:
+                index.ranges.append([start, end])
+
+    def import_csv(self, path: Union[str, Path], symbol: str, timeframe: str) -> int:
+        """One-time import of a CSV export (parsed once, then served from the store)."""
+        klines = load_csv(path, symbol, timeframe)
+        if klines is None:
+            return 0
+        return self.append(klines)
+
+    # ------------------------------------------------------------------
+    # Read
+    # ------------------------------------------------------------------
+
+    def load(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> Optional[KlinesResult]:
+        """
+        Load stored candles in [start, end] (seconds) as read-only memmap views.
+
+        Returns:
+            KlinesResult or None if nothing is stored for the range
+        """
+        index = self.get_index(symbol, timeframe)
+        if index.count == 0:
+            return None
+
+        columns = {
+            column: np.memmap(
+                self._column_path(symbol, timeframe, column, index.generation),
+                dtype=_DTYPE, mode="r", shape=(index.count,),
+            ).view(np.ndarray)
+            for column in COLUMNS
+        }
+
+        times = columns["candle_times"]
+        lo = 0 if start is None else int(np.searchsorted(times, start, side="left"))
+        hi = index.count if end is None else int(np.searchsorted(times, end, side="right"))
+        if hi <= lo:
+            return None
+
+        return KlinesResult(
+            symbol=symbol,
+            timeframe=timeframe,
+            timestamp=time.time(),
+            opens=columns["opens"][lo:hi],
+            highs=columns["highs"][lo:hi],
+            lows=columns["lows"][lo:hi],
+            closes=columns["closes"][lo:hi],
+            volumes=columns["volumes"][lo:hi],
+            candle_times=times[lo:hi],
+            is_stale=False,
+            from_cache=True,
+        )
+
+
+# Singleton instance
+_store_instance: Optional[KlinesStore] = None
+
+
+def get_klines_store() -> KlinesStore:
+    """Get singleton KlinesStore at DEFAULT_STORE_DIR."""
+    global _store_instance
+    if _store_instance is None:
+        _store_instance = KlinesStore()
+    return _store_instance
@@ -0,0 +1,390 @@
+# === AI SIGNATURE ===
+# Created by: Claude (opus-4)
+# Created at: 2026-02-02T12:00:00Z
+# Purpose: Parallel parameter-sweep / multi-symbol backtest runner
+# Security: Fail-closed per task, no real trades, read-only shared data
+# === END SIGNATURE ===
+"""
+Parallel Backtest Sweep.
+
+Fans a grid of (symbol, timeframe, strategy, strategy params, BacktestConfig
+overrides) out over a ProcessPoolExecutor.
+
+Klines are written once per (symbol, timeframe) to a .npy file and opened by
+workers with np.load(mmap_mode="r"), so every process shares the same page
+cache instead of receiving a pickled copy per task. Tasks themselves only
+carry names and small parameter dicts.
+
+Usage:
+    from core.backtest.sweep import build_grid, run_sweep, format_sweep_table
+
+    tasks = build_grid(
+        symbols=["BTCUSDT", "ETHUSDT"],
+        timeframes=["15m"],
+        strategies=["momentum", "breakout"],
+        strategy_grid={"momentum": {"rsi_oversold": [25, 30, 35]}},
+        config_grid={"position_size_pct": [0.01, 0.02]},
+    )
+    results = run_sweep(klines_map, tasks, max_workers=8, jsonl_path="sweep.jsonl")
+    print(format_sweep_table(results))
+"""
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field, asdict, fields
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from core.market.klines_provider import KlinesResult
+from core.strategy.orchestrator import StrategyOrchestrator, OrchestratorConfig
+from core.strategy.momentum import MomentumStrategy, MomentumConfig
+from core.strategy.breakout import BreakoutStrategy, BreakoutConfig
+from core.strategy.mean_reversion import MeanReversionStrategy, MeanReversionConfig
+from .engine import BacktestEngine, BacktestConfig, BacktestResult
+
+logger = logging.getLogger(__name__)
+
+# Strategy name -> (strategy class, config class). Same defaults as the CLI registry:
+# min_confidence=0.02 (synthetic data produces weak signals).
+SWEEP_STRATEGIES = {
+    "momentum": (MomentumStrategy, MomentumConfig),
+    "breakout": (BreakoutStrategy, BreakoutConfig),
+    "mean_reversion": (MeanReversionStrategy, MeanReversionConfig),
+}
+DEFAULT_STRATEGY_PARAMS = {"min_confidence": 0.02}
+DEFAULT_ORCHESTRATOR_MIN_CONFIDENCE = 0.02
+
+# Row order of the shared klines matrix
+_KLINES_ROWS = ("candle_times", "opens", "highs", "lows", "closes", "volumes")
+
+
+@dataclass(frozen=True)
+class SweepTask:
+    """Single backtest run in a sweep (small and cheap to pickle)."""
+    task_id: int
+    symbol: str
+    timeframe: str
+    strategy: str
+    strategy_params: Dict[str, Any] = field(default_factory=dict)
+    config_overrides: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class SweepResult:
+    """Summary metrics of one sweep task."""
+    task_id: int
+    symbol: str
+    timeframe: str
+    strategy: str
+    strategy_params: Dict[str, Any]
+    config_overrides: Dict[str, Any]
+    total_trades: int = 0
+    win_rate: float = 0.0
+    profit_factor: float = 0.0
+    sharpe_ratio: float = 0.0
+    max_drawdown: float = 0.0
+    total_return_pct: float = 0.0
+    final_equity: float = 0.0
+    elapsed_sec: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def build_grid(
+    symbols: List[str],
+    timeframes: List[str],
+    strategies: List[str],
+    strategy_grid: Optional[Dict[str, Dict[str, List[Any]]]] = None,
+    config_grid: Optional[Dict[str, List[Any]]] = None,
+) -> List[SweepTask]:
+    """
+    Expand a parameter grid into sweep tasks (cartesian product).
+
+    Args:
+        symbols: Symbols to test
+        timeframes: Timeframes to test
+        strategies: Strategy names (keys of SWEEP_STRATEGIES)
+        strategy_grid: Per-strategy {param: [values]} for the strategy config
+        config_grid: {BacktestConfig field: [values]}
+
+    Returns:
+        List of SweepTask with sequential task_id
+    """
+    strategy_grid = strategy_grid or {}
+    config_grid = config_grid or {}
+
+    unknown = [s for s in strategies if s not in SWEEP_STRATEGIES]
+    if unknown:
+        raise ValueError(f"Unknown strategies: {unknown}. Available: {list(SWEEP_STRATEGIES)}")
+
+    valid_config_fields = {f.name for f in fields(BacktestConfig)}
+    bad_fields = set(config_grid) - valid_config_fields
+    if bad_fields:
+        raise ValueError(f"Unknown BacktestConfig fields: {sorted(bad_fields)}")
+
+    for strategy, grid in strategy_grid.items():
+        if strategy not in SWEEP_STRATEGIES:
+            raise ValueError(f"Unknown strategy in strategy_grid: {strategy}. Available: {list(SWEEP_STRATEGIES)}")
+        valid_params = {f.name for f in fields(SWEEP_STRATEGIES[strategy][1])}
+        bad_params = set(grid) - valid_params
+        if bad_params:
+            raise ValueError(f"Unknown {strategy} parameters: {sorted(bad_params)}")
+
+    config_combos = _expand(config_grid)
+    tasks: List[SweepTask] = []
+    for symbol, timeframe, strategy in itertools.product(symbols, timeframes, strategies):
+        for params in _expand(strategy_grid.get(strategy, {})):
+            for overrides in config_combos:
+                tasks.append(SweepTask(
+                    task_id=len(tasks),
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    strategy=strategy,
+                    strategy_params=params,
+                    config_overrides=overrides,
+                ))
+    return tasks
+
+
+def _expand(grid: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """Cartesian product of a {key: [values]} grid ([{}] for an empty grid)."""
+    if not grid:
+        return [{}]
+    keys = sorted(grid)
+    return [dict(zip(keys, combo)) for combo in itertools.product(*(grid[k] for k in keys))]
+
+
+# =============================================================================
+# Shared klines (memmap)
+# =============================================================================
+
+def klines_key(symbol: str, timeframe: str) -> str:
+    """Key of a (symbol, timeframe) dataset in the share_klines() mapping."""
+    return f"{symbol}_{timeframe}"
+
+
+def share_klines(klines_map: Dict[Tuple[str, str], KlinesResult], directory: Union[str, Path]) -> Dict[str, str]:
+    """
+    Write klines to .npy files for zero-copy loading in worker processes.
+
+    Returns:
+        {data_key: path} mapping passed to workers
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = {}
+    for (symbol, timeframe), klines in klines_map.items():
+        matrix = np.vstack([np.asarray(getattr(klines, row), dtype=np.float64) for row in _KLINES_ROWS])
+        path = directory / f"{klines_key(symbol, timeframe)}.npy"
+        np.save(path, matrix)
+        paths[klines_key(symbol, timeframe)] = str(path)
+    return paths
+
+
+# Per-process cache of memory-mapped klines (filled lazily in workers)
+_WORKER_KLINES: Dict[str, KlinesResult] = {}
+
+
+def attach_klines(path: str, symbol: str, timeframe: str) -> KlinesResult:
+    """Open shared klines read-only (memmap, no copy), cached per process."""
+    cached = _WORKER_KLINES.get(path)
+    if cached is not None:
+        return cached
+    matrix = np.load(path, mmap_mode="r").view(np.ndarray)
+    rows = dict(zip(_KLINES_ROWS, matrix))
+    klines = KlinesResult(
+        symbol=symbol,
+        timeframe=timeframe,
+        timestamp=time.time(),
+        opens=rows["opens"],
+        highs=rows["highs"],
+        lows=rows["lows"],
+        closes=rows["closes"],
+        volumes=rows["volumes"],
+        candle_times=rows["candle_times"],
+    )
+    _WORKER_KLINES[path] = klines
+    return klines
+
+
+def create_sweep_strategy(name: str, params: Dict[str, Any]):
+    """Create strategy instance with DEFAULT_STRATEGY_PARAMS overridden by params."""
+    strategy_cls, config_cls = SWEEP_STRATEGIES[name]
+    return strategy_cls(config_cls(**{**DEFAULT_STRATEGY_PARAMS, **params}))
+
+
+def run_sweep_task(task: SweepTask, klines: KlinesResult, base_config: Optional[BacktestConfig] = None) -> SweepResult:
+    """Run one sweep task in the current process (fail-closed: errors are recorded)."""
+    result = _new_result(task)
+    start = time.time()
+    try:
+        config_values = asdict(base_config or BacktestConfig())
+        config_values.update(task.config_overrides)
+        config_values["timeframe"] = task.timeframe
+        config = BacktestConfig(**config_values)
+
+        orchestrator = StrategyOrchestrator(
+            [create_sweep_strategy(task.strategy, task.strategy_params)],
+            OrchestratorConfig(min_confidence=DEFAULT_ORCHESTRATOR_MIN_CONFIDENCE),
+        )
+        bt = BacktestEngine(orchestrator, config).run(klines)
+        _fill_metrics(result, bt)
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    result.elapsed_sec = time.time() - start
+    return result
+
+
+def _new_result(task: SweepTask, error: Optional[str] = None) -> SweepResult:
+    return SweepResult(
+        task_id=task.task_id,
+        symbol=task.symbol,
+        timeframe=task.timeframe,
+        strategy=task.strategy,
+        strategy_params=dict(task.strategy_params),
+        config_overrides=dict(task.config_overrides),
+        error=error,
+    )
+
+
+def _fill_metrics(result: SweepResult, bt: BacktestResult) -> None:
+    if not bt.validation.is_valid:
+        result.error = "INVALID_DATA: " + "; ".join(bt.validation.errors)
+        return
+    result.total_trades = bt.total_trades
+    result.win_rate = float(bt.win_rate)
+    result.profit_factor = float(bt.profit_factor)
+    result.sharpe_ratio = float(bt.sharpe_ratio)
+    result.max_drawdown = float(bt.max_drawdown)
+    result.total_return_pct = float(bt.total_return_pct)
+    result.final_equity = float(bt.final_equity)
+
+
+def _worker_run(task: SweepTask, path: str, base_config: Optional[BacktestConfig]) -> SweepResult:
+    """Process-pool entrypoint (top-level for pickling)."""
+    klines = attach_klines(path, task.symbol, task.timeframe)
+    return run_sweep_task(task, klines, base_config)
+
+
+def run_sweep(
+    klines_map: Dict[Tuple[str, str], KlinesResult],
+    tasks: List[SweepTask],
+    max_workers: Optional[int] = None,
+    jsonl_path: Optional[Union[str, Path]] = None,
+    base_config: Optional[BacktestConfig] = None,
+    share_dir: Optional[Union[str, Path]] = None,
+) -> List[SweepResult]:
+    """
+    Run sweep tasks in parallel.
+
+    Args:
+        klines_map: {(symbol, timeframe): KlinesResult} for every task
+        tasks: Tasks from build_grid()
+        max_workers: Process count (None = os.cpu_count(), 1 = run inline)
+        jsonl_path: Append one JSON line per finished task (as they complete)
+        base_config: BacktestConfig the per-task overrides are applied to
+        share_dir: Directory for shared .npy files (default: temp dir, removed after)
+
+    Returns:
+        Results ranked by rank_results()
+    """
+    missing = {(t.symbol, t.timeframe) for t in tasks} - set(klines_map)
+    if missing:
+        raise ValueError(f"No klines for: {sorted(missing)}")
+
+    workers = max_workers or os.cpu_count() or 1
+    results: List[SweepResult] = []
+    jsonl = open(jsonl_path, "a", encoding="utf-8") if jsonl_path else None
+
+    def _record(res: SweepResult) -> None:
+        results.append(res)
+        if jsonl:
+            jsonl.write(json.dumps(res.to_dict(), default=str) + "\n")
+            jsonl.flush()
+        if res.error:
+            logger.warning("Sweep task %d failed: %s", res.task_id, res.error)
+
+    started = time.time()
+    try:
+        if workers <= 1:
+            for task in tasks:
+                _record(run_sweep_task(task, klines_map[(task.symbol, task.timeframe)], base_config))
+        else:
+            owns_dir = share_dir is None
+            directory = Path(share_dir) if share_dir else Path(tempfile.mkdtemp(prefix="hope_sweep_"))
+            try:
+                paths = share_klines(klines_map, directory)
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    futures = {
+                        pool.submit(_worker_run, task, paths[klines_key(task.symbol, task.timeframe)], base_config): task
+                        for task in tasks
+                    }
+                    for future in as_completed(futures):
+                        try:
+                            res = future.result()
+                        except Exception as e:
+                            # Worker crash (OOM, BrokenProcessPool): record it, keep the other results
+                            res = _new_result(futures[future], f"{type(e).__name__}: {e}")
+                        _record(res)
+            finally:
+                if owns_dir:
+                    shutil.rmtree(directory, ignore_errors=True)
+    finally:
+        if jsonl:
+            jsonl.close()
+
+    logger.info(
+        "Sweep complete: %d tasks in %.1fs (%d workers, %d failed)",
+        len(results), time.time() - started, workers, sum(1 for r in results if not r.ok),
+    )
+    return rank_results(results)
+
+
+def rank_results(results: List[SweepResult], key: str = "sharpe_ratio") -> List[SweepResult]:
+    """Sort results best-first by `key`; failed tasks go last."""
+    return sorted(results, key=lambda r: (r.ok, getattr(r, key)), reverse=True)
+
+
+def format_sweep_table(results: List[SweepResult], top: Optional[int] = None) -> str:
+    """Format ranked comparison table (same layout as the CLI strategy comparison)."""
+    width = 120
+    lines = [
+        "=" * width,
+        "SWEEP RESULTS (ranked by Sharpe)",
+        "=" * width,
+        f"{'#':>4} {'Symbol':<10} {'TF':<4} {'Strategy':<15} {'Return':>9} {'Sharpe':>8} "
+        f"{'MaxDD':>8} {'WinRate':>8} {'Trades':>7}  Params",
+        "-" * width,
+    ]
+    shown = results[:top] if top else results
+    for rank, r in enumerate(shown, 1):
+        params = {**r.strategy_params, **r.config_overrides}
+        param_str = ", ".join(f"{k}={v}" for k, v in sorted(params.items())) or "-"
+        if not r.ok:
+            lines.append(f"{rank:>4} {r.symbol:<10} {r.timeframe:<4} {r.strategy:<15} ERROR: {r.error}")
+            continue
+        lines.append(
+            f"{rank:>4} {r.symbol:<10} {r.timeframe:<4} {r.strategy:<15} "
+            f"{r.total_return_pct:>8.2f}% "
+            f"{r.sharpe_ratio:>8.3f} "
+            f"{r.max_drawdown:>7.2%} "
+            f"{r.win_rate:>7.2%} "
+            f"{r.total_trades:>7}  {param_str}"
+        )
+    lines.append("=" * width)
+    return "\n".join(lines)
@@ -0,0 +1,122 @@
+# === AI SIGNATURE ===
+# Created by: Claude (opus-4)
+# Created at: 2026-02-02T16:00:00Z
+# Purpose: Consistency check for the vectorized backtest mode
+# Security: Fail-closed, deterministic execution
+# === END SIGNATURE ===
+"""
+Vectorized Backtest Consistency Check.
+
+BacktestConfig(vectorized=True) evaluates regime and entry/exit conditions
+as NumPy masks over the whole series and only calls orchestrator.decide()
+on candidate bars. Masks are supersets, so trades and the equity curve must
+match the event-driven run exactly; this module runs both and reports any
+divergence (use it when adding a strategy or changing a candidate mask).
+
+Usage:
+    report = check_vectorized_consistency(
+        klines, lambda: StrategyOrchestrator([MomentumStrategy()]),
+    )
+    assert report.is_consistent, report.mismatches
+"""
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, List, Optional
+
+from core.market.klines_provider import KlinesResult
+from core.strategy.orchestrator import StrategyOrchestrator
+from .engine import BacktestConfig, BacktestEngine, BacktestResult
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class VectorizedConsistency:
+    """Event-driven vs vectorized run of the same backtest."""
+    event_trades: int
+    vectorized_trades: int
+    total_bars: int
+    evaluated_bars: int
+    event_seconds: float
+    vectorized_seconds: float
+    mismatches: List[str] = field(default_factory=list)
+
+    @property
+    def is_consistent(self) -> bool:
+        return not self.mismatches
+
+    @property
+    def speedup(self) -> float:
+        return self.event_seconds / self.vectorized_seconds if self.vectorized_seconds > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "consistent": self.is_consistent,
+            "event_trades": self.event_trades,
+            "vectorized_trades": self.vectorized_trades,
+            "total_bars": self.total_bars,
+            "evaluated_bars": self.evaluated_bars,
+            "speedup": round(self.speedup, 2),
+            "mismatches": self.mismatches,
+        }
+
+
+def _compare(event: BacktestResult, vectorized: BacktestResult) -> List[str]:
+    mismatches = []
+    if len(event.trades) != len(vectorized.trades):
+        mismatches.append(f"trade count {len(event.trades)} != {len(vectorized.trades)}")
+    for i, (a, b) in enumerate(zip(event.trades, vectorized.trades)):
+        if a != b:
+            mismatches.append(
+                f"trade {i}: entry {a.entry_time}/{b.entry_time} exit {a.exit_time}/{b.exit_time} "
+                f"reason {a.exit_reason}/{b.exit_reason}"
+            )
+            break
+    if event.equity_curve != vectorized.equity_curve:
+        mismatches.append("equity curve differs")
+    return mismatches
+
+
+def check_vectorized_consistency(
+    klines: KlinesResult,
+    make_orchestrator: Callable[[], StrategyOrchestrator],
+    config: Optional[BacktestConfig] = None,
+) -> VectorizedConsistency:
+    """
+    Run the same backtest event-driven and vectorized and compare.
+
+    Args:
+        klines: OHLCV data
+        make_orchestrator: Factory for a fresh orchestrator (strategies keep
+            state, so each run needs its own instances)
+        config: Base config (vectorized flag is overridden per run)
+
+    Returns:
+        VectorizedConsistency (is_consistent False lists the first divergences)
+    """
+    base = config or BacktestConfig()
+
+    started = time.perf_counter()
+    event = BacktestEngine(make_orchestrator(), replace(base, vectorized=False)).run(klines)
+    event_seconds = time.perf_counter() - started
+
+    engine = BacktestEngine(make_orchestrator(), replace(base, vectorized=True))
+    started = time.perf_counter()
+    vectorized = engine.run(klines)
+    vectorized_seconds = time.perf_counter() - started
+
+    report = VectorizedConsistency(
+        event_trades=len(event.trades),
+        vectorized_trades=len(vectorized.trades),
+        total_bars=max(0, klines.candle_count - base.min_candles),
+        evaluated_bars=engine.evaluated_bars,
+        event_seconds=event_seconds,
+        vectorized_seconds=vectorized_seconds,
+        mismatches=_compare(event, vectorized),
+    )
+    if not report.is_consistent:
+        logger.warning("Vectorized backtest diverged: %s", report.mismatches)
+    return report
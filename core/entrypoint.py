@@ -384,6 +384,10 @@ class TradingContext:
                           snapshot.return_24h_pct, snapshot.current_drawdown_pct)
             except Exception as e:
                 logger.warning("Failed to get performance snapshot: %s", e)
+            try:
+                self._performance_tracker.close()  # Flush write-behind state
+            except Exception as e:
+                logger.warning("Failed to flush performance state: %s", e)
 
 
 class LiveTradingRunner:
@@ -1,5 +1,5 @@
 """
-HOPE/NORE Event Journal v1.0
+HOPE/NORE Event Journal v1.1
 
 Atomic append-only JSONL journal with cursor/ack mechanism.
 Ensures reliable, idempotent event delivery.
@@ -12,10 +12,19 @@ Design principles:
 - sha256 prefix for self-documenting format
 
 File format:
-- events.jsonl: append-only event log
-- cursors.json: {consumer_id: last_processed_event_id}
+- events.jsonl: active segment, one event per line with a "_seq" field
+  (monotonically increasing sequence number across segments)
+- events.<base_seq>.jsonl: sealed segments, rotated when the active one
+  exceeds SEGMENT_MAX_BYTES; only the newest MAX_SEGMENTS are kept
+- cursors.json: {consumer_id: {"event_id", "seq", "segment", "offset"}}
+  where (segment, offset) is the byte position just past the acked event
 - deadletter.jsonl: events that failed delivery
 
+Startup reads only the last MAX_EVENTS_IN_MEMORY lines from the end of the
+newest segments. get_pending resumes from memory by sequence number, or
+seeks straight to the cursor's byte offset for consumers that fell behind
+the in-memory window. A legacy journal without "_seq" is rewritten once.
+
 Usage:
     from core.event_journal import EventJournal
 
@@ -39,7 +48,7 @@ import time
 from dataclasses import dataclass
 from pathlib import Path
 from threading import Lock
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Tuple
 
 from core.event_contract import Event
 
@@ -54,6 +63,12 @@ DEADLETTER_FILE = STATE_DIR / "deadletter.jsonl"
 # Limits
 MAX_EVENTS_IN_MEMORY = 1000
 MAX_PENDING_PER_CONSUMER = 100
+SEGMENT_MAX_BYTES = 16 * 1024 * 1024  # Rotate active segment past this size
+MAX_SEGMENTS = 16  # Sealed segments kept on disk
+MAX_DISK_POSITIONS = 10_000  # Positions of events served from disk (for ack)
+
+_TAIL_BLOCK = 64 * 1024
+_TRIM_SLACK = MAX_EVENTS_IN_MEMORY // 4
 
 
 @dataclass
@@ -65,6 +80,14 @@ class JournalStats:
     last_event_ts: float
 
 
+@dataclass(frozen=True)
+class JournalPosition:
+    """Event position: sequence number, segment (its base seq) and byte offset past the line."""
+    seq: int
+    segment: int
+    offset: int
+
+
 class EventJournal:
     """
     Atomic append-only event journal with cursor tracking.
@@ -77,16 +100,28 @@ class EventJournal:
         events_path: Path = EVENTS_FILE,
         cursors_path: Path = CURSORS_FILE,
         deadletter_path: Path = DEADLETTER_FILE,
+        segment_max_bytes: int = SEGMENT_MAX_BYTES,
+        max_segments: int = MAX_SEGMENTS,
     ):
         self._events_path = events_path
         self._cursors_path = cursors_path
         self._deadletter_path = deadletter_path
+        self._segment_max_bytes = segment_max_bytes
+        self._max_segments = max_segments
         self._lock = Lock()
 
-        # In-memory cache
+        # In-memory cache (parallel lists, oldest first)
         self._events: List[Event] = []
-        self._event_ids: Set[str] = set()
-        self._cursors: Dict[str, str] = {}  # consumer_id -> last_acked_event_id
+        self._positions: List[JournalPosition] = []
+        self._by_id: Dict[str, JournalPosition] = {}
+        self._disk_positions: Dict[str, JournalPosition] = {}
+        self._cursors: Dict[str, JournalPosition] = {}  # consumer_id -> last acked position
+        self._cursor_ids: Dict[str, str] = {}  # consumer_id -> last acked event_id
+
+        # Active segment
+        self._next_seq = 0
+        self._active_base = 0
+        self._active_size = 0
 
         # Ensure directories exist
         self._events_path.parent.mkdir(parents=True, exist_ok=True)
@@ -95,36 +130,214 @@ class EventJournal:
         self._load_events()
         self._load_cursors()
 
-    def _load_events(self) -> None:
-        """Load events from JSONL file."""
-        if not self._events_path.exists():
-            return
+    # =========================================================================
+    # SEGMENTS
+    # =========================================================================
+
+    def _segment_path(self, base: int) -> Path:
+        """Path of segment starting at sequence `base`."""
+        if base == self._active_base:
+            return self._events_path
+        return self._events_path.with_name(
+            f"{self._events_path.stem}.{base:012d}{self._events_path.suffix}"
+        )
+
+    def _sealed_segments(self) -> List[int]:
+        """Base sequence numbers of sealed segments, oldest first."""
+        stem, suffix = self._events_path.stem, self._events_path.suffix
+        bases = []
+        for path in self._events_path.parent.glob(f"{stem}.*{suffix}"):
+            middle = path.name[len(stem) + 1:-len(suffix)]
+            if middle.isdigit():
+                bases.append(int(middle))
+        return sorted(bases)
+
+    def _rotate(self) -> None:
+        """Seal the active segment and drop segments beyond max_segments."""
+        sealed = self._events_path.with_name(
+            f"{self._events_path.stem}.{self._active_base:012d}{self._events_path.suffix}"
+        )
+        os.replace(self._events_path, sealed)
+        logger.info("Rotated journal segment %d (%d bytes)", self._active_base, self._active_size)
+        self._active_base = self._next_seq
+        self._active_size = 0
+
+        bases = self._sealed_segments()
+        for base in bases[:max(0, len(bases) - self._max_segments)]:
+            try:
+                self._segment_path(base).unlink()
+                logger.info("Dropped journal segment %d", base)
+            except OSError as e:
+                logger.warning("Failed to drop journal segment %d: %s", base, e)
+
+    @staticmethod
+    def _encode(event: Event, seq: int) -> bytes:
+        data = event.to_dict()
+        data["_seq"] = seq
+        return (json.dumps(data, ensure_ascii=False, sort_keys=True) + "\n").encode("utf-8")
+
+    @staticmethod
+    def _decode(raw: bytes) -> Tuple[Optional[int], Event]:
+        data = json.loads(raw)
+        return data.pop("_seq", None), Event.from_dict(data)
+
+    @staticmethod
+    def _read_tail(path: Path, n: int) -> List[Tuple[int, bytes]]:
+        """Last n complete lines of path as (end_offset, line), reading backwards."""
+        if n <= 0:
+            return []
+        with open(path, "rb") as f:
+            pos = f.seek(0, os.SEEK_END)
+            buf = b""
+            while pos > 0 and buf.count(b"\n") <= n:
+                step = min(_TAIL_BLOCK, pos)
+                pos -= step
+                f.seek(pos)
+                buf = f.read(step) + buf
+
+        lines = []
+        offset = pos
+        parts = buf.split(b"\n")
+        for i, part in enumerate(parts[:-1]):  # last part is the unterminated tail
+            offset += len(part) + 1
+            if i == 0 and pos > 0:
+                continue  # partial line at block boundary
+            if part.strip():
+                lines.append((offset, part))
+        return lines[-n:]
+
+    # =========================================================================
+    # LOADING
+    # =========================================================================
 
+    def _load_events(self) -> None:
+        """Load the last MAX_EVENTS_IN_MEMORY events from the segment tails."""
         try:
-            with open(self._events_path, "r", encoding="utf-8") as f:
-                for line_no, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line:
-                        continue
+            self._migrate_legacy_events()
+
+            if self._events_path.exists():
+                self._truncate_torn_tail(self._events_path)
+                self._active_size = self._events_path.stat().st_size
+                base = self._first_seq(self._events_path)
+                if base is not None:
+                    self._active_base = base
+
+            segments = [(b, self._events_path.with_name(
+                f"{self._events_path.stem}.{b:012d}{self._events_path.suffix}"
+            )) for b in self._sealed_segments()]
+            if self._active_size:
+                segments.append((self._active_base, self._events_path))
+
+            entries: List[Tuple[JournalPosition, Event]] = []
+            for base, path in reversed(segments):
+                chunk = []
+                for end_offset, raw in self._read_tail(path, MAX_EVENTS_IN_MEMORY - len(entries)):
                     try:
-                        data = json.loads(line)
-                        event = Event.from_dict(data)
-                        if event.event_id not in self._event_ids:
-                            self._events.append(event)
-                            self._event_ids.add(event.event_id)
+                        seq, event = self._decode(raw)
                     except (json.JSONDecodeError, KeyError) as e:
-                        logger.warning("Skipping malformed event at line %d: %s", line_no, e)
+                        logger.warning("Skipping malformed event in segment %d: %s", base, e)
+                        continue
+                    chunk.append((JournalPosition(seq, base, end_offset), event))
+                entries[:0] = chunk
+                if len(entries) >= MAX_EVENTS_IN_MEMORY:
+                    break
+
+            for position, event in entries:
+                if event.event_id not in self._by_id:
+                    self._events.append(event)
+                    self._positions.append(position)
+                    self._by_id[event.event_id] = position
 
-            # Keep only recent events in memory
-            if len(self._events) > MAX_EVENTS_IN_MEMORY:
-                self._events = self._events[-MAX_EVENTS_IN_MEMORY:]
-                self._event_ids = {e.event_id for e in self._events}
+            if self._positions:
+                self._next_seq = self._positions[-1].seq + 1
+            if not self._active_size:
+                self._active_base = self._next_seq
 
-            logger.info("Loaded %d events from journal", len(self._events))
+            logger.info("Loaded %d events from journal (next seq %d)", len(self._events), self._next_seq)
 
         except OSError as e:
             logger.error("Failed to load events: %s", e)
 
+    def _first_seq(self, path: Path) -> Optional[int]:
+        """_seq of the first decodable line of path (malformed lines skipped)."""
+        with open(path, "rb") as f:
+            for raw in f:
+                if not raw.strip():
+                    continue
+                try:
+                    seq = self._decode(raw)[0]
+                except (ValueError, KeyError, TypeError):
+                    continue
+                if isinstance(seq, int):
+                    return seq
+        return None
+
+    @staticmethod
+    def _truncate_torn_tail(path: Path) -> None:
+        """Drop an unterminated last line left by an interrupted append."""
+        with open(path, "r+b") as f:
+            size = f.seek(0, os.SEEK_END)
+            if size == 0:
+                return
+            f.seek(size - 1)
+            if f.read(1) == b"\n":
+                return
+            pos = size
+            while pos > 0:
+                step = min(_TAIL_BLOCK, pos)
+                pos -= step
+                f.seek(pos)
+                idx = f.read(step).rfind(b"\n")
+                if idx >= 0:
+                    f.truncate(pos + idx + 1)
+                    break
+            else:
+                f.truncate(0)
+            logger.warning("Truncated torn tail of %s", path)
+
+    def _migrate_legacy_events(self) -> None:
+        """One-time rewrite of a journal without sequence numbers."""
+        if not self._events_path.exists():
+            return
+        # Any unnumbered line (not just the first) means legacy writes to rewrite;
+        # the byte check keeps the scan cheap, json confirms a real event line
+        legacy = False
+        with open(self._events_path, "rb") as f:
+            for raw in f:
+                if not raw.strip() or b'"_seq"' in raw:
+                    continue
+                try:
+                    legacy = isinstance(json.loads(raw), dict)
+                except ValueError:
+                    continue
+                if legacy:
+                    break
+        if not legacy:
+            return
+
+        # Keep already-numbered leading events at their seq (cursors stay valid)
+        seen = set()
+        seq = self._first_seq(self._events_path) or 0
+        temp_path = self._events_path.with_suffix(".migrate.tmp")
+        with open(self._events_path, "rb") as src, open(temp_path, "wb") as dst:
+            for line_no, raw in enumerate(src, 1):
+                if not raw.strip():
+                    continue
+                try:
+                    event = self._decode(raw)[1]
+                except (ValueError, KeyError, TypeError) as e:
+                    logger.warning("Skipping malformed event at line %d: %s", line_no, e)
+                    continue
+                if event.event_id in seen:
+                    continue
+                seen.add(event.event_id)
+                dst.write(self._encode(event, seq))
+                seq += 1
+            dst.flush()
+            os.fsync(dst.fileno())
+        temp_path.replace(self._events_path)
+        logger.info("Migrated legacy journal: %d events numbered", seq)
+
     def _load_cursors(self) -> None:
         """Load cursor positions from JSON file."""
         if not self._cursors_path.exists():
@@ -132,17 +345,49 @@ class EventJournal:
 
         try:
             content = self._cursors_path.read_text(encoding="utf-8")
-            self._cursors = json.loads(content)
+            for consumer_id, value in json.loads(content).items():
+                if isinstance(value, dict):
+                    self._cursors[consumer_id] = JournalPosition(
+                        int(value["seq"]), int(value["segment"]), int(value["offset"])
+                    )
+                    self._cursor_ids[consumer_id] = value.get("event_id", "")
+                else:
+                    self._load_legacy_cursor(consumer_id, value)
             logger.info("Loaded cursors for %d consumers", len(self._cursors))
-        except (json.JSONDecodeError, OSError) as e:
+        except (json.JSONDecodeError, OSError, KeyError, TypeError, ValueError) as e:
             logger.warning("Failed to load cursors: %s", e)
             self._cursors = {}
+            self._cursor_ids = {}
+
+    def _load_legacy_cursor(self, consumer_id: str, event_id: str) -> None:
+        """Map a v1.0 cursor (last acked event_id) to a position."""
+        position = self._by_id.get(event_id)
+        if position is None and self._positions:
+            # Acked event pruned: resume with the most recent events (v1.0 behaviour)
+            start = max(0, len(self._positions) - MAX_PENDING_PER_CONSUMER)
+            first = self._positions[start]
+            position = JournalPosition(first.seq - 1, first.segment, 0)
+            logger.warning(
+                "Cursor %s not found for consumer %s, resuming at recent events",
+                event_id, consumer_id
+            )
+        if position is not None:
+            self._cursors[consumer_id] = position
+            self._cursor_ids[consumer_id] = event_id
 
     def _save_cursors(self) -> None:
         """Save cursor positions atomically (temp → fsync → rename)."""
         temp_path = self._cursors_path.with_suffix(".tmp")
         try:
-            content = json.dumps(self._cursors, ensure_ascii=False, indent=2)
+            content = json.dumps({
+                consumer_id: {
+                    "event_id": self._cursor_ids.get(consumer_id, ""),
+                    "seq": pos.seq,
+                    "segment": pos.segment,
+                    "offset": pos.offset,
+                }
+                for consumer_id, pos in self._cursors.items()
+            }, ensure_ascii=False, indent=2)
 
             # Write to temp file
             with open(temp_path, "w", encoding="utf-8") as f:
@@ -161,11 +406,15 @@ class EventJournal:
             except OSError:
                 pass
 
-    def _append_to_file(self, path: Path, event: Event) -> bool:
-        """Append event to JSONL file atomically."""
+    # =========================================================================
+    # APPEND
+    # =========================================================================
+
+    def _append_to_file(self, path: Path, data: bytes) -> bool:
+        """Append encoded event line to JSONL file atomically."""
         try:
-            with open(path, "a", encoding="utf-8") as f:
-                f.write(event.to_json() + "\n")
+            with open(path, "ab") as f:
+                f.write(data)
                 f.flush()
                 os.fsync(f.fileno())
             return True
@@ -187,24 +436,39 @@ class EventJournal:
         """
         with self._lock:
             # Check for duplicate
-            if event.event_id in self._event_ids:
+            if event.event_id in self._by_id:
                 logger.debug("Skipping duplicate event: %s", event.event_id)
                 return False
 
+            seq = self._next_seq
+            data = self._encode(event, seq)
+            if self._active_size and self._active_size + len(data) > self._segment_max_bytes:
+                try:
+                    self._rotate()
+                except OSError as e:
+                    logger.error("Failed to rotate journal segment: %s", e)
+
             # Append to file
-            if not self._append_to_file(self._events_path, event):
+            if not self._append_to_file(self._events_path, data):
                 return False
+            self._active_size += len(data)
+            self._next_seq += 1
 
             # Update in-memory cache
+            position = JournalPosition(seq, self._active_base, self._active_size)
             self._events.append(event)
-            self._event_ids.add(event.event_id)
-
-            # Trim cache if needed
-            if len(self._events) > MAX_EVENTS_IN_MEMORY:
-                removed = self._events.pop(0)
-                self._event_ids.discard(removed.event_id)
-
-            logger.debug("Appended event: %s", event.event_id)
+            self._positions.append(position)
+            self._by_id[event.event_id] = position
+
+            # Trim cache in chunks (amortized O(1))
+            if len(self._events) > MAX_EVENTS_IN_MEMORY + _TRIM_SLACK:
+                drop = len(self._events) - MAX_EVENTS_IN_MEMORY
+                for removed in self._events[:drop]:
+                    self._by_id.pop(removed.event_id, None)
+                del self._events[:drop]
+                del self._positions[:drop]
+
+            logger.debug("Appended event: %s (seq %d)", event.event_id, seq)
             return True
 
     def append_batch(self, events: List[Event]) -> int:
@@ -219,6 +483,95 @@ class EventJournal:
                 count += 1
         return count
 
+    # =========================================================================
+    # CONSUMERS
+    # =========================================================================
+
+    def _index_after(self, seq: int) -> int:
+        """Index of the first in-memory event with sequence > seq."""
+        if not self._positions:
+            return 0
+        idx = seq + 1 - self._positions[0].seq
+        if idx <= 0:
+            return 0
+        if idx >= len(self._positions):
+            return len(self._positions)
+        if self._positions[idx].seq == seq + 1 and self._positions[idx - 1].seq <= seq:
+            return idx
+        # Gap in sequence (malformed line skipped at load): binary search
+        lo, hi = 0, len(self._positions)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._positions[mid].seq <= seq:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _read_from(self, cursor: JournalPosition, limit: int) -> List[Event]:
+        """Read events after cursor from disk, seeking to its byte offset."""
+        bases = self._sealed_segments()
+        if self._active_size:
+            bases.append(self._active_base)
+
+        offset = cursor.offset
+        if cursor.segment not in bases:
+            later = [b for b in bases if b > cursor.segment]
+            if not later:
+                return []
+            logger.warning("Journal segment %d pruned, resuming at segment %d", cursor.segment, later[0])
+            bases, offset = later, 0
+        else:
+            bases = bases[bases.index(cursor.segment):]
+
+        events: List[Event] = []
+        for base in bases:
+            with open(self._segment_path(base), "rb") as f:
+                f.seek(offset)
+                pos = offset
+                for raw in f:
+                    pos += len(raw)
+                    if not raw.endswith(b"\n"):
+                        break
+                    if not raw.strip():
+                        continue
+                    try:
+                        seq, event = self._decode(raw)
+                    except (json.JSONDecodeError, KeyError):
+                        continue
+                    if seq <= cursor.seq:
+                        continue
+                    if len(self._disk_positions) >= MAX_DISK_POSITIONS:
+                        self._disk_positions.clear()
+                    self._disk_positions[event.event_id] = JournalPosition(seq, base, pos)
+                    events.append(event)
+                    if len(events) >= limit:
+                        return events
+            offset = 0
+        return events
+
+    def _pending_locked(self, consumer_id: str, limit: int) -> List[Event]:
+        cursor = self._cursors.get(consumer_id)
+
+        if cursor is None:
+            # Consumer is new, return all events
+            return self._events[:limit]
+
+        if cursor.seq >= self._next_seq:
+            # Cursor from a journal that was reset
+            logger.warning(
+                "Cursor seq %d ahead of journal for consumer %s, returning recent events",
+                cursor.seq, consumer_id
+            )
+            return self._events[-limit:]
+
+        if not self._positions or cursor.seq + 1 >= self._positions[0].seq:
+            start = self._index_after(cursor.seq)
+            return self._events[start:start + limit]
+
+        # Consumer fell behind the in-memory window: resume from disk
+        return self._read_from(cursor, limit)
+
     def get_pending(
         self,
         consumer_id: str,
@@ -235,33 +588,10 @@ class EventJournal:
             List of unprocessed events, oldest first
         """
         with self._lock:
-            last_acked = self._cursors.get(consumer_id)
-
-            if last_acked is None:
-                # Consumer is new, return all events
-                return self._events[:limit]
-
-            # Find position after last acked
-            pending = []
-            found_cursor = False
+            return self._pending_locked(consumer_id, limit)
 
-            for event in self._events:
-                if found_cursor:
-                    pending.append(event)
-                    if len(pending) >= limit:
-                        break
-                elif event.event_id == last_acked:
-                    found_cursor = True
-
-            # If cursor not found (old event pruned), return recent events
-            if not found_cursor and last_acked:
-                logger.warning(
-                    "Cursor %s not found for consumer %s, returning recent events",
-                    last_acked, consumer_id
-                )
-                return self._events[-limit:]
-
-            return pending
+    def _position_of(self, event_id: str) -> Optional[JournalPosition]:
+        return self._by_id.get(event_id) or self._disk_positions.get(event_id)
 
     def ack(self, consumer_id: str, event_id: str) -> bool:
         """
@@ -276,15 +606,17 @@ class EventJournal:
         """
         with self._lock:
             # Verify event exists
-            if event_id not in self._event_ids:
+            position = self._position_of(event_id)
+            if position is None:
                 logger.warning("Cannot ack unknown event: %s", event_id)
                 return False
 
             # Update cursor
-            self._cursors[consumer_id] = event_id
+            self._cursors[consumer_id] = position
+            self._cursor_ids[consumer_id] = event_id
             self._save_cursors()
 
-            logger.debug("Consumer %s acked event %s", consumer_id, event_id)
+            logger.debug("Consumer %s acked event %s (seq %d)", consumer_id, event_id, position.seq)
             return True
 
     def ack_batch(self, consumer_id: str, event_ids: List[str]) -> int:
@@ -301,10 +633,8 @@ class EventJournal:
         if not event_ids:
             return 0
 
-        count = 0
-        for event_id in event_ids:
-            if event_id in self._event_ids:
-                count += 1
+        with self._lock:
+            count = sum(1 for event_id in event_ids if self._position_of(event_id))
 
         if count > 0:
             # Set cursor to last event
@@ -356,11 +686,15 @@ class EventJournal:
                 except OSError:
                     pass
 
-            # Calculate pending per consumer
+            # Calculate pending per consumer from sequence numbers
             pending_counts = {}
-            for consumer_id in self._cursors:
-                pending = self.get_pending(consumer_id, limit=1000)
-                pending_counts[consumer_id] = len(pending)
+            last_seq = self._next_seq - 1
+            for consumer_id, cursor in self._cursors.items():
+                if cursor.seq > last_seq:
+                    pending = len(self._events)
+                else:
+                    pending = last_seq - cursor.seq
+                pending_counts[consumer_id] = min(pending, 1000)
 
             return JournalStats(
                 total_events=len(self._events),
@@ -372,21 +706,22 @@ class EventJournal:
     def has_event(self, event_id: str) -> bool:
         """Check if event exists in journal."""
         with self._lock:
-            return event_id in self._event_ids
+            return event_id in self._by_id
 
     def get_event(self, event_id: str) -> Optional[Event]:
-        """Get event by ID."""
+        """Get event by ID (in-memory window)."""
         with self._lock:
-            for event in self._events:
-                if event.event_id == event_id:
-                    return event
-            return None
+            position = self._by_id.get(event_id)
+            if position is None:
+                return None
+            return self._events[self._index_after(position.seq - 1)]
 
     def clear_consumer(self, consumer_id: str) -> None:
         """Reset cursor for consumer (reprocess all events)."""
         with self._lock:
             if consumer_id in self._cursors:
                 del self._cursors[consumer_id]
+                self._cursor_ids.pop(consumer_id, None)
                 self._save_cursors()
                 logger.info("Cleared cursor for consumer: %s", consumer_id)
 
@@ -64,14 +64,27 @@ USAGE:
 
     # Or subscribe to event types
     transport.subscribe("FILL", my_handler)
-    transport.start_reader()  # Background thread polls journal
+    transport.start_reader()  # Background thread tails journal
+
+READER WAKE-UP:
+    On Linux the reader blocks on inotify and wakes as soon as the journal
+    grows; elsewhere (or if inotify is unavailable) it polls every
+    POLL_INTERVAL_SEC. Lines from this process and lines whose event type
+    has no subscriber are skipped by header match, before JSON decode.
+    get_stats()["deliver_latency_ms"] reports publish->deliver percentiles.
 """
 
+import ctypes
+import ctypes.util
 import json
 import os
+import re
+import select
+import sys
 import time
 import threading
 import logging
+from collections import deque
 from pathlib import Path
 
 # Platform-specific locking
@@ -80,11 +93,13 @@ if os.name == 'nt':
 else:
     import fcntl
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional, Callable, Set
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Optional, Callable, Set, Tuple
+from dataclasses import dataclass
 from queue import Queue
 
-from .event_schema import HopeEvent
+from core.io_group_commit import GroupCommitConfig, GroupCommitWriter
+
+from .event_schema import HopeEvent, ORDER_INTENT, ORDER_SUBMITTED, ORDER, FILL
 
 log = logging.getLogger("EVENT_TRANSPORT")
 
@@ -94,7 +109,26 @@ JOURNAL_DIR.mkdir(parents=True, exist_ok=True)
 
 # Reader configuration
 POLL_INTERVAL_SEC = 0.1  # 100ms - fast enough for scalping
+WATCH_TIMEOUT_SEC = 1.0  # inotify safety timeout (rotation, missed wake-ups)
 MAX_EVENTS_PER_POLL = 100
+LATENCY_SAMPLES = 4096   # publish->deliver latency window
+
+# inotify(7) masks
+_IN_MODIFY = 0x00000002
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+
+# Journal line header written by JournalEntry.to_json (pre-decode filter)
+_HEADER_RE = re.compile(
+    rb'\{"seq": -?\d+, "ts_unix": [^,]+, "process_id": (\d+), "event_type": "([A-Za-z0-9_.:-]*)"'
+)
+
+# Writer configuration (group commit: one write + fsync per batch)
+WRITE_BATCH_SIZE = 256
+WRITE_MAX_DELAY_MS = 5.0
+
+# Event types fsynced before publish() returns
+DURABLE_EVENT_TYPES = frozenset({ORDER_INTENT, ORDER_SUBMITTED, ORDER, FILL})
 
 
 def _get_journal_path(date: datetime = None) -> Path:
@@ -104,25 +138,6 @@ def _get_journal_path(date: datetime = None) -> Path:
     return JOURNAL_DIR / f"journal_{date.strftime('%Y%m%d')}.jsonl"
 
 
-def _atomic_append(path: Path, line: str) -> bool:
-    """
-    Atomically append line to file.
-    Uses simple append mode - safe enough for HOPE's use case.
-    For true atomicity, we write to temp file and use os.replace.
-    """
-    try:
-        # Simple append - works on Windows and Unix
-        # For HOPE, writes are infrequent enough that collisions are rare
-        with open(path, 'a', encoding='utf-8', newline='\n') as f:
-            f.write(line + '\n')
-            f.flush()
-            os.fsync(f.fileno())
-        return True
-    except Exception as e:
-        log.error(f"Atomic append failed: {e}")
-        return False
-
-
 @dataclass
 class JournalEntry:
     """Entry in the event journal with metadata."""
@@ -131,9 +146,18 @@ class JournalEntry:
     process_id: int             # PID of writer
     process_name: str           # Name of writer process
     event: Dict[str, Any]       # The HopeEvent as dict
+    event_type: str = ""        # Copy of event["event_type"] for header filtering
 
     def to_json(self) -> str:
-        return json.dumps(asdict(self), ensure_ascii=False)
+        # Header fields first, in _HEADER_RE order
+        return json.dumps({
+            "seq": self.seq,
+            "ts_unix": self.ts_unix,
+            "process_id": self.process_id,
+            "event_type": self.event_type or self.event.get("event_type", ""),
+            "process_name": self.process_name,
+            "event": self.event,
+        }, ensure_ascii=False)
 
     @classmethod
     def from_json(cls, line: str) -> Optional['JournalEntry']:
@@ -144,12 +168,58 @@ class JournalEntry:
             return None
 
 
+class _JournalWatcher:
+    """Blocks until the journal directory changes: inotify on Linux, sleep elsewhere."""
+
+    def __init__(self, directory: Path):
+        self.mode = "poll"
+        self._fd = -1
+
+        if not sys.platform.startswith("linux"):
+            return
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+            mask = _IN_MODIFY | _IN_CREATE | _IN_MOVED_TO
+            if libc.inotify_add_watch(fd, str(directory).encode(), mask) < 0:
+                errno = ctypes.get_errno()
+                os.close(fd)
+                raise OSError(errno, "inotify_add_watch failed")
+            self._fd = fd
+            self.mode = "inotify"
+        except Exception as e:
+            log.warning(f"inotify unavailable, falling back to polling: {e}")
+
+    def wait(self) -> None:
+        """Return on the next change (inotify) or after POLL_INTERVAL_SEC."""
+        if self._fd < 0:
+            time.sleep(POLL_INTERVAL_SEC)
+            return
+
+        ready, _, _ = select.select([self._fd], [], [], WATCH_TIMEOUT_SEC)
+        if ready:
+            # Drain queued notifications; one poll covers all of them
+            try:
+                while os.read(self._fd, 4096):
+                    pass
+            except BlockingIOError:
+                pass
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
 class EventTransport:
     """
     Cross-process event transport using file-based journal.
 
     Features:
-    - Atomic writes with file locking (safe for multiple writers)
+    - Group-committed appends (one O_APPEND write + fsync per batch)
+    - Order events durable before publish() returns
     - Sequence numbers for ordering
     - Background reader thread for subscriptions
     - Automatic journal rotation (daily)
@@ -170,6 +240,15 @@ class EventTransport:
         self._reader_thread: Optional[threading.Thread] = None
         self._reader_running = False
         self._last_read_pos: Dict[Path, int] = {}  # Track position per journal file
+        self._tail_path: Optional[Path] = None      # Journal tailed by poll()
+        self._reader_wake = "stopped"
+
+        # Writer state
+        self._durable_types = DURABLE_EVENT_TYPES
+        self._writer = GroupCommitWriter(
+            GroupCommitConfig(batch_size=WRITE_BATCH_SIZE, max_delay_ms=WRITE_MAX_DELAY_MS),
+            name=f"transport-{process_name}",
+        )
 
         # Stats
         self._stats = {
@@ -178,7 +257,10 @@ class EventTransport:
             "events_delivered": 0,
             "write_errors": 0,
             "read_errors": 0,
+            "lines_skipped": 0,
         }
+        self._latency_ms: deque = deque(maxlen=LATENCY_SAMPLES)
+        self._latency_lock = threading.Lock()
 
         log.info(f"EventTransport initialized: process={process_name} pid={self._process_id}")
 
@@ -197,6 +279,7 @@ class EventTransport:
         with cls._lock:
             if cls._instance:
                 cls._instance.stop_reader()
+                cls._instance._writer.close()
             cls._instance = None
 
     # =========================================================================
@@ -207,7 +290,10 @@ class EventTransport:
         """
         Publish event to journal (visible to all processes).
 
-        Returns True if written successfully.
+        Order events (DURABLE_EVENT_TYPES) are fsynced before returning;
+        others are group-committed within WRITE_MAX_DELAY_MS.
+
+        Returns True if written (durable) or queued successfully.
         """
         self._seq += 1
 
@@ -217,10 +303,12 @@ class EventTransport:
             process_id=self._process_id,
             process_name=self._process_name,
             event=event.to_dict(),
+            event_type=event.event_type,
         )
 
         journal_path = _get_journal_path()
-        success = _atomic_append(journal_path, entry.to_json())
+        durable = event.event_type in self._durable_types
+        success = self._writer.append(journal_path, entry.to_json(), durable=durable)
 
         if success:
             self._stats["events_written"] += 1
@@ -231,6 +319,10 @@ class EventTransport:
 
         return success
 
+    def flush(self, timeout: float = None) -> bool:
+        """Wait until every published event is in the journal."""
+        return self._writer.flush(timeout)
+
     def publish_dict(self, event_dict: Dict[str, Any]) -> bool:
         """Publish event from dict (for compatibility)."""
         event = HopeEvent.from_dict(event_dict)
@@ -247,43 +339,94 @@ class EventTransport:
         Returns list of new events.
         """
         if journal_path is None:
-            journal_path = _get_journal_path()
+            entries = self._poll_entries()
+        else:
+            entries = self._read_entries(journal_path)
+
+        self._record_latency([ts for ts, _ in entries])
+        return [event for _, event in entries]
+
+    def _poll_entries(self, event_types: Optional[Set[str]] = None) -> List[Tuple[float, HopeEvent]]:
+        """Read new entries from today's journal, draining yesterday's first after rotation."""
+        today = _get_journal_path()
+        if self._tail_path is not None and self._tail_path != today:
+            entries = self._read_entries(self._tail_path, event_types)
+            if entries:
+                return entries
+            self._last_read_pos.pop(self._tail_path, None)
+        self._tail_path = today
+        return self._read_entries(today, event_types)
+
+    def _read_entries(
+        self,
+        journal_path: Path,
+        event_types: Optional[Set[str]] = None,
+    ) -> List[Tuple[float, HopeEvent]]:
+        """
+        Read up to MAX_EVENTS_PER_POLL foreign entries as (ts_unix, event).
 
+        Own lines and lines whose type is not in event_types (None = all) are
+        skipped by header match before decoding. A trailing line without a
+        newline is still being written and is left for the next read.
+        """
         if not journal_path.exists():
             return []
 
-        events = []
-        last_pos = self._last_read_pos.get(journal_path, 0)
+        entries: List[Tuple[float, HopeEvent]] = []
+        pos = self._last_read_pos.get(journal_path, 0)
+        skipped = 0
 
         try:
-            with open(journal_path, 'r', encoding='utf-8') as f:
-                f.seek(last_pos)
-                count = 0
-                for line in f:
-                    if count >= MAX_EVENTS_PER_POLL:
+            with open(journal_path, 'rb') as f:
+                f.seek(pos)
+                while len(entries) < MAX_EVENTS_PER_POLL:
+                    raw = f.readline()
+                    if not raw.endswith(b"\n"):
                         break
-                    line = line.strip()
-                    if not line:
-                        continue
+                    pos += len(raw)
 
-                    entry = JournalEntry.from_json(line)
-                    if entry:
-                        # Skip our own events (already processed locally)
-                        if entry.process_id == self._process_id:
+                    header = _HEADER_RE.match(raw)
+                    if header:
+                        if int(header.group(1)) == self._process_id:
+                            continue
+                        if event_types is not None and header.group(2).decode() not in event_types:
+                            skipped += 1
                             continue
 
-                        event = HopeEvent.from_dict(entry.event)
-                        events.append(event)
-                        count += 1
+                    entry = JournalEntry.from_json(raw)
+                    if entry is None:
+                        continue
+                    # Skip our own events (already processed locally)
+                    if entry.process_id == self._process_id:
+                        continue
+                    if event_types is not None and entry.event.get("event_type") not in event_types:
+                        skipped += 1
+                        continue
 
-                self._last_read_pos[journal_path] = f.tell()
-                self._stats["events_read"] += len(events)
+                    entries.append((entry.ts_unix, HopeEvent.from_dict(entry.event)))
+
+            self._last_read_pos[journal_path] = pos
+            self._stats["events_read"] += len(entries)
+            self._stats["lines_skipped"] += skipped
 
         except Exception as e:
             self._stats["read_errors"] += 1
             log.error(f"Poll error: {e}")
 
-        return events
+        return entries
+
+    def _record_latency(self, published_ts: List[float]) -> None:
+        """Record publish->deliver latency for delivered entries."""
+        if not published_ts:
+            return
+        now = time.time()
+        with self._latency_lock:
+            self._latency_ms.extend((now - ts) * 1000 for ts in published_ts)
+
+    def _subscribed_types(self) -> Optional[Set[str]]:
+        """Event types with subscribers (None = wildcard subscriber present)."""
+        types = {t for t, handlers in self._subscribers.items() if handlers}
+        return None if "*" in types else types
 
     def subscribe(self, event_type: str, handler: Callable[[HopeEvent], None]):
         """Subscribe handler to event type."""
@@ -300,7 +443,7 @@ class EventTransport:
         """Deliver events to subscribers."""
         for event in events:
             # Deliver to specific subscribers
-            handlers = self._subscribers.get(event.event_type, [])
+            handlers = list(self._subscribers.get(event.event_type, []))
             # Also deliver to wildcard subscribers
             handlers += self._subscribers.get("*", [])
 
@@ -338,16 +481,26 @@ class EventTransport:
         log.info("Background reader stopped")
 
     def _reader_loop(self):
-        """Background loop that polls journal and delivers events."""
-        while self._reader_running:
-            try:
-                events = self.poll()
-                if events:
-                    self._deliver_events(events)
-                time.sleep(POLL_INTERVAL_SEC)
-            except Exception as e:
-                log.error(f"Reader loop error: {e}")
-                time.sleep(1.0)  # Back off on error
+        """Background loop that tails journal and delivers events."""
+        watcher = _JournalWatcher(JOURNAL_DIR)
+        self._reader_wake = watcher.mode
+        try:
+            while self._reader_running:
+                try:
+                    # Drain everything written so far, then block for growth
+                    while self._reader_running:
+                        entries = self._poll_entries(self._subscribed_types())
+                        if not entries:
+                            break
+                        self._deliver_events([event for _, event in entries])
+                        self._record_latency([ts for ts, _ in entries])
+                    watcher.wait()
+                except Exception as e:
+                    log.error(f"Reader loop error: {e}")
+                    time.sleep(1.0)  # Back off on error
+        finally:
+            watcher.close()
+            self._reader_wake = "stopped"
 
     # =========================================================================
     # STATS & DEBUG
@@ -362,6 +515,27 @@ class EventTransport:
             "sequence": self._seq,
             "subscribers": {k: len(v) for k, v in self._subscribers.items()},
             "reader_running": self._reader_running,
+            "reader_wake": self._reader_wake,
+            "deliver_latency_ms": self._latency_percentiles(),
+            "writer": self._writer.get_metrics(),
+        }
+
+    def _latency_percentiles(self) -> Dict[str, float]:
+        """p50/p90/p99/max of recent publish->deliver latencies."""
+        with self._latency_lock:
+            samples = sorted(self._latency_ms)
+        if not samples:
+            return {"samples": 0}
+
+        def pct(q: float) -> float:
+            return round(samples[min(len(samples) - 1, int(q * len(samples)))], 3)
+
+        return {
+            "samples": len(samples),
+            "p50": pct(0.50),
+            "p90": pct(0.90),
+            "p99": pct(0.99),
+            "max": round(samples[-1], 3),
         }
 
     def get_journal_info(self) -> Dict[str, Any]:
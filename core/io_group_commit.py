@@ -0,0 +1,341 @@
+# -*- coding: utf-8 -*-
+# === AI SIGNATURE ===
+# Created by: Claude (opus-4)
+# Created at: 2026-02-03T10:00:00Z
+# Purpose: Group-commit background writer for append-only JSONL logs
+# Security: Fail-closed durable acks, bounded queue with backpressure
+# === END SIGNATURE ===
+"""
+Group-Commit JSONL Writer.
+
+Appending one line with open/write/fsync per event caps throughput at disk
+fsync latency. GroupCommitWriter queues lines and a background thread
+writes them in batches: one os.write and one fsync per file per batch.
+
+- batch_size / max_delay_ms: a batch is committed when it is full or the
+  oldest queued line has waited max_delay_ms
+- append(..., durable=True) blocks (at most durable_timeout_s) until the
+  batch holding the line is fsynced and returns False if it was not
+  (durable-before-ack); submit() + wait() split it so callers can queue
+  under their own lock and wait outside it
+- flush() waits until everything queued so far is on disk: every line gets a
+  submitted sequence number, the writer advances a committed sequence number
+  after each batch, and flush waits for committed >= submitted-at-call (this
+  includes a batch the writer has already dequeued but not yet fsynced)
+- The queue is bounded: a full queue blocks the caller (backpressure)
+  instead of dropping lines
+
+Each batch is one O_APPEND write per file, so whole lines from concurrent
+processes do not interleave.
+
+Usage:
+    writer = GroupCommitWriter(GroupCommitConfig(batch_size=256, max_delay_ms=5))
+    writer.append(path, json.dumps(event))                  # queued
+    ok = writer.append(path, json.dumps(fill), durable=True)  # fsynced
+    writer.get_metrics()["queue_depth"]
+"""
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class GroupCommitConfig:
+    """Group-commit tuning."""
+    batch_size: int = 256          # Max lines per commit
+    max_delay_ms: float = 5.0      # Max wait for a batch to fill
+    max_queue: int = 100_000       # Queued lines before append() blocks
+    enqueue_timeout_s: float = 10.0  # Max block on a full queue
+    durable_timeout_s: float = 30.0  # Max wait for a durable ack
+
+
+class _Ticket:
+    """Completion handle for a durable append."""
+    __slots__ = ("done", "ok")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.ok = False
+
+
+# (path, encoded line, enqueue time, ticket, sequence number)
+_Pending = Tuple[Path, bytes, float, Optional[_Ticket], int]
+
+_FAILED_SEQS_KEPT = 10_000  # Recent failed sequence numbers remembered for flush()
+
+
+class GroupCommitWriter:
+    """Background group-commit appender for line-oriented logs."""
+
+    def __init__(self, config: Optional[GroupCommitConfig] = None, name: str = "group-commit"):
+        self.config = config or GroupCommitConfig()
+        self.name = name
+
+        self._cond = threading.Condition()
+        self._pending: List[_Pending] = []
+        self._urgent = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+        # Sequence numbers: last enqueued line / last line whose batch finished
+        self._submitted_seq = 0
+        self._committed_seq = 0
+        self._flush_target = 0
+        self._failed_seqs: deque = deque(maxlen=_FAILED_SEQS_KEPT)
+        self._writer_error: Optional[str] = None
+
+        # Metrics
+        self._max_queue_depth = 0
+        self._lines_written = 0
+        self._bytes_written = 0
+        self._batches = 0
+        self._fsyncs = 0
+        self._write_errors = 0
+        self._write_ms_total = 0.0
+        self._write_ms_max = 0.0
+        self._write_ms_last = 0.0
+        self._commit_ms_max = 0.0
+
+        atexit.register(self.close)
+
+    # =========================================================================
+    # PUBLIC API
+    # =========================================================================
+
+    def append(self, path: Path, line: str, durable: bool = False) -> bool:
+        """
+        Queue one line (newline added) for appending to path.
+
+        Args:
+            path: Target file (created on first write)
+            line: Line content without trailing newline
+            durable: Block until the line is fsynced
+
+        Returns:
+            True if queued (or, with durable=True, written and fsynced)
+        """
+        queued, ticket = self.submit(path, line, durable=durable)
+        if not queued:
+            return False
+        return ticket is None or self.wait(ticket, path)
+
+    def submit(self, path: Path, line: str, durable: bool = False) -> Tuple[bool, Optional[_Ticket]]:
+        """
+        Queue one line without waiting; append() is submit() + wait().
+
+        Lets a caller fix line order under its own lock and wait for the
+        fsync after releasing it, so concurrent durable lines share a batch.
+
+        Returns:
+            (queued, ticket): ticket is set for durable lines, pass it to wait()
+        """
+        ticket = _Ticket() if durable else None
+        data = (line + "\n").encode("utf-8")
+        if not self._enqueue(Path(path), data, ticket, urgent=durable):
+            return False, None
+        return True, ticket
+
+    def wait(self, ticket: _Ticket, path: Optional[Path] = None) -> bool:
+        """Block (at most durable_timeout_s) until a submitted durable line is fsynced."""
+        if not ticket.done.wait(self.config.durable_timeout_s):
+            logger.error(
+                f"{self.name}: durable append to {path} not acked within "
+                f"{self.config.durable_timeout_s}s (writer error: {self._writer_error})"
+            )
+            return False
+        return ticket.ok
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every line queued before this call is fsynced.
+
+        Returns:
+            False on timeout or if any of those lines failed to write
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            target = self._submitted_seq
+            floor = self._committed_seq
+            if target > floor:
+                self._flush_target = max(self._flush_target, target)
+                self._urgent = True
+                self._ensure_thread()
+                self._cond.notify_all()
+            while self._committed_seq < target:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    logger.error(f"{self.name}: flush timed out (writer error: {self._writer_error})")
+                    return False
+                self._cond.wait(remaining)
+            return not any(floor < seq <= target for seq in self._failed_seqs)
+
+    def close(self) -> None:
+        """Commit everything queued and stop the writer thread."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._urgent = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+        atexit.unregister(self.close)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Queue depth and write latency metrics."""
+        with self._cond:
+            batches = self._batches
+            return {
+                "queue_depth": len(self._pending),
+                "max_queue_depth": self._max_queue_depth,
+                "lines_written": self._lines_written,
+                "bytes_written": self._bytes_written,
+                "batches": batches,
+                "fsyncs": self._fsyncs,
+                "write_errors": self._write_errors,
+                "submitted_seq": self._submitted_seq,
+                "committed_seq": self._committed_seq,
+                "writer_error": self._writer_error,
+                "avg_batch_size": round(self._lines_written / batches, 2) if batches else 0.0,
+                "write_latency_ms_avg": round(self._write_ms_total / batches, 3) if batches else 0.0,
+                "write_latency_ms_max": round(self._write_ms_max, 3),
+                "write_latency_ms_last": round(self._write_ms_last, 3),
+                "commit_latency_ms_max": round(self._commit_ms_max, 3),
+            }
+
+    # =========================================================================
+    # WRITER THREAD
+    # =========================================================================
+
+    def _enqueue(self, path: Path, data: bytes, ticket: Optional[_Ticket], urgent: bool) -> bool:
+        deadline = time.monotonic() + self.config.enqueue_timeout_s
+        with self._cond:
+            while len(self._pending) >= self.config.max_queue and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.error(f"{self.name}: queue full ({len(self._pending)}), line rejected")
+                    return False
+                self._cond.wait(remaining)
+            if self._closed:
+                logger.error(f"{self.name}: writer closed, line rejected")
+                return False
+
+            self._submitted_seq += 1
+            self._pending.append((path, data, time.monotonic(), ticket, self._submitted_seq))
+            self._max_queue_depth = max(self._max_queue_depth, len(self._pending))
+            if urgent:
+                self._urgent = True
+            self._ensure_thread()
+            self._cond.notify_all()
+        return True
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, daemon=True, name=f"GroupCommit-{self.name}")
+            self._thread.start()
+
+    def _next_batch(self) -> Optional[List[_Pending]]:
+        """Block until a batch is due; None once closed and drained."""
+        max_delay = self.config.max_delay_ms / 1000.0
+        with self._cond:
+            while not self._pending:
+                if self._closed:
+                    return None
+                self._cond.wait()
+
+            deadline = self._pending[0][2] + max_delay
+            while len(self._pending) < self.config.batch_size and not self._urgent:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+            batch = self._pending[:self.config.batch_size]
+            del self._pending[:len(batch)]
+            if not any(item[3] is not None for item in self._pending):
+                self._urgent = self._closed or batch[-1][4] < self._flush_target
+            self._cond.notify_all()  # Wake producers blocked on a full queue
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            try:
+                self._commit(batch)
+            except BaseException as e:
+                # Never leave waiters hanging: fail the batch and mark it committed
+                self._writer_error = f"{type(e).__name__}: {e}"
+                logger.error(f"{self.name}: writer failed: {self._writer_error}")
+                self._finish(batch, {path for path, *_ in batch}, 0, 0, 0.0, time.monotonic())
+                if not isinstance(e, Exception):
+                    raise
+
+    def _commit(self, batch: List[_Pending]) -> None:
+        """Write a batch: one append + fsync per file, then release tickets."""
+        started = time.monotonic()
+        by_path: Dict[Path, List[bytes]] = {}
+        for path, data, _, _, _ in batch:
+            by_path.setdefault(path, []).append(data)
+
+        failed: set = set()
+        fsyncs = 0
+        written = 0
+        for path, chunks in by_path.items():
+            try:
+                _append_fsync(path, b"".join(chunks))
+                fsyncs += 1
+                written += sum(len(c) for c in chunks)
+            except Exception as e:
+                failed.add(path)
+                self._writer_error = f"append to {path} failed: {e}"
+                logger.error(f"{self.name}: append to {path} failed: {e}")
+
+        self._finish(batch, failed, fsyncs, written, (time.monotonic() - started) * 1000, time.monotonic())
+
+    def _finish(
+        self, batch: List[_Pending], failed: set, fsyncs: int, written: int, write_ms: float, finished: float,
+    ) -> None:
+        """Release tickets, advance the committed sequence and update metrics."""
+        for path, _, _, ticket, _ in batch:
+            if ticket is not None:
+                ticket.ok = path not in failed
+                ticket.done.set()
+
+        with self._cond:
+            self._failed_seqs.extend(seq for path, _, _, _, seq in batch if path in failed)
+            self._committed_seq = batch[-1][4]
+            self._batches += 1
+            self._fsyncs += fsyncs
+            self._bytes_written += written
+            self._lines_written += sum(1 for path, *_ in batch if path not in failed)
+            self._write_errors += len(failed)
+            self._write_ms_total += write_ms
+            self._write_ms_last = write_ms
+            self._write_ms_max = max(self._write_ms_max, write_ms)
+            self._commit_ms_max = max(self._commit_ms_max, (finished - batch[0][2]) * 1000)
+            self._cond.notify_all()  # Wake flush() waiters
+
+
+def _append_fsync(path: Path, data: bytes) -> None:
+    """Append bytes with a single O_APPEND write loop and fsync."""
+    fd = os.open(str(path), os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            n = os.write(fd, view)
+            view = view[n:]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
@@ -268,8 +268,11 @@ def get_audit_stats(audit_path: Optional[Path] = None) -> dict:
     Get summary statistics from audit log.
 
     Returns:
-        Dict with counts of ALLOW/DENY, top denied hosts, etc.
+        Dict with counts of ALLOW/DENY, top denied hosts, etc., plus the
+        in-process connection pool counters (pool hits, TLS handshakes,
+        request latency) under "http_pool".
     """
+    from core.net.http_pool import get_pool_stats
     records = read_audit_log(audit_path, last_n=10000)
 
     allow_count = sum(1 for r in records if r.get('action') == 'ALLOW')
@@ -289,4 +292,5 @@ def get_audit_stats(audit_path: Optional[Path] = None) -> dict:
         "allow_count": allow_count,
         "deny_count": deny_count,
         "top_denied_hosts": top_denied,
+        "http_pool": get_pool_stats(),
     }
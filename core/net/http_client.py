@@ -13,16 +13,17 @@ ALL external HTTP requests MUST go through this module.
 - Audits every request (ALLOW/DENY)
 - Blocks redirects to different hosts
 - Limits response size
+- Reuses keep-alive connections per host (core.net.http_pool)
 
 Direct use of urllib.request.urlopen elsewhere is FORBIDDEN.
 Use tools/net_policy_grep_guard.ps1 to verify.
 """
 
-import ssl
 import socket
 import time
 from urllib.parse import urlsplit, urlunsplit
-from urllib.request import Request, urlopen
+from urllib.request import Request, getproxies
+from urllib.request import urlopen as _urllib_urlopen
 from urllib.error import HTTPError, URLError
 from typing import Tuple, Optional
 from pathlib import Path
@@ -36,6 +37,7 @@ from core.net.audit_log import (
     AuditAction,
     AuditReason,
 )
+from core.net.http_pool import get_pool, get_ssl_context
 
 
 class EgressDeniedError(Exception):
@@ -103,6 +105,34 @@ def _extract_host(url: str) -> str:
     return host.lower()
 
 
+def urlopen(req: Request, timeout: float = DEFAULT_TIMEOUT_SEC):
+    """
+    Open req over the keep-alive pool (drop-in for urllib's urlopen).
+
+    Redirects are followed only to AllowList hosts. If a proxy is configured
+    for the scheme, urllib is used so the proxy settings are honoured.
+    """
+    scheme = urlsplit(req.full_url).scheme.lower()
+    if scheme in getproxies():
+        return _urllib_urlopen(req, timeout=timeout, context=get_ssl_context())
+    return get_pool().open(
+        req,
+        timeout=timeout,
+        redirect_allowed=lambda host: get_allowlist().is_allowed(host),
+    )
+
+
+def _read_body(response, max_bytes: int) -> bytes:
+    """Read at most max_bytes of the response body into one buffer."""
+    body = bytearray()
+    while len(body) < max_bytes:
+        chunk = response.read(min(64 * 1024, max_bytes - len(body)))
+        if not chunk:
+            break
+        body += chunk
+    return bytes(body)
+
+
 def http_get(
     url: str,
     *,
@@ -113,6 +143,8 @@ def http_get(
     follow_redirects: bool = True,
     max_redirects: int = 5,
     extra_headers: Optional[dict] = None,
+    accept_gzip: bool = False,
+    response_headers: Optional[dict] = None,
 ) -> Tuple[int, bytes, str]:
     """
     Perform HTTP GET with egress policy enforcement.
@@ -128,6 +160,9 @@ def http_get(
         follow_redirects: Whether to follow redirects (within same host)
         max_redirects: Maximum redirect hops
         extra_headers: Additional HTTP headers (e.g., for API authentication)
+        accept_gzip: Request gzip encoding (body is returned decompressed)
+        response_headers: If given, filled with the response headers
+            (e.g., ETag/Last-Modified for conditional requests)
 
     Returns:
         Tuple of (status_code, body_bytes, final_url)
@@ -190,12 +225,11 @@ def http_get(
     redirects = 0
     final_url = url
 
-    # Create SSL context
-    ssl_context = ssl.create_default_context()
-
     while True:
         # Build request with headers
         headers = {'User-Agent': user_agent}
+        if accept_gzip:
+            headers['Accept-Encoding'] = 'gzip'
         if extra_headers:
             headers.update(extra_headers)
 
@@ -207,7 +241,7 @@ def http_get(
 
         try:
             # Execute request
-            with urlopen(req, timeout=timeout_sec, context=ssl_context) as response:
+            with urlopen(req, timeout=timeout_sec) as response:
                 status_code = response.status
                 final_url = response.url
 
@@ -232,20 +266,10 @@ def http_get(
                             request_id
                         )
 
-                # Read response with size limit
-                body_bytes = b''
-                bytes_read = 0
-
-                while bytes_read < max_bytes:
-                    chunk = response.read(8192)
-                    if not chunk:
-                        break
-                    body_bytes += chunk
-                    bytes_read += len(chunk)
-
-                if bytes_read >= max_bytes:
-                    # Truncated - log warning but continue
-                    pass
+                # Read response with size limit (truncated at max_bytes)
+                body_bytes = _read_body(response, max_bytes)
+                if response_headers is not None:
+                    response_headers.update(response.headers.items())
 
                 # SUCCESS: ALLOW
                 latency_ms = int((time.time() - start_time) * 1000)
@@ -295,6 +319,8 @@ def http_get(
                     body_bytes = e.read(max_bytes)
                 except Exception:
                     pass
+            if response_headers is not None and e.headers is not None:
+                response_headers.update(e.headers.items())
             return (e.code, body_bytes, url)
 
         except URLError as e:
@@ -394,10 +420,8 @@ def http_head(
         method='HEAD',
     )
 
-    ssl_context = ssl.create_default_context()
-
     try:
-        with urlopen(req, timeout=timeout_sec, context=ssl_context) as response:
+        with urlopen(req, timeout=timeout_sec) as response:
             latency_ms = int((time.time() - start_time) * 1000)
             append_audit_record(
                 action=AuditAction.ALLOW,
@@ -525,22 +549,13 @@ def http_post(
         method='POST',
     )
 
-    ssl_context = ssl.create_default_context()
-
     try:
-        with urlopen(req, timeout=timeout_sec, context=ssl_context) as response:
+        with urlopen(req, timeout=timeout_sec) as response:
             status_code = response.status
             final_url = response.url
 
             # Read response with size limit
-            body_bytes = b''
-            bytes_read = 0
-            while bytes_read < max_bytes:
-                chunk = response.read(8192)
-                if not chunk:
-                    break
-                body_bytes += chunk
-                bytes_read += len(chunk)
+            body_bytes = _read_body(response, max_bytes)
 
             latency_ms = int((time.time() - start_time) * 1000)
             append_audit_record(
@@ -700,21 +715,12 @@ def http_delete(
         method='DELETE',
     )
 
-    ssl_context = ssl.create_default_context()
-
     try:
-        with urlopen(req, timeout=timeout_sec, context=ssl_context) as response:
+        with urlopen(req, timeout=timeout_sec) as response:
             status_code = response.status
             final_url = response.url
 
-            body_bytes = b''
-            bytes_read = 0
-            while bytes_read < max_bytes:
-                chunk = response.read(8192)
-                if not chunk:
-                    break
-                body_bytes += chunk
-                bytes_read += len(chunk)
+            body_bytes = _read_body(response, max_bytes)
 
             latency_ms = int((time.time() - start_time) * 1000)
             append_audit_record(
@@ -0,0 +1,386 @@
+# === AI SIGNATURE ===
+# Created by: Claude (opus-4)
+# Created at (UTC): 2026-02-03T12:00:00Z
+# Purpose: Keep-alive connection pool behind core.net.http_client (stdlib-only)
+# === END SIGNATURE ===
+"""
+HTTP Connection Pool (stdlib-only, used ONLY by core.net.http_client)
+
+Opening a fresh urllib connection per call costs a TCP + TLS handshake
+every time. HttpPool keeps idle http.client connections per
+(scheme, host, port) and reuses them:
+
+- One SSL context per process (created once, not per request)
+- Up to MAX_IDLE_PER_HOST idle connections per host, dropped after
+  IDLE_TIMEOUT_SEC
+- A connection is returned to the pool only if its response was read to
+  the end and the server did not ask to close it
+- An idle connection the server already closed (EOF seen by a zero-timeout
+  select) is dropped instead of reused
+- A stale reused connection is retried once on a fresh one, never for POST
+  (an order may already have reached the exchange); non-idempotent methods
+  therefore always get a fresh connection
+- Accept-Encoding: gzip responses are decompressed incrementally, so
+  max_bytes applies to the decoded body
+- Redirects are followed only to hosts accepted by redirect_allowed; auth
+  headers (API key, Authorization, Cookie) are dropped when the host changes
+
+Policy (AllowList, audit) stays in http_client; this module only moves bytes.
+Do NOT import it elsewhere - use core.net.http_client.
+"""
+
+import http.client
+import select
+import socket
+import ssl
+import threading
+import time
+import zlib
+from io import BytesIO
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.error import HTTPError, URLError
+from urllib.parse import urljoin, urlsplit
+from urllib.request import Request
+
+# Pool configuration
+MAX_IDLE_PER_HOST = 4
+IDLE_TIMEOUT_SEC = 15.0
+MAX_REDIRECTS = 5
+MAX_ERROR_BODY_BYTES = 1024 * 1024
+
+_REDIRECT_CODES = {301, 302, 303, 307, 308}
+_IDEMPOTENT_METHODS = {"GET", "HEAD", "DELETE"}
+_AUTH_HEADERS = {"authorization", "proxy-authorization", "cookie", "x-mbx-apikey"}
+_STALE_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+
+_ssl_context: Optional[ssl.SSLContext] = None
+_ssl_lock = threading.Lock()
+
+_PoolKey = Tuple[str, str, int]
+
+
+def get_ssl_context() -> ssl.SSLContext:
+    """Get the process-wide default SSL context (created once)."""
+    global _ssl_context
+    with _ssl_lock:
+        if _ssl_context is None:
+            _ssl_context = ssl.create_default_context()
+        return _ssl_context
+
+
+class PooledResponse:
+    """
+    urlopen-compatible response that returns its connection to the pool on close.
+
+    Attributes:
+        status: HTTP status code
+        url: Final URL (after redirects)
+        headers: Response headers
+    """
+
+    def __init__(self, pool: "HttpPool", key: _PoolKey, conn: http.client.HTTPConnection,
+                 response: http.client.HTTPResponse, url: str):
+        self.status = response.status
+        self.reason = response.reason
+        self.url = url
+        self.headers = response.headers
+        self._pool = pool
+        self._key = key
+        self._conn: Optional[http.client.HTTPConnection] = conn
+        self._response = response
+
+        encoding = (response.getheader("Content-Encoding") or "").strip().lower()
+        self._decoder = zlib.decompressobj(16 + zlib.MAX_WBITS) if encoding == "gzip" else None
+        self._pending = b""
+        if self._decoder is not None:
+            pool._count("gzip_responses")
+
+    @property
+    def code(self) -> int:
+        return self.status
+
+    def geturl(self) -> str:
+        return self.url
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        """Read up to amt decoded bytes (all remaining if None)."""
+        if self._decoder is None:
+            return self._response.read(amt) if amt is not None else self._response.read()
+
+        out = bytearray()
+        while amt is None or len(out) < amt:
+            want = 0 if amt is None else amt - len(out)
+            if self._pending:
+                out += self._decoder.decompress(self._pending, want)
+                self._pending = self._decoder.unconsumed_tail
+                continue
+            raw = self._response.read(64 * 1024)
+            if not raw:
+                out += self._decoder.flush()
+                break
+            self._pending = raw
+        return bytes(out)
+
+    def readinto(self, buffer: Any) -> int:
+        """Read decoded bytes into a writable buffer; 0 at EOF."""
+        view = memoryview(buffer).cast("B")
+        if self._decoder is None:
+            return self._response.readinto(view)
+        data = self.read(len(view))
+        view[:len(data)] = data
+        return len(data)
+
+    def close(self) -> None:
+        """Release the connection: back to the pool if fully read, else close it."""
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        response = self._response
+        if not response.isclosed() and response.length == 0:
+            response.read()  # Finalize empty bodies (HEAD, 204, 304)
+        if response.isclosed() and not response.will_close and conn.sock is not None:
+            self._pool._release(self._key, conn)
+        else:
+            response.close()
+            conn.close()
+
+    def __enter__(self) -> "PooledResponse":
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        self.close()
+        return False
+
+
+class HttpPool:
+    """Per-host keep-alive connection pool with handshake and latency counters."""
+
+    def __init__(self, max_idle_per_host: int = MAX_IDLE_PER_HOST,
+                 idle_timeout_sec: float = IDLE_TIMEOUT_SEC):
+        self.max_idle_per_host = max_idle_per_host
+        self.idle_timeout_sec = idle_timeout_sec
+        self._idle: Dict[_PoolKey, List[Tuple[float, http.client.HTTPConnection]]] = {}
+        self._lock = threading.Lock()
+        self._stats: Dict[str, float] = {
+            "requests": 0,
+            "pool_hits": 0,
+            "pool_misses": 0,
+            "tls_handshakes": 0,
+            "stale_retries": 0,
+            "stale_dropped": 0,
+            "redirects": 0,
+            "gzip_responses": 0,
+            "latency_ms_total": 0.0,
+            "latency_ms_max": 0.0,
+        }
+
+    # =========================================================================
+    # PUBLIC API
+    # =========================================================================
+
+    def open(
+        self,
+        req: Request,
+        timeout: float,
+        redirect_allowed: Optional[Callable[[str], bool]] = None,
+    ) -> PooledResponse:
+        """
+        Send req over a pooled connection, following allowed redirects.
+
+        Raises HTTPError for status >= 400 and URLError for connection
+        failures (socket.timeout is raised as-is), like urllib's urlopen.
+        A redirect to a host rejected by redirect_allowed is not followed:
+        the 3xx response is returned with url set to the redirect target.
+        """
+        method = req.get_method()
+        url = req.full_url
+        body = req.data
+        headers = dict(req.header_items())
+
+        for _ in range(MAX_REDIRECTS + 1):
+            response = self._send(method, url, body, headers, timeout)
+            location = response.headers.get("Location")
+            if response.status not in _REDIRECT_CODES or not location:
+                break
+
+            target = urljoin(url, location)
+            target_host = (urlsplit(target).hostname or "").lower()
+            if target_host != (urlsplit(url).hostname or "").lower():
+                if redirect_allowed is None or not redirect_allowed(target_host):
+                    response.read(MAX_ERROR_BODY_BYTES)
+                    response.close()
+                    response.url = target
+                    return response
+                # Credentials are for the original host only
+                headers = {k: v for k, v in headers.items() if k.lower() not in _AUTH_HEADERS}
+
+            response.read(MAX_ERROR_BODY_BYTES)
+            response.close()
+            self._count("redirects")
+            if response.status == 303 or (response.status in (301, 302) and method == "POST"):
+                method, body = "GET", None
+                headers = {k: v for k, v in headers.items() if k.lower() not in ("content-type", "content-length")}
+            url = target
+
+        if response.status >= 400:
+            data = response.read(MAX_ERROR_BODY_BYTES)
+            response.close()
+            raise HTTPError(url, response.status, response.reason, response.headers, BytesIO(data))
+        return response
+
+    def clear(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for _, conn in conns:
+                conn.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool-hit, handshake and latency counters."""
+        with self._lock:
+            stats = dict(self._stats)
+            idle = sum(len(c) for c in self._idle.values())
+        requests = stats.pop("requests")
+        total = stats.pop("latency_ms_total")
+        return {
+            "requests": int(requests),
+            **{k: (round(v, 1) if isinstance(v, float) else int(v)) for k, v in stats.items()},
+            "pool_hit_rate": round(stats["pool_hits"] / requests, 3) if requests else 0.0,
+            "latency_ms_avg": round(total / requests, 1) if requests else 0.0,
+            "idle_connections": idle,
+        }
+
+    # =========================================================================
+    # INTERNALS
+    # =========================================================================
+
+    def _send(self, method: str, url: str, body: Optional[bytes],
+              headers: Dict[str, str], timeout: float) -> PooledResponse:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https"):
+            raise URLError(f"unsupported scheme: {scheme!r}")
+        host = parts.hostname or ""
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, host, port)
+        selector = parts.path or "/"
+        if parts.query:
+            selector += "?" + parts.query
+
+        start = time.time()
+        while True:
+            conn, reused = self._acquire(key, timeout, method in _IDEMPOTENT_METHODS)
+            try:
+                conn.request(method, selector, body=body, headers=headers)
+                response = conn.getresponse()
+                break
+            except socket.timeout:
+                conn.close()
+                raise
+            except _STALE_ERRORS as e:
+                conn.close()
+                if reused and method in _IDEMPOTENT_METHODS:
+                    self._count("stale_retries")
+                    continue
+                raise URLError(e)
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                raise URLError(e)
+
+        latency_ms = (time.time() - start) * 1000
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats["latency_ms_total"] += latency_ms
+            self._stats["latency_ms_max"] = max(self._stats["latency_ms_max"], latency_ms)
+        return PooledResponse(self, key, conn, response, url)
+
+    def _acquire(self, key: _PoolKey, timeout: float,
+                 reuse: bool = True) -> Tuple[http.client.HTTPConnection, bool]:
+        """
+        Get an idle connection for key, or open a new one.
+
+        reuse=False (non-idempotent methods) always opens a fresh connection:
+        a send on a socket the server closed meanwhile cannot be retried.
+        """
+        now = time.time()
+        expired = []
+        conn = None
+        with self._lock:
+            idle = self._idle.get(key, []) if reuse else []
+            while idle:
+                released_at, candidate = idle.pop()
+                if now - released_at > self.idle_timeout_sec:
+                    expired.append(candidate)
+                elif self._is_closed(candidate):
+                    self._stats["stale_dropped"] += 1
+                    expired.append(candidate)
+                else:
+                    conn = candidate
+                    break
+            self._stats["pool_hits" if conn else "pool_misses"] += 1
+            if conn is None and key[0] == "https":
+                self._stats["tls_handshakes"] += 1
+        for stale in expired:
+            stale.close()
+
+        if conn is not None:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            return conn, True
+
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=timeout, context=get_ssl_context()), False
+        return http.client.HTTPConnection(host, port, timeout=timeout), False
+
+    @staticmethod
+    def _is_closed(conn: http.client.HTTPConnection) -> bool:
+        """An idle keep-alive socket that is readable has hit EOF (or got stray data)."""
+        sock = conn.sock
+        if sock is None:
+            return True
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return True
+        return bool(readable)
+
+    def _release(self, key: _PoolKey, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append((time.time(), conn))
+                return
+        conn.close()
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+
+_pool: Optional[HttpPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> HttpPool:
+    """Get the process-wide connection pool."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = HttpPool()
+        return _pool
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    """Counters of the process-wide pool (empty if no request was made)."""
+    with _pool_lock:
+        pool = _pool
+    return pool.get_stats() if pool is not None else {}
@@ -3,10 +3,18 @@ Outcome Tracker - Track signal performance with MFE/MAE metrics.
 
 Implements OUTCOME TRACKING RULE from CLAUDE.md:
 - tracked_signals.jsonl: signal entries with entry_price, invalidation_price
-- price_samples.jsonl: sampled prices per cycle
+- price_samples/<SYMBOL>.f64: sampled prices per cycle, one file per symbol
 - signal_outcomes.jsonl: computed MFE/MAE per horizon
 
-All writes are atomic (temp -> fsync -> replace) per CRITICAL RULE: FILE WRITING.
+Price samples are fixed-width little-endian (ts, price) float64 pairs, appended
+in time order, so the file itself is the time index (np.searchsorted on ts).
+A torn trailing record from an interrupted append is ignored on read and
+truncated by the next append. A legacy price_samples.jsonl is migrated once.
+
+compute_outcomes groups signals by symbol, loads each symbol's samples once
+and takes all horizons from running max/min over consecutive windows.
+
+JSONL writes are atomic (temp -> fsync -> replace) per CRITICAL RULE: FILE WRITING.
 """
 from __future__ import annotations
 
@@ -15,20 +23,27 @@ import json
 import logging
 import os
 import time
+from collections import defaultdict
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
 logger = logging.getLogger("outcome_tracker")
 
 BASE_DIR = Path(r"C:\Users\kirillDev\Desktop\TradingBot\minibot")
 STATE_DIR = BASE_DIR / "state"
 
 TRACKED_SIGNALS_FILE = STATE_DIR / "tracked_signals.jsonl"
-PRICE_SAMPLES_FILE = STATE_DIR / "price_samples.jsonl"
+PRICE_SAMPLES_FILE = STATE_DIR / "price_samples.jsonl"  # Legacy, migrated to PRICE_SAMPLES_DIR
+PRICE_SAMPLES_DIR = STATE_DIR / "price_samples"
 SIGNAL_OUTCOMES_FILE = STATE_DIR / "signal_outcomes.jsonl"
 
+_SAMPLE_DTYPE = np.dtype([("ts", "<f8"), ("price", "<f8")])
+_SAMPLE_BYTES = _SAMPLE_DTYPE.itemsize
+
 # Horizons for outcome tracking (seconds)
 DEFAULT_HORIZONS = [3600, 14400, 86400]  # 1h, 4h, 24h
 
@@ -61,6 +76,125 @@ def _atomic_append_jsonl(path: Path, record: Dict[str, Any]) -> None:
     _atomic_write(path, "\n".join(lines) + "\n")
 
 
+def _atomic_append_jsonl_many(path: Path, records: List[Dict[str, Any]]) -> None:
+    """Atomic append of several records with a single rewrite."""
+    if not records:
+        return
+    content = ""
+    if path.exists():
+        try:
+            content = path.read_text(encoding="utf-8")
+        except Exception as e:
+            logger.warning("Failed to read %s: %s", path, e)
+    if content and not content.endswith("\n"):
+        content += "\n"
+    content += "".join(
+        json.dumps(r, ensure_ascii=False, sort_keys=True) + "\n" for r in records
+    )
+    _atomic_write(path, content)
+
+
+def _samples_path(symbol: str) -> Path:
+    return PRICE_SAMPLES_DIR / f"{symbol}.f64"
+
+
+def _load_samples(symbol: str) -> np.ndarray:
+    """All (ts, price) rows for symbol, time-ordered (torn tail ignored)."""
+    path = _samples_path(symbol)
+    try:
+        count = path.stat().st_size // _SAMPLE_BYTES
+    except OSError:
+        return np.empty(0, dtype=_SAMPLE_DTYPE)
+    if count == 0:
+        return np.empty(0, dtype=_SAMPLE_DTYPE)
+    return np.fromfile(path, dtype=_SAMPLE_DTYPE, count=count)
+
+
+def _append_samples(symbol: str, rows: np.ndarray) -> int:
+    """
+    Append (ts, price) rows to the symbol's sample file.
+
+    Timestamps are clamped to be non-decreasing (including against the
+    stored tail), so a clock step back never unsorts the file.
+    Returns rows written.
+    """
+    if len(rows) == 0:
+        return 0
+    PRICE_SAMPLES_DIR.mkdir(parents=True, exist_ok=True)
+    rows = np.array(rows, dtype=_SAMPLE_DTYPE)
+
+    with open(_samples_path(symbol), "a+b") as f:
+        size = f.seek(0, os.SEEK_END)
+        count = size // _SAMPLE_BYTES
+        if size != count * _SAMPLE_BYTES:
+            # Drop bytes from an interrupted append before writing
+            f.truncate(count * _SAMPLE_BYTES)
+        last_ts = -np.inf
+        if count:
+            f.seek((count - 1) * _SAMPLE_BYTES)
+            last_ts = float(np.frombuffer(f.read(_SAMPLE_BYTES), dtype=_SAMPLE_DTYPE)["ts"][0])
+        rows["ts"] = np.maximum.accumulate(np.maximum(rows["ts"], last_ts))
+        f.seek(0, os.SEEK_END)
+        f.write(rows.tobytes())
+        f.flush()
+        os.fsync(f.fileno())
+    return len(rows)
+
+
+def _rewrite_samples(symbol: str, rows: np.ndarray) -> None:
+    """Replace the symbol's sample file atomically (temp -> fsync -> replace)."""
+    PRICE_SAMPLES_DIR.mkdir(parents=True, exist_ok=True)
+    path = _samples_path(symbol)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(np.ascontiguousarray(rows, dtype=_SAMPLE_DTYPE).tobytes())
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def migrate_legacy_price_samples() -> int:
+    """
+    One-time migration of price_samples.jsonl into per-symbol sample files.
+
+    Legacy rows are merged by timestamp with any samples already stored, so
+    the migration stays correct if new samples were written first. The
+    legacy file is renamed to *.migrated afterwards.
+
+    Returns:
+        Number of samples migrated
+    """
+    if not PRICE_SAMPLES_FILE.exists():
+        return 0
+
+    by_symbol: Dict[str, List[tuple]] = defaultdict(list)
+    try:
+        with open(PRICE_SAMPLES_FILE, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    data = json.loads(line)
+                    price = float(data["price"])
+                    if price > 0:
+                        by_symbol[data["symbol"]].append((float(data["ts_utc"]), price))
+                except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                    pass
+    except Exception as e:
+        logger.error("Failed to read legacy price samples: %s", e)
+        return 0
+
+    migrated = 0
+    for symbol, rows in by_symbol.items():
+        merged = np.concatenate([_load_samples(symbol), np.array(rows, dtype=_SAMPLE_DTYPE)])
+        _rewrite_samples(symbol, merged[np.argsort(merged["ts"], kind="stable")])
+        migrated += len(rows)
+
+    os.replace(PRICE_SAMPLES_FILE, PRICE_SAMPLES_FILE.with_suffix(".jsonl.migrated"))
+    logger.info("Migrated %d legacy price samples (%d symbols)", migrated, len(by_symbol))
+    return migrated
+
+
 def _generate_signal_id(signal: Dict[str, Any]) -> str:
     """Generate deterministic signal ID from key fields."""
     key_fields = {
@@ -179,6 +313,8 @@ def record_price_sample(symbol: str, price: float, source: str = "binance",
     """
     Record a price sample for outcome calculation.
 
+    Only (ts, price) is stored; source and snapshot_id are logged.
+
     Args:
         symbol: Trading pair (e.g., BTCUSDT)
         price: Current price
@@ -189,16 +325,10 @@ def record_price_sample(symbol: str, price: float, source: str = "binance",
         logger.warning("FAIL-CLOSED: invalid price sample: %s = %s", symbol, price)
         return
 
-    sample = PriceSample(
-        ts_utc=time.time(),
-        symbol=symbol,
-        price=price,
-        source=source,
-        snapshot_id=snapshot_id,
-    )
-
-    _atomic_append_jsonl(PRICE_SAMPLES_FILE, sample.to_dict())
-    logger.debug("Recorded price: %s = %.8f", symbol, price)
+    migrate_legacy_price_samples()
+    row = np.array([(time.time(), price)], dtype=_SAMPLE_DTYPE)
+    _append_samples(symbol, row)
+    logger.debug("Recorded price: %s = %.8f (%s %s)", symbol, price, source, snapshot_id)
 
 
 def get_tracked_signals(max_age_sec: int = 86400 * 7) -> List[TrackedSignal]:
@@ -245,24 +375,18 @@ def get_price_samples(symbol: str, since_ts: float) -> List[PriceSample]:
     Returns:
         List of PriceSample objects
     """
-    if not PRICE_SAMPLES_FILE.exists():
-        return []
-
-    samples = []
+    migrate_legacy_price_samples()
     try:
-        for line in PRICE_SAMPLES_FILE.read_text(encoding="utf-8").splitlines():
-            if not line.strip():
-                continue
-            try:
-                data = json.loads(line)
-                if data.get("symbol") == symbol and data.get("ts_utc", 0) >= since_ts:
-                    samples.append(PriceSample(**data))
-            except (json.JSONDecodeError, TypeError):
-                pass
+        data = _load_samples(symbol)
     except Exception as e:
         logger.error("Failed to read price samples: %s", e)
+        return []
 
-    return samples
+    start = int(np.searchsorted(data["ts"], since_ts, side="left"))
+    return [
+        PriceSample(ts_utc=float(ts), symbol=symbol, price=float(price))
+        for ts, price in data[start:].tolist()
+    ]
 
 
 def compute_outcomes(horizons: List[int] = None) -> int:
@@ -283,60 +407,89 @@ def compute_outcomes(horizons: List[int] = None) -> int:
         logger.info("No tracked signals to compute outcomes for")
         return 0
 
+    migrate_legacy_price_samples()
+    horizons = sorted(horizons)
     now = time.time()
-    outcomes_computed = 0
+    outcomes: List[SignalOutcome] = []
 
+    by_symbol: Dict[str, List[TrackedSignal]] = defaultdict(list)
     for signal in signals:
-        samples = get_price_samples(signal.symbol, signal.ts_utc)
-        if not samples:
-            continue
+        by_symbol[signal.symbol].append(signal)
 
-        for horizon in horizons:
-            horizon_end = signal.ts_utc + horizon
-            if now < horizon_end:
-                # Horizon not yet reached
-                continue
+    for symbol, group in by_symbol.items():
+        try:
+            data = _load_samples(symbol)
+        except Exception as e:
+            logger.error("Failed to read price samples for %s: %s", symbol, e)
+            continue
+        if len(data) == 0:
+            continue
+        ts = np.ascontiguousarray(data["ts"])
+        prices = np.ascontiguousarray(data["price"])
 
-            # Get samples within horizon
-            horizon_samples = [s for s in samples if signal.ts_utc <= s.ts_utc <= horizon_end]
-            if not horizon_samples:
-                continue
+        for signal in group:
+            outcomes.extend(_signal_outcomes(signal, ts, prices, horizons, now))
 
-            # Calculate MFE/MAE
-            entry = signal.entry_price
-            prices = [s.price for s in horizon_samples]
+    _atomic_append_jsonl_many(SIGNAL_OUTCOMES_FILE, [o.to_dict() for o in outcomes])
+    for o in outcomes:
+        logger.info("Outcome: %s %dh MFE=%.2f%% MAE=%.2f%% PnL=%.2f%%",
+                   o.signal_id[:16], o.horizon_sec // 3600, o.mfe, o.mae, o.pnl_pct)
 
-            if signal.side == "LONG":
-                mfe = max((p - entry) / entry * 100 for p in prices)
-                mae = min((p - entry) / entry * 100 for p in prices)
-            else:  # SHORT
-                mfe = max((entry - p) / entry * 100 for p in prices)
-                mae = min((entry - p) / entry * 100 for p in prices)
+    return len(outcomes)
 
-            # Get price at horizon end
-            ref_price = horizon_samples[-1].price
-            if signal.side == "LONG":
-                pnl_pct = (ref_price - entry) / entry * 100
-            else:
-                pnl_pct = (entry - ref_price) / entry * 100
 
-            outcome = SignalOutcome(
-                signal_id=signal.signal_id,
-                horizon_sec=horizon,
-                mfe=round(mfe, 4),
-                mae=round(mae, 4),
-                outcome_ts_utc=horizon_end,
-                reference_price=ref_price,
-                pnl_pct=round(pnl_pct, 4),
-            )
+def _signal_outcomes(signal: TrackedSignal, ts: np.ndarray, prices: np.ndarray,
+                     horizons: List[int], now: float) -> List[SignalOutcome]:
+    """
+    Outcomes for one signal from its symbol's sample columns.
 
-            _atomic_append_jsonl(SIGNAL_OUTCOMES_FILE, outcome.to_dict())
-            outcomes_computed += 1
+    horizons must be ascending: each horizon extends the previous window, so
+    max/min are carried over and only the new slice is reduced.
+    """
+    ends = [signal.ts_utc + h for h in horizons if now >= signal.ts_utc + h]
+    if not ends:
+        # Horizon not yet reached
+        return []
 
-            logger.info("Outcome: %s %dh MFE=%.2f%% MAE=%.2f%% PnL=%.2f%%",
-                       signal.signal_id[:16], horizon // 3600, mfe, mae, pnl_pct)
+    lo = int(np.searchsorted(ts, signal.ts_utc, side="left"))
+    his = np.searchsorted(ts, ends, side="right")
+    entry = signal.entry_price
+    results = []
+    prev = lo
+    p_max, p_min = -np.inf, np.inf
+
+    for horizon, horizon_end, hi in zip(horizons, ends, his.tolist()):
+        if hi > prev:
+            window = prices[prev:hi]
+            p_max = max(p_max, float(window.max()))
+            p_min = min(p_min, float(window.min()))
+            prev = hi
+        if hi <= lo:
+            # No samples within horizon
+            continue
 
-    return outcomes_computed
+        # Calculate MFE/MAE and PnL at the last sample in the horizon
+        ref_price = float(prices[hi - 1])
+        if signal.side == "LONG":
+            mfe = (p_max - entry) / entry * 100
+            mae = (p_min - entry) / entry * 100
+            pnl_pct = (ref_price - entry) / entry * 100
+        else:  # SHORT
+            mfe = (entry - p_min) / entry * 100
+            mae = (entry - p_max) / entry * 100
+            pnl_pct = (entry - ref_price) / entry * 100
+
+        results.append(SignalOutcome(
+            signal_id=signal.signal_id,
+            horizon_sec=horizon,
+            mfe=round(mfe, 4),
+            mae=round(mae, 4),
+            outcome_ts_utc=horizon_end,
+            reference_price=ref_price,
+            pnl_pct=round(pnl_pct, 4),
+        ))
+
+    return results
 
 
 def get_symbols_to_track() -> List[str]:
@@ -358,7 +511,24 @@ def cleanup_old_data(max_age_days: int = 30) -> int:
     cutoff = time.time() - (max_age_days * 86400)
     removed = 0
 
-    for filepath in [TRACKED_SIGNALS_FILE, PRICE_SAMPLES_FILE, SIGNAL_OUTCOMES_FILE]:
+    migrate_legacy_price_samples()
+    for path in sorted(PRICE_SAMPLES_DIR.glob("*.f64")) if PRICE_SAMPLES_DIR.exists() else []:
+        data = _load_samples(path.stem)
+        start = int(np.searchsorted(data["ts"], cutoff, side="left"))
+        if start == 0:
+            continue
+        removed += start
+        if start < len(data):
+            tmp = path.with_suffix(".f64.tmp")
+            with open(tmp, "wb") as f:
+                f.write(data[start:].tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        else:
+            path.unlink()
+
+    for filepath in [TRACKED_SIGNALS_FILE, SIGNAL_OUTCOMES_FILE]:
         if not filepath.exists():
             continue
 
@@ -47,6 +47,8 @@ __all__ = [
     "HealthStatus",
     "ErrorCategory",
     "categorize_error",
+    # Fetch cache
+    "SourceFetchCache",
     # Policy
     "PolicyMode",
     "PolicyConfig",
@@ -88,6 +90,10 @@ def __getattr__(name):
         from core.spider.health import categorize_error
         return categorize_error
 
+    if name == "SourceFetchCache":
+        from core.spider.fetch_cache import SourceFetchCache
+        return SourceFetchCache
+
     if name in ("PolicyMode", "PolicyConfig", "PolicyVerdict", "evaluate_policy"):
         from core.spider.policy import PolicyMode, PolicyConfig, PolicyVerdict, evaluate_policy
         return locals()[name]
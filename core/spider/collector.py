@@ -8,17 +8,29 @@ News Collector Module
 
 Orchestrates fetching from all enabled sources using egress-policy-enforced HTTP.
 Supports STRICT (fail-fast) and LENIENT (skip-and-continue) modes.
+
+With max_workers > 1, sources are downloaded concurrently on a bounded
+thread pool, while parsing, dedup, persistence and health bookkeeping still
+run in priority order on the calling thread. cycle_deadline_sec bounds the
+whole run: sources not fetched by then fail with a timeout.
+
+Requests are conditional (ETag/Last-Modified from SourceFetchCache); a 304
+or a byte-identical body skips parsing and dedup and reports the cached
+item count.
 """
 
 import json
+import math
 import os
 import sys
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, Union
 
 from core.net.http_client import http_get, EgressDeniedError, EgressError
 from core.spider.sources import (
@@ -34,6 +46,7 @@ from core.spider.parser import (
     ParseError,
 )
 from core.spider.dedup import DedupStore
+from core.spider.fetch_cache import SourceFetchCache, body_sha256
 from core.spider.health import HealthTracker, categorize_error, ErrorCategory
 
 
@@ -61,6 +74,13 @@ SOURCES_MUST_HAVE_ITEMS = {
 }
 
 
+# Per-source HTTP timeout (capped by the remaining cycle deadline)
+SOURCE_TIMEOUT_SEC = 30
+
+# Latency histogram bucket upper bounds (ms); slower samples go to "+inf"
+LATENCY_BUCKETS_MS = (100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
 class CollectorMode(Enum):
     """
     Collector operating mode.
@@ -84,6 +104,8 @@ class SourceResult:
     new_items_count: int
     error: Optional[str] = None
     latency_ms: int = 0
+    bytes_downloaded: int = 0
+    cache: Optional[str] = None  # "not_modified" (304) / "unchanged" (same body hash)
 
 
 @dataclass
@@ -103,6 +125,8 @@ class CollectorResult:
         duplicate_items: Items skipped as duplicates
         source_results: Per-source result details
         fatal_error: If STRICT mode, the error that caused stop
+        latency_histograms: Per-source latency bucket counts across this
+            collector's runs (bucket upper bound in ms -> count)
     """
     mode: CollectorMode
     started_utc: datetime
@@ -115,6 +139,7 @@ class CollectorResult:
     duplicate_items: int = 0
     source_results: List[SourceResult] = field(default_factory=list)
     fatal_error: Optional[str] = None
+    latency_histograms: Dict[str, Dict[str, int]] = field(default_factory=dict)
 
     def is_success(self) -> bool:
         """Check if run completed successfully."""
@@ -141,9 +166,12 @@ class CollectorResult:
                     "new_items_count": r.new_items_count,
                     "error": r.error,
                     "latency_ms": r.latency_ms,
+                    "bytes_downloaded": r.bytes_downloaded,
+                    "cache": r.cache,
                 }
                 for r in self.source_results
             ],
+            "latency_histograms": self.latency_histograms,
         }
 
 
@@ -162,6 +190,9 @@ class NewsCollector:
         output_path: Optional[Path] = None,
         project_root: Optional[Path] = None,
         health_tracker: Optional[HealthTracker] = None,
+        max_workers: int = 1,
+        cycle_deadline_sec: Optional[float] = None,
+        fetch_cache: Optional[SourceFetchCache] = None,
     ):
         """
         Initialize collector.
@@ -172,8 +203,14 @@ class NewsCollector:
             output_path: Path to write collected items JSONL
             project_root: Project root for resolving paths
             health_tracker: Health tracker for monitoring (creates default if None)
+            max_workers: Concurrent source downloads (1 = sequential)
+            cycle_deadline_sec: Deadline for a whole collect() run (None = no limit)
+            fetch_cache: Conditional GET / body-hash cache (creates default if None)
         """
         self._mode = mode
+        self._max_workers = max(1, max_workers)
+        self._cycle_deadline_sec = cycle_deadline_sec
+        self._latency_histograms: Dict[str, List[int]] = {}
         self._project_root = project_root or Path(__file__).resolve().parent.parent.parent
 
         if dedup_store is None:
@@ -188,6 +225,10 @@ class NewsCollector:
             health_tracker = HealthTracker(project_root=self._project_root)
         self._health = health_tracker
 
+        if fetch_cache is None:
+            fetch_cache = SourceFetchCache(project_root=self._project_root)
+        self._fetch_cache = fetch_cache
+
     def collect(
         self,
         sources: Optional[List[SourceConfig]] = None,
@@ -198,7 +239,7 @@ class NewsCollector:
 
         Args:
             sources: Source list (loads enabled from registry if None)
-            dry_run: If True, fetch but don't persist items
+            dry_run: If True, fetch but don't persist items (or the fetch cache)
 
         Returns:
             CollectorResult with run statistics
@@ -228,62 +269,151 @@ class NewsCollector:
         # Sort by priority (lower = higher priority)
         sources = sorted(sources, key=lambda s: s.priority)
 
-        for source in sources:
-            result.sources_attempted += 1
-
-            try:
-                src_result = self._fetch_source(source, dry_run)
-                result.source_results.append(src_result)
-
-                if src_result.success:
-                    result.sources_success += 1
-                    result.total_items += src_result.items_count
-                    result.new_items += src_result.new_items_count
-                    result.duplicate_items += (
-                        src_result.items_count - src_result.new_items_count
-                    )
-                    # Record success in health tracker
-                    self._health.record_success(source.id, src_result.items_count)
-                else:
-                    result.sources_failed += 1
-                    # Record failure in health tracker
-                    error_category = self._health.record_failure(
-                        source.id, src_result.error or "Unknown error"
-                    )
+        deadline = None
+        if self._cycle_deadline_sec is not None:
+            deadline = time.monotonic() + self._cycle_deadline_sec
+
+        # Concurrent mode: start all downloads now, merge below in priority order
+        executor = None
+        futures: List[Optional[Future]] = [None] * len(sources)
+        if self._max_workers > 1 and len(sources) > 1:
+            executor = ThreadPoolExecutor(
+                max_workers=min(self._max_workers, len(sources)),
+                thread_name_prefix="spider-fetch",
+            )
+            timeout_sec = self._source_timeout(deadline)
+            futures = [executor.submit(self._download, source, timeout_sec) for source in sources]
 
-                    # In STRICT mode, CLIENT_BUG errors should stop immediately
-                    if self._mode == CollectorMode.STRICT:
-                        result.fatal_error = (
-                            f"Source {source.id} failed: {src_result.error}"
+        try:
+            for source, future in zip(sources, futures):
+                result.sources_attempted += 1
+
+                try:
+                    src_result = self._collect_source(source, future, deadline, dry_run)
+                    result.source_results.append(src_result)
+                    self._record_latency(source.id, src_result.latency_ms)
+
+                    if src_result.success:
+                        result.sources_success += 1
+                        result.total_items += src_result.items_count
+                        result.new_items += src_result.new_items_count
+                        result.duplicate_items += (
+                            src_result.items_count - src_result.new_items_count
                         )
-                        break
-                    # In LENIENT mode, CLIENT_BUG should still be flagged
-                    elif error_category == ErrorCategory.CLIENT_BUG:
-                        # Log but continue - this is a bug we need to fix
-                        import sys
-                        print(
-                            f"[CRITICAL] {source.id}: CLIENT BUG detected - {src_result.error}",
-                            file=sys.stderr
+                        # Record success in health tracker
+                        self._health.record_success(source.id, src_result.items_count)
+                    else:
+                        result.sources_failed += 1
+                        # Record failure in health tracker
+                        error_category = self._health.record_failure(
+                            source.id, src_result.error or "Unknown error"
                         )
 
-            except Exception as e:
-                error_msg = f"{type(e).__name__}: {e}"
-                result.source_results.append(SourceResult(
-                    source_id=source.id,
-                    success=False,
-                    items_count=0,
-                    new_items_count=0,
-                    error=error_msg,
-                ))
-                result.sources_failed += 1
+                        # In STRICT mode, CLIENT_BUG errors should stop immediately
+                        if self._mode == CollectorMode.STRICT:
+                            result.fatal_error = (
+                                f"Source {source.id} failed: {src_result.error}"
+                            )
+                            break
+                        # In LENIENT mode, CLIENT_BUG should still be flagged
+                        elif error_category == ErrorCategory.CLIENT_BUG:
+                            # Log but continue - this is a bug we need to fix
+                            print(
+                                f"[CRITICAL] {source.id}: CLIENT BUG detected - {src_result.error}",
+                                file=sys.stderr
+                            )
+
+                except Exception as e:
+                    error_msg = f"{type(e).__name__}: {e}"
+                    result.source_results.append(SourceResult(
+                        source_id=source.id,
+                        success=False,
+                        items_count=0,
+                        new_items_count=0,
+                        error=error_msg,
+                    ))
+                    result.sources_failed += 1
 
-                if self._mode == CollectorMode.STRICT:
-                    result.fatal_error = f"Source {source.id} failed: {error_msg}"
-                    raise
+                    if self._mode == CollectorMode.STRICT:
+                        result.fatal_error = f"Source {source.id} failed: {error_msg}"
+                        raise
+
+        finally:
+            if executor is not None:
+                # STRICT stop or deadline: drop downloads that have not started
+                executor.shutdown(wait=False, cancel_futures=True)
+            result.latency_histograms = self.get_latency_histograms()
+            if not dry_run:
+                self._fetch_cache.save()
 
         result.finished_utc = datetime.now(timezone.utc)
         return result
 
+    def get_latency_histograms(self) -> Dict[str, Dict[str, int]]:
+        """Per-source latency bucket counts (bucket upper bound in ms -> count)."""
+        labels = [str(b) for b in LATENCY_BUCKETS_MS] + ["+inf"]
+        return {
+            source_id: dict(zip(labels, counts))
+            for source_id, counts in self._latency_histograms.items()
+        }
+
+    def _record_latency(self, source_id: str, latency_ms: int) -> None:
+        counts = self._latency_histograms.setdefault(source_id, [0] * (len(LATENCY_BUCKETS_MS) + 1))
+        bucket = len(LATENCY_BUCKETS_MS)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if latency_ms <= bound:
+                bucket = i
+                break
+        counts[bucket] += 1
+
+    def _source_timeout(self, deadline: Optional[float]) -> int:
+        """Per-source HTTP timeout, capped by the remaining cycle deadline."""
+        if deadline is None:
+            return SOURCE_TIMEOUT_SEC
+        remaining = deadline - time.monotonic()
+        return max(1, min(SOURCE_TIMEOUT_SEC, math.ceil(remaining)))
+
+    def _collect_source(
+        self,
+        source: SourceConfig,
+        future: Optional[Future],
+        deadline: Optional[float],
+        dry_run: bool,
+    ) -> SourceResult:
+        """
+        Get one source's download (inline or from its future) and process it.
+
+        A source whose download is not done by the cycle deadline fails
+        with a timeout error.
+        """
+        start_ms = time.monotonic_ns() // 1_000_000
+
+        if future is None:
+            if deadline is not None and time.monotonic() >= deadline:
+                return self._deadline_result(source, 0)
+            fetched = self._download(source, self._source_timeout(deadline))
+        else:
+            try:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                fetched = future.result(timeout=timeout)
+            except FutureTimeoutError:
+                waited_ms = (time.monotonic_ns() // 1_000_000) - start_ms
+                return self._deadline_result(source, waited_ms)
+
+        if isinstance(fetched, SourceResult):
+            return fetched
+        return self._process_source(source, *fetched, dry_run=dry_run)
+
+    def _deadline_result(self, source: SourceConfig, latency_ms: int) -> SourceResult:
+        return SourceResult(
+            source_id=source.id,
+            success=False,
+            items_count=0,
+            new_items_count=0,
+            error=f"Cycle deadline exceeded (timeout after {self._cycle_deadline_sec}s)",
+            latency_ms=latency_ms,
+        )
+
     def _fetch_source(
         self,
         source: SourceConfig,
@@ -299,23 +429,114 @@ class NewsCollector:
         Returns:
             SourceResult with fetch statistics
         """
+        fetched = self._download(source, SOURCE_TIMEOUT_SEC)
+        if isinstance(fetched, SourceResult):
+            return fetched
+        return self._process_source(source, *fetched, dry_run=dry_run)
+
+    def _download(
+        self,
+        source: SourceConfig,
+        timeout_sec: int,
+    ) -> Union[Tuple[int, bytes, int, Dict[str, str]], SourceResult]:
+        """
+        Download single source (safe to run on a worker thread).
+
+        Args:
+            source: Source configuration
+            timeout_sec: HTTP timeout
+
+        Returns:
+            (status, body, latency_ms, response_headers), or a failed
+            SourceResult on egress error
+        """
         start_ms = time.monotonic_ns() // 1_000_000
 
         try:
             # Use browser-like headers for Binance sources
-            extra_headers = None
+            extra_headers = {}
             if source.source_type == SourceType.BINANCE_ANN:
-                extra_headers = BINANCE_HEADERS
+                extra_headers.update(BINANCE_HEADERS)
+            extra_headers.update(self._fetch_cache.conditional_headers(source.id, source.url))
 
             # Fetch via egress-controlled http_get
+            response_headers: Dict[str, str] = {}
             status, body, final_url = http_get(
                 source.url,
-                timeout_sec=30,
+                timeout_sec=timeout_sec,
                 process=f"spider:{source.id}",
-                extra_headers=extra_headers,
+                extra_headers=extra_headers or None,
+                response_headers=response_headers,
             )
 
             latency_ms = (time.monotonic_ns() // 1_000_000) - start_ms
+            return status, body, latency_ms, response_headers
+
+        except EgressDeniedError as e:
+            latency_ms = (time.monotonic_ns() // 1_000_000) - start_ms
+            return SourceResult(
+                source_id=source.id,
+                success=False,
+                items_count=0,
+                new_items_count=0,
+                error=f"Egress DENIED: {e.reason.value}",
+                latency_ms=latency_ms,
+            )
+
+        except EgressError as e:
+            latency_ms = (time.monotonic_ns() // 1_000_000) - start_ms
+            return SourceResult(
+                source_id=source.id,
+                success=False,
+                items_count=0,
+                new_items_count=0,
+                error=f"Egress error: {e.reason.value}",
+                latency_ms=latency_ms,
+            )
+
+    def _process_source(
+        self,
+        source: SourceConfig,
+        status: int,
+        body: bytes,
+        latency_ms: int,
+        response_headers: Dict[str, str],
+        dry_run: bool,
+    ) -> SourceResult:
+        """
+        Parse, deduplicate and persist a downloaded source (calling thread only).
+
+        A 304 or a body identical to the last processed one is reported as
+        success with the cached item count and no new items, without parsing.
+
+        Args:
+            source: Source configuration
+            status: HTTP status
+            body: Response body
+            latency_ms: Download latency
+            response_headers: Response headers (ETag/Last-Modified)
+            dry_run: Skip persistence (and fetch cache update) if True
+
+        Returns:
+            SourceResult with fetch statistics
+        """
+        try:
+            cached = self._fetch_cache.get(source.id, source.url)
+            cache_state = None
+            if cached is not None and status == 304:
+                cache_state = "not_modified"
+            elif cached is not None and status == 200 and cached.body_sha256 == body_sha256(body):
+                cache_state = "unchanged"
+            if cache_state is not None:
+                return SourceResult(
+                    source_id=source.id,
+                    success=True,
+                    items_count=cached.items_count,
+                    new_items_count=0,
+                    latency_ms=latency_ms,
+                    bytes_downloaded=len(body),
+                    cache=cache_state,
+                )
 
             if status != 200:
                 return SourceResult(
@@ -354,38 +575,19 @@ class NewsCollector:
                     if not dry_run:
                         self._persist_item(item)
 
+            if not dry_run:
+                self._fetch_cache.update(source.id, source.url, response_headers, body, len(items))
+
             return SourceResult(
                 source_id=source.id,
                 success=True,
                 items_count=len(items),
                 new_items_count=new_count,
                 latency_ms=latency_ms,
-            )
-
-        except EgressDeniedError as e:
-            latency_ms = (time.monotonic_ns() // 1_000_000) - start_ms
-            return SourceResult(
-                source_id=source.id,
-                success=False,
-                items_count=0,
-                new_items_count=0,
-                error=f"Egress DENIED: {e.reason.value}",
-                latency_ms=latency_ms,
-            )
-
-        except EgressError as e:
-            latency_ms = (time.monotonic_ns() // 1_000_000) - start_ms
-            return SourceResult(
-                source_id=source.id,
-                success=False,
-                items_count=0,
-                new_items_count=0,
-                error=f"Egress error: {e.reason.value}",
-                latency_ms=latency_ms,
+                bytes_downloaded=len(body),
             )
 
         except ParseError as e:
-            latency_ms = (time.monotonic_ns() // 1_000_000) - start_ms
             return SourceResult(
                 source_id=source.id,
                 success=False,
@@ -420,6 +622,8 @@ class NewsCollector:
 def run_collection(
     mode: str = "strict",
     dry_run: bool = False,
+    max_workers: int = 1,
+    cycle_deadline_sec: Optional[float] = None,
 ) -> CollectorResult:
     """
     Convenience function to run collection.
@@ -427,10 +631,16 @@ def run_collection(
     Args:
         mode: "strict" or "lenient"
         dry_run: Skip persistence if True
+        max_workers: Concurrent source downloads (1 = sequential)
+        cycle_deadline_sec: Deadline for the whole run (None = no limit)
 
     Returns:
         CollectorResult
     """
     collector_mode = CollectorMode(mode.lower())
-    collector = NewsCollector(mode=collector_mode)
+    collector = NewsCollector(
+        mode=collector_mode,
+        max_workers=max_workers,
+        cycle_deadline_sec=cycle_deadline_sec,
+    )
     return collector.collect(dry_run=dry_run)
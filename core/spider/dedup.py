@@ -2,32 +2,46 @@
 # Created by: Claude (opus-4)
 # Created at (UTC): 2026-01-25T14:00:00Z
 # Modified by: Claude (opus-4)
-# Modified at (UTC): 2026-01-25T20:00:00Z
-# Purpose: News deduplication store (sha256 JSONL format, atomic I/O, rotation-based cleanup)
+# Modified at (UTC): 2026-02-03T16:00:00Z
+# Purpose: News deduplication store (daily sha256 JSONL segments + sorted hash indexes)
 # === END SIGNATURE ===
 """
 News Deduplication Module
 
 Tracks seen item IDs to avoid processing duplicates.
-Uses sha256 JSONL format: sha256:<hex16> <json>
 
-Backward compatible: reads legacy plain JSON lines during migration.
+Layout (next to store_path, e.g. state/news_dedup.d/):
+- seg_YYYYMMDD.jsonl: items first seen that UTC day, sha256 JSONL format
+  (sha256:<hex16> <json>), append-only
+- seg_YYYYMMDD.idx: sorted little-endian uint64 hashes of the day's item
+  IDs, built once when the day is over
+
+Only today's segment is parsed on load; past days are answered by binary
+search over their index (8 bytes per ID), so cold start and memory stay
+flat as history grows. Segments older than retention_days are dropped
+wholesale. IDs are compared by 64-bit blake2b hash (collision odds are
+negligible at millions of IDs).
+
+Backward compatible: a legacy single-file store (sha256 JSONL or plain JSON
+lines) is migrated into segments once and renamed to *.migrated.
 """
 
+import hashlib
 import json
 import os
 import sys
 import threading
+from array import array
+from bisect import bisect_left
 from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Set, Optional, Dict, Any
+from typing import Dict, List, Optional, Set, Tuple
 
 from core.io.atomic import (
     atomic_append_sha256_jsonl,
     parse_sha256_jsonl_line,
     format_sha256_jsonl_line,
-    atomic_write_text,
 )
 
 
@@ -40,12 +54,31 @@ class DedupEntry:
     link: str = ""
 
 
+def _hash_id(item_id: str) -> int:
+    """64-bit hash of an item ID (index key)."""
+    return int.from_bytes(hashlib.blake2b(item_id.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def _parse_line(line: str) -> Optional[dict]:
+    """Parse a sha256 JSONL or legacy plain JSON line (None if invalid)."""
+    try:
+        if line.startswith("sha256:"):
+            return parse_sha256_jsonl_line(line)
+        return json.loads(line)
+    except (json.JSONDecodeError, ValueError):
+        return None
+
+
+def _today() -> str:
+    return datetime.now(timezone.utc).strftime("%Y%m%d")
+
+
 class DedupStore:
     """
-    Persistent deduplication store using JSONL file.
+    Persistent deduplication store using daily JSONL segments.
 
-    Thread-safe with file locking for concurrent access.
-    Entries are kept for configurable retention period.
+    Thread-safe; segment appends use file locking for concurrent processes.
+    Entries are kept for configurable retention period (whole days).
     """
 
     def __init__(
@@ -58,7 +91,8 @@ class DedupStore:
         Initialize dedup store.
 
         Args:
-            store_path: Path to JSONL file (default: state/news_dedup.jsonl)
+            store_path: Store base path (default: state/news_dedup.jsonl);
+                segments live in <store_path without suffix>.d/
             retention_days: Days to keep entries before expiry
             project_root: Project root for resolving paths
         """
@@ -69,56 +103,20 @@ class DedupStore:
             store_path = project_root / "state" / "news_dedup.jsonl"
 
         self._path = store_path
+        self._dir = store_path.with_suffix(".d")
         self._retention_days = retention_days
         self._lock = threading.Lock()
-        self._cache: Set[str] = set()
-        self._loaded = False
 
-    def _ensure_loaded(self) -> None:
-        """Load existing entries into memory cache."""
-        if self._loaded:
-            return
-
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-
-        if not self._path.exists():
-            self._loaded = True
-            return
-
-        cutoff = datetime.now(timezone.utc) - timedelta(days=self._retention_days)
-
-        try:
-            with open(self._path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        # Try sha256 JSONL format first
-                        if line.startswith("sha256:"):
-                            entry = parse_sha256_jsonl_line(line)
-                        else:
-                            # Legacy plain JSON (backward compatible)
-                            entry = json.loads(line)
-
-                        # Check expiry
-                        first_seen = entry.get("first_seen_utc", "")
-                        if first_seen:
-                            try:
-                                dt = datetime.fromisoformat(
-                                    first_seen.replace("Z", "+00:00")
-                                )
-                                if dt < cutoff:
-                                    continue  # Expired
-                            except Exception:
-                                pass
-                        self._cache.add(entry.get("item_id", ""))
-                    except (json.JSONDecodeError, ValueError):
-                        continue
-        except Exception:
-            pass
+        # Sealed days: segment day -> sorted hashes
+        self._indexes: Dict[str, array] = {}
+        # Active day (today): hashes seen
+        self._active_day = ""
+        self._active: Set[int] = set()
+        self._loaded = False
 
-        self._loaded = True
+    # =========================================================================
+    # PUBLIC API
+    # =========================================================================
 
     def contains(self, item_id: str) -> bool:
         """
@@ -132,7 +130,7 @@ class DedupStore:
         """
         with self._lock:
             self._ensure_loaded()
-            return item_id in self._cache
+            return self._contains_hash(_hash_id(item_id))
 
     def add(
         self,
@@ -143,7 +141,7 @@ class DedupStore:
         """
         Add item to dedup store if not present.
 
-        Uses sha256 JSONL format: sha256:<hex16> <json>
+        Appends to today's segment in sha256 JSONL format: sha256:<hex16> <json>
 
         Args:
             item_id: Item identifier
@@ -159,13 +157,10 @@ class DedupStore:
         with self._lock:
             self._ensure_loaded()
 
-            if item_id in self._cache:
+            key = _hash_id(item_id)
+            if self._contains_hash(key):
                 return False
 
-            # Add to cache
-            self._cache.add(item_id)
-
-            # Persist to file with sha256 JSONL format
             entry = {
                 "item_id": item_id,
                 "source_id": source_id,
@@ -173,159 +168,207 @@ class DedupStore:
                 "link": link,
             }
 
-            # Atomic append with sha256 prefix
-            atomic_append_sha256_jsonl(self._path, entry)
+            # Atomic append with sha256 prefix (raises before the ID is cached)
+            atomic_append_sha256_jsonl(self._segment_path(self._active_day), entry)
+            self._active.add(key)
 
             return True
 
     def count(self) -> int:
-        """Return number of entries in cache."""
+        """Return number of unexpired entries."""
         with self._lock:
             self._ensure_loaded()
-            return len(self._cache)
+            return len(self._active) + sum(len(idx) for idx in self._indexes.values())
 
     def rotate_if_needed(
         self,
         max_entries: int = 10000,
         max_bytes: int = 5 * 1024 * 1024,
-    ) -> tuple[bool, str]:
+    ) -> Tuple[bool, str]:
         """
-        Rotate dedup file if size limits exceeded.
+        Drop expired segments (size limits no longer apply).
 
-        NEVER deletes original file. Creates backup and starts fresh.
-        Policy: backup + new file + LATEST pointer (all atomic).
-
-        Args:
-            max_entries: Max entries before rotation (default: 10000)
-            max_bytes: Max file size before rotation (default: 5MB)
+        Kept for backward compatibility: the segmented store never grows
+        past retention_days of segments, so there is nothing to rotate.
 
         Returns:
-            (rotated, backup_path_or_reason)
+            (dropped_any, reason)
         """
         with self._lock:
-            if not self._path.exists():
-                return False, "no_file"
+            dropped = self._drop_expired()
+            self._ensure_loaded()
+        if dropped:
+            return True, f"dropped_{dropped}_expired_entries"
+        return False, "within_limits"
 
-            # Check size limits
-            try:
-                file_size = self._path.stat().st_size
-            except OSError:
-                return False, "stat_error"
+    def clear_expired(self) -> int:
+        """
+        Drop segments older than retention_days.
 
-            entry_count = len(self._cache) if self._loaded else self._count_lines()
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            dropped = self._drop_expired()
+            self._ensure_loaded()
+            return dropped
+
+    # =========================================================================
+    # SEGMENTS
+    # =========================================================================
+
+    def _segment_path(self, day: str) -> Path:
+        return self._dir / f"seg_{day}.jsonl"
+
+    def _segment_days(self) -> List[str]:
+        if not self._dir.exists():
+            return []
+        days = []
+        for path in self._dir.glob("seg_*.jsonl"):
+            day = path.stem[4:]
+            if len(day) == 8 and day.isdigit():
+                days.append(day)
+        return sorted(days)
+
+    def _cutoff_day(self) -> str:
+        cutoff = datetime.now(timezone.utc) - timedelta(days=self._retention_days)
+        return cutoff.strftime("%Y%m%d")
 
-            needs_rotation = (entry_count > max_entries) or (file_size > max_bytes)
+    def _ensure_loaded(self) -> None:
+        """Load sealed indexes and today's segment; roll over after midnight."""
+        today = _today()
+        if self._loaded and self._active_day == today:
+            return
 
-            if not needs_rotation:
-                return False, "within_limits"
+        self._dir.mkdir(parents=True, exist_ok=True)
+        if not self._loaded and self._path.exists():
+            self._migrate_legacy()
 
-            # Generate backup filename with run_id
-            ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-            backup_name = f"news_dedup.{ts}.bak.jsonl"
-            backup_path = self._path.parent / backup_name
+        self._drop_expired()
+        cutoff = self._cutoff_day()
+        self._indexes = {
+            day: self._load_index(day)
+            for day in self._segment_days()
+            if cutoff <= day < today
+        }
 
-            # Step 1: Rename current to backup (atomic on same filesystem)
-            try:
-                os.rename(self._path, backup_path)
-            except OSError as e:
-                return False, f"rename_error: {e}"
+        self._active_day = today
+        self._active = set(self._read_segment_hashes(today))
+        self._loaded = True
 
-            # Step 2: Create fresh empty file
-            try:
-                self._path.touch()
-            except OSError as e:
-                # Restore backup
+    def _drop_expired(self) -> int:
+        """Delete segments (and indexes) older than the retention cutoff."""
+        cutoff = self._cutoff_day()
+        dropped = 0
+        for day in self._segment_days():
+            if day >= cutoff:
+                break
+            idx = self._indexes.pop(day, None)
+            dropped += len(idx) if idx is not None else sum(1 for _ in self._read_segment_hashes(day))
+            for path in (self._segment_path(day), self._segment_path(day).with_suffix(".idx")):
                 try:
-                    os.rename(backup_path, self._path)
-                except OSError:
+                    path.unlink()
+                except FileNotFoundError:
                     pass
-                return False, f"create_error: {e}"
+        return dropped
+
+    def _read_segment_hashes(self, day: str) -> List[int]:
+        """Hash every item ID in a segment (parses the JSONL)."""
+        path = self._segment_path(day)
+        hashes: List[int] = []
+        if not path.exists():
+            return hashes
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    entry = _parse_line(line)
+                    if entry and entry.get("item_id"):
+                        hashes.append(_hash_id(entry["item_id"]))
+        except OSError:
+            pass
+        return hashes
 
-            # Step 3: Write LATEST pointer
-            latest_path = self._path.parent / "news_dedup.LATEST"
+    def _load_index(self, day: str) -> array:
+        """Load a sealed day's sorted hash index, building it if missing or stale."""
+        seg_path = self._segment_path(day)
+        idx_path = seg_path.with_suffix(".idx")
+        try:
+            if idx_path.stat().st_mtime >= seg_path.stat().st_mtime and idx_path.stat().st_size % 8 == 0:
+                idx = array("Q")
+                with open(idx_path, "rb") as f:
+                    idx.frombytes(f.read())
+                if sys.byteorder != "little":
+                    idx.byteswap()
+                return idx
+        except OSError:
+            pass
+
+        idx = array("Q", sorted(set(self._read_segment_hashes(day))))
+        self._write_index(idx_path, idx)
+        return idx
+
+    def _write_index(self, idx_path: Path, idx: array) -> None:
+        """Atomically write an index (temp -> fsync -> replace)."""
+        data = idx
+        if sys.byteorder != "little":
+            data = array("Q", idx)
+            data.byteswap()
+        tmp = idx_path.with_suffix(f".idx.{os.getpid()}.tmp")
+        try:
+            with open(tmp, "wb") as f:
+                data.tofile(f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, idx_path)
+        except OSError:
+            # Index is a cache; the segment stays authoritative
             try:
-                atomic_write_text(latest_path, backup_name + "\n")
+                tmp.unlink()
             except OSError:
-                pass  # Non-fatal, backup still valid
-
-            # Clear cache for fresh start
-            self._cache.clear()
-            self._loaded = True
+                pass
 
-            return True, str(backup_path)
+    def _contains_hash(self, key: int) -> bool:
+        if key in self._active:
+            return True
+        for idx in self._indexes.values():
+            pos = bisect_left(idx, key)
+            if pos < len(idx) and idx[pos] == key:
+                return True
+        return False
 
-    def _count_lines(self) -> int:
-        """Count lines in dedup file without loading all."""
-        if not self._path.exists():
-            return 0
+    def _migrate_legacy(self) -> None:
+        """Split a legacy single-file store into daily segments (once)."""
+        cutoff = self._cutoff_day()
+        by_day: Dict[str, List[dict]] = {}
         try:
             with open(self._path, "r", encoding="utf-8") as f:
-                return sum(1 for line in f if line.strip())
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    entry = _parse_line(line)
+                    if not entry or not entry.get("item_id"):
+                        continue
+                    day = entry.get("first_seen_utc", "")[:10].replace("-", "")
+                    if not (len(day) == 8 and day.isdigit()):
+                        day = _today()
+                    if day >= cutoff:
+                        by_day.setdefault(day, []).append(entry)
         except OSError:
-            return 0
-
-    def clear_expired(self) -> int:
-        """
-        Mark expired entries (DEPRECATED - use rotate_if_needed).
-
-        This method is kept for backward compatibility but now only
-        triggers rotation if limits exceeded. It does NOT rewrite
-        the file in place (that would violate append-only policy).
-
-        Returns:
-            Number of entries that would be removed (informational only)
-        """
-        with self._lock:
-            if not self._path.exists():
-                return 0
-
-            cutoff = datetime.now(timezone.utc) - timedelta(days=self._retention_days)
-            expired_count = 0
-
-            try:
-                with open(self._path, "r", encoding="utf-8") as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        try:
-                            if line.startswith("sha256:"):
-                                entry = parse_sha256_jsonl_line(line)
-                            else:
-                                entry = json.loads(line)
-
-                            first_seen = entry.get("first_seen_utc", "")
-                            if first_seen:
-                                dt = datetime.fromisoformat(
-                                    first_seen.replace("Z", "+00:00")
-                                )
-                                if dt < cutoff:
-                                    expired_count += 1
-                        except Exception:
-                            expired_count += 1
-            except Exception:
-                return 0
-
-            # Trigger rotation if many expired (instead of rewrite)
-            if expired_count > 1000:
-                self.rotate_if_needed()
-
-            return expired_count
-
-    def _needs_migration(self) -> bool:
-        """Check if file contains legacy plain JSON that needs migration."""
-        if not self._path.exists():
-            return False
+            return
 
-        try:
-            with open(self._path, "r", encoding="utf-8") as f:
-                first_line = f.readline().strip()
-                if first_line and not first_line.startswith("sha256:"):
-                    return True
-        except Exception:
-            pass
+        # One append + fsync per day (fail-closed: legacy file kept on error)
+        for day, entries in by_day.items():
+            with open(self._segment_path(day), "a", encoding="utf-8", newline="\n") as f:
+                f.write("".join(format_sha256_jsonl_line(entry) for entry in entries))
+                f.flush()
+                os.fsync(f.fileno())
 
-        return False
+        ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        os.replace(self._path, self._path.with_name(f"{self._path.name}.{ts}.migrated"))
 
 
 def is_duplicate(
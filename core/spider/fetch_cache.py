@@ -0,0 +1,144 @@
+# === AI SIGNATURE ===
+# Created by: Claude (opus-4)
+# Created at (UTC): 2026-02-03T14:00:00Z
+# Purpose: Per-source conditional GET and body-hash cache for News Spider
+# === END SIGNATURE ===
+"""
+Source Fetch Cache Module
+
+Remembers, per source, what the last successful fetch looked like:
+- ETag / Last-Modified validators -> sent as If-None-Match /
+  If-Modified-Since, so an unchanged feed answers 304 with no body
+- sha256 of the body -> a byte-identical 200 body skips parsing and dedup
+- items_count -> reported for short-circuited fetches
+
+Entries are keyed by source id and tied to the source URL (a changed URL
+invalidates the entry). Persists state to JSON across runs.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional
+
+
+@dataclass
+class SourceCacheEntry:
+    """Validators and body hash from the last processed fetch of a source."""
+    url: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    body_sha256: Optional[str] = None
+    items_count: int = 0
+    updated_utc: Optional[str] = None
+
+
+def body_sha256(body: bytes) -> str:
+    """Hex sha256 of a response body."""
+    return hashlib.sha256(body).hexdigest()
+
+
+class SourceFetchCache:
+    """
+    Persistent per-source fetch cache.
+
+    Usage:
+        cache = SourceFetchCache()
+        headers = cache.conditional_headers(source.id, source.url)
+        ...
+        cache.update(source.id, source.url, response_headers, body, len(items))
+        cache.save()
+    """
+
+    def __init__(
+        self,
+        state_path: Optional[Path] = None,
+        project_root: Optional[Path] = None,
+    ):
+        """
+        Initialize fetch cache.
+
+        Args:
+            state_path: Path to cache state JSON
+            project_root: Project root for path resolution
+        """
+        if project_root is None:
+            project_root = Path(__file__).resolve().parent.parent.parent
+
+        if state_path is None:
+            state_path = project_root / "state" / "spider_fetch_cache.json"
+
+        self._path = state_path
+        self._entries: Dict[str, SourceCacheEntry] = {}
+        self._loaded = False
+        self._dirty = False
+
+    def _ensure_loaded(self) -> None:
+        """Load state from disk if not already loaded."""
+        if self._loaded:
+            return
+
+        if self._path.exists():
+            try:
+                data = json.loads(self._path.read_text(encoding="utf-8"))
+                for source_id, entry in data.get("sources", {}).items():
+                    self._entries[source_id] = SourceCacheEntry(**entry)
+            except Exception:
+                pass  # Start fresh on error (worst case: one full fetch)
+
+        self._loaded = True
+
+    def get(self, source_id: str, url: str) -> Optional[SourceCacheEntry]:
+        """Get cache entry for source, if it was recorded for this URL."""
+        self._ensure_loaded()
+        entry = self._entries.get(source_id)
+        if entry is None or entry.url != url:
+            return None
+        return entry
+
+    def conditional_headers(self, source_id: str, url: str) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for the next request."""
+        entry = self.get(source_id, url)
+        headers: Dict[str, str] = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def update(
+        self,
+        source_id: str,
+        url: str,
+        response_headers: Dict[str, str],
+        body: bytes,
+        items_count: int,
+    ) -> None:
+        """Record a processed 200 response."""
+        self._ensure_loaded()
+        lowered = {k.lower(): v for k, v in response_headers.items()}
+        self._entries[source_id] = SourceCacheEntry(
+            url=url,
+            etag=lowered.get("etag"),
+            last_modified=lowered.get("last-modified"),
+            body_sha256=body_sha256(body),
+            items_count=items_count,
+            updated_utc=datetime.now(timezone.utc).isoformat(),
+        )
+        self._dirty = True
+
+    def save(self) -> None:
+        """Persist state to disk (atomic; no-op if unchanged)."""
+        if not self._dirty:
+            return
+        from core.io.atomic import atomic_write_json
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_json(self._path, {
+            "last_updated_utc": datetime.now(timezone.utc).isoformat(),
+            "sources": {sid: asdict(e) for sid, e in self._entries.items()},
+        })
+        self._dirty = False
@@ -16,13 +16,15 @@ Strategies:
 Orchestration:
 - StrategyOrchestrator: Regime-based strategy selection
 - Regime detection: TRENDING/RANGING/VOLATILE
+- Candidate masks: vectorized entry/exit prefilter for batch backtests
 """
 
 from .base import BaseStrategy, StrategyConfig, Position, PositionSide, TradeResult
 from .momentum import MomentumStrategy, MomentumConfig
 from .mean_reversion import MeanReversionStrategy, MeanReversionConfig
 from .breakout import BreakoutStrategy, BreakoutConfig
-from .regime import Regime, RegimeResult, RegimeConfig, detect_regime
+from .regime import Regime, RegimeResult, RegimeConfig, detect_regime, detect_regime_series
+from .masks import BarSeries, CandidateMasks
 from .orchestrator import (
     StrategyOrchestrator,
     OrchestratorConfig,
@@ -50,6 +52,10 @@ __all__ = [
     "RegimeResult",
     "RegimeConfig",
     "detect_regime",
+    "detect_regime_series",
+    # Candidate masks
+    "BarSeries",
+    "CandidateMasks",
     # Orchestrator
     "StrategyOrchestrator",
     "OrchestratorConfig",
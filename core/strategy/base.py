@@ -7,11 +7,14 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List
 from enum import Enum
 import numpy as np
 from core.ai.signal_engine import TradingSignal, MarketData, SignalDirection
 
+if TYPE_CHECKING:
+    from core.strategy.masks import BarSeries, CandidateMasks
+
 class PositionSide(Enum):
     LONG = 'LONG'
     SHORT = 'SHORT'
@@ -89,6 +92,15 @@ class BaseStrategy(ABC):
     def should_exit(self, position: Position, market_data: MarketData) -> Optional[str]:
         pass
 
+    def candidate_masks(self, bars: "BarSeries") -> Optional["CandidateMasks"]:
+        """
+        Vectorized entry/exit candidate bars for batch backtests.
+
+        Masks must be supersets of the bars where generate_signal() /
+        should_exit() can fire. Default None: every bar is a candidate.
+        """
+        return None
+
     def should_enter(self, market_data: MarketData) -> bool:
         """
         Check if strategy should enter a new position.
@@ -15,8 +15,9 @@ from dataclasses import dataclass
 from typing import Optional
 import numpy as np
 from core.ai.signal_engine import SignalEngine, SignalEngineConfig, TradingSignal, MarketData, SignalDirection
-from core.ai.technical_indicators import TechnicalIndicators
+from core.ai.indicator_stream import indicators_for
 from core.strategy.base import BaseStrategy, StrategyConfig, Position, PositionSide
+from core.strategy.masks import EPS, BarSeries, CandidateMasks
 
 @dataclass
 class BreakoutConfig(StrategyConfig):
@@ -83,14 +84,14 @@ class BreakoutStrategy(BaseStrategy):
         current_high = float(market_data.highs[-1])
         
         # ATR filter
-        atr = TechnicalIndicators.atr(market_data.highs, market_data.lows, market_data.closes)
+        atr = indicators_for(market_data).atr()
         atr_pct = atr / current_price
         if atr_pct < self.bo_config.min_atr_pct:
             return None  # Too low volatility
         
         # Volume filter
         if self.bo_config.require_volume:
-            volume = TechnicalIndicators.volume_profile(market_data.volumes)
+            volume = indicators_for(market_data).volume_profile()
             if volume.current_ratio < self.bo_config.min_volume_ratio:
                 return None  # Insufficient volume
         
@@ -107,6 +108,18 @@ class BreakoutStrategy(BaseStrategy):
         
         return None
     
+    def candidate_masks(self, bars: BarSeries) -> Optional[CandidateMasks]:
+        """
+        Entry where the high clears the prior N-bar high with enough ATR.
+
+        Exit depends on the breakout level remembered at signal time, so
+        every bar in a position stays a candidate (exit_long=None).
+        """
+        breakout_level = bars.prior_high(self.bo_config.lookback_period) * (1 + self.bo_config.breakout_threshold)
+        atr_pct = bars.atr() / bars.closes
+        entry = (bars.highs >= breakout_level) & (atr_pct >= self.bo_config.min_atr_pct * (1 - EPS))
+        return CandidateMasks(entry=entry)
+
     def _create_breakout_signal(self, market_data: MarketData, direction: SignalDirection, level: float, atr: float) -> TradingSignal:
         """Create breakout signal."""
         import hashlib
@@ -124,10 +137,10 @@ class BreakoutStrategy(BaseStrategy):
         signal_id = f"sha256:{hashlib.sha256(content.encode()).hexdigest()[:16]}"
         
         # Calculate confidence based on volume and ATR
-        volume = TechnicalIndicators.volume_profile(market_data.volumes)
+        volume = indicators_for(market_data).volume_profile()
         confidence = min(0.85, 0.6 + (volume.current_ratio - 1.0) * 0.1)
         
-        rsi = TechnicalIndicators.rsi(market_data.closes)
+        rsi = indicators_for(market_data).rsi()
         
         return TradingSignal(
             signal_id=signal_id,
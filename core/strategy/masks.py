@@ -0,0 +1,198 @@
+# === AI SIGNATURE ===
+# Created by: Claude (opus-4)
+# Created at: 2026-02-02T16:00:00Z
+# Purpose: Vectorized entry/exit candidate masks for batch backtests
+# Security: Pure calculations, no side effects
+# === END SIGNATURE ===
+"""
+Vectorized Candidate Masks.
+
+Boolean masks over a whole OHLCV series marking the bars where a strategy
+could enter or exit. Masks are conservative supersets of the event-driven
+decisions: every float tolerance widens a mask, never narrows it, so a bar
+outside the mask is guaranteed to be a HOLD for that strategy. The vectorized
+backtest mode uses them to skip orchestrator.decide() on all other bars.
+
+Series come from the TechnicalIndicators *_series family, aligned to bar
+index (NaN where an indicator is not yet defined). Entry masks treat NaN as
+"no entry" (generate_signal fails closed to None); exit masks treat NaN as
+"maybe exit" (should_exit fails closed to 'error').
+
+Usage:
+    bars = BarSeries.from_klines(klines)
+    masks = strategy.candidate_masks(bars)   # None = evaluate every bar
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, Hashable, Optional, Tuple
+
+import numpy as np
+
+from core.ai.technical_indicators import TechnicalIndicators
+
+if TYPE_CHECKING:
+    from core.ai.signal_engine import SignalEngineConfig
+    from core.market.klines_provider import KlinesResult
+
+# Slack for indicator values in [0, 100] / [0, 1] (vectorized vs scalar rounding)
+EPS = 1e-6
+
+# Relative price tolerance for MACD histogram sign (vectorized EMA rounding)
+_PRICE_REL_TOL = 1e-9
+
+
+@dataclass(frozen=True)
+class CandidateMasks:
+    """Per-bar candidate flags for one strategy (or the whole orchestrator)."""
+    entry: np.ndarray                         # LONG entry possible
+    exit_long: Optional[np.ndarray] = None    # exit of a LONG possible (None = every bar)
+
+
+class BarSeries:
+    """
+    OHLCV arrays with lazily cached, bar-aligned indicator series.
+
+    Every series has len(closes) values; value[t] is the indicator over the
+    prefix closes[:t + 1] (what MarketData holds at bar t).
+    """
+
+    def __init__(
+        self,
+        opens: np.ndarray,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        closes: np.ndarray,
+        volumes: np.ndarray,
+    ):
+        self.opens = np.asarray(opens, dtype=float)
+        self.highs = np.asarray(highs, dtype=float)
+        self.lows = np.asarray(lows, dtype=float)
+        self.closes = np.asarray(closes, dtype=float)
+        self.volumes = np.asarray(volumes, dtype=float)
+        self.n = len(self.closes)
+        self._cache: Dict[Hashable, object] = {}
+
+    @classmethod
+    def from_klines(cls, klines: "KlinesResult") -> "BarSeries":
+        return cls(klines.opens, klines.highs, klines.lows, klines.closes, klines.volumes)
+
+    def _cached(self, key: Hashable, compute: Callable[[], object]):
+        value = self._cache.get(key)
+        if value is None:
+            value = compute()
+            self._cache[key] = value
+        return value
+
+    def _align(self, values: np.ndarray, start: int) -> np.ndarray:
+        """Place a series starting at bar `start` into a full-length NaN array."""
+        out = np.full(self.n, np.nan)
+        if len(values):
+            out[start:start + len(values)] = values
+        return out
+
+    def rsi(self, period: int = 14) -> np.ndarray:
+        return self._cached(
+            ("rsi", period),
+            lambda: self._align(TechnicalIndicators.rsi_series(self.closes, period), period),
+        )
+
+    def atr(self, period: int = 14) -> np.ndarray:
+        return self._cached(
+            ("atr", period),
+            lambda: self._align(TechnicalIndicators.atr_series(self.highs, self.lows, self.closes, period), period),
+        )
+
+    def ema(self, period: int) -> np.ndarray:
+        return self._cached(
+            ("ema", period),
+            lambda: self._align(TechnicalIndicators.ema_series(self.closes, period), period - 1),
+        )
+
+    def bollinger_position(self, period: int = 20, std_dev: float = 2.0) -> np.ndarray:
+        return self._cached(
+            ("bb_position", period, std_dev),
+            lambda: self._align(TechnicalIndicators.bollinger_series(self.closes, period, std_dev).position, period - 1),
+        )
+
+    def macd(self, fast: int = 12, slow: int = 26, signal_period: int = 9) -> Tuple[np.ndarray, np.ndarray]:
+        """Aligned (macd_line, histogram)."""
+        def compute():
+            series = TechnicalIndicators.macd_series(self.closes, fast, slow, signal_period)
+            start = slow + signal_period - 2
+            return self._align(series.macd_line, start), self._align(series.histogram, start)
+        return self._cached(("macd", fast, slow, signal_period), compute)
+
+    def prior_high(self, lookback: int) -> np.ndarray:
+        """max(highs[t - lookback:t]) - highest high of the bars before t."""
+        def compute():
+            out = np.full(self.n, np.nan)
+            if self.n > lookback:
+                windows = np.lib.stride_tricks.sliding_window_view(self.highs[:-1], lookback)
+                out[lookback:] = windows.max(axis=1)
+            return out
+        return self._cached(("prior_high", lookback), compute)
+
+    def price_tolerance(self) -> np.ndarray:
+        return self._cached(("price_tol", ), lambda: np.abs(self.closes) * _PRICE_REL_TOL)
+
+    def all_bars(self) -> np.ndarray:
+        return np.ones(self.n, dtype=bool)
+
+
+def technical_score_bounds(bars: BarSeries, config: "SignalEngineConfig") -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Lower/upper bound of SignalEngine._calc_technical_score for every bar.
+
+    The RSI and Bollinger terms are continuous and only get EPS slack. The
+    MACD term jumps at a crossover, so bars whose histogram sign is within
+    rounding of zero take the envelope of both outcomes.
+    """
+    rsi = bars.rsi(config.rsi_period)
+    position = bars.bollinger_position(config.bb_period, config.bb_std)
+    macd_line, hist = bars.macd(config.macd_fast, config.macd_slow, config.macd_signal)
+    prev_hist = np.concatenate(([np.nan], hist[:-1]))
+    tol = bars.price_tolerance()
+
+    rsi_term = 0.3 * np.clip((30 - rsi) / 30, 0.0, 1.0) - 0.3 * np.clip((rsi - 70) / 30, 0.0, 1.0)
+    bb_term = 0.3 * ((0.5 - position) * 2)
+
+    direction = np.where(hist > 0, 1.0, -1.0)
+    trend_strength = np.minimum(1.0, np.abs(hist) / (np.abs(macd_line) + 0.0001))
+    cross_term = 0.4 * trend_strength * direction
+    none_term = 0.2 * np.minimum(1.0, np.abs(hist) / 0.01) * direction
+    crossed = ((prev_hist <= 0) & (hist > 0)) | ((prev_hist >= 0) & (hist < 0))
+    macd_term = np.where(crossed, cross_term, none_term)
+
+    macd_lo = macd_term.copy()
+    macd_hi = macd_term.copy()
+    prev_ambiguous = np.abs(prev_hist) <= tol
+    macd_lo = np.where(prev_ambiguous, np.minimum(cross_term, none_term), macd_lo)
+    macd_hi = np.where(prev_ambiguous, np.maximum(cross_term, none_term), macd_hi)
+    ambiguous = np.abs(hist) <= tol
+    macd_lo = np.where(ambiguous, -0.4, macd_lo)
+    macd_hi = np.where(ambiguous, 0.4, macd_hi)
+
+    # Rounding of histogram / macd_line feeds through |h|/(|m|+1e-4) and |h|/0.01
+    macd_slack = 0.8 * tol / (np.abs(macd_line) + 0.0001) + 0.2 * tol / 0.01
+
+    base = rsi_term + bb_term
+    lo = np.clip(base + macd_lo - macd_slack - EPS, -1.0, 1.0)
+    hi = np.clip(base + macd_hi + macd_slack + EPS, -1.0, 1.0)
+    return lo, hi
+
+
+def signal_possible(bars: BarSeries, config: "SignalEngineConfig", long: bool) -> np.ndarray:
+    """
+    Bars where SignalEngine.generate_signal (no ML/sentiment input) may
+    return a signal in the given direction.
+
+    combined = technical * (technical_weight + volume_weight * k) with the
+    volume multiplier k in [0.2, 0.8], so the strongest possible signal is
+    |technical| * (technical_weight + 0.8 * volume_weight).
+    """
+    lo, hi = technical_score_bounds(bars, config)
+    weight = config.technical_weight + max(0.2 * config.volume_weight, 0.8 * config.volume_weight)
+    threshold = max(config.min_confidence, 0.0) - EPS
+    strength = hi * weight if long else -lo * weight
+    return strength >= threshold
@@ -14,8 +14,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional
 from core.ai.signal_engine import SignalEngine, SignalEngineConfig, TradingSignal, MarketData, SignalDirection
-from core.ai.technical_indicators import TechnicalIndicators
+from core.ai.indicator_stream import indicators_for
 from core.strategy.base import BaseStrategy, StrategyConfig, Position, PositionSide
+from core.strategy.masks import EPS, BarSeries, CandidateMasks
 
 @dataclass
 class MeanReversionConfig(StrategyConfig):
@@ -74,8 +75,7 @@ class MeanReversionStrategy(BaseStrategy):
     
     def _generate_signal_impl(self, market_data: MarketData) -> Optional[TradingSignal]:
         # Calculate Bollinger Bands
-        bb = TechnicalIndicators.bollinger_bands(
-            market_data.closes,
+        bb = indicators_for(market_data).bollinger_bands(
             self.mr_config.bb_period,
             self.mr_config.bb_std,
             self.mr_config.squeeze_threshold
@@ -86,7 +86,7 @@ class MeanReversionStrategy(BaseStrategy):
             return None
         
         # Check RSI
-        rsi = TechnicalIndicators.rsi(market_data.closes)
+        rsi = indicators_for(market_data).rsi()
         
         # LONG entry: price near lower band + RSI oversold
         if bb.position <= self.mr_config.entry_lower_threshold:
@@ -107,12 +107,20 @@ class MeanReversionStrategy(BaseStrategy):
         
         return None
     
+    def candidate_masks(self, bars: BarSeries) -> Optional[CandidateMasks]:
+        """Entry near the lower band, exit back at the middle band."""
+        position = bars.bollinger_position(self.mr_config.bb_period, self.mr_config.bb_std)
+        entry = position <= self.mr_config.entry_lower_threshold + EPS
+        if self.mr_config.use_rsi_filter:
+            entry &= bars.rsi() <= self.mr_config.rsi_oversold + EPS
+        exit_long = ~(position < self.mr_config.exit_middle_threshold - EPS)
+        return CandidateMasks(entry=entry, exit_long=exit_long)
+
     def _create_manual_signal(self, market_data: MarketData, direction: SignalDirection, position: float) -> Optional[TradingSignal]:
         """Create signal manually when engine returns None but conditions are met."""
         import hashlib
-        from core.ai.technical_indicators import TechnicalIndicators
         
-        atr = TechnicalIndicators.atr(market_data.highs, market_data.lows, market_data.closes)
+        atr = indicators_for(market_data).atr()
         current_price = float(market_data.closes[-1])
         
         # Only LONG allowed in Spot
@@ -138,7 +146,7 @@ class MeanReversionStrategy(BaseStrategy):
             ml_score=0.0,
             sentiment_score=0.0,
             volume_score=0.3,
-            rsi=TechnicalIndicators.rsi(market_data.closes).value,
+            rsi=indicators_for(market_data).rsi().value,
             macd_histogram=0.0,
             bollinger_position=position,
             atr=atr,
@@ -157,8 +165,7 @@ class MeanReversionStrategy(BaseStrategy):
         if position.symbol != market_data.symbol:
             return None
         
-        bb = TechnicalIndicators.bollinger_bands(
-            market_data.closes,
+        bb = indicators_for(market_data).bollinger_bands(
             self.mr_config.bb_period,
             self.mr_config.bb_std
         )
@@ -8,8 +8,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional
 from core.ai.signal_engine import SignalEngine, SignalEngineConfig, TradingSignal, MarketData, SignalDirection
-from core.ai.technical_indicators import TechnicalIndicators
+from core.ai.indicator_stream import indicators_for
 from core.strategy.base import BaseStrategy, StrategyConfig, Position, PositionSide
+from core.strategy.masks import EPS, BarSeries, CandidateMasks, signal_possible
 
 @dataclass
 class MomentumConfig(StrategyConfig):
@@ -61,7 +62,7 @@ class MomentumStrategy(BaseStrategy):
             if signal.rsi < self.momentum_config.rsi_overbought - 10:
                 return False
         if self.momentum_config.require_macd_crossover:
-            macd_result = TechnicalIndicators.macd(market_data.closes, self.momentum_config.macd_fast, self.momentum_config.macd_slow, self.momentum_config.macd_signal)
+            macd_result = indicators_for(market_data).macd(self.momentum_config.macd_fast, self.momentum_config.macd_slow, self.momentum_config.macd_signal)
             if signal.direction == SignalDirection.LONG:
                 if macd_result.crossover != 'BULLISH' and macd_result.histogram <= 0:
                     return False
@@ -69,11 +70,22 @@ class MomentumStrategy(BaseStrategy):
                 if macd_result.crossover != 'BEARISH' and macd_result.histogram >= 0:
                     return False
         if self.momentum_config.require_volume_confirmation:
-            volume_result = TechnicalIndicators.volume_profile(market_data.volumes)
+            volume_result = indicators_for(market_data).volume_profile()
             if volume_result.current_ratio < self.momentum_config.min_volume_ratio:
                 return False
         return True
     
+    def candidate_masks(self, bars: BarSeries) -> Optional[CandidateMasks]:
+        engine_config = self._signal_engine.config
+        rsi = bars.rsi()
+        entry = signal_possible(bars, engine_config, long=True) & (rsi <= self.momentum_config.rsi_oversold + 10 + EPS)
+        if self.momentum_config.use_time_exit:
+            return CandidateMasks(entry=entry)
+        exit_long = ~(rsi < self.momentum_config.rsi_exit_long - EPS)
+        if self.momentum_config.exit_on_opposite_signal:
+            exit_long |= signal_possible(bars, engine_config, long=False)
+        return CandidateMasks(entry=entry, exit_long=exit_long)
+
     def should_exit(self, position: Position, market_data: MarketData) -> Optional[str]:
         try:
             return self._should_exit_impl(position, market_data)
@@ -83,7 +95,7 @@ class MomentumStrategy(BaseStrategy):
     def _should_exit_impl(self, position: Position, market_data: MarketData) -> Optional[str]:
         if position.symbol != market_data.symbol:
             return None
-        rsi_result = TechnicalIndicators.rsi(market_data.closes)
+        rsi_result = indicators_for(market_data).rsi()
         if position.side == PositionSide.LONG:
             if rsi_result.value >= self.momentum_config.rsi_exit_long:
                 return 'rsi_reversal'
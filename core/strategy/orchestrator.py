@@ -9,10 +9,17 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, List, Optional, Tuple
 import time
+import numpy as np
 from core.ai.signal_engine import TradingSignal, MarketData, SignalDirection
-from core.ai.technical_indicators import TechnicalIndicators
-from core.strategy.regime import Regime, RegimeResult, detect_regime
+from core.ai.indicator_stream import indicators_for
+from core.strategy.regime import Regime, RegimeResult, detect_regime, detect_regime_series
 from core.strategy.base import BaseStrategy, Position
+from core.strategy.masks import BarSeries, CandidateMasks
+
+# Regime inputs: ATR/EMA periods and the trailing window handed to detect_regime
+REGIME_ATR_PERIOD = 14
+REGIME_EMA_PERIOD = 20
+REGIME_WINDOW = 50
 
 class DecisionAction(str, Enum):
     ENTER = 'ENTER'
@@ -103,25 +110,59 @@ class StrategyOrchestrator:
         return OrchestratorDecision(action=DecisionAction.HOLD, signal=None, strategy_name='orchestrator', regime=regime, confidence=0.0, reason='NO_SIGNAL', timestamp=ts)
     
     def _detect_regime(self, market_data: MarketData) -> RegimeResult:
-        """Detect market regime using O(n) batch computation."""
+        """Detect market regime (O(1) per bar when an IndicatorStream is attached)."""
         try:
-            # O(n) batch computation instead of O(n²) loop
-            atr_series = TechnicalIndicators.atr_series(
-                market_data.highs, market_data.lows, market_data.closes, period=14
-            )
-            ema_series = TechnicalIndicators.ema_series(market_data.closes, period=20)
+            # Use last 50 values for regime detection
+            ind = indicators_for(market_data)
+            atr_vals = ind.atr_series_tail(REGIME_ATR_PERIOD, REGIME_WINDOW)
+            ema_vals = ind.ema_series_tail(REGIME_EMA_PERIOD, REGIME_WINDOW)
 
-            if len(atr_series) < 50 or len(ema_series) < 50:
+            if len(atr_vals) < REGIME_WINDOW or len(ema_vals) < REGIME_WINDOW:
                 return RegimeResult(regime=Regime.UNKNOWN, atr_pct=0.0, slope=0.0, confidence=0.0, reason='INSUFFICIENT')
 
-            # Use last 50 values for regime detection
-            atr_vals = list(atr_series[-50:])
-            ema_vals = list(ema_series[-50:])
-
-            return detect_regime(closes=market_data.closes, atr_values=atr_vals, ema_values=ema_vals)
+            # detect_regime only reads the last close; pass the matching window
+            # instead of copying the whole history every bar
+            return detect_regime(closes=market_data.closes[-REGIME_WINDOW:], atr_values=atr_vals, ema_values=ema_vals)
         except Exception:
             return RegimeResult(regime=Regime.UNKNOWN, atr_pct=0.0, slope=0.0, confidence=0.0, reason='ERROR')
     
+    def regime_series(self, bars: BarSeries) -> np.ndarray:
+        """Regime for every bar, identical to _detect_regime() on each prefix."""
+        regimes = detect_regime_series(bars.closes, bars.atr(REGIME_ATR_PERIOD), bars.ema(REGIME_EMA_PERIOD))
+        # Bars before both tails hold REGIME_WINDOW values are INSUFFICIENT
+        warmup = max(REGIME_ATR_PERIOD + REGIME_WINDOW - 1, REGIME_EMA_PERIOD + REGIME_WINDOW - 2)
+        regimes[:warmup] = Regime.UNKNOWN.value
+        return regimes
+
+    def candidate_masks(self, bars: BarSeries) -> CandidateMasks:
+        """
+        Bars where decide() may return ENTER (flat) or EXIT (in a LONG).
+
+        Combines the vectorized regime with each strategy's candidate masks
+        for the strategies that regime enables. Superset of the event-driven
+        decisions: any bar outside the mask is a HOLD. Strategies without
+        masks, or spot_only=False, make every bar a candidate.
+        """
+        if not self.config.spot_only:
+            return CandidateMasks(entry=bars.all_bars(), exit_long=bars.all_bars())
+
+        regimes = self.regime_series(bars)
+        entry = np.zeros(bars.n, dtype=bool)
+        exit_long = np.zeros(bars.n, dtype=bool)
+        for regime in (Regime.TRENDING_UP, Regime.TRENDING_DOWN, Regime.RANGING, Regime.VOLATILE):
+            in_regime = regimes == regime.value
+            if not in_regime.any():
+                continue
+            for _, strat in self._get_strategies_for_regime(regime):
+                masks = strat.candidate_masks(bars)
+                if masks is None:
+                    entry |= in_regime
+                    exit_long |= in_regime
+                    continue
+                entry |= in_regime & masks.entry
+                exit_long |= in_regime & (masks.exit_long if masks.exit_long is not None else True)
+        return CandidateMasks(entry=entry, exit_long=exit_long)
+
     def _get_strategies_for_regime(self, regime: Regime) -> List[Tuple[str, BaseStrategy]]:
         if regime in (Regime.TRENDING_UP, Regime.TRENDING_DOWN):
             names = self.config.trending_strategies
@@ -138,6 +138,56 @@ def detect_regime(
     )
 
 
+def detect_regime_series(
+    closes: Union[Sequence[float], np.ndarray],
+    atr_values: Union[Sequence[float], np.ndarray],
+    ema_values: Union[Sequence[float], np.ndarray],
+    cfg: RegimeConfig = RegimeConfig(),
+) -> np.ndarray:
+    """
+    Vectorized detect_regime for every bar.
+
+    Inputs are bar-aligned (same length, NaN where undefined). regimes[t]
+    equals detect_regime() on a trailing window ending at t that holds more
+    than lookback_slope bars; the same arithmetic is applied elementwise, so
+    classifications are identical. Windows shorter than cfg.min_bars are the
+    caller's to mask (they are UNKNOWN in detect_regime).
+
+    Returns:
+        String array of Regime values (compare with regime.value)
+    """
+    closes_arr = _to_float_array(closes)
+    atr_arr = _to_float_array(atr_values)
+    ema_arr = _to_float_array(ema_values)
+    n = min(len(closes_arr), len(atr_arr), len(ema_arr))
+    closes_arr, atr_arr, ema_arr = closes_arr[:n], atr_arr[:n], ema_arr[:n]
+
+    regimes = np.full(n, Regime.UNKNOWN.value, dtype=f"<U{max(len(r.value) for r in Regime)}")
+    k = cfg.lookback_slope
+    if n <= k:
+        return regimes
+
+    ema_start = np.full(n, np.nan)
+    ema_start[k:] = ema_arr[:-k]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        atr_pct = atr_arr / closes_arr
+        slope = (ema_arr - ema_start) / ema_start
+    slope_ok = (ema_start > 0) & np.isfinite(ema_start) & np.isfinite(ema_arr)
+    slope = np.where(slope_ok, slope, 0.0)
+
+    valid = (closes_arr > 0) & np.isfinite(closes_arr) & np.isfinite(atr_arr)
+    valid[:k] = False
+    volatile = valid & (atr_pct >= cfg.atr_pct_volatile)
+    trending = valid & ~volatile & (np.abs(slope) >= cfg.slope_trending)
+
+    regimes[valid] = Regime.RANGING.value
+    regimes[volatile] = Regime.VOLATILE.value
+    regimes[trending & (slope > 0)] = Regime.TRENDING_UP.value
+    regimes[trending & ~(slope > 0)] = Regime.TRENDING_DOWN.value
+    return regimes
+
+
 class MarketRegimeDetector:
     """
     Market regime detector class wrapper for TZ v1.0 compatibility.
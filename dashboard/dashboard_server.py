@@ -3,7 +3,7 @@
 # Created by: Claude (opus-4)
 # Created at: 2026-01-31 04:20:00 UTC
 # Modified by: Claude (opus-4)
-# Modified at: 2026-02-04 01:00:00 UTC
+# Modified at: 2026-02-06 01:00:00 UTC
 # Purpose: HOPE AI Dashboard Backend Server + Chart APIs
 # === END SIGNATURE ===
 """
@@ -24,9 +24,11 @@ ENDPOINTS:
     GET  /api/chart/winrate    - Win rate trend data
     GET  /api/chart/confidence - AI confidence distribution
     GET  /api/chart/model      - Model performance metrics
+                                 (metrics/chart endpoints: in-memory views, ETag/304, see outcomes_view.py)
     POST /api/close            - Close position
     POST /api/stop             - Emergency stop
-    WS   /ws/prices            - Real-time price feed
+    GET  /api/ws/metrics       - Price broadcaster metrics (clients, latency)
+    WS   /ws/prices            - Real-time price feed (shared producer, see price_broadcaster.py)
 """
 
 import os
@@ -62,6 +64,9 @@ else:
 from aiohttp import web
 import aiohttp_cors
 
+from dashboard.outcomes_view import ConfidenceView, JsonFileCache, OutcomesView, RecentRecords
+from dashboard.price_broadcaster import PriceBroadcaster
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s | %(levelname)s | %(message)s"
@@ -108,6 +113,9 @@ PROTECTED_ENDPOINTS = [
     "/api/allowlist"  # POST only
 ]
 
+# /api/trades?limit= cap (trade history tail size; also Binance allOrders max)
+MAX_TRADES_LIMIT = 1000
+
 
 # Process configuration for watchdog
 PROCESS_CONFIG = {
@@ -200,9 +208,48 @@ class DashboardServer:
         self.position: Optional[Position] = None
         self.load_position()
 
+        # Shared price producer for /ws/prices (WS feed if available, REST in executor otherwise)
+        self.price_feed = self._create_price_feed()
+        self.price_broadcaster = PriceBroadcaster(
+            get_symbol=self._broadcast_symbol,
+            fetch_price=self._fetch_price if self.binance else None,
+            price_feed=self.price_feed,
+        )
+
+        # Incremental views over state files (tailed from last offset on request)
+        self.outcomes_view = OutcomesView(Path("state/ai/outcomes/history.jsonl"))
+        self.confidence_view = ConfidenceView(Path("state/ai/decisions.jsonl"), window=200)
+        self.model_metrics = JsonFileCache(Path("state/ai/model_metrics.json"))
+        self.training_history = RecentRecords(Path("state/ai/training_history.jsonl"), maxlen=20)
+        self.trade_history = RecentRecords(Path("state/ai/autotrader/trade_history.jsonl"), maxlen=MAX_TRADES_LIMIT)
+        self._etag_prefix = format(int(self.start_time), "x")
+        self._payload_cache: Dict[str, tuple] = {}
+
         self._setup_routes()
         self._setup_cors()
 
+    @staticmethod
+    def _create_price_feed():
+        """Binance WebSocket price feed, if its dependencies are installed."""
+        try:
+            import websockets  # noqa: F401
+            from ai_gateway.feeds.binance_ws import BinancePriceFeed
+            return BinancePriceFeed()
+        except Exception as e:
+            logger.info(f"WS price feed unavailable, using REST: {e}")
+            return None
+
+    def _broadcast_symbol(self) -> Optional[str]:
+        """Symbol streamed on /ws/prices (active position only)."""
+        if self.position and (self.binance or self.price_feed):
+            return self.position.symbol
+        return None
+
+    def _fetch_price(self, symbol: str) -> float:
+        """Blocking REST price fetch (runs in executor)."""
+        ticker = self.binance.get_symbol_ticker(symbol=symbol)
+        return float(ticker['price'])
+
     def load_position(self):
         """Load active position from state."""
         state_file = Path("state/ai/autotrader/positions.json")
@@ -240,6 +287,7 @@ class DashboardServer:
         self.app.router.add_post('/api/stop', self.emergency_stop)
         self.app.router.add_get('/ws/prices', self.websocket_handler)
         self.app.router.add_get('/ws/updates', self.websocket_updates_handler)
+        self.app.router.add_get('/api/ws/metrics', self.get_ws_metrics)
 
         # Chart API endpoints
         self.app.router.add_get('/api/metrics', self.get_metrics)
@@ -370,165 +418,72 @@ class DashboardServer:
 
     # === CHART API ENDPOINTS (NEW) ===
 
-    async def get_metrics(self, request):
-        """Get aggregated metrics for dashboard."""
-        metrics = {
-            "winrate": 0.0,
-            "total_pnl": 0.0,
-            "trades_today": 0,
-            "model_accuracy": 0.0
-        }
-
-        # Load from outcomes history
-        outcomes_file = Path("state/ai/outcomes/history.jsonl")
-        if outcomes_file.exists():
-            try:
-                lines = outcomes_file.read_text().strip().split('\n')
-                trades = [json.loads(line) for line in lines if line.strip()]
-                if trades:
-                    wins = sum(1 for t in trades if t.get("pnl_pct", 0) > 0)
-                    metrics["winrate"] = round(wins / len(trades) * 100, 1)
-                    metrics["total_pnl"] = round(sum(t.get("pnl_pct", 0) for t in trades), 2)
-
-                    # Trades today
-                    today = datetime.now(timezone.utc).date().isoformat()
-                    metrics["trades_today"] = sum(
-                        1 for t in trades
-                        if t.get("timestamp", "").startswith(today)
-                    )
-            except Exception as e:
-                logger.error(f"Failed to load outcomes: {e}")
+    def _cached_json(self, request, name: str, version: str, build):
+        """
+        JSON response with ETag; 304 if the client already has this version.
 
-        # Model accuracy from training state
-        model_state = Path("state/ai/model_metrics.json")
-        if model_state.exists():
-            try:
-                data = json.loads(model_state.read_text())
-                metrics["model_accuracy"] = data.get("accuracy", 0.0)
-            except:
-                pass
+        Payloads are built once per version and reused for every poller.
+        """
+        etag = f'"{self._etag_prefix}-{name}-{version}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag in request.headers.get("If-None-Match", ""):
+            return web.Response(status=304, headers=headers)
 
-        return web.json_response(metrics)
+        cached = self._payload_cache.get(name)
+        if cached is None or cached[0] != etag:
+            cached = (etag, build())
+            self._payload_cache[name] = cached
+        return web.json_response(cached[1], headers=headers)
 
-    async def get_chart_pnl(self, request):
-        """Get PnL over time data for chart."""
-        data = []
+    async def get_metrics(self, request):
+        """Get aggregated metrics for dashboard."""
+        view = self.outcomes_view
+        today = datetime.now(timezone.utc).date().isoformat()
+        version = f"{view.refresh()}.{self.model_metrics.refresh()}.{today}"
+
+        def build():
+            model = self.model_metrics.data or {}
+            return {
+                "winrate": view.winrate_pct(),
+                "total_pnl": round(view.total_pnl, 2),
+                "trades_today": view.trades_on(today),
+                "model_accuracy": model.get("accuracy", 0.0),
+            }
 
-        outcomes_file = Path("state/ai/outcomes/history.jsonl")
-        if outcomes_file.exists():
-            try:
-                lines = outcomes_file.read_text().strip().split('\n')
-                trades = [json.loads(line) for line in lines if line.strip()]
-
-                cumulative = 0.0
-                for trade in trades[-50:]:  # Last 50 trades
-                    cumulative += trade.get("pnl_pct", 0)
-                    data.append({
-                        "timestamp": trade.get("timestamp", ""),
-                        "pnl": round(cumulative, 2)
-                    })
-            except Exception as e:
-                logger.error(f"Failed to load PnL data: {e}")
+        return self._cached_json(request, "metrics", version, build)
 
-        return web.json_response({"data": data})
+    async def get_chart_pnl(self, request):
+        """Get PnL over time data for chart (last 50 trades)."""
+        view = self.outcomes_view
+        version = str(view.refresh())
+        return self._cached_json(request, "chart_pnl", version, lambda: {"data": view.pnl_series()})
 
     async def get_chart_winrate(self, request):
-        """Get win rate trend data for chart."""
-        data = []
-
-        outcomes_file = Path("state/ai/outcomes/history.jsonl")
-        if outcomes_file.exists():
-            try:
-                lines = outcomes_file.read_text().strip().split('\n')
-                trades = [json.loads(line) for line in lines if line.strip()]
-
-                # Rolling 10-trade window
-                window_size = 10
-                for i in range(window_size, len(trades) + 1):
-                    window = trades[i - window_size:i]
-                    wins = sum(1 for t in window if t.get("pnl_pct", 0) > 0)
-                    winrate = wins / window_size * 100
-
-                    data.append({
-                        "trade_num": i,
-                        "winrate": round(winrate, 1)
-                    })
-            except Exception as e:
-                logger.error(f"Failed to load winrate data: {e}")
-
-        return web.json_response({"data": data[-30:]})  # Last 30 points
+        """Get win rate trend data for chart (rolling 10-trade window, last 30 points)."""
+        view = self.outcomes_view
+        version = str(view.refresh())
+        return self._cached_json(request, "chart_winrate", version, lambda: {"data": view.winrate_series()})
 
     async def get_chart_confidence(self, request):
-        """Get AI confidence distribution for chart."""
-        # Confidence histogram: buckets 0-20, 20-40, 40-60, 60-80, 80-100
-        buckets = {
-            "0-20": 0,
-            "20-40": 0,
-            "40-60": 0,
-            "60-80": 0,
-            "80-100": 0
-        }
-
-        decisions_file = Path("state/ai/decisions.jsonl")
-        if decisions_file.exists():
-            try:
-                lines = decisions_file.read_text().strip().split('\n')
-                for line in lines[-200:]:  # Last 200 decisions
-                    if line.strip():
-                        decision = json.loads(line)
-                        conf = decision.get("confidence", 0)
-                        if conf < 20:
-                            buckets["0-20"] += 1
-                        elif conf < 40:
-                            buckets["20-40"] += 1
-                        elif conf < 60:
-                            buckets["40-60"] += 1
-                        elif conf < 80:
-                            buckets["60-80"] += 1
-                        else:
-                            buckets["80-100"] += 1
-            except Exception as e:
-                logger.error(f"Failed to load confidence data: {e}")
-
-        return web.json_response({"buckets": buckets})
+        """Get AI confidence distribution for chart (last 200 decisions)."""
+        view = self.confidence_view
+        version = str(view.refresh())
+        return self._cached_json(request, "chart_confidence", version, lambda: {"buckets": view.buckets()})
 
     async def get_chart_model(self, request):
         """Get model performance metrics for chart."""
-        metrics = {
-            "accuracy": 0.0,
-            "precision": 0.0,
-            "recall": 0.0,
-            "f1": 0.0
-        }
-
-        model_state = Path("state/ai/model_metrics.json")
-        if model_state.exists():
-            try:
-                data = json.loads(model_state.read_text())
-                metrics["accuracy"] = data.get("accuracy", 0.0)
-                metrics["precision"] = data.get("precision", 0.0)
-                metrics["recall"] = data.get("recall", 0.0)
-                metrics["f1"] = data.get("f1", 0.0)
-            except Exception as e:
-                logger.error(f"Failed to load model metrics: {e}")
+        version = f"{self.model_metrics.refresh()}.{self.training_history.refresh()}"
 
-        # Also get training history if available
-        history = []
-        training_log = Path("state/ai/training_history.jsonl")
-        if training_log.exists():
-            try:
-                lines = training_log.read_text().strip().split('\n')
-                for line in lines[-20:]:
-                    if line.strip():
-                        entry = json.loads(line)
-                        history.append({
-                            "timestamp": entry.get("timestamp", ""),
-                            "accuracy": entry.get("accuracy", 0.0)
-                        })
-            except:
-                pass
+        def build():
+            data = self.model_metrics.data or {}
+            metrics = {key: data.get(key, 0.0) for key in ("accuracy", "precision", "recall", "f1")}
+            history = [
+                {"timestamp": entry.get("timestamp", ""), "accuracy": entry.get("accuracy", 0.0)}
+                for entry in self.training_history.last(20)
+            ]
+            return {"current": metrics, "history": history}
 
-        return web.json_response({"current": metrics, "history": history})
+        return self._cached_json(request, "chart_model", version, build)
 
     # === PROCESS MANAGEMENT (WATCHDOG) ===
 
@@ -795,25 +750,16 @@ class DashboardServer:
             return web.json_response({"error": str(e)}, status=500)
 
     async def get_trades(self, request):
-        """Get recent trades from Binance."""
-        limit = int(request.query.get("limit", 20))
+        """Get recent trades from Binance (?limit=, capped at MAX_TRADES_LIMIT)."""
+        limit = min(int(request.query.get("limit", 20)), MAX_TRADES_LIMIT)
 
         if not self.binance:
             return web.json_response({"error": "Binance not connected"}, status=500)
 
         try:
-            # Get recent trades from executor state
-            trades_file = Path("state/ai/autotrader/trade_history.jsonl")
-            trades = []
-
-            if trades_file.exists():
-                lines = trades_file.read_text().strip().split('\n')
-                for line in lines[-limit:]:
-                    if line.strip():
-                        try:
-                            trades.append(json.loads(line))
-                        except:
-                            pass
+            # Get recent trades from executor state (in-memory tail)
+            self.trade_history.refresh()
+            trades = self.trade_history.last(limit)
 
             # If no local trades, get from Binance
             if not trades:
@@ -1110,38 +1056,31 @@ class DashboardServer:
         return web.json_response({"success": True, "results": results})
 
     async def websocket_handler(self, request):
-        """WebSocket for real-time updates."""
+        """WebSocket for real-time prices (fed by the shared PriceBroadcaster)."""
         ws = web.WebSocketResponse()
         await ws.prepare(request)
 
         self.clients.append(ws)
+        client = self.price_broadcaster.register(ws)
         logger.info(f"WebSocket client connected. Total: {len(self.clients)}")
 
         try:
-            while True:
-                if self.position and self.binance:
-                    try:
-                        ticker = self.binance.get_symbol_ticker(symbol=self.position.symbol)
-                        price = float(ticker['price'])
-
-                        await ws.send_json({
-                            "type": "price",
-                            "symbol": self.position.symbol,
-                            "price": price,
-                            "timestamp": datetime.now(timezone.utc).isoformat()
-                        })
-                    except Exception as e:
-                        await ws.send_json({"type": "error", "message": str(e)})
-
-                await asyncio.sleep(1)
+            # Sends happen in the broadcaster; here we only wait for close
+            async for _msg in ws:
+                pass
         except Exception as e:
             logger.error(f"WebSocket error: {e}")
         finally:
+            await self.price_broadcaster.unregister(client)
             self.clients.remove(ws)
             logger.info(f"WebSocket client disconnected. Total: {len(self.clients)}")
 
         return ws
 
+    async def get_ws_metrics(self, request):
+        """Price broadcaster metrics."""
+        return web.json_response(self.price_broadcaster.get_metrics())
+
     async def websocket_updates_handler(self, request):
         """WebSocket for real-time dashboard updates (processes + balances every 5s)."""
         ws = web.WebSocketResponse()
@@ -1282,6 +1221,8 @@ class DashboardServer:
         async def start_with_watchdog():
             # Start watchdog as background task
             asyncio.create_task(self._process_watchdog())
+            if self.price_feed is not None:
+                asyncio.create_task(self.price_feed.run())
 
         self.app.on_startup.append(lambda app: start_with_watchdog())
         web.run_app(self.app, port=self.port)
@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+# === AI SIGNATURE ===
+# Created by: Claude (opus-4)
+# Created at: 2026-02-06 01:00:00 UTC
+# Purpose: Incremental in-memory views over dashboard JSONL state (outcomes, decisions, trades)
+# === END SIGNATURE ===
+"""
+Dashboard Materialized Views
+
+Chart endpoints used to re-read and re-parse whole JSONL files on every
+request. These views tail each file from the last byte offset and keep the
+aggregates up to date incrementally:
+
+- OutcomesView   (state/ai/outcomes/history.jsonl): trade count, wins,
+  cumulative PnL, trades per day, last-50 PnL points, rolling 10-trade win rate
+- ConfidenceView (state/ai/decisions.jsonl): confidence histogram over the
+  last 200 decisions (counts adjusted as decisions enter/leave the window)
+- RecentRecords  (any JSONL): last N records
+- JsonFileCache  (small JSON files): re-read only when mtime changes
+
+Each view exposes `version`, bumped whenever its content changes, so the
+server can answer with ETag / 304 Not Modified. A file that shrinks or whose
+head bytes change (rewritten/rotated) is re-read from the start.
+
+Only complete lines are consumed; a partially written last line is picked up
+on the next refresh. Malformed lines are skipped.
+"""
+
+import json
+import logging
+import os
+from collections import Counter, deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("dashboard")
+
+HEAD_BYTES = 256  # Prefix compared to detect a rewritten file
+
+
+class JsonlTail:
+    """Reads records appended to a JSONL file since the last poll."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.offset = 0
+        self._head = b""
+        self._mtime_ns = 0
+
+    def poll(self) -> Tuple[bool, List[Dict[str, Any]]]:
+        """
+        Returns:
+            (reset, records): reset is True when the file was rewritten or
+            removed and previously returned records are no longer valid
+        """
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            if self.offset or self._head:
+                self.offset, self._head, self._mtime_ns = 0, b"", 0
+                return True, []
+            return False, []
+
+        if st.st_size == self.offset and st.st_mtime_ns == self._mtime_ns:
+            return False, []
+
+        reset = False
+        with open(self.path, "rb") as f:
+            head = f.read(HEAD_BYTES)
+            if st.st_size < self.offset or head[:len(self._head)] != self._head:
+                reset = True
+                self.offset = 0
+            self._head = head
+            f.seek(self.offset)
+            data = f.read()
+
+        self._mtime_ns = st.st_mtime_ns
+        end = data.rfind(b"\n")
+        if end < 0:
+            return reset, []
+        self.offset += end + 1
+
+        records = []
+        for line in data[:end + 1].splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                logger.warning(f"Skipping malformed line in {self.path.name}")
+                continue
+            if isinstance(record, dict):
+                records.append(record)
+        return reset, records
+
+
+class _TailView:
+    """Base for views fed by a JsonlTail."""
+
+    def __init__(self, path: Path):
+        self._tail = JsonlTail(path)
+        self.version = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        raise NotImplementedError
+
+    def _add(self, record: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def refresh(self) -> int:
+        """Apply appended records; returns the current version."""
+        try:
+            reset, records = self._tail.poll()
+        except OSError as e:
+            logger.error(f"Failed to read {self._tail.path}: {e}")
+            return self.version
+        if reset:
+            self._reset()
+        for record in records:
+            self._add(record)
+        if reset or records:
+            self.version += 1
+        return self.version
+
+
+class OutcomesView(_TailView):
+    """Aggregates over closed-trade outcomes."""
+
+    PNL_POINTS = 50
+    WINRATE_WINDOW = 10
+    WINRATE_POINTS = 30
+
+    def _reset(self) -> None:
+        self.count = 0
+        self.wins = 0
+        self.total_pnl = 0.0
+        self._by_day: Counter = Counter()
+        self._recent: Deque[Tuple[str, float]] = deque(maxlen=self.PNL_POINTS)
+        self._window: Deque[bool] = deque(maxlen=self.WINRATE_WINDOW)
+        self._window_wins = 0
+        self._winrate_points: Deque[Dict[str, Any]] = deque(maxlen=self.WINRATE_POINTS)
+
+    def _add(self, trade: Dict[str, Any]) -> None:
+        pnl = trade.get("pnl_pct", 0) or 0
+        win = pnl > 0
+        timestamp = trade.get("timestamp", "")
+
+        self.count += 1
+        self.wins += win
+        self.total_pnl += pnl
+        self._by_day[str(timestamp)[:10]] += 1
+        self._recent.append((timestamp, pnl))
+
+        if len(self._window) == self.WINRATE_WINDOW:
+            self._window_wins -= self._window[0]
+        self._window.append(win)
+        self._window_wins += win
+        if self.count >= self.WINRATE_WINDOW:
+            self._winrate_points.append({
+                "trade_num": self.count,
+                "winrate": round(self._window_wins / self.WINRATE_WINDOW * 100, 1),
+            })
+
+    def trades_on(self, day: str) -> int:
+        """Trades whose timestamp starts with ISO date `day`."""
+        return self._by_day.get(day, 0)
+
+    def winrate_pct(self) -> float:
+        return round(self.wins / self.count * 100, 1) if self.count else 0.0
+
+    def pnl_series(self) -> List[Dict[str, Any]]:
+        """Cumulative PnL over the last PNL_POINTS trades."""
+        data = []
+        cumulative = 0.0
+        for timestamp, pnl in self._recent:
+            cumulative += pnl
+            data.append({"timestamp": timestamp, "pnl": round(cumulative, 2)})
+        return data
+
+    def winrate_series(self) -> List[Dict[str, Any]]:
+        """Rolling win rate, last WINRATE_POINTS points."""
+        return list(self._winrate_points)
+
+
+class ConfidenceView(_TailView):
+    """Confidence histogram over the last `window` decisions."""
+
+    BUCKETS = ("0-20", "20-40", "40-60", "60-80", "80-100")
+
+    def __init__(self, path: Path, window: int = 200):
+        self.window = window
+        super().__init__(path)
+
+    def _reset(self) -> None:
+        self._labels: Deque[str] = deque()
+        self._counts = {b: 0 for b in self.BUCKETS}
+
+    @staticmethod
+    def bucket(confidence: float) -> str:
+        if confidence < 20:
+            return "0-20"
+        if confidence < 40:
+            return "20-40"
+        if confidence < 60:
+            return "40-60"
+        if confidence < 80:
+            return "60-80"
+        return "80-100"
+
+    def _add(self, decision: Dict[str, Any]) -> None:
+        label = self.bucket(decision.get("confidence", 0) or 0)
+        if len(self._labels) == self.window:
+            self._counts[self._labels.popleft()] -= 1
+        self._labels.append(label)
+        self._counts[label] += 1
+
+    def buckets(self) -> Dict[str, int]:
+        return dict(self._counts)
+
+
+class RecentRecords(_TailView):
+    """Last `maxlen` records of a JSONL file."""
+
+    def __init__(self, path: Path, maxlen: int):
+        self.maxlen = maxlen
+        super().__init__(path)
+
+    def _reset(self) -> None:
+        self._records: Deque[Dict[str, Any]] = deque(maxlen=self.maxlen)
+
+    def _add(self, record: Dict[str, Any]) -> None:
+        self._records.append(record)
+
+    def last(self, n: int) -> List[Dict[str, Any]]:
+        if n <= 0:
+            return []
+        records = list(self._records)
+        return records[-n:]
+
+
+class JsonFileCache:
+    """Small JSON file, re-parsed only when its mtime/size changes."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.version = 0
+        self.data: Optional[Dict[str, Any]] = None
+        self._stamp: Optional[Tuple[int, int]] = None
+
+    def refresh(self) -> int:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            if self.data is not None:
+                self.data, self._stamp = None, None
+                self.version += 1
+            return self.version
+
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp != self._stamp:
+            self._stamp = stamp
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                self.data = data if isinstance(data, dict) else None
+            except (OSError, ValueError) as e:
+                logger.error(f"Failed to load {self.path}: {e}")
+                self.data = None
+            self.version += 1
+        return self.version
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+# === AI SIGNATURE ===
+# Created by: Claude (opus-4)
+# Created at: 2026-02-06 00:00:00 UTC
+# Purpose: Single-producer price fan-out for dashboard WebSocket clients
+# === END SIGNATURE ===
+"""
+Dashboard Price Broadcaster
+
+One background producer fetches the tracked price once per interval and fans
+it out to every connected WebSocket client:
+
+- Price source: WebSocket feed (BinancePriceFeed.get_price) when it has a
+  fresh price, otherwise the blocking REST fetch runs in the default executor
+  so the aiohttp event loop never stalls
+- Per-client bounded queue: when a client falls behind, its oldest message is
+  dropped (latest price wins); clients that keep dropping are disconnected
+- Producer runs only while at least one client is connected
+- Metrics: client count, published/sent/dropped counts, broadcast latency
+  percentiles (publish -> send_json completed)
+
+USAGE:
+    broadcaster = PriceBroadcaster(get_symbol, fetch_price, price_feed=feed)
+    client = broadcaster.register(ws)
+    ...
+    await broadcaster.unregister(client)
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger("dashboard")
+
+QUEUE_SIZE = 8                 # Messages buffered per client
+MAX_CONSECUTIVE_DROPS = 30     # ~30s of stalled sends at 1 msg/s -> disconnect
+LATENCY_WINDOW = 1000          # Samples kept for latency percentiles
+
+
+class _Client:
+    """Connected WebSocket client with its own bounded queue."""
+
+    def __init__(self, ws: Any, queue_size: int):
+        self.ws = ws
+        self.queue: "asyncio.Queue[Tuple[float, Dict[str, Any]]]" = asyncio.Queue(maxsize=queue_size)
+        self.sender: Optional[asyncio.Task] = None
+        self.sent = 0
+        self.dropped = 0
+        self.consecutive_drops = 0
+        self.connected_at = time.time()
+
+
+class PriceBroadcaster:
+    """Fetch prices once, broadcast to all clients."""
+
+    def __init__(
+        self,
+        get_symbol: Callable[[], Optional[str]],
+        fetch_price: Optional[Callable[[str], float]] = None,
+        price_feed: Any = None,
+        interval: float = 1.0,
+        queue_size: int = QUEUE_SIZE,
+        max_consecutive_drops: int = MAX_CONSECUTIVE_DROPS,
+    ):
+        """
+        Args:
+            get_symbol: Returns the symbol to broadcast (None = nothing to send)
+            fetch_price: Blocking REST price fetch, run in the executor
+            price_feed: Optional WebSocket feed with get_price(symbol),
+                async subscribe([symbols]) and is_subscribed(symbol)
+            interval: Seconds between ticks
+        """
+        self._get_symbol = get_symbol
+        self._fetch_price = fetch_price
+        self._price_feed = price_feed
+        self._interval = interval
+        self._queue_size = queue_size
+        self._max_consecutive_drops = max_consecutive_drops
+
+        self._clients: Dict[int, _Client] = {}
+        self._producer: Optional[asyncio.Task] = None
+        self._latency_ms: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._stats = {
+            "published": 0,
+            "sent": 0,
+            "dropped": 0,
+            "clients_disconnected_slow": 0,
+            "fetch_errors": 0,
+            "feed_hits": 0,
+            "rest_fetches": 0,
+            "last_fetch_ms": 0.0,
+        }
+
+    # === Clients ===
+
+    def register(self, ws: Any) -> _Client:
+        """Add client and start its sender (and the producer if idle)."""
+        client = _Client(ws, self._queue_size)
+        client.sender = asyncio.create_task(self._send_loop(client))
+        self._clients[id(client)] = client
+        if self._producer is None or self._producer.done():
+            self._producer = asyncio.create_task(self._produce())
+        return client
+
+    async def unregister(self, client: _Client) -> None:
+        """Remove client and stop its sender."""
+        self._clients.pop(id(client), None)
+        if client.sender is not None and not client.sender.done():
+            client.sender.cancel()
+            try:
+                await client.sender
+            except asyncio.CancelledError:
+                pass
+
+    @property
+    def client_count(self) -> int:
+        return len(self._clients)
+
+    async def close(self) -> None:
+        """Stop producer and all senders."""
+        for client in list(self._clients.values()):
+            await self.unregister(client)
+        if self._producer is not None:
+            self._producer.cancel()
+            try:
+                await self._producer
+            except asyncio.CancelledError:
+                pass
+            self._producer = None
+
+    # === Fan-out ===
+
+    def publish(self, message: Dict[str, Any]) -> None:
+        """Queue message for every client without awaiting any of them."""
+        stamp = time.perf_counter()
+        self._stats["published"] += 1
+        for client in list(self._clients.values()):
+            if client.queue.full():
+                # Slow consumer: drop its oldest message, keep the latest price
+                client.queue.get_nowait()
+                client.dropped += 1
+                client.consecutive_drops += 1
+                self._stats["dropped"] += 1
+                if client.consecutive_drops >= self._max_consecutive_drops:
+                    self._disconnect_slow(client)
+                    continue
+            client.queue.put_nowait((stamp, message))
+
+    def _disconnect_slow(self, client: _Client) -> None:
+        logger.warning("Price WS client dropped %d messages in a row, disconnecting", client.consecutive_drops)
+        self._stats["clients_disconnected_slow"] += 1
+        self._clients.pop(id(client), None)
+        if client.sender is not None:
+            client.sender.cancel()
+        asyncio.create_task(self._close_ws(client.ws))
+
+    @staticmethod
+    async def _close_ws(ws: Any) -> None:
+        try:
+            await ws.close()
+        except Exception:
+            pass
+
+    async def _send_loop(self, client: _Client) -> None:
+        try:
+            while True:
+                stamp, message = await client.queue.get()
+                await client.ws.send_json(message)
+                self._latency_ms.append((time.perf_counter() - stamp) * 1000)
+                client.sent += 1
+                client.consecutive_drops = 0
+                self._stats["sent"] += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.info(f"Price WS send failed, closing client: {e}")
+            self._clients.pop(id(client), None)
+            await self._close_ws(client.ws)
+
+    # === Producer ===
+
+    def _feed_has(self, symbol: str) -> bool:
+        """Whether the feed already streams symbol (BinancePriceFeed.is_subscribed, else .symbols)."""
+        is_subscribed = getattr(self._price_feed, "is_subscribed", None)
+        if is_subscribed is not None:
+            return is_subscribed(symbol)
+        return symbol in getattr(self._price_feed, "symbols", ())
+
+    async def _get_price(self, symbol: str) -> float:
+        if self._price_feed is not None:
+            price = self._price_feed.get_price(symbol)
+            if price:
+                self._stats["feed_hits"] += 1
+                return price
+            subscribe = getattr(self._price_feed, "subscribe", None)
+            if subscribe is not None and not self._feed_has(symbol):
+                await subscribe([symbol])
+
+        if self._fetch_price is None:
+            raise RuntimeError(f"No price available for {symbol}")
+        self._stats["rest_fetches"] += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._fetch_price, symbol)
+
+    async def _produce(self) -> None:
+        logger.info("Price broadcaster started")
+        try:
+            while self._clients:
+                started = time.perf_counter()
+                symbol = self._get_symbol()
+                if symbol:
+                    try:
+                        price = await self._get_price(symbol)
+                        message = {
+                            "type": "price",
+                            "symbol": symbol,
+                            "price": float(price),
+                            "timestamp": datetime.now(timezone.utc).isoformat(),
+                        }
+                    except Exception as e:
+                        self._stats["fetch_errors"] += 1
+                        message = {"type": "error", "message": str(e)}
+                    self._stats["last_fetch_ms"] = round((time.perf_counter() - started) * 1000, 2)
+                    self.publish(message)
+
+                elapsed = time.perf_counter() - started
+                await asyncio.sleep(max(0.0, self._interval - elapsed))
+        finally:
+            logger.info("Price broadcaster idle")
+
+    # === Metrics ===
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Client count, message counters and broadcast latency percentiles."""
+        samples = sorted(self._latency_ms)
+
+        def pct(q: float) -> float:
+            if not samples:
+                return 0.0
+            return round(samples[min(len(samples) - 1, int(q * len(samples)))], 3)
+
+        return {
+            "clients": len(self._clients),
+            "producer_running": self._producer is not None and not self._producer.done(),
+            **self._stats,
+            "latency_ms": {
+                "samples": len(samples),
+                "p50": pct(0.50),
+                "p95": pct(0.95),
+                "p99": pct(0.99),
+                "max": round(samples[-1], 3) if samples else 0.0,
+            },
+            "per_client": [
+                {"sent": c.sent, "dropped": c.dropped, "queued": c.queue.qsize(),
+                 "connected_sec": round(time.time() - c.connected_at, 1)}
+                for c in self._clients.values()
+            ],
+        }
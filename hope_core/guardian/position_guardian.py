@@ -3,7 +3,9 @@
 # Module: hope_core/guardian/position_guardian.py
 # Created by: Claude (opus-4.5)
 # Created at: 2026-02-05T12:55:00Z
+# Modified at: 2026-10-16T00:00:00Z
 # Purpose: AI-powered Position Guardian with hybrid TP/SL management
+# Change: Batched price polling (WS cache first), BTC ring buffer, single-pass exit evaluation, cycle latency percentiles
 # === END SIGNATURE ===
 """
 Position Guardian - AI-powered position monitoring and management.
@@ -17,6 +19,11 @@ Features:
 - Secret Sauce integration
 - Telegram alerts
 
+Each cycle fetches all tracked prices in one batched call (WebSocket price
+cache first, REST for the rest) and evaluates every position against a
+shared per-cycle context (time, BTC change, panic, AI scores fetched
+concurrently), so cycle latency stays flat as positions grow.
+
 Usage:
     guardian = PositionGuardian(config)
     await guardian.start()
@@ -27,10 +34,11 @@ import json
 import logging
 import os
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, List, Optional, Tuple
 from enum import Enum
 
 log = logging.getLogger(__name__)
@@ -77,7 +85,11 @@ class Position:
     @property
     def hold_time_minutes(self) -> float:
         """Minutes since entry."""
-        return (time.time() - self.entry_time) / 60
+        return self.hold_minutes_at(time.time())
+
+    def hold_minutes_at(self, now: float) -> float:
+        """Minutes since entry as of `now`."""
+        return (now - self.entry_time) / 60
 
     @property
     def value_usd(self) -> float:
@@ -115,6 +127,7 @@ class GuardianConfig:
     enable_btc_filter: bool = True
     btc_crash_threshold_pct: float = -2.0  # Close all if BTC drops 2%
     btc_lookback_minutes: int = 15
+    btc_history_minutes: int = 30  # BTC ring buffer horizon
 
     # Partial profits (Secret Thought #1)
     enable_partial_profits: bool = True
@@ -140,17 +153,28 @@ class PositionGuardian:
     using a hybrid approach: AI for optimal exits, rules for safety.
     """
 
+    BTC_SYMBOL = "BTCUSDT"
+    LATENCY_WINDOW = 500  # Cycles kept for latency percentiles
+
     def __init__(
         self,
         config: Optional[GuardianConfig] = None,
         binance_client: Any = None,
         eye_of_god: Any = None,
         secret_sauce: Any = None,
+        price_feed: Any = None,
     ):
+        """
+        Args:
+            price_feed: Optional WebSocket price cache with get_all_prices()
+                returning fresh prices (e.g. BinancePriceFeed, PriceFeedBridge).
+                Symbols it lacks are fetched from REST in one batched call.
+        """
         self.config = config or GuardianConfig()
         self.binance = binance_client
         self.eye_of_god = eye_of_god
         self.secret_sauce = secret_sauce
+        self.price_feed = price_feed
 
         # Try to create Binance client if none provided
         if not self.binance:
@@ -158,10 +182,14 @@ class PositionGuardian:
 
         # State
         self.positions: Dict[str, Position] = {}
-        self.btc_prices: List[Tuple[float, float]] = []  # (timestamp, price)
+        # (timestamp, price) ring buffer; sized for the horizon at 1 sample/sec
+        self.btc_prices: Deque[Tuple[float, float]] = deque(
+            maxlen=max(2, self.config.btc_history_minutes * 60)
+        )
         self.closed_positions: List[Dict] = []
         self._running = False
         self._last_check = 0.0
+        self._cycle_latency_ms: Deque[float] = deque(maxlen=self.LATENCY_WINDOW)
 
         # Stats
         self.stats = {
@@ -403,25 +431,31 @@ class PositionGuardian:
             return
 
         symbols = list(self.positions.keys())
-        symbols.append("BTCUSDT")  # Always track BTC
+        symbols.append(self.BTC_SYMBOL)  # Always track BTC
 
         try:
             prices = await self._get_prices_batch(symbols)
 
             for symbol, pos in self.positions.items():
-                if symbol in prices:
-                    pos.update_price(prices[symbol])
+                price = prices.get(symbol)
+                if price:
+                    pos.update_price(price)
 
             # Track BTC for correlation filter
-            if "BTCUSDT" in prices:
-                self.btc_prices.append((time.time(), prices["BTCUSDT"]))
-                # Keep only last 30 minutes
-                cutoff = time.time() - 1800
-                self.btc_prices = [(t, p) for t, p in self.btc_prices if t > cutoff]
+            btc_price = prices.get(self.BTC_SYMBOL)
+            if btc_price:
+                self._record_btc_price(time.time(), btc_price)
 
         except Exception as e:
             log.error(f"[GUARDIAN] Price update error: {e}")
 
+    def _record_btc_price(self, timestamp: float, price: float) -> None:
+        """Append BTC sample to the ring buffer and drop samples past the horizon."""
+        self.btc_prices.append((timestamp, price))
+        cutoff = timestamp - self.config.btc_history_minutes * 60
+        while self.btc_prices and self.btc_prices[0][0] <= cutoff:
+            self.btc_prices.popleft()
+
     # =========================================================================
     # EXIT DECISION ENGINE (AI + RULES HYBRID)
     # =========================================================================
@@ -433,36 +467,78 @@ class PositionGuardian:
         Returns:
             (should_close, reason, details)
         """
-        symbol = pos.symbol
-        pnl = pos.pnl_pct
+        return (await self.evaluate_positions([pos]))[0]
+
+    async def evaluate_positions(
+        self, positions: List[Position]
+    ) -> List[Tuple[bool, ExitReason, str]]:
+        """
+        Evaluate all positions in one pass.
+
+        Cycle-wide inputs (clock, BTC change, panic) are computed once and AI
+        scores for positions past the hard rules are fetched concurrently.
+
+        Returns:
+            (should_close, reason, details) per position, in input order
+        """
+        now = time.time()
+        decisions: List[Optional[Tuple[bool, ExitReason, str]]] = [None] * len(positions)
 
         # =====================================================================
         # LAYER 1: HARD RULES (Safety Net - Cannot be bypassed)
         # =====================================================================
 
-        # Hard Stop Loss - ABSOLUTE PROTECTION
-        if pnl <= self.config.hard_sl_pct:
-            return True, ExitReason.STOP_LOSS, f"Hard SL hit: {pnl:.2f}% <= {self.config.hard_sl_pct}%"
+        btc_change = self._get_btc_change(now) if self.config.enable_btc_filter else None
+        btc_crash = bool(btc_change) and btc_change <= self.config.btc_crash_threshold_pct
+        panic, panic_reason = False, ""
+        pending: List[int] = []
 
-        # BTC Crash Filter
-        if self.config.enable_btc_filter:
-            btc_change = self._get_btc_change()
-            if btc_change and btc_change <= self.config.btc_crash_threshold_pct:
-                return True, ExitReason.BTC_CRASH, f"BTC crashed {btc_change:.2f}%"
+        for i, pos in enumerate(positions):
+            pnl = pos.pnl_pct
+
+            # Hard Stop Loss - ABSOLUTE PROTECTION
+            if pnl <= self.config.hard_sl_pct:
+                decisions[i] = (True, ExitReason.STOP_LOSS, f"Hard SL hit: {pnl:.2f}% <= {self.config.hard_sl_pct}%")
+            # BTC Crash Filter
+            elif btc_crash:
+                decisions[i] = (True, ExitReason.BTC_CRASH, f"BTC crashed {btc_change:.2f}%")
+            else:
+                pending.append(i)
 
         # Panic mode from Secret Sauce
-        if self.secret_sauce:
-            panic, reason = self.secret_sauce.panic.is_panic()
+        if pending and self.secret_sauce:
+            panic, panic_reason = self.secret_sauce.panic.is_panic()
             if panic:
-                return True, ExitReason.PANIC, f"Panic mode: {reason}"
+                for i in pending:
+                    decisions[i] = (True, ExitReason.PANIC, f"Panic mode: {panic_reason}")
+                pending = []
 
         # =====================================================================
         # LAYER 2: AI-POWERED DECISIONS
         # =====================================================================
 
+        if pending and self.config.enable_ai and self.eye_of_god:
+            scores = await asyncio.gather(
+                *(self._get_ai_score(positions[i].symbol) for i in pending)
+            )
+            for i, score in zip(pending, scores):
+                positions[i].ai_score = score
+
+        # =====================================================================
+        # LAYERS 3-5: TP / TRAILING / TIME (pure arithmetic, no awaits)
+        # =====================================================================
+
+        for i in pending:
+            decisions[i] = self._evaluate_rules(positions[i], now)
+
+        return decisions
+
+    def _evaluate_rules(self, pos: Position, now: float) -> Tuple[bool, ExitReason, str]:
+        """AI threshold, dynamic TP, trailing stop and time exits for one position."""
+        pnl = pos.pnl_pct
+
         if self.config.enable_ai and self.eye_of_god:
-            ai_score = await self._get_ai_score(symbol)
-            pos.ai_score = ai_score
+            ai_score = pos.ai_score
 
             # AI says SELL
             if ai_score < self.config.ai_close_threshold and pnl > -0.5:
@@ -478,7 +554,7 @@ class PositionGuardian:
         # =====================================================================
 
         if self.config.enable_dynamic:
-            dynamic_tp = self._calculate_dynamic_tp(pos)
+            dynamic_tp = self._calculate_dynamic_tp(pos, now)
 
             if pnl >= dynamic_tp:
                 return True, ExitReason.TAKE_PROFIT, f"Dynamic TP: {pnl:.2f}% >= {dynamic_tp:.2f}%"
@@ -501,7 +577,7 @@ class PositionGuardian:
         # LAYER 5: TIME DECAY
         # =====================================================================
 
-        hold_minutes = pos.hold_time_minutes
+        hold_minutes = pos.hold_minutes_at(now)
 
         if hold_minutes >= self.config.max_hold_minutes:
             if pnl > 0:
@@ -515,7 +591,7 @@ class PositionGuardian:
 
         return False, ExitReason.TAKE_PROFIT, "HOLD"
 
-    def _calculate_dynamic_tp(self, pos: Position) -> float:
+    def _calculate_dynamic_tp(self, pos: Position, now: Optional[float] = None) -> float:
         """
         Calculate dynamic take profit based on conditions.
 
@@ -530,7 +606,7 @@ class PositionGuardian:
             base_tp *= 0.7  # Lower TP if AI bearish
 
         # Time decay: reduce TP over time
-        hold_minutes = pos.hold_time_minutes
+        hold_minutes = pos.hold_minutes_at(now if now is not None else time.time())
         if hold_minutes > self.config.time_decay_start_minutes:
             decay_factor = max(0.5, 1 - (hold_minutes - self.config.time_decay_start_minutes) / 180)
             base_tp *= decay_factor
@@ -538,19 +614,19 @@ class PositionGuardian:
         # Clamp to bounds
         return max(self.config.min_tp_pct, min(self.config.max_tp_pct, base_tp))
 
-    def _get_btc_change(self) -> Optional[float]:
+    def _get_btc_change(self, now: Optional[float] = None) -> Optional[float]:
         """Get BTC price change over lookback period."""
         if len(self.btc_prices) < 2:
             return None
 
         lookback_sec = self.config.btc_lookback_minutes * 60
-        cutoff = time.time() - lookback_sec
+        cutoff = (now if now is not None else time.time()) - lookback_sec
 
-        old_prices = [p for t, p in self.btc_prices if t <= cutoff + 60]
-        if not old_prices:
+        # Ring buffer is time-ordered: oldest sample is the reference if old enough
+        oldest_ts, old_price = self.btc_prices[0]
+        if oldest_ts > cutoff + 60:
             return None
 
-        old_price = old_prices[0]
         current_price = self.btc_prices[-1][1]
 
         return ((current_price - old_price) / old_price) * 100
@@ -714,6 +790,7 @@ class PositionGuardian:
 
     async def run_once(self) -> Dict[str, Any]:
         """Run one monitoring cycle."""
+        cycle_start = time.perf_counter()
         results = {
             "checked": 0,
             "closed": 0,
@@ -724,19 +801,27 @@ class PositionGuardian:
         # Update prices
         await self.update_prices()
 
-        # Evaluate each position
-        for symbol, pos in list(self.positions.items()):
+        # Evaluate all positions in one pass
+        tracked = list(self.positions.items())
+        try:
+            decisions = await self.evaluate_positions([pos for _, pos in tracked])
+        except Exception as e:
+            log.error(f"[GUARDIAN] Evaluation error: {e}")
+            results["checked"] = len(tracked)
+            results["errors"] = len(tracked)
+            tracked, decisions = [], []
+        now = time.time()
+
+        for (symbol, pos), (should_close, reason, details) in zip(tracked, decisions):
             results["checked"] += 1
 
             try:
-                should_close, reason, details = await self.evaluate_position(pos)
-
                 pos_status = {
                     "symbol": symbol,
                     "pnl_pct": pos.pnl_pct,
                     "mfe": pos.mfe,
                     "mae": pos.mae,
-                    "hold_minutes": pos.hold_time_minutes,
+                    "hold_minutes": pos.hold_minutes_at(now),
                     "ai_score": pos.ai_score,
                     "decision": "CLOSE" if should_close else "HOLD",
                     "reason": reason.value if should_close else None,
@@ -761,8 +846,28 @@ class PositionGuardian:
                 results["errors"] += 1
 
         self._last_check = time.time()
+        cycle_ms = (time.perf_counter() - cycle_start) * 1000
+        self._cycle_latency_ms.append(cycle_ms)
+        results["cycle_ms"] = round(cycle_ms, 2)
         return results
 
+    def get_cycle_latency(self) -> Dict[str, float]:
+        """Cycle latency percentiles (ms) over the last LATENCY_WINDOW cycles."""
+        samples = sorted(self._cycle_latency_ms)
+        if not samples:
+            return {"cycles": 0, "p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+
+        def pct(q: float) -> float:
+            return round(samples[min(len(samples) - 1, int(q * len(samples)))], 2)
+
+        return {
+            "cycles": len(samples),
+            "p50_ms": pct(0.50),
+            "p95_ms": pct(0.95),
+            "p99_ms": pct(0.99),
+            "max_ms": round(samples[-1], 2),
+        }
+
     async def _handle_partial_profits(self, pos: Position) -> bool:
         """
         Handle partial profit taking.
@@ -935,33 +1040,65 @@ class PositionGuardian:
             return None
 
     async def _get_prices_batch(self, symbols: List[str]) -> Dict[str, float]:
-        """Get prices for multiple symbols."""
+        """
+        Get prices for multiple symbols.
+
+        WebSocket price cache first; the remaining symbols in one REST call.
+        """
+        prices: Dict[str, float] = {}
+        if self.price_feed is not None:
+            try:
+                cached = self.price_feed.get_all_prices()
+                prices = {s: cached[s] for s in symbols if cached.get(s)}
+            except Exception as e:
+                log.debug(f"[GUARDIAN] Price feed unavailable: {e}")
+
+        missing = [s for s in symbols if s not in prices]
+        if missing:
+            prices.update(await self._get_prices_rest(missing))
+        return prices
+
+    async def _get_prices_rest(self, symbols: List[str]) -> Dict[str, float]:
+        """Get prices for multiple symbols from REST."""
         if not self.binance:
             return {}
 
+        prices: Dict[str, float] = {}
         try:
+            # Custom BinanceClient: one /ticker/price?symbols=[...] request
+            if hasattr(self.binance, 'get_prices'):
+                result = self.binance.get_prices(symbols)
+                if hasattr(result, '__await__'):
+                    result = await result
+                prices = dict(result)
+
             # Try get_all_tickers for python-binance
-            if hasattr(self.binance, 'get_all_tickers'):
+            elif hasattr(self.binance, 'get_all_tickers'):
                 result = self.binance.get_all_tickers()
                 if hasattr(result, '__await__'):
                     tickers = await result
                 else:
                     tickers = result
-                return {t['symbol']: float(t['price']) for t in tickers if t['symbol'] in symbols}
-
-            # Fallback to individual price fetches for custom BinanceClient
-            if hasattr(self.binance, 'get_price'):
-                prices = {}
-                for symbol in symbols:
-                    price = self.binance.get_price(symbol)
-                    if price and price > 0:
-                        prices[symbol] = price
-                return prices
-
-            return {}
+                wanted = set(symbols)
+                prices = {t['symbol']: float(t['price']) for t in tickers if t['symbol'] in wanted}
         except Exception as e:
             log.error(f"[GUARDIAN] Batch price error: {e}")
-            return {}
+
+        # Per-symbol fallback for anything the batch call failed or skipped
+        # (one invalid symbol makes Binance reject the whole batch)
+        missing = [s for s in symbols if s not in prices]
+        if missing and hasattr(self.binance, 'get_price'):
+            for symbol in missing:
+                try:
+                    price = self.binance.get_price(symbol)
+                    if hasattr(price, '__await__'):
+                        price = await price
+                except Exception as e:
+                    log.error(f"[GUARDIAN] Price error for {symbol}: {e}")
+                    continue
+                if price and price > 0:
+                    prices[symbol] = price
+        return prices
 
     async def _get_entry_price(self, symbol: str) -> Optional[float]:
         """Get entry price from recent trades."""
@@ -1085,6 +1222,7 @@ class PositionGuardian:
                 "ai_enabled": self.config.enable_ai,
             },
             "last_check": self._last_check,
+            "cycle_latency": self.get_cycle_latency(),
             "positions_detail": [
                 {
                     "symbol": pos.symbol,
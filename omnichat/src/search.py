@@ -2,10 +2,10 @@
 # Created by: Claude (opus-4)
 # Created at: 2026-01-26T16:45:00Z
 # Modified by: Claude (opus-4)
-# Modified at: 2026-01-26T17:05:00Z
-# Purpose: HOPE OMNI-CHAT Search Engine v1.1 - Full-text search with filters
-# Security: Secrets redaction in search results
-# Changes: Added performance metrics (Gemini recommendation)
+# Modified at: 2026-02-06T03:00:00Z
+# Purpose: HOPE OMNI-CHAT Search Engine v1.2 - Indexed full-text search with filters
+# Security: Secrets redaction in search results and index
+# Changes: Persistent incremental inverted index (snapshot + delta log), lazy page materialization
 # === END SIGNATURE ===
 """
 HOPE OMNI-CHAT Search Engine v1.0
@@ -19,7 +19,10 @@ Production-grade search functionality for chat history:
 - Fail-closed error handling
 
 Architecture:
-- SearchEngine: Core search logic, file I/O, caching
+- SearchIndex: Persistent token/role/day index, updated incrementally
+  from the last indexed byte offset (snapshot chat_history.idx.json plus
+  append-only delta log chat_history.idx.log)
+- SearchEngine: Query planning over the index, lazy page reads, caching
 - SearchQuery: Query parameters dataclass
 - SearchResult: Single result with match positions
 - SearchResults: Paginated results container
@@ -28,13 +31,17 @@ Architecture:
 from __future__ import annotations
 
 import json
+import os
 import re
+import threading
 import time
 import sys
+from array import array
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from pathlib import Path
-from typing import Optional, Generator, Callable
+from typing import Any, Optional, Generator, Callable
 from functools import lru_cache
 import hashlib
 
@@ -48,6 +55,7 @@ class SearchMetrics:
     """Performance metrics for search operations."""
     query_time_ms: float = 0.0
     lines_scanned: int = 0
+    lines_indexed: int = 0
     matches_found: int = 0
     cache_hit: bool = False
     file_size_kb: float = 0.0
@@ -57,6 +65,7 @@ class SearchMetrics:
         return {
             "query_time_ms": round(self.query_time_ms, 2),
             "lines_scanned": self.lines_scanned,
+            "lines_indexed": self.lines_indexed,
             "matches_found": self.matches_found,
             "cache_hit": self.cache_hit,
             "file_size_kb": round(self.file_size_kb, 2),
@@ -242,6 +251,365 @@ class SearchResults:
         return f"Показано {self.start_index}-{self.end_index} из {self.total_count}"
 
 
+# === SEARCH INDEX ===
+
+_TOKEN_RE = re.compile(r"\w+")
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _parse_timestamp(timestamp_str: str) -> datetime:
+    """Parse a history timestamp (ISO, optional microseconds/Z); utcnow on failure."""
+    try:
+        if "." in timestamp_str:
+            return datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+        return datetime.fromisoformat(timestamp_str.replace("Z", ""))
+    except (ValueError, AttributeError, TypeError):
+        return datetime.utcnow()
+
+
+class SearchIndex:
+    """
+    Persistent inverted index over the chat-history JSONL.
+
+    Per message (doc id = position in file order):
+    - byte offset and line number (for lazy materialization)
+    - role and timestamp (sort key + facets)
+
+    Lookup tables:
+    - postings: token -> doc ids (ascending)
+    - by_role: role -> doc ids
+    - by_day: date ordinal -> doc ids
+
+    The index is updated incrementally from the last indexed byte offset,
+    so only appended messages are parsed. It is rebuilt from scratch if the
+    file shrinks or its head changes (rewritten/replaced history).
+    Tokens are built from redacted content, so secrets never reach the
+    index files.
+
+    Persistence: each refresh appends only its new docs as one record to a
+    delta log (<index>.log, keyed by the byte offset it starts from); the
+    full snapshot is rewritten only on rebuild, on save() and when the log
+    outgrows the snapshot (compaction).
+
+    `generation` changes whenever indexed content changes (append or
+    rebuild), so result caches can key on it.
+    """
+
+    VERSION = 1
+
+    # Bytes of file head fingerprinted to detect a rewritten history
+    HEAD_BYTES = 4096
+
+    # Compact (rewrite snapshot, clear log) when the log exceeds this
+    # fraction of the snapshot size
+    COMPACT_RATIO = 1.0
+
+    # Progress callback granularity (lines)
+    PROGRESS_EVERY = 1000
+
+    def __init__(self, history_path: Path, index_path: Path):
+        """
+        Initialize index (loaded lazily on first refresh).
+
+        Args:
+            history_path: Path to chat_history.jsonl file
+            index_path: Path to persisted index JSON
+        """
+        self.history_path = history_path
+        self.index_path = index_path
+        self.log_path = index_path.with_suffix(".log")
+        self._loaded = False
+        self.generation = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        """Drop all indexed state."""
+        self.generation += 1
+        self.offset = 0
+        self.line_count = 0
+        self.head_len = 0
+        self.head_sig = ""
+        self.role_names: list[str] = []
+        self.doc_offsets = array("Q")
+        self.doc_lines = array("I")
+        self.doc_roles = array("H")
+        self.doc_ts = array("d")
+        self.postings: dict[str, array] = {}
+        self.by_role: dict[str, array] = {}
+        self.by_day: dict[int, array] = {}
+
+    def __len__(self) -> int:
+        return len(self.doc_offsets)
+
+    # --- Maintenance ---
+
+    def refresh(self, on_progress: Optional[Callable[[int, int], None]] = None) -> int:
+        """
+        Index messages appended since the last refresh.
+
+        Args:
+            on_progress: Optional callback (bytes indexed, total bytes)
+
+        Returns:
+            Number of lines indexed
+        """
+        if not self._loaded:
+            self._load()
+            self._loaded = True
+
+        if not self.history_path.exists():
+            if self.offset:
+                self._reset()
+                self.save()
+            return 0
+
+        size = self.history_path.stat().st_size
+        if self.offset and (size < self.offset or self._head_signature(self.head_len) != self.head_sig):
+            self._reset()
+        if size == self.offset:
+            return 0
+
+        from_scratch = self.offset == 0
+        start = self.offset
+        lines = 0
+        pos = self.offset
+        docs: list[list[Any]] = []
+        with open(self.history_path, "rb") as f:
+            f.seek(pos)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # Message still being written; picked up next refresh
+                self.line_count += 1
+                doc = self._parse_line(raw, pos)
+                if doc is not None:
+                    self._index_doc(*doc)
+                    docs.append(doc)
+                pos += len(raw)
+                lines += 1
+                if on_progress and lines % self.PROGRESS_EVERY == 0:
+                    on_progress(pos, size)
+        self.offset = pos
+        if on_progress:
+            on_progress(pos, size)
+
+        if self.head_len < self.HEAD_BYTES:
+            self.head_len = min(self.HEAD_BYTES, self.offset)
+            self.head_sig = self._head_signature(self.head_len)
+
+        if lines:
+            self.generation += 1
+            if from_scratch or not self._append_log(start, docs):
+                self.save()
+        return lines
+
+    def _parse_line(self, raw: bytes, offset: int) -> Optional[list[Any]]:
+        """
+        Parse one JSONL line into a doc record (None for blank/malformed lines).
+
+        Returns:
+            [offset, line number, role, timestamp seconds, tokens]
+        """
+        line = raw.strip()
+        if not line:
+            return None
+        try:
+            msg = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return None
+        if not isinstance(msg, dict):
+            return None
+
+        content = msg.get("content", "")
+        if not isinstance(content, str):
+            content = str(content)
+        if contains_secret(content):
+            content = redact(content)
+        timestamp = _parse_timestamp(msg.get("timestamp", "")).replace(tzinfo=None)
+        role = str(msg.get("role", "unknown"))
+        tokens = sorted(set(_TOKEN_RE.findall(content.lower())))
+        return [offset, self.line_count, role, (timestamp - _EPOCH).total_seconds(), tokens]
+
+    def _index_doc(self, offset: int, line: int, role: str, ts: float, tokens: list[str]) -> None:
+        """Add one parsed doc to the columns and lookup tables."""
+        if role not in self.by_role:
+            self.by_role[role] = array("I")
+            self.role_names.append(role)
+
+        doc = len(self.doc_offsets)
+        self.doc_offsets.append(offset)
+        self.doc_lines.append(line)
+        self.doc_roles.append(self.role_names.index(role))
+        self.doc_ts.append(ts)
+
+        self.by_role[role].append(doc)
+        self.by_day.setdefault((_EPOCH + timedelta(seconds=ts)).toordinal(), array("I")).append(doc)
+        for token in tokens:
+            postings = self.postings.get(token)
+            if postings is None:
+                postings = self.postings[token] = array("I")
+            postings.append(doc)
+
+    def _head_signature(self, length: int) -> str:
+        if length <= 0:
+            return ""
+        try:
+            with open(self.history_path, "rb") as f:
+                return hashlib.sha256(f.read(length)).hexdigest()
+        except OSError:
+            return ""
+
+    # --- Persistence ---
+
+    def _append_log(self, start: int, docs: list[list[Any]]) -> bool:
+        """
+        Append one refresh worth of docs to the delta log.
+
+        Returns:
+            False if the snapshot should be rewritten instead (compaction
+            due or log write failed)
+        """
+        record = {
+            "from": start,
+            "offset": self.offset,
+            "line_count": self.line_count,
+            "head_len": self.head_len,
+            "head_sig": self.head_sig,
+            "docs": docs,
+        }
+        try:
+            snapshot_size = self.index_path.stat().st_size
+            log_size = self.log_path.stat().st_size if self.log_path.exists() else 0
+            if log_size > snapshot_size * self.COMPACT_RATIO:
+                return False
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            return True
+        except OSError:
+            return False
+
+    def _replay_log(self) -> None:
+        """Apply delta-log records that continue from the snapshot offset."""
+        try:
+            with open(self.log_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break  # Torn tail: the rest is re-indexed from the history file
+                    if record.get("from") != self.offset:
+                        continue  # Already in the snapshot (crash before log truncate)
+                    for doc in record["docs"]:
+                        self._index_doc(*doc)
+                    self.offset = int(record["offset"])
+                    self.line_count = int(record["line_count"])
+                    self.head_len = int(record["head_len"])
+                    self.head_sig = str(record["head_sig"])
+        except FileNotFoundError:
+            pass
+
+    def save(self) -> None:
+        """
+        Persist a full snapshot atomically (temp -> fsync -> replace) and clear
+        the delta log. Best effort: it is a cache.
+        """
+        data = {
+            "version": self.VERSION,
+            "offset": self.offset,
+            "line_count": self.line_count,
+            "head_len": self.head_len,
+            "head_sig": self.head_sig,
+            "roles": self.role_names,
+            "doc_offsets": self.doc_offsets.tolist(),
+            "doc_lines": self.doc_lines.tolist(),
+            "doc_roles": self.doc_roles.tolist(),
+            "doc_ts": self.doc_ts.tolist(),
+            "postings": {token: docs.tolist() for token, docs in self.postings.items()},
+        }
+        tmp = self.index_path.with_suffix(".tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.index_path)
+            with open(self.log_path, "w", encoding="utf-8"):
+                pass
+        except OSError:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+    def _load(self) -> None:
+        """Load persisted index; start empty (full rebuild) if missing or invalid."""
+        if not self.index_path.exists():
+            return
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+            if data.get("version") != self.VERSION:
+                return
+            self.offset = int(data["offset"])
+            self.line_count = int(data["line_count"])
+            self.head_len = int(data["head_len"])
+            self.head_sig = str(data["head_sig"])
+            self.role_names = list(data["roles"])
+            self.doc_offsets = array("Q", data["doc_offsets"])
+            self.doc_lines = array("I", data["doc_lines"])
+            self.doc_roles = array("H", data["doc_roles"])
+            self.doc_ts = array("d", data["doc_ts"])
+            self.postings = {token: array("I", docs) for token, docs in data["postings"].items()}
+        except (OSError, ValueError, KeyError, TypeError, OverflowError):
+            self._reset()
+            return
+
+        # Facets are derived from the doc columns
+        self.by_role = {role: array("I") for role in self.role_names}
+        for doc, (role_idx, ts) in enumerate(zip(self.doc_roles, self.doc_ts)):
+            self.by_role[self.role_names[role_idx]].append(doc)
+            day = (_EPOCH + timedelta(seconds=ts)).toordinal()
+            self.by_day.setdefault(day, array("I")).append(doc)
+
+        try:
+            self._replay_log()
+        except (OSError, ValueError, KeyError, TypeError, OverflowError):
+            self._reset()
+
+    # --- Lookups ---
+
+    def docs_for_roles(self, roles: list[str]) -> set[int]:
+        """Doc ids written by any of roles."""
+        docs: set[int] = set()
+        for role in roles:
+            docs.update(self.by_role.get(role, ()))
+        return docs
+
+    def docs_for_dates(self, date_from: Optional[date], date_to: Optional[date]) -> set[int]:
+        """Doc ids whose message date is within [date_from, date_to]."""
+        days = sorted(self.by_day)
+        lo = bisect_left(days, date_from.toordinal()) if date_from else 0
+        hi = bisect_right(days, date_to.toordinal()) if date_to else len(days)
+        docs: set[int] = set()
+        for day in days[lo:hi]:
+            docs.update(self.by_day[day])
+        return docs
+
+    def docs_containing(self, piece: str) -> set[int]:
+        """Doc ids having a token that contains piece (lowercase word chars)."""
+        docs: set[int] = set()
+        for token, postings in self.postings.items():
+            if piece in token:
+                docs.update(postings)
+        return docs
+
+    def date_range(self) -> tuple[Optional[date], Optional[date]]:
+        """(earliest, latest) message date, or (None, None) if empty."""
+        if not self.by_day:
+            return None, None
+        return date.fromordinal(min(self.by_day)), date.fromordinal(max(self.by_day))
+
+
 # === SEARCH ENGINE ===
 
 class SearchEngine:
@@ -253,11 +621,19 @@ class SearchEngine:
     - Multiple filters: agent, date range
     - Case-insensitive by default
     - Optional regex mode
-    - Pagination for large datasets
+    - Persistent inverted index, updated incrementally on append
+    - Pagination with lazy materialization (only the page is read)
     - Result caching for performance
     - Fail-closed error handling
     - Secrets redaction in results
 
+    Query plan:
+    - agent/date filters come from the role/day facets
+    - each keyword is expanded to the vocabulary tokens containing it
+      (exact for word-character keywords, case-insensitive)
+    - case-sensitive, punctuated or regex queries re-check only the
+      index candidates against the message text
+
     Usage:
         engine = SearchEngine(history_path)
         query = SearchQuery(text="error", agents=["claude"])
@@ -267,7 +643,7 @@ class SearchEngine:
     # Default page size
     DEFAULT_PAGE_SIZE = 50
 
-    # Maximum results to return (safety limit)
+    # Maximum results to return (safety limit, newest kept)
     MAX_RESULTS = 10000
 
     # Cache size for query results
@@ -278,6 +654,7 @@ class SearchEngine:
         history_path: Path,
         page_size: int = DEFAULT_PAGE_SIZE,
         on_progress: Optional[Callable[[int, int], None]] = None,
+        index_path: Optional[Path] = None,
     ):
         """
         Initialize search engine.
@@ -285,55 +662,31 @@ class SearchEngine:
         Args:
             history_path: Path to chat_history.jsonl file
             page_size: Number of results per page
-            on_progress: Optional callback for progress updates (current, total)
+            on_progress: Optional callback for indexing progress (bytes done, total bytes)
+            index_path: Path to persisted index (default: <history>.idx.json)
         """
         self.history_path = history_path
         self.page_size = page_size
         self.on_progress = on_progress
 
-        # Result cache: query_hash -> (results, timestamp)
-        self._cache: dict[str, tuple[list[SearchResult], datetime]] = {}
-        self._cache_file_mtime: Optional[float] = None
+        if index_path is None:
+            index_path = history_path.with_suffix(".idx.json")
+        self._index = SearchIndex(history_path, index_path)
+        self._lock = threading.Lock()
+
+        # Result cache: query_hash -> (doc ids newest first, timestamp)
+        self._cache: dict[str, tuple[list[int], datetime]] = {}
+        self._cache_generation: int = -1
 
         # Performance metrics (last query)
         self.last_metrics: SearchMetrics = SearchMetrics()
 
     def _invalidate_cache_if_needed(self) -> None:
-        """Invalidate cache if history file has been modified."""
-        if not self.history_path.exists():
+        """Invalidate cache if the index has changed (messages appended or rebuilt)."""
+        generation = self._index.generation
+        if self._cache_generation != generation:
             self._cache.clear()
-            return
-
-        current_mtime = self.history_path.stat().st_mtime
-        if self._cache_file_mtime != current_mtime:
-            self._cache.clear()
-            self._cache_file_mtime = current_mtime
-
-    def _load_messages(self) -> Generator[tuple[int, dict], None, None]:
-        """
-        Load messages from JSONL file as generator.
-
-        Yields:
-            Tuple of (line_number, message_dict)
-
-        Raises:
-            FileNotFoundError: If history file doesn't exist
-        """
-        if not self.history_path.exists():
-            return
-
-        with open(self.history_path, "r", encoding="utf-8") as f:
-            for line_num, line in enumerate(f, start=1):
-                line = line.strip()
-                if not line:
-                    continue
-
-                try:
-                    msg = json.loads(line)
-                    yield line_num, msg
-                except json.JSONDecodeError:
-                    # Skip malformed lines (fail-closed: don't crash)
-                    continue
+            self._cache_generation = generation
 
     def _parse_message(self, line_num: int, msg: dict) -> Optional[SearchResult]:
         """
@@ -349,19 +702,9 @@ class SearchEngine:
         try:
             role = msg.get("role", "unknown")
             content = msg.get("content", "")
-            timestamp_str = msg.get("timestamp", "")
             tokens_used = msg.get("tokens_used", 0)
             cost_cents = msg.get("cost_cents", 0.0)
-
-            # Parse timestamp
-            try:
-                # Handle ISO format with optional microseconds
-                if "." in timestamp_str:
-                    timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-                else:
-                    timestamp = datetime.fromisoformat(timestamp_str.replace("Z", ""))
-            except (ValueError, AttributeError):
-                timestamp = datetime.utcnow()
+            timestamp = _parse_timestamp(msg.get("timestamp", ""))
 
             # SECURITY: Redact any secrets that might be in history
             # (This is defense-in-depth; secrets should already be redacted on save)
@@ -496,11 +839,12 @@ class SearchEngine:
             page: Page number (1-indexed)
 
         Returns:
-            SearchResults with matching messages
+            SearchResults with matching messages (only this page is read
+            from the history file)
 
         Note:
             Results are cached by query hash. Cache is invalidated
-            when the history file is modified.
+            when new messages are indexed.
         """
         # Start timing
         start_time = time.perf_counter()
@@ -513,97 +857,146 @@ class SearchEngine:
         # Validate page number
         page = max(1, page)
 
-        # Check cache
-        self._invalidate_cache_if_needed()
-        cache_key = query.cache_key()
+        with self._lock:
+            metrics.lines_indexed = self._index.refresh(self.on_progress)
 
-        if cache_key in self._cache:
-            all_results, _ = self._cache[cache_key]
-            metrics.cache_hit = True
-        else:
-            # Execute search
-            all_results, lines_scanned = self._execute_search(query)
-            metrics.lines_scanned = lines_scanned
-            metrics.cache_hit = False
+            # Check cache
+            self._invalidate_cache_if_needed()
+            cache_key = query.cache_key()
+
+            if cache_key in self._cache:
+                all_ids, _ = self._cache[cache_key]
+                metrics.cache_hit = True
+            else:
+                # Execute search
+                all_ids, lines_scanned = self._execute_search(query)
+                metrics.lines_scanned = lines_scanned
+                metrics.cache_hit = False
+
+                # Cache results (limit cache size)
+                if len(self._cache) >= self.CACHE_SIZE:
+                    # Remove oldest entry
+                    oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k][1])
+                    del self._cache[oldest_key]
 
-            # Cache results (limit cache size)
-            if len(self._cache) >= self.CACHE_SIZE:
-                # Remove oldest entry
-                oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k][1])
-                del self._cache[oldest_key]
+                self._cache[cache_key] = (all_ids, datetime.utcnow())
 
-            self._cache[cache_key] = (all_results, datetime.utcnow())
+            # Paginate, then materialize only the requested page
+            start_idx = (page - 1) * self.page_size
+            page_ids = all_ids[start_idx:start_idx + self.page_size]
+            page_results = self._materialize(page_ids, query)
+            metrics.lines_scanned += len(page_ids)
 
         # Record metrics
-        metrics.matches_found = len(all_results)
+        metrics.matches_found = len(all_ids)
         metrics.query_time_ms = (time.perf_counter() - start_time) * 1000
-        metrics.memory_usage_mb = sys.getsizeof(all_results) / (1024 * 1024)
+        metrics.memory_usage_mb = sys.getsizeof(all_ids) / (1024 * 1024)
         self.last_metrics = metrics
 
-        # Paginate
-        total_count = len(all_results)
-        start_idx = (page - 1) * self.page_size
-        end_idx = start_idx + self.page_size
-        page_results = all_results[start_idx:end_idx]
-
         return SearchResults(
             items=page_results,
-            total_count=total_count,
+            total_count=len(all_ids),
             page=page,
             page_size=self.page_size,
             query=query,
         )
 
-    def _execute_search(self, query: SearchQuery) -> tuple[list[SearchResult], int]:
+    def _execute_search(self, query: SearchQuery) -> tuple[list[int], int]:
         """
-        Execute search and return all matching results.
+        Resolve query against the index.
 
         Args:
             query: SearchQuery with criteria
 
         Returns:
-            Tuple of (results list, lines scanned count)
+            Tuple of (matching doc ids newest first, lines read to verify)
         """
-        results = []
-        total_lines = 0
-        lines_scanned = 0
+        index = self._index
+        candidates: Optional[set[int]] = None  # None = all messages
+        verify = False
 
-        # Count total lines for progress
-        if self.on_progress and self.history_path.exists():
-            with open(self.history_path, "r", encoding="utf-8") as f:
-                total_lines = sum(1 for _ in f)
+        def narrow(docs: set[int]) -> None:
+            nonlocal candidates
+            candidates = docs if candidates is None else candidates & docs
 
-        # Search
-        for line_num, msg in self._load_messages():
-            lines_scanned = line_num
+        if query.agents:
+            narrow(index.docs_for_roles(query.agents))
 
-            # Progress callback
-            if self.on_progress and total_lines > 0:
-                self.on_progress(line_num, total_lines)
+        if query.date_from or query.date_to:
+            narrow(index.docs_for_dates(query.date_from, query.date_to))
 
-            result = self._parse_message(line_num, msg)
-            if result is None:
-                continue
+        if query.text.strip():
+            if query.regex_mode:
+                try:
+                    re.compile(query.text)
+                except re.error:
+                    # Invalid regex - fail-closed, don't match
+                    return [], 0
+                verify = True
+            else:
+                verify = query.case_sensitive
+                for keyword in query.text.lower().split():
+                    pieces = _TOKEN_RE.findall(keyword)
+                    if pieces != [keyword]:
+                        # Punctuation: pieces only narrow, text decides
+                        verify = True
+                    for piece in pieces:
+                        narrow(index.docs_containing(piece))
+                        if not candidates:
+                            return [], 0
+
+        doc_ids = range(len(index)) if candidates is None else sorted(candidates)
 
-            if self._matches_query(result, query):
-                # Find match positions for highlighting
-                result.match_positions = self._find_match_positions(
-                    result.content, query
-                )
-                results.append(result)
+        lines_scanned = 0
+        if verify:
+            matched = []
+            for doc, result in self._read_docs(doc_ids):
+                lines_scanned += 1
+                if self._matches_query(result, query):
+                    matched.append(doc)
+            doc_ids = matched
 
-                # Safety limit
-                if len(results) >= self.MAX_RESULTS:
-                    break
+        # Sort by timestamp (newest first; file order among equal timestamps)
+        doc_ts = index.doc_ts
+        ordered = sorted(doc_ids, key=lambda doc: -doc_ts[doc])
 
-        # Sort by timestamp (newest first)
-        results.sort(key=lambda r: r.timestamp, reverse=True)
+        return ordered[:self.MAX_RESULTS], lines_scanned
 
-        return results, lines_scanned
+    def _read_docs(self, doc_ids) -> Generator[tuple[int, SearchResult], None, None]:
+        """
+        Read and parse indexed messages by byte offset.
+
+        Yields:
+            Tuple of (doc id, SearchResult); unreadable lines are skipped
+        """
+        if not doc_ids or not self.history_path.exists():
+            return
+
+        index = self._index
+        with open(self.history_path, "rb") as f:
+            for doc in doc_ids:
+                f.seek(index.doc_offsets[doc])
+                try:
+                    msg = json.loads(f.readline())
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+                if not isinstance(msg, dict):
+                    continue
+                result = self._parse_message(index.doc_lines[doc], msg)
+                if result is not None:
+                    yield doc, result
+
+    def _materialize(self, doc_ids: list[int], query: SearchQuery) -> list[SearchResult]:
+        """Build SearchResults (with match positions) for one page of doc ids."""
+        results = []
+        for _, result in self._read_docs(doc_ids):
+            result.match_positions = self._find_match_positions(result.content, query)
+            results.append(result)
+        return results
 
     def get_stats(self) -> dict:
         """
-        Get statistics about the history file.
+        Get statistics about the history file (from the index).
 
         Returns:
             Dict with total_messages, date_range, agents, file_size
@@ -612,7 +1005,7 @@ class SearchEngine:
             "total_messages": 0,
             "date_from": None,
             "date_to": None,
-            "agents": set(),
+            "agents": [],
             "file_size_kb": 0,
         }
 
@@ -621,28 +1014,19 @@ class SearchEngine:
 
         stats["file_size_kb"] = self.history_path.stat().st_size / 1024
 
-        for line_num, msg in self._load_messages():
-            stats["total_messages"] = line_num
-
-            role = msg.get("role", "unknown")
-            stats["agents"].add(role)
-
-            timestamp_str = msg.get("timestamp", "")
-            try:
-                timestamp = datetime.fromisoformat(timestamp_str.replace("Z", ""))
-                msg_date = timestamp.date()
-
-                if stats["date_from"] is None or msg_date < stats["date_from"]:
-                    stats["date_from"] = msg_date
-                if stats["date_to"] is None or msg_date > stats["date_to"]:
-                    stats["date_to"] = msg_date
-            except (ValueError, AttributeError):
-                pass
-
-        stats["agents"] = list(stats["agents"])
+        with self._lock:
+            self._index.refresh(self.on_progress)
+            stats["total_messages"] = len(self._index)
+            stats["date_from"], stats["date_to"] = self._index.date_range()
+            stats["agents"] = list(self._index.by_role)
 
         return stats
 
+    def save_index(self) -> None:
+        """Persist the index now (e.g. on shutdown)."""
+        with self._lock:
+            self._index.save()
+
     def clear_cache(self) -> None:
         """Clear the search result cache."""
         self._cache.clear()
@@ -2,11 +2,13 @@
 # === AI SIGNATURE ===
 # Created by: Claude (opus-4.5)
 # Created at: 2026-01-30 12:45:00 UTC
+# Modified by: Claude (opus-4)
+# Modified at: 2026-02-06 02:00:00 UTC
 # Purpose: Eye of God Training Module - Learn from market patterns
-# Version: 1.0
+# Version: 1.1
 # === END SIGNATURE ===
 """
-Eye of God Training Module v1.0
+Eye of God Training Module v1.1
 
 ═══════════════════════════════════════════════════════════════════════════════
 ИСТОЧНИКИ ОБУЧЕНИЯ:
@@ -36,6 +38,15 @@ python scripts/eye_trainer.py --train
 
 # Показать статистику
 python scripts/eye_trainer.py --stats
+
+═══════════════════════════════════════════════════════════════════════════════
+SIMILAR TRADES (v1.1):
+═══════════════════════════════════════════════════════════════════════════════
+analyze_signal() не перечитывает trade_outcomes.jsonl: OutcomeStore держит
+последние OUTCOME_STORE_CAPACITY outcomes в NumPy-колонках и дочитывает файл
+с последнего offset (record_trade / следующий сигнал). Поиск похожих сделок
+идёт по сетке (delta_pct, buys_per_sec): внутренние ячейки отдают готовые
+агрегаты (count/wins/pnl), граничные проверяются векторно.
 """
 
 import asyncio
@@ -47,6 +58,13 @@ from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 import random
+import math
+import os
+import time
+from collections import deque
+from itertools import chain
+
+import numpy as np
 
 try:
     import httpx
@@ -69,6 +87,12 @@ STATE_DIR.mkdir(parents=True, exist_ok=True)
 MODEL_DIR = Path("state/ai/models")
 MODEL_DIR.mkdir(parents=True, exist_ok=True)
 
+# Similar-trade lookup
+SIMILAR_TOLERANCE = 0.3           # Relative diff for delta_pct / buys_per_sec
+OUTCOME_STORE_CAPACITY = 1000     # Same window as DataCollector.get_outcomes()
+GRID_DELTA_STEP = 0.5             # delta_pct per grid cell
+GRID_BUYS_STEP = 5.0              # buys_per_sec per grid cell
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 # DATA CLASSES
@@ -274,6 +298,206 @@ class DataCollector:
         }
 
 
+# ══════════════════════════════════════════════════════════════════════════════
+# OUTCOME STORE - In-memory outcomes + grid index for similar trades
+# ══════════════════════════════════════════════════════════════════════════════
+
+class _GridCell:
+    """Outcomes in one (delta_pct, buys_per_sec) cell, oldest first."""
+    __slots__ = ("seqs", "wins", "pnl")
+
+    def __init__(self):
+        self.seqs: deque = deque()
+        self.wins = 0
+        self.pnl = 0.0
+
+
+class OutcomeStore:
+    """
+    Последние `capacity` outcomes в NumPy-колонках (ring buffer) + сеточный индекс.
+
+    Файл outcomes дочитывается с последнего offset (sync), так что записи
+    других процессов тоже попадают в индекс. Вытеснение FIFO: самая старая
+    запись всегда первая в своей ячейке.
+    """
+
+    FEATURES = ("delta_pct", "buys_per_sec", "vol_raise_pct", "btc_change", "pnl_pct")
+
+    def __init__(
+        self,
+        outcomes_file: Path,
+        capacity: int = OUTCOME_STORE_CAPACITY,
+        delta_step: float = GRID_DELTA_STEP,
+        buys_step: float = GRID_BUYS_STEP,
+    ):
+        self.outcomes_file = Path(outcomes_file)
+        self.capacity = capacity
+        self.delta_step = delta_step
+        self.buys_step = buys_step
+
+        self._offset = 0
+        self._stamp: Optional[Tuple[int, int]] = None
+        self.stats = {"loaded": 0, "skipped": 0, "queries": 0, "last_query_us": 0.0}
+        self._reset()
+
+    def _reset(self) -> None:
+        self.columns = {name: np.zeros(self.capacity) for name in self.FEATURES}
+        self.is_win = np.zeros(self.capacity, dtype=bool)
+        self.total = 0  # Records ever added; next record's sequence number
+        self._cells: Dict[Tuple[int, int], _GridCell] = {}
+
+    def __len__(self) -> int:
+        return min(self.total, self.capacity)
+
+    def _cell_key(self, delta: float, buys: float) -> Tuple[int, int]:
+        return math.floor(delta / self.delta_step), math.floor(buys / self.buys_step)
+
+    # === Updates ===
+
+    def add(self, outcome: TradeOutcome) -> bool:
+        """Добавить outcome; False если признаки не числовые."""
+        try:
+            values = [float(getattr(outcome, name)) for name in self.FEATURES]
+        except (TypeError, ValueError):
+            return False
+        if not all(math.isfinite(v) for v in values):
+            return False
+
+        slot = self.total % self.capacity
+        if self.total >= self.capacity:
+            self._evict(slot)
+
+        for name, value in zip(self.FEATURES, values):
+            self.columns[name][slot] = value
+        self.is_win[slot] = bool(outcome.is_win)
+
+        key = self._cell_key(values[0], values[1])
+        cell = self._cells.get(key)
+        if cell is None:
+            cell = self._cells[key] = _GridCell()
+        cell.seqs.append(self.total)
+        cell.wins += self.is_win[slot]
+        cell.pnl += values[4]
+
+        self.total += 1
+        return True
+
+    def _evict(self, slot: int) -> None:
+        key = self._cell_key(self.columns["delta_pct"][slot], self.columns["buys_per_sec"][slot])
+        cell = self._cells[key]
+        cell.seqs.popleft()
+        if not cell.seqs:
+            del self._cells[key]
+            return
+        cell.wins -= self.is_win[slot]
+        cell.pnl -= self.columns["pnl_pct"][slot]
+
+    def sync(self) -> int:
+        """Дочитать новые строки outcomes файла. Returns: число добавленных записей."""
+        try:
+            st = os.stat(self.outcomes_file)
+        except OSError:
+            return 0
+        stamp = (st.st_size, st.st_mtime_ns)
+        if stamp == self._stamp:
+            return 0
+
+        if st.st_size < self._offset:
+            log.info("Outcomes file shrank, rebuilding similarity index")
+            self._offset = 0
+            self._reset()
+
+        with open(self.outcomes_file, "rb") as f:
+            f.seek(self._offset)
+            data = f.read()
+        self._stamp = stamp
+
+        end = data.rfind(b"\n")
+        if end < 0:
+            return 0
+        self._offset += end + 1
+
+        added = 0
+        for line in data[:end + 1].splitlines():
+            try:
+                outcome = TradeOutcome(**json.loads(line.strip()))
+            except Exception:
+                self.stats["skipped"] += line.strip() != b""
+                continue
+            if self.add(outcome):
+                added += 1
+            else:
+                self.stats["skipped"] += 1
+        self.stats["loaded"] += added
+        return added
+
+    # === Queries ===
+
+    def similar(self, delta: float, buys: float, tolerance: float = SIMILAR_TOLERANCE) -> Dict:
+        """
+        Похожие сделки: |delta_pct - delta| / max(delta, 1) < tolerance и то же
+        для buys_per_sec (как в прежнем линейном поиске).
+        """
+        started = time.perf_counter()
+        scale_d = max(delta, 1)
+        scale_b = max(buys, 1)
+        lo_i, lo_j = self._cell_key(delta - tolerance * scale_d, buys - tolerance * scale_b)
+        hi_i, hi_j = self._cell_key(delta + tolerance * scale_d, buys + tolerance * scale_b)
+
+        count = 0
+        wins = 0
+        pnl = 0.0
+        boundary = []
+
+        def visit(key, cell):
+            nonlocal count, wins, pnl
+            i, j = key
+            if lo_i < i < hi_i and lo_j < j < hi_j:
+                # Whole cell lies strictly inside the query box
+                count += len(cell.seqs)
+                wins += cell.wins
+                pnl += cell.pnl
+            else:
+                boundary.append(cell.seqs)
+
+        n_cells = (hi_i - lo_i + 1) * (hi_j - lo_j + 1)
+        if n_cells <= len(self._cells):
+            for i in range(lo_i, hi_i + 1):
+                for j in range(lo_j, hi_j + 1):
+                    cell = self._cells.get((i, j))
+                    if cell is not None:
+                        visit((i, j), cell)
+        else:
+            for key, cell in self._cells.items():
+                if lo_i <= key[0] <= hi_i and lo_j <= key[1] <= hi_j:
+                    visit(key, cell)
+
+        if boundary:
+            seqs = np.fromiter(chain.from_iterable(boundary), dtype=np.int64)
+            slots = seqs % self.capacity
+            mask = (
+                (np.abs(self.columns["delta_pct"][slots] - delta) / scale_d < tolerance)
+                & (np.abs(self.columns["buys_per_sec"][slots] - buys) / scale_b < tolerance)
+            )
+            count += int(mask.sum())
+            wins += int(self.is_win[slots][mask].sum())
+            pnl += float(self.columns["pnl_pct"][slots][mask].sum())
+
+        self.stats["queries"] += 1
+        self.stats["last_query_us"] = round((time.perf_counter() - started) * 1e6, 1)
+
+        if not count:
+            return {"count": 0, "win_rate": 0.5}
+        return {
+            "count": count,
+            "win_rate": int(wins) / count,
+            "avg_pnl": float(pnl) / count,
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"records": len(self), "cells": len(self._cells), **self.stats}
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # PATTERN DETECTOR
 # ══════════════════════════════════════════════════════════════════════════════
@@ -487,6 +711,7 @@ class EyeOfGodTrainer:
         self.collector = DataCollector()
         self.pattern_detector = PatternDetector()
         self.threshold_learner = ThresholdLearner()
+        self.outcome_store = OutcomeStore(self.collector.outcomes_file)
         
     def record_trade(self, trade_data: Dict[str, Any]):
         """
@@ -514,6 +739,7 @@ class EyeOfGodTrainer:
         """
         outcome = TradeOutcome(**trade_data)
         self.collector.record_outcome(outcome)
+        self.outcome_store.sync()
         
     def analyze_signal(self, signal_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -535,9 +761,8 @@ class EyeOfGodTrainer:
         patterns = self.pattern_detector.detect(signal_data)
         pattern_score = self.pattern_detector.get_pattern_score(patterns)
         
-        # Find similar historical trades
-        outcomes = self.collector.get_outcomes()
-        similar = self._find_similar(signal_data, outcomes)
+        # Find similar historical trades (in-memory index, tails outcomes file)
+        similar = self._find_similar(signal_data)
         
         # Get thresholds
         thresholds = self.threshold_learner.get_thresholds()
@@ -565,28 +790,14 @@ class EyeOfGodTrainer:
             "recommendation": "BUY" if passes_thresholds and pattern_score > 0.5 else "SKIP",
         }
         
-    def _find_similar(self, signal: Dict, outcomes: List[TradeOutcome], tolerance: float = 0.3) -> Dict:
+    def _find_similar(self, signal: Dict, tolerance: float = SIMILAR_TOLERANCE) -> Dict:
         """Найти похожие исторические сделки."""
-        delta = signal.get("delta_pct", 0)
-        buys = signal.get("buys_per_sec", 0)
-        
-        similar = []
-        for o in outcomes:
-            delta_diff = abs(o.delta_pct - delta) / max(delta, 1)
-            buys_diff = abs(o.buys_per_sec - buys) / max(buys, 1)
-            
-            if delta_diff < tolerance and buys_diff < tolerance:
-                similar.append(o)
-                
-        if not similar:
-            return {"count": 0, "win_rate": 0.5}
-            
-        wins = sum(1 for o in similar if o.is_win)
-        return {
-            "count": len(similar),
-            "win_rate": wins / len(similar),
-            "avg_pnl": sum(o.pnl_pct for o in similar) / len(similar),
-        }
+        self.outcome_store.sync()
+        return self.outcome_store.similar(
+            signal.get("delta_pct", 0),
+            signal.get("buys_per_sec", 0),
+            tolerance,
+        )
         
     def train(self) -> Dict[str, Any]:
         """
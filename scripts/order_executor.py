@@ -309,6 +309,24 @@ class BinanceClient:
             return 0.0
         return float(resp.get("price", 0))
 
+    def get_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """
+        Get current prices for several symbols in one request.
+
+        One invalid symbol makes Binance reject the whole batch; callers fall
+        back to get_price() for symbols missing from the result.
+        """
+        if not symbols:
+            return {}
+        resp = self._request(
+            "GET", "/api/v3/ticker/price",
+            {"symbols": json.dumps(sorted(set(symbols)), separators=(",", ":"))},
+            signed=False,
+        )
+        if not isinstance(resp, list):
+            return {}
+        return {t["symbol"]: float(t["price"]) for t in resp if float(t.get("price", 0)) > 0}
+
     def get_step_size(self, symbol: str) -> float:
         """Get LOT_SIZE step size for symbol (for quantity rounding)."""
         info = self.get_symbol_info(symbol)
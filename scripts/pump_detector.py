@@ -3,7 +3,7 @@
 # Created by: Claude (opus-4)
 # Created at: 2026-01-30 15:45:00 UTC
 # Modified by: Claude (opus-4.5)
-# Modified at: 2026-01-30 21:40:00 UTC
+# Modified at: 2026-02-05 16:00:00 UTC
 # Purpose: Real-time pump detection + HOPE v4.0 Trading Engine (full cycle)
 # Changes: Integrated Trading Engine v4.0 (Signal→Gate→TP/SL→Binance→Log→Learn)
 # === END SIGNATURE ===
@@ -169,6 +169,95 @@ AUTOTRADER_URL = "http://127.0.0.1:8200"
 SIGNALS_DIR.mkdir(parents=True, exist_ok=True)
 
 
+class RollingWindow:
+    """
+    Trade count and notional sum over the last window_sec, in 1-second buckets.
+
+    Running totals are updated on add and when buckets leave the window,
+    so per-trade cost is constant (at most window_sec buckets cleared).
+    """
+
+    __slots__ = ("window_sec", "counts", "sums", "head", "count", "total")
+
+    def __init__(self, window_sec: int = 60):
+        self.window_sec = window_sec
+        self.counts = [0] * window_sec
+        self.sums = [0.0] * window_sec
+        self.head: Optional[int] = None  # Newest bucket (epoch second)
+        self.count = 0
+        self.total = 0.0
+
+    def advance(self, second: int) -> None:
+        """Move window end to second, expiring older buckets."""
+        if self.head is None or second <= self.head:
+            if self.head is None:
+                self.head = second
+            return
+        if second - self.head >= self.window_sec:
+            self.counts = [0] * self.window_sec
+            self.sums = [0.0] * self.window_sec
+            self.count = 0
+            self.total = 0.0
+        else:
+            for s in range(self.head + 1, second + 1):
+                i = s % self.window_sec
+                self.count -= self.counts[i]
+                self.total -= self.sums[i]
+                self.counts[i] = 0
+                self.sums[i] = 0.0
+            if self.count == 0:
+                self.total = 0.0  # Drop float drift
+        self.head = second
+
+    def add(self, timestamp: float, value: float) -> None:
+        second = int(timestamp)
+        self.advance(second)
+        if second <= self.head - self.window_sec:
+            return  # Late trade, already outside the window
+        i = second % self.window_sec
+        self.counts[i] += 1
+        self.sums[i] += value
+        self.count += 1
+        self.total += value
+
+
+class PriceSnapshots:
+    """
+    Last trade price per bucket_sec bucket over horizon_sec (forward-filled).
+
+    price_ago(60) is the close of the bucket one minute back, or 0 until
+    that much history exists.
+    """
+
+    __slots__ = ("bucket_sec", "closes", "head")
+
+    def __init__(self, horizon_sec: int = 300, bucket_sec: int = 10):
+        self.bucket_sec = bucket_sec
+        self.closes: deque = deque(maxlen=horizon_sec // bucket_sec + 1)
+        self.head: Optional[int] = None
+
+    def update(self, timestamp: float, price: float) -> None:
+        bucket = int(timestamp // self.bucket_sec)
+        if self.head is None:
+            self.closes.append(price)
+            self.head = bucket
+        elif bucket == self.head:
+            self.closes[-1] = price
+        elif bucket > self.head:
+            last = self.closes[-1]
+            for _ in range(min(bucket - self.head, self.closes.maxlen) - 1):
+                self.closes.append(last)  # No trades in between: price unchanged
+            self.closes.append(price)
+            self.head = bucket
+        # Late trade for a closed bucket: keep its close
+
+    def price_ago(self, seconds: int) -> float:
+        n = seconds // self.bucket_sec
+        if n >= len(self.closes):
+            return 0
+        return self.closes[-1 - n]
+
+
 @dataclass
 class SymbolState:
     """Real-time state for a symbol."""
@@ -177,9 +266,10 @@ class SymbolState:
     price_1m_ago: float = 0
     price_5m_ago: float = 0
 
-    # Volume tracking (last 60 seconds)
-    buy_trades: deque = field(default_factory=lambda: deque(maxlen=1000))
-    sell_trades: deque = field(default_factory=lambda: deque(maxlen=1000))
+    # Volume tracking (last 60 seconds, by trade time)
+    buy_window: RollingWindow = field(default_factory=lambda: RollingWindow(60))
+    sell_window: RollingWindow = field(default_factory=lambda: RollingWindow(60))
+    price_snapshots: PriceSnapshots = field(default_factory=PriceSnapshots)
 
     # Rolling metrics
     buys_per_sec: float = 0
@@ -203,41 +293,28 @@ class SymbolState:
     cooldown_sec: float = 30  # Min time between signals
 
     def update_price(self, price: float, is_buy: bool, quantity: float, timestamp: float):
-        """Update state with new trade."""
+        """Update state with new trade (constant time)."""
         self.price = price
 
-        # Record trade
-        trade = (timestamp, quantity, price)
+        # Record trade; both windows end at the same second
+        second = int(timestamp)
+        self.buy_window.advance(second)
+        self.sell_window.advance(second)
         if is_buy:
-            self.buy_trades.append(trade)
+            self.buy_window.add(timestamp, quantity * price)
         else:
-            self.sell_trades.append(trade)
-
-        # Calculate rolling metrics
-        now = time.time()
-        cutoff_1m = now - 60
-        cutoff_5m = now - 300
-
-        # Buys in last minute
-        recent_buys = [(t, q, p) for t, q, p in self.buy_trades if t > cutoff_1m]
-        recent_sells = [(t, q, p) for t, q, p in self.sell_trades if t > cutoff_1m]
-
-        if recent_buys:
-            self.buy_volume_1m = sum(q * p for _, q, p in recent_buys)
-            self.buys_per_sec = len(recent_buys) / 60
-
-        if recent_sells:
-            self.sell_volume_1m = sum(q * p for _, q, p in recent_sells)
-            self.sells_per_sec = len(recent_sells) / 60
-
-        # Update historical prices (every 10 seconds)
-        if not hasattr(self, '_last_price_update'):
-            self._last_price_update = 0
-
-        if now - self._last_price_update > 10:
-            self.price_5m_ago = self.price_1m_ago
-            self.price_1m_ago = self.price
-            self._last_price_update = now
+            self.sell_window.add(timestamp, quantity * price)
+
+        # Rolling metrics (last minute)
+        self.buy_volume_1m = self.buy_window.total
+        self.buys_per_sec = self.buy_window.count / 60
+        self.sell_volume_1m = self.sell_window.total
+        self.sells_per_sec = self.sell_window.count / 60
+
+        # Historical prices from 10-second snapshots
+        self.price_snapshots.update(timestamp, price)
+        self.price_1m_ago = self.price_snapshots.price_ago(60)
+        self.price_5m_ago = self.price_snapshots.price_ago(300)
 
         # Calculate deltas
         if self.price_1m_ago > 0:
@@ -10,6 +10,7 @@ AI-Gateway Tests: Verify contracts, status manager, and JSONL writer.
 
 import json
 import tempfile
+import time
 from datetime import datetime
 from pathlib import Path
 
@@ -349,5 +350,221 @@ class TestAIReader:
             assert insights.position_size_multiplier == 1.0
 
 
+class TestTradeAggregator:
+    """Test rolling-window trade statistics."""
+
+    def test_running_sums_match_window_scan(self):
+        """Running sums equal a full scan of the window after eviction."""
+        import random
+        import time
+        from unittest.mock import patch
+        from ai_gateway.feeds.trade_aggregator import TradeAggregator
+
+        rng = random.Random(3)
+        agg = TradeAggregator(window_size=10)
+        now = 1_700_000_000.0
+        trades = []
+        for i in range(2000):
+            ts = now + i * 0.05
+            price, qty, maker = rng.uniform(90, 110), rng.uniform(0.1, 2.0), rng.random() < 0.4
+            trades.append((ts, price * qty, not maker))
+            agg.add_trade_raw("btcusdt", price, qty, maker, timestamp=ts, trade_id=i)
+
+            if i % 97 == 0:
+                with patch.object(time, "time", return_value=ts):
+                    stats = agg.get_stats("BTCUSDT")
+                live = [t for t in trades if t[0] >= ts - 10]
+                assert stats.total_trades == len(live)
+                assert stats.buy_count == sum(1 for t in live if t[2])
+                assert stats.buy_volume == pytest.approx(sum(t[1] for t in live if t[2]))
+                assert stats.sell_volume == pytest.approx(sum(t[1] for t in live if not t[2]))
+
+    def test_window_expiry_and_capacity(self):
+        """Old trades leave the window; a full ring drops its oldest trade."""
+        import time
+        from unittest.mock import patch
+        from ai_gateway.feeds.trade_aggregator import TradeAggregator, TradeEvent, _TradeRing
+
+        agg = TradeAggregator(window_size=60)
+        agg.add_trade(TradeEvent("ETHUSDT", 100.0, 1.0, False, 1000.0, 1))
+        agg.add_trade(TradeEvent("ETHUSDT", 100.0, 2.0, True, 1030.0, 2))
+
+        with patch.object(time, "time", return_value=1050.0):
+            assert agg.get_stats("ETHUSDT").buy_count == 1
+            assert agg.get_sells_per_sec("ETHUSDT") == pytest.approx(1 / 60)
+        with patch.object(time, "time", return_value=1070.0):
+            stats = agg.get_stats("ETHUSDT")
+            assert stats.buy_count == 0
+            assert stats.sell_volume == pytest.approx(200.0)
+        with patch.object(time, "time", return_value=2000.0):
+            assert agg.get_stats("ETHUSDT").total_trades == 0
+            assert agg.get_buys_per_sec("UNKNOWN") == 0.0
+
+        ring = _TradeRing(capacity=3)
+        for i in range(5):
+            ring.append(float(i), 10.0 * (i + 1), True)
+        assert len(ring) == 3
+        assert ring.buy_count == 3
+        assert ring.buy_volume == pytest.approx(30.0 + 40.0 + 50.0)
+
+    def test_ring_grows_on_demand(self):
+        """Storage starts small and grows (across wrap-around) up to capacity."""
+        from ai_gateway.feeds.trade_aggregator import INITIAL_RING_SIZE, _TradeRing
+
+        ring = _TradeRing(capacity=INITIAL_RING_SIZE * 3)
+        assert ring.allocated == INITIAL_RING_SIZE
+        live = []
+        for i in range(INITIAL_RING_SIZE * 5):
+            ring.append(float(i), float(i), i % 2 == 0)
+            live.append(i)
+            if i % 10 == 9:
+                ring.evict_before(float(i - 20))  # wrap the head before growing
+                live = [t for t in live if t >= i - 20]
+        assert ring.allocated == INITIAL_RING_SIZE  # evictions kept it small
+        for i in range(INITIAL_RING_SIZE * 5, INITIAL_RING_SIZE * 9):
+            ring.append(float(i), float(i), i % 2 == 0)
+            live = (live + [i])[-ring.capacity:]
+        assert ring.allocated == ring.capacity
+        stored = [ring.timestamps[(ring.head + k) % ring.allocated] for k in range(len(ring))]
+        assert stored == [float(t) for t in live]
+        assert ring.buy_count == sum(1 for t in live if t % 2 == 0)
+        assert ring.sell_volume == pytest.approx(sum(t for t in live if t % 2))
+
+    def test_on_stats_rate_limited(self):
+        """on_stats fires at most once per second per symbol."""
+        import time
+        from unittest.mock import patch
+        from ai_gateway.feeds.trade_aggregator import TradeAggregator
+
+        calls = []
+        agg = TradeAggregator(window_size=60, on_stats=calls.append)
+        agg.add_trade_raw("BTCUSDT", 100.0, 1.0, False, timestamp=1000.0)
+        agg.add_trade_raw("ETHUSDT", 100.0, 1.0, False, timestamp=1000.0)
+        for now in (1000.0, 1000.3, 1000.9, 1001.0, 1001.5):
+            with patch.object(time, "time", return_value=now):
+                agg.get_stats("BTCUSDT")
+                agg.get_stats("ETHUSDT")
+        assert [c.symbol for c in calls] == ["BTCUSDT", "ETHUSDT", "BTCUSDT", "ETHUSDT"]
+
+
+class TestEventBusPersistence:
+    """Test group-committed EventBus persistence."""
+
+    def test_batched_events_replay_and_durable_trades(self):
+        """Test events are batched, replayable and trade events are fsynced on publish."""
+        from ai_gateway.core.event_bus import EventBus, EventType
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bus = EventBus(state_dir=Path(tmpdir), batch_size=64, max_delay_ms=50)
+            try:
+                for i in range(200):
+                    bus.publish(EventType.PRICE, {"symbol": "BTCUSDT", "price": 100.0 + i})
+
+                # Durable type is on disk as soon as publish returns
+                trade = bus.publish(EventType.TRADE, {"symbol": "BTCUSDT", "side": "BUY"})
+                lines = bus._get_log_path(EventType.TRADE, trade.timestamp).read_text(encoding="utf-8").splitlines()
+                assert json.loads(lines[-1])["id"] == trade.id
+
+                # Replay flushes the queue first
+                replayed = bus.replay(EventType.PRICE, limit=1000)
+                assert [e.payload["price"] for e in replayed] == [100.0 + i for i in range(200)]
+
+                stats = bus.get_stats()["persistence"]
+                assert stats["lines_written"] == 201 + 2  # events + one index entry per log
+                assert stats["batches"] < 201
+                assert stats["queue_depth"] == 0
+                assert stats["durable_failures"] == 0
+            finally:
+                bus.close()
+
+    def test_indexed_replay_seeks_to_window(self):
+        """Test replay enters the daily log via the sparse index and honours the window."""
+        from ai_gateway.core.event_bus import EventBus, EventType
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bus = EventBus(state_dir=Path(tmpdir), index_interval=10)
+            try:
+                events = [bus.publish(EventType.SIGNAL, {"i": i}) for i in range(100)]
+                bus.flush()
+                log_path = bus._get_log_path(EventType.SIGNAL, events[0].timestamp)
+                assert log_path.with_suffix(".idx").exists()
+
+                from_ts, to_ts = events[55].timestamp, events[80].timestamp
+                assert bus._index_offset(log_path, from_ts) > 0
+
+                replayed = list(bus.iter_replay(EventType.SIGNAL, from_ts=from_ts, to_ts=to_ts))
+                assert [e.payload["i"] for e in replayed] == list(range(55, 81))
+
+                # A corrupt index falls back to a full scan
+                log_path.with_suffix(".idx").write_text(f"{events[50].timestamp}\t7\n", encoding="utf-8")
+                assert bus._index_offset(log_path, from_ts) == 0
+                assert len(bus.replay(EventType.SIGNAL, from_ts=from_ts, limit=10)) == 10
+            finally:
+                bus.close()
+
+    def test_durable_wait_does_not_hold_bus_lock(self):
+        """Test concurrent durable publishes wait for fsync outside the lock and share a batch."""
+        import threading
+
+        from ai_gateway.core.event_bus import EventBus, EventType
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bus = EventBus(state_dir=Path(tmpdir))
+            try:
+                real_wait = bus._writer.wait
+                release = threading.Event()
+                waiting = []
+
+                def slow_wait(ticket, path=None):
+                    waiting.append(ticket)
+                    release.wait(5)
+                    return real_wait(ticket, path)
+
+                bus._writer.wait = slow_wait
+                threads = [
+                    threading.Thread(target=bus.publish, args=(EventType.TRADE, {"n": i}))
+                    for i in range(4)
+                ]
+                for t in threads:
+                    t.start()
+                deadline = time.time() + 5
+                while len(waiting) < 4 and time.time() < deadline:
+                    time.sleep(0.01)
+                assert len(waiting) == 4  # all four queued while the others wait
+
+                # The bus lock is free while durable publishes wait
+                bus.publish(EventType.PRICE, {"price": 1.0})
+                release.set()
+                for t in threads:
+                    t.join(5)
+
+                stats = bus.get_stats()["persistence"]
+                assert stats["durable_failures"] == 0
+                assert stats["batches"] < 5
+                assert len(bus.replay(EventType.TRADE)) == 4
+            finally:
+                bus.close()
+
+    def test_index_offsets_resume_at_existing_log_size(self):
+        """Test a new bus indexes an existing daily log from its on-disk size."""
+        from ai_gateway.core.event_bus import EventBus, EventType
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            first = EventBus(state_dir=Path(tmpdir), index_interval=1)
+            events = [first.publish(EventType.SIGNAL, {"i": i}) for i in range(3)]
+            first.close()
+
+            bus = EventBus(state_dir=Path(tmpdir), index_interval=1)
+            try:
+                events += [bus.publish(EventType.SIGNAL, {"i": i}) for i in range(3, 6)]
+                bus.flush()
+                log_path = bus._get_log_path(EventType.SIGNAL, events[0].timestamp)
+                replayed = bus.replay(EventType.SIGNAL, from_ts=events[4].timestamp)
+                assert bus._index_offset(log_path, events[4].timestamp) > 0
+                assert [e.payload["i"] for e in replayed] == [4, 5]
+            finally:
+                bus.close()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
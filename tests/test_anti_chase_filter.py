@@ -0,0 +1,82 @@
+# === AI SIGNATURE ===
+# Created by: Claude (opus-4)
+# Created at (UTC): 2026-02-05T14:00:00Z
+# Purpose: Tests for AntiChaseFilter price window (bisect lookup, eviction, batch analyze)
+# === END SIGNATURE ===
+"""Tests for core.anti_chase_filter.AntiChaseFilter."""
+
+import pytest
+
+import core.anti_chase_filter as acf_module
+from core.anti_chase_filter import AntiChaseFilter, PriceSeries
+
+
+class _Clock:
+    def __init__(self, now: float):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock(1_000_000.0)
+    monkeypatch.setattr(acf_module.time, "time", clock.time)
+    return clock
+
+
+def test_price_series_nearest_and_eviction():
+    series = PriceSeries()
+    for i in range(100):
+        series.append(float(i * 10), float(i))
+
+    assert series.nearest(254.0) == (25.0, 4.0)
+    assert series.nearest(255.0) == (25.0, 5.0)  # tie -> earlier point
+    assert series.nearest(-50.0) == (0.0, 50.0)
+
+    series.evict_before(600.0)
+    assert len(series) == 39
+    assert series.timestamps[series.head] == 610.0
+    assert series.nearest(0.0) == (61.0, 610.0)
+
+    # Clock going backwards keeps the window sorted
+    series.append(500.0, 1.0)
+    assert series.timestamps[-1] == 990.0
+
+
+def test_analyze_uses_nearest_historical_price(tmp_path, clock):
+    acf = AntiChaseFilter(state_file=tmp_path / "state.json")
+    for _ in range(21):
+        acf.record_price("BTCUSDT", 100.0)
+        clock.now += 30
+
+    # 10-minute lookback: only the last 20 samples are kept
+    assert len(acf.price_history["BTCUSDT"]) == 20
+
+    analysis = acf.analyze("BTCUSDT", 102.0)
+    assert analysis.price_3min_ago == 100.0
+    assert analysis.move_3min_pct == 2.0
+    assert not analysis.should_enter
+    assert acf.get_stats()["blocked_by_3min"] == 1
+
+
+def test_analyze_many_matches_single_analyze(tmp_path, clock):
+    acf = AntiChaseFilter(state_file=tmp_path / "state.json")
+    single = AntiChaseFilter(state_file=tmp_path / "state2.json")
+    symbols = ["BTCUSDT", "ETHUSDT", "PEPEUSDT"]
+    for step in range(12):
+        for i, symbol in enumerate(symbols):
+            price = 100.0 + step * (i + 1) * 0.1
+            acf.record_price(symbol, price)
+            single.record_price(symbol, price)
+        clock.now += 30
+
+    prices = [101.0, 104.0, 103.0]
+    batch = acf.analyze_many(symbols, prices)
+    expected = [single.analyze(s, p) for s, p in zip(symbols, prices)]
+    assert batch == expected
+    assert acf.get_stats()["signals_checked"] == 3
+
+    with pytest.raises(ValueError):
+        acf.analyze_many(symbols, prices[:2])
@@ -0,0 +1,119 @@
+# === AI SIGNATURE ===
+# Created by: Claude (opus-4)
+# Created at (UTC): 2026-02-05T23:00:00Z
+# Purpose: Tests for EventJournal sequence cursors, tail loading and segment rotation
+# === END SIGNATURE ===
+"""Tests for core.event_journal.EventJournal."""
+
+import json
+
+import core.event_journal as ej
+from core.event_contract import create_event
+from core.event_journal import EventJournal
+
+
+def _event(i: int):
+    return create_event("market", f"Event {i}", "test", timestamp_unix=1_700_000_000.0 + i)
+
+
+def _journal(tmp_path, **kwargs) -> EventJournal:
+    return EventJournal(
+        events_path=tmp_path / "events.jsonl",
+        cursors_path=tmp_path / "cursors.json",
+        deadletter_path=tmp_path / "deadletter.jsonl",
+        **kwargs,
+    )
+
+
+def test_cursor_resume_and_restart(tmp_path):
+    journal = _journal(tmp_path)
+    events = [_event(i) for i in range(10)]
+    assert journal.append_batch(events) == 10
+    assert journal.append(events[0]) is False  # duplicate
+
+    pending = journal.get_pending("tg", limit=4)
+    assert [e.event_id for e in pending] == [e.event_id for e in events[:4]]
+    assert journal.ack("tg", pending[-1].event_id)
+    assert [e.title for e in journal.get_pending("tg", limit=3)] == ["Event 4", "Event 5", "Event 6"]
+    assert journal.get_stats().pending_by_consumer == {"tg": 6}
+
+    cursors = json.loads((tmp_path / "cursors.json").read_text())
+    assert cursors["tg"]["seq"] == 3
+
+    reopened = _journal(tmp_path)
+    assert reopened.get_pending("tg", limit=1)[0].title == "Event 4"
+    assert reopened.append(_event(10))
+    assert reopened.get_pending("tg")[-1].title == "Event 10"
+    assert reopened.get_event(events[7].event_id).title == "Event 7"
+
+
+def test_startup_tails_segments_and_lagging_consumer_reads_disk(tmp_path, monkeypatch):
+    monkeypatch.setattr(ej, "MAX_EVENTS_IN_MEMORY", 5)
+    monkeypatch.setattr(ej, "_TRIM_SLACK", 1)
+    journal = _journal(tmp_path, segment_max_bytes=1200, max_segments=100)
+    events = [_event(i) for i in range(30)]
+    journal.append_batch(events[:2])
+    journal.ack("slow", events[1].event_id)
+    journal.append_batch(events[2:])
+
+    assert len(list(tmp_path.glob("events.0*.jsonl"))) >= 2  # rotated
+    assert len(journal._events) <= 6
+
+    reopened = _journal(tmp_path, segment_max_bytes=1200, max_segments=100)
+    assert [e.title for e in reopened._events] == [f"Event {i}" for i in range(25, 30)]
+
+    # Cursor is older than the in-memory window: resumed from its byte offset
+    pending = reopened.get_pending("slow", limit=4)
+    assert [e.title for e in pending] == ["Event 2", "Event 3", "Event 4", "Event 5"]
+    assert reopened.ack("slow", pending[-1].event_id)
+    pending = reopened.get_pending("slow", limit=100)
+    assert pending[0].title == "Event 6"
+    assert pending[-1].title == "Event 29"
+    assert len(pending) == 24
+
+
+def test_legacy_journal_and_cursors_are_migrated(tmp_path):
+    events = [_event(i) for i in range(3)]
+    with open(tmp_path / "events.jsonl", "w", encoding="utf-8") as f:
+        for e in events:
+            f.write(e.to_json() + "\n")
+        f.write("not json\n")
+    (tmp_path / "cursors.json").write_text(json.dumps({"tg": events[0].event_id}))
+
+    journal = _journal(tmp_path)
+    assert [e.title for e in journal.get_pending("tg")] == ["Event 1", "Event 2"]
+    first = (tmp_path / "events.jsonl").read_text().splitlines()[0]
+    assert json.loads(first)["_seq"] == 0
+
+    # Torn tail from an interrupted append is dropped on open
+    with open(tmp_path / "events.jsonl", "a", encoding="utf-8") as f:
+        f.write('{"_seq": 3, "event_id": "tor')
+    journal = _journal(tmp_path)
+    assert journal.append(_event(3))
+    assert [e.title for e in _journal(tmp_path).get_pending("tg")] == ["Event 1", "Event 2", "Event 3"]
+
+
+def test_malformed_first_line_uses_next_seq_as_base(tmp_path):
+    journal = _journal(tmp_path)
+    journal.append_batch([_event(i) for i in range(3)])
+    path = tmp_path / "events.jsonl"
+    lines = path.read_bytes().splitlines(keepends=True)
+    path.write_bytes(b"not json\n" + b"".join(lines[1:]))
+
+    reopened = _journal(tmp_path)
+    assert reopened._active_base == 1
+    assert [e.title for e in reopened.get_pending("tg")] == ["Event 1", "Event 2"]
+    assert reopened.append(_event(3))
+    assert json.loads(path.read_text().splitlines()[-1])["_seq"] == 3
+
+
+def test_unnumbered_lines_after_numbered_ones_are_migrated(tmp_path):
+    journal = _journal(tmp_path)
+    journal.append_batch([_event(i) for i in range(2)])
+    with open(tmp_path / "events.jsonl", "a", encoding="utf-8") as f:
+        f.write(_event(2).to_json() + "\n")  # written by an older process
+
+    reopened = _journal(tmp_path)
+    seqs = [json.loads(l)["_seq"] for l in (tmp_path / "events.jsonl").read_text().splitlines()]
+    assert seqs == [0, 1, 2]
+    assert [e.title for e in reopened.get_pending("tg")] == ["Event 0", "Event 1", "Event 2"]
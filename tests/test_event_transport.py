@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+Event Transport Tests: header filtering, tailing reader and latency stats.
+"""
+
+import sys
+import threading
+
+import pytest
+
+from core.events import transport as transport_mod
+from core.events.event_schema import HopeEvent
+from core.events.transport import EventTransport
+
+
+@pytest.fixture
+def journal_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(transport_mod, "JOURNAL_DIR", tmp_path)
+    return tmp_path
+
+
+def _pair():
+    writer = EventTransport("writer")
+    reader = EventTransport("reader")
+    reader._process_id = writer._process_id + 1  # Simulate another process
+    return writer, reader
+
+
+def test_poll_skips_own_and_filters_types_before_decode(journal_dir):
+    writer, reader = _pair()
+    for event_type in ("HEARTBEAT", "FILL", "HEARTBEAT"):
+        assert writer.publish(HopeEvent(event_type=event_type, payload={}, correlation_id="c"))
+    writer.flush()
+
+    assert writer.poll() == []  # Own events are skipped
+    entries = reader._poll_entries({"FILL"})
+    assert [e.event_type for _, e in entries] == ["FILL"]
+    assert reader.get_stats()["lines_skipped"] == 2
+
+    # A partially written line is left for the next poll
+    with open(transport_mod._get_journal_path(), "ab") as f:
+        f.write(b'{"seq": 9')
+    assert reader.poll() == []
+    writer._writer.close()
+
+
+def test_reader_wakes_on_growth_and_reports_latency(journal_dir):
+    writer, reader = _pair()
+    received = threading.Event()
+    got = []
+
+    def on_fill(event):
+        got.append(event)
+        received.set()
+
+    reader.subscribe("FILL", on_fill)
+    reader.start_reader()
+    try:
+        writer.publish(HopeEvent(event_type="HEARTBEAT", payload={}, correlation_id="c"))
+        writer.publish(HopeEvent(event_type="FILL", payload={"qty": 1}, correlation_id="c"))
+        assert received.wait(2.0)
+
+        stats = reader.get_stats()
+        assert [e.payload for e in got] == [{"qty": 1}]
+        assert stats["deliver_latency_ms"]["samples"] == 1
+        assert stats["deliver_latency_ms"]["p99"] >= 0
+        if sys.platform.startswith("linux"):
+            assert stats["reader_wake"] == "inotify"
+    finally:
+        reader.stop_reader()
+        writer._writer.close()
+        reader._writer.close()
@@ -0,0 +1,92 @@
+# === AI SIGNATURE ===
+# Created by: Claude (opus-4)
+# Created at (UTC): 2026-02-06T02:00:00Z
+# Purpose: Tests for Eye of God OutcomeStore (grid similarity index, eviction, file tail)
+# === END SIGNATURE ===
+"""Tests for scripts.eye_trainer.OutcomeStore."""
+
+import json
+import random
+from dataclasses import asdict
+
+import pytest
+
+from scripts.eye_trainer import OutcomeStore, TradeOutcome
+
+
+def _outcome(delta: float, buys: float, pnl: float) -> TradeOutcome:
+    return TradeOutcome(
+        symbol="PEPEUSDT", entry_time="", exit_time="", entry_price=1.0, exit_price=1.0,
+        pnl_pct=pnl, is_win=pnl > 0, mode="scalp", delta_pct=delta, buys_per_sec=buys,
+        vol_raise_pct=50.0, volume_24h=1e6, btc_change=0.0, hour_utc=12, day_of_week=2,
+        exit_reason="target",
+    )
+
+
+def _linear_similar(outcomes, delta, buys, tolerance=0.3):
+    """Reference: the original per-record scan."""
+    similar = [
+        o for o in outcomes
+        if abs(o.delta_pct - delta) / max(delta, 1) < tolerance
+        and abs(o.buys_per_sec - buys) / max(buys, 1) < tolerance
+    ]
+    if not similar:
+        return {"count": 0, "win_rate": 0.5}
+    wins = sum(1 for o in similar if o.is_win)
+    return {"count": len(similar), "win_rate": wins / len(similar),
+            "avg_pnl": sum(o.pnl_pct for o in similar) / len(similar)}
+
+
+def _write(path, outcomes):
+    with open(path, "a") as f:
+        for o in outcomes:
+            f.write(json.dumps(asdict(o)) + "\n")
+
+
+def test_similar_matches_linear_scan_with_eviction(tmp_path):
+    rng = random.Random(7)
+    outcomes = [
+        _outcome(rng.uniform(-3, 15), rng.uniform(0, 120), rng.uniform(-3, 3))
+        for _ in range(700)
+    ]
+    store = OutcomeStore(tmp_path / "outcomes.jsonl", capacity=500)
+    for o in outcomes:
+        store.add(o)
+    assert len(store) == 500
+
+    window = outcomes[-500:]
+    for delta, buys in [(3.5, 25), (0.2, 0.5), (-2.0, 10), (12.0, 90), (40.0, 500)]:
+        got = store.similar(delta, buys)
+        want = _linear_similar(window, delta, buys)
+        assert got["count"] == want["count"]
+        assert got["win_rate"] == pytest.approx(want["win_rate"])
+        if want["count"]:
+            assert got["avg_pnl"] == pytest.approx(want["avg_pnl"])
+
+    assert store.get_stats()["cells"] <= 500
+    assert not store.add(_outcome(float("nan"), 1.0, 1.0))
+
+
+def test_sync_tails_outcomes_file(tmp_path):
+    path = tmp_path / "outcomes.jsonl"
+    store = OutcomeStore(path)
+    assert store.sync() == 0
+
+    _write(path, [_outcome(3.0, 20.0, 1.0), _outcome(3.1, 21.0, -1.0)])
+    with open(path, "a") as f:
+        f.write("garbage\n")
+    assert store.sync() == 2
+    assert store.sync() == 0
+    assert store.similar(3.0, 20.0) == {"count": 2, "win_rate": 0.5, "avg_pnl": 0.0}
+
+    # Another writer appends; only the new line is read
+    _write(path, [_outcome(3.0, 20.0, 2.0)])
+    assert store.sync() == 1
+    assert store.similar(3.0, 20.0)["count"] == 3
+
+    # Rewritten (shorter) file rebuilds the index
+    path.write_text("")
+    _write(path, [_outcome(8.0, 60.0, 1.0)])
+    store.sync()
+    assert len(store) == 1
+    assert store.similar(3.0, 20.0)["count"] == 0
@@ -352,5 +352,151 @@ class TestDataclasses:
             result.upper = 110.0
 
 
+class TestIndicatorStream:
+    """Tests for incremental IndicatorStream (must match TechnicalIndicators exactly)."""
+
+    @staticmethod
+    def _ohlcv(n: int = 120, seed: int = 7):
+        rng = np.random.default_rng(seed)
+        closes = 100 * np.cumprod(1 + rng.normal(0, 0.01, n))
+        highs = closes * (1 + rng.uniform(0, 0.01, n))
+        lows = closes * (1 - rng.uniform(0, 0.01, n))
+        opens = closes * (1 + rng.normal(0, 0.002, n))
+        volumes = rng.uniform(100, 1000, n)
+        return opens, highs, lows, closes, volumes
+
+    def test_stream_matches_stateless_per_bar(self):
+        """Every bar must produce bit-identical values to a full recompute."""
+        from core.ai.indicator_stream import IndicatorStream
+
+        opens, highs, lows, closes, volumes = self._ohlcv()
+        stream = IndicatorStream(opens, highs, lows, closes, volumes)
+
+        for end in range(40, len(closes) + 1):
+            stream.advance(end)
+            c, h, l = closes[:end], highs[:end], lows[:end]
+            assert stream.rsi() == TechnicalIndicators.rsi(c)
+            assert stream.macd() == TechnicalIndicators.macd(c)
+            assert stream.atr() == TechnicalIndicators.atr(h, l, c)
+            assert stream.ema(20) == TechnicalIndicators.ema(c, 20)
+            assert np.array_equal(
+                stream.atr_series_tail(14, 50),
+                TechnicalIndicators.atr_series(h, l, c, 14)[-50:],
+            )
+            assert np.array_equal(
+                stream.ema_series_tail(20, 50),
+                TechnicalIndicators.ema_series(c, 20)[-50:],
+            )
+
+    def test_stream_raises_like_stateless(self):
+        """Insufficient data raises ValueError, same as TechnicalIndicators."""
+        from core.ai.indicator_stream import IndicatorStream
+
+        stream = IndicatorStream(*self._ohlcv(n=30))
+        stream.advance(10)
+        with pytest.raises(ValueError):
+            stream.rsi()
+        with pytest.raises(ValueError):
+            stream.macd()
+        with pytest.raises(ValueError):
+            stream.advance(5)
+
+    def test_indicators_for_ignores_stale_stream(self):
+        """A stream positioned on another bar falls back to array computation."""
+        from core.ai.indicator_stream import IndicatorStream, ArrayIndicators, indicators_for
+        from core.ai.signal_engine import MarketData
+
+        opens, highs, lows, closes, volumes = self._ohlcv(n=60)
+        stream = IndicatorStream(opens, highs, lows, closes, volumes)
+        stream.advance(60)
+        md = MarketData(
+            symbol="TEST", timestamp=0,
+            opens=opens[:50], highs=highs[:50], lows=lows[:50],
+            closes=closes[:50], volumes=volumes[:50],
+            indicators=stream,
+        )
+
+        assert isinstance(indicators_for(md), ArrayIndicators)
+        stream2 = IndicatorStream(opens, highs, lows, closes, volumes)
+        stream2.advance(50)
+        md2 = MarketData(
+            symbol="TEST", timestamp=0,
+            opens=opens[:50], highs=highs[:50], lows=lows[:50],
+            closes=closes[:50], volumes=volumes[:50],
+            indicators=stream2,
+        )
+        assert indicators_for(md2) is stream2
+
+
+class TestVectorizedSeries:
+    """Tests for the vectorized *_series family (must match scalar methods per prefix)."""
+
+    @pytest.fixture
+    def prices(self):
+        rng = np.random.default_rng(11)
+        closes = 50000 * np.cumprod(1 + rng.normal(0, 0.01, 400))
+        volumes = rng.uniform(10, 1000, 400)
+        return closes, volumes
+
+    def test_sma_series(self, prices):
+        closes, _ = prices
+        series = TechnicalIndicators.sma_series(closes, 20)
+
+        assert len(series) == len(closes) - 19
+        for end in range(20, len(closes) + 1, 17):
+            assert series[end - 20] == pytest.approx(TechnicalIndicators.sma(closes[:end], 20), rel=1e-12)
+
+    def test_rsi_series(self, prices):
+        closes, _ = prices
+        series = TechnicalIndicators.rsi_series(closes)
+
+        assert len(series) == len(closes) - 14
+        for end in range(15, len(closes) + 1, 13):
+            assert series[end - 15] == pytest.approx(TechnicalIndicators.rsi(closes[:end]).value, abs=1e-9)
+
+    def test_rsi_series_no_losses(self):
+        closes = np.array([100 + i for i in range(30)], dtype=float)
+        assert np.all(TechnicalIndicators.rsi_series(closes) == 100.0)
+
+    def test_macd_series(self, prices):
+        closes, _ = prices
+        series = TechnicalIndicators.macd_series(closes)
+        first = 26 + 9 - 2
+
+        assert len(series.macd_line) == len(series.signal_line) == len(closes) - first
+        for end in range(35, len(closes) + 1, 29):
+            scalar = TechnicalIndicators.macd(closes[:end])
+            assert series.macd_line[end - 1 - first] == pytest.approx(scalar.macd_line, abs=1e-6)
+            assert series.signal_line[end - 1 - first] == pytest.approx(scalar.signal_line, abs=1e-6)
+            assert series.histogram[end - 1 - first] == pytest.approx(scalar.histogram, abs=1e-6)
+
+    def test_bollinger_series(self, prices):
+        closes, _ = prices
+        series = TechnicalIndicators.bollinger_series(closes)
+
+        for end in range(20, len(closes) + 1, 19):
+            scalar = TechnicalIndicators.bollinger_bands(closes[:end])
+            assert series.upper[end - 20] == pytest.approx(scalar.upper)
+            assert series.position[end - 20] == pytest.approx(scalar.position)
+            assert bool(series.squeeze[end - 20]) == scalar.squeeze
+
+    def test_volume_spike_series(self, prices):
+        _, volumes = prices
+        ratios = TechnicalIndicators.volume_ratio_series(volumes)
+        spikes = TechnicalIndicators.volume_spike_series(volumes)
+
+        for end in range(20, len(volumes) + 1, 7):
+            profile = TechnicalIndicators.volume_profile(volumes[:end])
+            assert ratios[end - 20] == pytest.approx(profile.current_ratio)
+            assert bool(spikes[end - 20]) == profile.spike
+
+    def test_series_insufficient_data_empty(self):
+        closes = np.array([1.0, 2.0, 3.0])
+        assert len(TechnicalIndicators.rsi_series(closes)) == 0
+        assert len(TechnicalIndicators.macd_series(closes).macd_line) == 0
+        assert len(TechnicalIndicators.bollinger_series(closes).upper) == 0
+        assert len(TechnicalIndicators.sma_series(closes, 5)) == 0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# === AI SIGNATURE ===
+# Created by: Claude (opus-4)
+# Created at: 2026-02-03T10:00:00Z
+# Purpose: Tests for the group-commit JSONL writer
+# === END SIGNATURE ===
+"""
+Group-Commit Writer Tests: batching, durable acks, flush and failures.
+"""
+
+import json
+import threading
+
+import core.io_group_commit as gc_module
+from core.io_group_commit import GroupCommitConfig, GroupCommitWriter
+
+
+def test_concurrent_appends_are_batched_in_order(tmp_path):
+    writer = GroupCommitWriter(GroupCommitConfig(batch_size=128, max_delay_ms=20))
+    path = tmp_path / "events.jsonl"
+
+    def produce(tag):
+        for i in range(250):
+            writer.append(path, json.dumps({"tag": tag, "i": i}))
+
+    threads = [threading.Thread(target=produce, args=(t,)) for t in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert writer.flush(timeout=5.0)
+
+    records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert len(records) == 1000
+    for tag in range(4):
+        assert [r["i"] for r in records if r["tag"] == tag] == list(range(250))
+
+    metrics = writer.get_metrics()
+    assert metrics["lines_written"] == 1000
+    assert metrics["fsyncs"] == metrics["batches"] < 1000
+    assert metrics["queue_depth"] == 0
+    writer.close()
+
+
+def test_durable_append_is_on_disk_when_acked(tmp_path):
+    writer = GroupCommitWriter(GroupCommitConfig(batch_size=1000, max_delay_ms=10_000))
+    path = tmp_path / "orders.jsonl"
+
+    writer.append(path, "queued")
+    assert writer.append(path, "fill", durable=True)
+
+    # Durable ack commits everything queued before it without waiting max_delay
+    assert path.read_text(encoding="utf-8").splitlines() == ["queued", "fill"]
+    writer.close()
+
+
+def test_failed_write_fails_durable_ack(tmp_path):
+    writer = GroupCommitWriter()
+    missing = tmp_path / "no_such_dir" / "events.jsonl"
+
+    assert writer.append(missing, "x", durable=True) is False
+    assert writer.get_metrics()["write_errors"] == 1
+
+    # Writer keeps working for other files
+    assert writer.append(tmp_path / "ok.jsonl", "y", durable=True)
+    writer.close()
+    assert writer.append(tmp_path / "ok.jsonl", "z") is False
+
+
+def test_flush_waits_for_batch_in_flight(tmp_path, monkeypatch):
+    writing = threading.Event()
+    release = threading.Event()
+    real_append = gc_module._append_fsync
+
+    def slow_append(path, data):
+        writing.set()
+        release.wait(5.0)
+        real_append(path, data)
+
+    monkeypatch.setattr(gc_module, "_append_fsync", slow_append)
+    writer = GroupCommitWriter(GroupCommitConfig(max_delay_ms=1))
+    path = tmp_path / "events.jsonl"
+    writer.append(path, "a")
+    assert writing.wait(5.0)
+
+    # Batch already dequeued by the writer but not yet on disk
+    assert writer.get_metrics()["queue_depth"] == 0
+    assert writer.flush(timeout=0.1) is False
+
+    release.set()
+    assert writer.flush(timeout=5.0)
+    assert path.read_text(encoding="utf-8") == "a\n"
+    writer.close()
+
+
+def test_durable_wait_is_bounded_and_surfaces_writer_error(tmp_path, monkeypatch):
+    release = threading.Event()
+    monkeypatch.setattr(gc_module, "_append_fsync", lambda path, data: release.wait(5.0))
+    writer = GroupCommitWriter(GroupCommitConfig(durable_timeout_s=0.1))
+    assert writer.append(tmp_path / "a.jsonl", "x", durable=True) is False
+    release.set()
+    assert writer.flush(timeout=5.0)
+
+    def broken_commit(batch):
+        raise RuntimeError("disk on fire")
+
+    monkeypatch.setattr(writer, "_commit", broken_commit)
+    assert writer.append(tmp_path / "a.jsonl", "y", durable=True) is False
+    assert writer.flush(timeout=1.0)  # nothing new since the failed line committed
+    assert "disk on fire" in writer.get_metrics()["writer_error"]
+    writer.close()
@@ -454,6 +454,149 @@ class TestHttpClientEnforcement(unittest.TestCase):
         self.assertEqual(ctx.exception.reason, AuditReason.REDIRECT_TO_DIFFERENT_HOST)
 
 
+class TestHttpPool(unittest.TestCase):
+    """Tests for the keep-alive connection pool (local server, no network)."""
+
+    @classmethod
+    def setUpClass(cls):
+        import gzip
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                if self.path == "/redirect":
+                    self._reply(302, b"", {"Location": "/data"})
+                elif self.path == "/cross":
+                    port = self.server.server_address[1]
+                    self._reply(302, b"", {"Location": f"http://localhost:{port}/apikey"})
+                elif self.path == "/apikey":
+                    self._reply(200, self.headers.get("X-MBX-APIKEY", "-").encode())
+                elif self.path == "/data":
+                    body = b"x" * 100_000
+                    if "gzip" in self.headers.get("Accept-Encoding", ""):
+                        self._reply(200, gzip.compress(body), {"Content-Encoding": "gzip"})
+                    else:
+                        self._reply(200, body)
+                else:
+                    self._reply(404, b"missing")
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                self._reply(200, b"ok")
+
+            def _reply(self, code, body, headers=None):
+                self.send_response(code)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def _get(self, pool, path, headers=None):
+        from urllib.request import Request
+        from core.net.http_client import _read_body
+
+        with pool.open(Request(self.base + path, headers=headers or {}), timeout=5) as response:
+            return response.status, _read_body(response, 1_000_000), response.url
+
+    def test_connection_reused_and_gzip_decoded(self):
+        """Sequential requests share one connection; gzip bodies are decoded."""
+        from core.net.http_pool import HttpPool
+
+        pool = HttpPool()
+        try:
+            self.assertEqual(self._get(pool, "/data")[1], b"x" * 100_000)
+            status, body, _ = self._get(pool, "/data", {"Accept-Encoding": "gzip"})
+            self.assertEqual((status, body), (200, b"x" * 100_000))
+
+            stats = pool.get_stats()
+            self.assertEqual(stats["requests"], 2)
+            self.assertEqual(stats["pool_misses"], 1)
+            self.assertEqual(stats["pool_hits"], 1)
+            self.assertEqual(stats["gzip_responses"], 1)
+        finally:
+            pool.clear()
+
+    def test_redirect_and_http_error(self):
+        """Same-host redirects are followed; 4xx raises HTTPError with the body."""
+        from urllib.error import HTTPError
+        from core.net.http_pool import HttpPool
+
+        pool = HttpPool()
+        try:
+            status, _, url = self._get(pool, "/redirect")
+            self.assertEqual((status, url), (200, self.base + "/data"))
+
+            with self.assertRaises(HTTPError) as ctx:
+                self._get(pool, "/nope")
+            self.assertEqual(ctx.exception.code, 404)
+            self.assertEqual(ctx.exception.read(), b"missing")
+            self.assertEqual(pool.get_stats()["pool_misses"], 1)
+        finally:
+            pool.clear()
+
+    def test_post_never_reuses_idle_connection(self):
+        """POST cannot be retried, so it skips idle (possibly stale) connections."""
+        from urllib.request import Request
+        from core.net.http_pool import HttpPool
+
+        pool = HttpPool()
+        try:
+            self._get(pool, "/data")
+            with pool.open(Request(self.base + "/order", data=b"q=1", method="POST"), timeout=5) as r:
+                self.assertEqual(r.read(), b"ok")
+            stats = pool.get_stats()
+            self.assertEqual((stats["pool_hits"], stats["pool_misses"]), (0, 2))
+        finally:
+            pool.clear()
+
+    def test_idle_connection_closed_by_server_is_dropped(self):
+        """A reused socket that already saw EOF is replaced before sending."""
+        import socket
+        from core.net.http_pool import HttpPool
+
+        pool = HttpPool()
+        try:
+            self._get(pool, "/data")
+            [(_, conn)] = next(iter(pool._idle.values()))
+            conn.sock.shutdown(socket.SHUT_RD)  # reads now return EOF, like a server close
+            self.assertEqual(self._get(pool, "/data")[0], 200)
+            stats = pool.get_stats()
+            self.assertEqual((stats["stale_dropped"], stats["stale_retries"]), (1, 0))
+        finally:
+            pool.clear()
+
+    def test_cross_host_redirect_drops_api_key(self):
+        """Auth headers are not forwarded to a different redirect host."""
+        from urllib.request import Request
+        from core.net.http_pool import HttpPool
+
+        pool = HttpPool()
+        try:
+            self.assertEqual(self._get(pool, "/cross", {"X-MBX-APIKEY": "secret"})[0], 302)
+            req = Request(self.base + "/cross", headers={"X-MBX-APIKEY": "secret"})
+            with pool.open(req, timeout=5, redirect_allowed=lambda host: True) as response:
+                self.assertEqual(response.read(), b"-")
+            self.assertEqual(self._get(pool, "/apikey", {"X-MBX-APIKEY": "secret"})[1], b"secret")
+        finally:
+            pool.clear()
+
+
 class TestNormalizeHost(unittest.TestCase):
     """Tests for host normalization."""
 
@@ -0,0 +1,119 @@
+# === AI SIGNATURE ===
+# Created by: Claude (opus-4)
+# Created at (UTC): 2026-02-04T10:00:00Z
+# Purpose: Tests for OMNI-CHAT indexed search (incremental index, facets, paging)
+# === END SIGNATURE ===
+"""Tests for omnichat SearchEngine / SearchIndex."""
+
+import json
+import sys
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "omnichat"))
+
+from src.search import SearchEngine, SearchQuery  # noqa: E402
+
+
+def _append(path: Path, role: str, content: str, ts: str) -> None:
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"role": role, "content": content, "timestamp": ts}) + "\n")
+
+
+def test_index_is_incremental_and_persistent(tmp_path):
+    history = tmp_path / "chat_history.jsonl"
+    _append(history, "user", "Deploy failed with ERROR code", "2026-01-10T10:00:00")
+    _append(history, "claude", "The error is in config.yaml", "2026-01-11T09:00:00")
+    with open(history, "a", encoding="utf-8") as f:
+        f.write("not json\n")
+    _append(history, "gpt", "All good", "2026-01-12T08:00:00")
+
+    engine = SearchEngine(history, page_size=1)
+    results = engine.search(SearchQuery(text="err"))
+    assert engine.last_metrics.lines_indexed == 4
+    assert results.total_count == 2
+    assert results.total_pages == 2
+    assert [r.role for r in results.items] == ["claude"]  # newest first
+    assert results.items[0].line_number == 2
+    assert results.items[0].match_positions == [(4, 7)]
+
+    page2 = engine.search(SearchQuery(text="err"), page=2)
+    assert page2.items[0].role == "user"
+    assert engine.last_metrics.cache_hit
+
+    # Only the appended message is indexed; cache invalidated
+    _append(history, "claude", "another error", "2026-01-13T07:00:00")
+    results = engine.search(SearchQuery(text="error", agents=["claude"]))
+    assert engine.last_metrics.lines_indexed == 1
+    assert results.total_count == 2
+    assert results.items[0].line_number == 5
+
+    # Punctuated and case-sensitive queries are verified against the text
+    assert engine.search(SearchQuery(text="config.yaml")).total_count == 1
+    assert engine.search(SearchQuery(text="ERROR", case_sensitive=True)).total_count == 1
+    assert engine.search(SearchQuery(text="err.r", regex_mode=True)).total_count == 3
+    assert engine.search(SearchQuery(text="(", regex_mode=True)).total_count == 0
+
+    # Date facet
+    query = SearchQuery(date_from=date(2026, 1, 11), date_to=date(2026, 1, 12))
+    assert engine.search(query).total_count == 2
+
+    # New engine resumes from the persisted index
+    engine.save_index()
+    engine2 = SearchEngine(history)
+    assert engine2.search(SearchQuery(text="good")).total_count == 1
+    assert engine2.last_metrics.lines_indexed == 0
+    stats = engine2.get_stats()
+    assert stats["total_messages"] == 4
+    assert stats["date_from"] == date(2026, 1, 10)
+    assert sorted(stats["agents"]) == ["claude", "gpt", "user"]
+
+
+def test_rewritten_history_triggers_rebuild(tmp_path):
+    history = tmp_path / "chat_history.jsonl"
+    _append(history, "user", "alpha beta", "2026-01-10T10:00:00")
+    _append(history, "user", "gamma", "2026-01-10T11:00:00")
+    engine = SearchEngine(history)
+    assert engine.search(SearchQuery(text="alpha")).total_count == 1
+
+    history.write_text("")
+    _append(history, "gpt", "delta", "2026-01-12T10:00:00")
+    assert engine.search(SearchQuery(text="alpha")).total_count == 0
+    results = engine.search(SearchQuery(text="delta"))
+    assert results.total_count == 1
+    assert results.items[0].role == "gpt"
+
+
+def test_delta_log_persists_appends_without_snapshot_rewrite(tmp_path):
+    history = tmp_path / "chat_history.jsonl"
+    _append(history, "user", "first message", "2026-01-10T10:00:00")
+    engine = SearchEngine(history)
+    assert engine.search(SearchQuery(text="first")).total_count == 1
+    snapshot = tmp_path / "chat_history.idx.json"
+    snapshot_bytes = snapshot.read_bytes()
+
+    _append(history, "gpt", "second message", "2026-01-11T10:00:00")
+    _append(history, "claude", "third message", "2026-01-12T10:00:00")
+    assert engine.search(SearchQuery(text="message")).total_count == 3
+    assert snapshot.read_bytes() == snapshot_bytes  # only the delta log grew
+    assert (tmp_path / "chat_history.idx.log").stat().st_size > 0
+
+    # Fresh engine = snapshot + replayed log, nothing re-indexed
+    engine2 = SearchEngine(history)
+    assert engine2.search(SearchQuery(text="third")).total_count == 1
+    assert engine2.last_metrics.lines_indexed == 0
+    assert engine2.get_stats()["total_messages"] == 3
+
+
+def test_cache_invalidated_on_rebuild_with_same_count(tmp_path):
+    history = tmp_path / "chat_history.jsonl"
+    _append(history, "user", "apple", "2026-01-10T10:00:00")
+    engine = SearchEngine(history)
+    assert engine.search(SearchQuery(text="apple")).total_count == 1
+
+    # Rewritten with the same number of messages
+    history.write_text("")
+    _append(history, "user", "banana split", "2026-01-10T10:00:00")
+    assert engine.search(SearchQuery(text="apple")).total_count == 0
+    results = engine.search(SearchQuery(text="banana"))
+    assert results.items[0].content == "banana split"
@@ -0,0 +1,100 @@
+# === AI SIGNATURE ===
+# Created by: Claude (opus-4)
+# Created at (UTC): 2026-02-05T22:00:00Z
+# Purpose: Tests for core.outcome_tracker per-symbol sample files and single-pass outcomes
+# === END SIGNATURE ===
+"""Tests for core.outcome_tracker."""
+
+import json
+
+import pytest
+
+import core.outcome_tracker as ot
+
+
+@pytest.fixture
+def state(tmp_path, monkeypatch):
+    monkeypatch.setattr(ot, "TRACKED_SIGNALS_FILE", tmp_path / "tracked_signals.jsonl")
+    monkeypatch.setattr(ot, "PRICE_SAMPLES_FILE", tmp_path / "price_samples.jsonl")
+    monkeypatch.setattr(ot, "PRICE_SAMPLES_DIR", tmp_path / "price_samples")
+    monkeypatch.setattr(ot, "SIGNAL_OUTCOMES_FILE", tmp_path / "signal_outcomes.jsonl")
+    return tmp_path
+
+
+def _samples(symbol, rows):
+    ot._append_samples(symbol, ot.np.array(rows, dtype=ot._SAMPLE_DTYPE))
+
+
+def test_compute_outcomes_groups_by_symbol(state, monkeypatch):
+    t0 = 1_000_000.0
+    monkeypatch.setattr(ot.time, "time", lambda: t0 + 20_000)
+    ot.record_signal({"symbol": "AUSDT", "side": "LONG", "entry_price": 100.0, "ts_utc": t0})
+    ot.record_signal({"symbol": "AUSDT", "side": "SHORT", "entry_price": 100.0, "ts_utc": t0})
+    ot.record_signal({"symbol": "BUSDT", "side": "LONG", "entry_price": 10.0, "ts_utc": t0})
+
+    _samples("AUSDT", [(t0 - 10, 50.0), (t0 + 600, 104.0), (t0 + 3000, 97.0),
+                       (t0 + 5000, 110.0), (t0 + 14000, 101.0)])
+
+    assert ot.compute_outcomes([14400, 3600]) == 4  # BUSDT has no samples
+    rows = [json.loads(l) for l in ot.SIGNAL_OUTCOMES_FILE.read_text().splitlines()]
+    by_key = {(r["signal_id"], r["horizon_sec"]): r for r in rows}
+    long_id = ot.get_tracked_signals()[0].signal_id
+    short_id = ot.get_tracked_signals()[1].signal_id
+
+    assert by_key[(long_id, 3600)]["mfe"] == 4.0
+    assert by_key[(long_id, 3600)]["mae"] == -3.0
+    assert by_key[(long_id, 3600)]["reference_price"] == 97.0
+    assert by_key[(long_id, 14400)]["mfe"] == 10.0
+    assert by_key[(long_id, 14400)]["pnl_pct"] == 1.0
+    assert by_key[(short_id, 14400)]["mfe"] == 3.0
+    assert by_key[(short_id, 14400)]["mae"] == -10.0
+
+    samples = ot.get_price_samples("AUSDT", t0)
+    assert [s.price for s in samples] == [104.0, 97.0, 110.0, 101.0]
+
+
+def test_samples_stay_sorted_and_torn_tail_is_dropped(state):
+    _samples("AUSDT", [(100.0, 1.0), (200.0, 2.0)])
+    path = ot._samples_path("AUSDT")
+    with open(path, "ab") as f:
+        f.write(b"\x00" * 5)  # interrupted append
+
+    assert len(ot._load_samples("AUSDT")) == 2
+    _samples("AUSDT", [(150.0, 3.0)])  # clock stepped back
+    data = ot._load_samples("AUSDT")
+    assert data["ts"].tolist() == [100.0, 200.0, 200.0]
+    assert path.stat().st_size == 3 * ot._SAMPLE_BYTES
+
+
+def test_legacy_jsonl_is_migrated(state):
+    with open(ot.PRICE_SAMPLES_FILE, "w", encoding="utf-8") as f:
+        for ts, sym, price in [(300.0, "AUSDT", 3.0), (100.0, "AUSDT", 1.0), (200.0, "BUSDT", 2.0)]:
+            f.write(json.dumps({"ts_utc": ts, "symbol": sym, "price": price}) + "\n")
+        f.write("garbage\n")
+
+    assert ot.migrate_legacy_price_samples() == 3
+    assert not ot.PRICE_SAMPLES_FILE.exists()
+    assert [s.price for s in ot.get_price_samples("AUSDT", 0)] == [1.0, 3.0]
+    assert [s.ts_utc for s in ot.get_price_samples("BUSDT", 150.0)] == [200.0]
+
+
+def test_legacy_migration_merges_with_existing_samples(state):
+    _samples("AUSDT", [(250.0, 2.5)])  # written before the migration ran
+    with open(ot.PRICE_SAMPLES_FILE, "w", encoding="utf-8") as f:
+        for ts, price in [(300.0, 3.0), (100.0, 1.0)]:
+            f.write(json.dumps({"ts_utc": ts, "symbol": "AUSDT", "price": price}) + "\n")
+
+    assert ot.migrate_legacy_price_samples() == 2
+    data = ot._load_samples("AUSDT")
+    assert data["ts"].tolist() == [100.0, 250.0, 300.0]
+    assert data["price"].tolist() == [1.0, 2.5, 3.0]
+
+
+def test_record_price_sample_migrates_first(state, monkeypatch):
+    with open(ot.PRICE_SAMPLES_FILE, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"ts_utc": 100.0, "symbol": "AUSDT", "price": 1.0}) + "\n")
+    monkeypatch.setattr(ot.time, "time", lambda: 500.0)
+
+    ot.record_price_sample("AUSDT", 5.0)
+    assert not ot.PRICE_SAMPLES_FILE.exists()
+    assert ot._load_samples("AUSDT")["ts"].tolist() == [100.0, 500.0]
@@ -0,0 +1,99 @@
+# === AI SIGNATURE ===
+# Created by: Claude (opus-4)
+# Created at (UTC): 2026-02-06T01:00:00Z
+# Purpose: Tests for dashboard materialized views (incremental tail, rolling aggregates, reset)
+# === END SIGNATURE ===
+"""Tests for dashboard.outcomes_view."""
+
+import json
+from pathlib import Path
+
+from dashboard.outcomes_view import ConfidenceView, JsonlTail, OutcomesView, RecentRecords
+
+
+def _append(path: Path, *records: dict, raw: str = "") -> None:
+    with open(path, "a", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+        f.write(raw)
+
+
+def _full_recompute(trades):
+    """Reference: what the dashboard computed by re-reading the whole file."""
+    pnl, cumulative = [], 0.0
+    for t in trades[-50:]:
+        cumulative += t["pnl_pct"]
+        pnl.append({"timestamp": t["timestamp"], "pnl": round(cumulative, 2)})
+    winrate = []
+    for i in range(10, len(trades) + 1):
+        wins = sum(1 for t in trades[i - 10:i] if t["pnl_pct"] > 0)
+        winrate.append({"trade_num": i, "winrate": round(wins / 10 * 100, 1)})
+    return pnl, winrate[-30:]
+
+
+def test_outcomes_view_matches_full_recompute(tmp_path):
+    history = tmp_path / "history.jsonl"
+    view = OutcomesView(history)
+    assert view.refresh() == 0
+    assert view.pnl_series() == [] and view.winrate_pct() == 0.0
+
+    trades = []
+    for i in range(75):
+        trade = {"timestamp": f"2026-02-0{1 + i % 3}T10:00:{i % 60:02d}", "pnl_pct": ((i * 7) % 11 - 5) / 3}
+        trades.append(trade)
+        _append(history, trade)
+        if i % 20 == 0:
+            view.refresh()
+
+    # Partial trailing line is not consumed until complete
+    _append(history, raw='{"timestamp": "2026-02-03T11:00:00", ')
+    version = view.refresh()
+    assert view.count == 75
+    assert view.refresh() == version  # nothing new -> same version
+
+    pnl, winrate = _full_recompute(trades)
+    assert view.pnl_series() == pnl
+    assert view.winrate_series() == winrate
+    assert view.total_pnl == sum(t["pnl_pct"] for t in trades)
+    assert view.wins == sum(1 for t in trades if t["pnl_pct"] > 0)
+    assert view.trades_on("2026-02-02") == 25
+
+    _append(history, raw='"pnl_pct": 1.0}\nnot json\n')
+    assert view.refresh() > version
+    assert view.count == 76
+
+
+def test_rewritten_file_resets_view(tmp_path):
+    history = tmp_path / "history.jsonl"
+    _append(history, *({"timestamp": "2026-02-01", "pnl_pct": 1.0} for _ in range(12)))
+    view = OutcomesView(history)
+    view.refresh()
+    assert view.winrate_series()[-1] == {"trade_num": 12, "winrate": 100.0}
+
+    history.write_text(json.dumps({"timestamp": "2026-02-05", "pnl_pct": -2.0}) + "\n")
+    view.refresh()
+    assert view.count == 1
+    assert view.winrate_series() == []
+    assert view.pnl_series() == [{"timestamp": "2026-02-05", "pnl": -2.0}]
+
+    history.unlink()
+    view.refresh()
+    assert view.count == 0
+
+    tail = JsonlTail(history)
+    assert tail.poll() == (False, [])
+
+
+def test_confidence_window_and_recent_records(tmp_path):
+    decisions = tmp_path / "decisions.jsonl"
+    view = ConfidenceView(decisions, window=5)
+    _append(decisions, *({"confidence": c} for c in (10, 30, 50, 70, 90, 95, 15)))
+    view.refresh()
+    # Last 5: 50, 70, 90, 95, 15
+    assert view.buckets() == {"0-20": 1, "20-40": 0, "40-60": 1, "60-80": 1, "80-100": 2}
+
+    recent = RecentRecords(decisions, maxlen=3)
+    recent.refresh()
+    assert [r["confidence"] for r in recent.last(2)] == [95, 15]
+    assert len(recent.last(10)) == 3
+    assert recent.last(0) == []
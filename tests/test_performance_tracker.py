@@ -0,0 +1,112 @@
+# === AI SIGNATURE ===
+# Created by: Claude (opus-4)
+# Created at (UTC): 2026-02-05T20:00:00Z
+# Purpose: Tests for PerformanceTracker write-behind persistence (trade log, snapshots, replay)
+# === END SIGNATURE ===
+"""Tests for core.analytics.performance.PerformanceTracker persistence."""
+
+import json
+
+from core.analytics.performance import CompletedTrade, PerformanceTracker
+
+
+def _trade(i: int, pnl: float, strategy: str = "momentum") -> CompletedTrade:
+    return CompletedTrade(
+        trade_id=f"t{i}",
+        symbol="BTCUSDT",
+        strategy=strategy,
+        side="LONG",
+        entry_price=100.0,
+        exit_price=100.0 + pnl,
+        size=1.0,
+        pnl=pnl,
+        pnl_pct=pnl,
+        entry_time=1_000_000 + i * 60,
+        exit_time=1_000_000 + i * 60 + 30,
+        exit_reason="TP",
+    )
+
+
+def test_updates_are_deferred_until_flush(tmp_path):
+    tracker = PerformanceTracker(10000.0, state_dir=tmp_path, flush_interval_sec=3600)
+    for i in range(5):
+        tracker.record_trade(_trade(i, 10.0))
+        tracker.update_equity(10050.0 + i, timestamp=1_000_000 + i * 1000)
+
+    assert not tracker.state_path.exists()
+    assert tracker.get_persistence_stats()["pending_trades"] == 5
+
+    tracker.close()
+    stats = tracker.get_persistence_stats()
+    assert stats["flushes"] == 1
+    assert stats["trades_logged"] == 5
+    assert not stats["dirty"]
+
+    lines = tracker.trade_log_path.read_text().splitlines()
+    assert [json.loads(l)["trade_id"] for l in lines] == [f"t{i}" for i in range(5)]
+    state = json.loads(tracker.state_path.read_text())
+    assert state["schema"] == "performance_v2"
+    assert state["trade_log_offset"] == tracker.trade_log_path.stat().st_size
+    assert len(state["recent_trades"]) == 5
+
+
+def test_risk_event_flushes_immediately(tmp_path):
+    tracker = PerformanceTracker(10000.0, state_dir=tmp_path, flush_interval_sec=3600)
+    tracker.update_equity(9990.0, timestamp=1_000_000)
+    assert not tracker.state_path.exists()
+
+    tracker.update_equity(9400.0, timestamp=1_000_100)  # 6% drawdown
+    state = json.loads(tracker.state_path.read_text())
+    assert state["equity"] == 9400.0
+    tracker.close()
+
+
+def test_trades_logged_after_snapshot_are_replayed(tmp_path):
+    tracker = PerformanceTracker(10000.0, state_dir=tmp_path, flush_interval_sec=0)
+    tracker.record_trade(_trade(0, 25.0))
+
+    # Simulate a crash between trade-log append and snapshot write
+    with open(tracker.trade_log_path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(_trade(1, -5.0, "mean_rev").to_dict()) + "\n")
+        f.write('{"trade_id": "torn"')
+
+    restored = PerformanceTracker(10000.0, state_dir=tmp_path, flush_interval_sec=0)
+    assert restored._equity == 10020.0
+    assert [t.trade_id for t in restored._trades] == ["t0", "t1"]
+    assert restored._strategy_stats["mean_rev"].total_trades == 1
+
+    # Replay is persisted, so a third load does not apply it twice
+    again = PerformanceTracker(10000.0, state_dir=tmp_path, flush_interval_sec=0)
+    assert again._equity == 10020.0
+    assert len(again._trades) == 2
+
+    # Torn tail was truncated, so new appends stay line-aligned
+    again.record_trade(_trade(2, 1.0))
+    assert again.trade_log_path.stat().st_size == again.get_persistence_stats()["trade_log_offset"]
+    assert json.loads(again.trade_log_path.read_text().splitlines()[-1])["trade_id"] == "t2"
+
+
+def test_failed_snapshot_does_not_relog_trades(tmp_path, monkeypatch):
+    tracker = PerformanceTracker(10000.0, state_dir=tmp_path, flush_interval_sec=3600)
+    tracker.record_trade(_trade(0, 10.0))
+
+    real_write = tracker._write_state
+
+    def failing_write(state):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(tracker, "_write_state", failing_write)
+    tracker.flush()
+    stats = tracker.get_persistence_stats()
+    assert stats["dirty"]
+    assert stats["pending_trades"] == 0
+    assert stats["state_log_offset"] == 0 < stats["trade_log_offset"]
+
+    monkeypatch.setattr(tracker, "_write_state", real_write)
+    tracker.close()
+    lines = tracker.trade_log_path.read_text().splitlines()
+    assert [json.loads(l)["trade_id"] for l in lines] == ["t0"]
+
+    restored = PerformanceTracker(10000.0, state_dir=tmp_path, flush_interval_sec=0)
+    assert [t.trade_id for t in restored._trades] == ["t0"]
+    assert restored._equity == 10010.0
@@ -51,6 +51,18 @@ class TestRegimeDetection:
         result = detect_regime(closes, atr, ema)
         assert result.regime == Regime.UNKNOWN
 
+    def test_regime_series_matches_per_bar(self):
+        from core.backtest.data_loader import generate_synthetic_klines
+        from core.strategy.masks import BarSeries
+
+        klines = generate_synthetic_klines(candle_count=300, volatility=0.015, seed=11)
+        orchestrator = StrategyOrchestrator([MomentumStrategy()])
+        regimes = orchestrator.regime_series(BarSeries.from_klines(klines))
+        for end in range(40, klines.candle_count + 1):
+            md = MarketData(symbol="BTCUSDT", timestamp=1700000000, opens=klines.opens[:end], highs=klines.highs[:end],
+                            lows=klines.lows[:end], closes=klines.closes[:end], volumes=klines.volumes[:end])
+            assert regimes[end - 1] == orchestrator.detect_market_regime(md).regime.value
+
 class TestSpotOnlyPolicy:
     def test_base_strategy_blocks_short(self):
         """Verify BaseStrategy blocks SHORT in Spot mode."""
@@ -154,6 +166,37 @@ class TestStrategies:
         assert strategy is not None
         assert strategy.bo_config.lookback_period == 10  # Changed from 20 for backtest flexibility
 
+class TestCandidateMasks:
+    def test_entry_masks_cover_signals(self):
+        from core.backtest.data_loader import generate_synthetic_klines
+        from core.strategy.masks import BarSeries
+        from core.strategy.momentum import MomentumConfig
+
+        klines = generate_synthetic_klines(candle_count=400, volatility=0.015, seed=5)
+        bars = BarSeries.from_klines(klines)
+        strategies = [MomentumStrategy(MomentumConfig(min_confidence=0.02)), MeanReversionStrategy(), BreakoutStrategy()]
+        for strategy in strategies:
+            entry = strategy.candidate_masks(bars).entry
+            fired = 0
+            for end in range(70, klines.candle_count + 1):
+                md = MarketData(symbol="BTCUSDT", timestamp=1700000000 + end, opens=klines.opens[:end], highs=klines.highs[:end],
+                                lows=klines.lows[:end], closes=klines.closes[:end], volumes=klines.volumes[:end])
+                signal = strategy.generate_signal(md)
+                if signal is not None and signal.direction == SignalDirection.LONG:
+                    fired += 1
+                    assert entry[end - 1], f"{strategy.name} fired outside its mask at bar {end - 1}"
+            assert entry.sum() >= fired
+
+    def test_default_mask_is_none(self):
+        class PlainStrategy(BaseStrategy):
+            def generate_signal(self, market_data):
+                return None
+
+            def should_exit(self, position, market_data):
+                return None
+
+        assert PlainStrategy().candidate_masks(None) is None
+
 class TestOrchestrator:
     def test_orchestrator_creates(self):
         strategies = [MomentumStrategy(), MeanReversionStrategy(), BreakoutStrategy()]
@@ -377,6 +377,51 @@ class TestBacktestEngine:
         assert "BACKTEST RESULTS" in report
         assert "Initial Capital" in report
 
+    def test_incremental_indicators_match_full_recompute(self):
+        """Verify streaming indicator state gives identical results."""
+        from core.backtest.engine import BacktestEngine, BacktestConfig
+        from core.backtest.data_loader import generate_synthetic_klines
+        from core.strategy import (
+            StrategyOrchestrator, MomentumStrategy, BreakoutStrategy, MeanReversionStrategy,
+        )
+
+        klines = generate_synthetic_klines(candle_count=250, volatility=0.02, seed=42)
+        results = []
+        for incremental in (True, False):
+            orchestrator = StrategyOrchestrator(
+                [MomentumStrategy(), BreakoutStrategy(), MeanReversionStrategy()]
+            )
+            config = BacktestConfig(incremental_indicators=incremental)
+            results.append(BacktestEngine(orchestrator, config).run(klines))
+
+        fast, slow = results
+        assert fast.trades == slow.trades
+        assert fast.equity_curve == slow.equity_curve
+        assert [d.reason for d in fast.decisions] == [d.reason for d in slow.decisions]
+
+    def test_vectorized_mode_matches_event_driven(self):
+        """Verify candidate-mask mode skips bars without changing trades."""
+        from core.backtest import check_vectorized_consistency
+        from core.backtest.data_loader import generate_synthetic_klines
+        from core.strategy import (
+            StrategyOrchestrator, MomentumStrategy, MomentumConfig, BreakoutStrategy, MeanReversionStrategy,
+        )
+
+        klines = generate_synthetic_klines(candle_count=600, volatility=0.015, seed=7)
+
+        def make_orchestrator():
+            return StrategyOrchestrator([
+                MomentumStrategy(MomentumConfig(min_confidence=0.02)),
+                BreakoutStrategy(),
+                MeanReversionStrategy(),
+            ])
+
+        report = check_vectorized_consistency(klines, make_orchestrator)
+
+        assert report.is_consistent, report.mismatches
+        assert report.event_trades > 0
+        assert report.evaluated_bars < report.total_bars
+
 
 class TestConvenienceFunctions:
     """Tests for convenience functions."""
@@ -393,5 +438,296 @@ class TestConvenienceFunctions:
         assert result.validation.is_valid
 
 
+class TestSweep:
+    """Tests for parallel parameter sweep."""
+
+    def test_build_grid_cartesian(self):
+        """Verify grid expands to full cartesian product."""
+        from core.backtest.sweep import build_grid
+
+        tasks = build_grid(
+            symbols=["BTCUSDT", "ETHUSDT"],
+            timeframes=["15m"],
+            strategies=["momentum", "breakout"],
+            strategy_grid={"momentum": {"rsi_oversold": [25, 30, 35]}},
+            config_grid={"position_size_pct": [0.01, 0.02]},
+        )
+
+        # 2 symbols x (momentum: 3 x 2 + breakout: 1 x 2)
+        assert len(tasks) == 2 * (6 + 2)
+        assert [t.task_id for t in tasks] == list(range(len(tasks)))
+
+    def test_build_grid_rejects_unknown(self):
+        """Verify unknown strategies/strategy params/config fields fail fast."""
+        from core.backtest.sweep import build_grid
+
+        with pytest.raises(ValueError):
+            build_grid(["BTCUSDT"], ["15m"], ["nope"])
+        with pytest.raises(ValueError):
+            build_grid(["BTCUSDT"], ["15m"], ["momentum"], config_grid={"bogus": [1]})
+        with pytest.raises(ValueError, match="rsi_oversld"):
+            build_grid(["BTCUSDT"], ["15m"], ["momentum"],
+                       strategy_grid={"momentum": {"rsi_oversld": [25, 30]}})
+        with pytest.raises(ValueError):
+            build_grid(["BTCUSDT"], ["15m"], ["momentum"], strategy_grid={"momentm": {}})
+
+    def test_parallel_matches_inline(self, tmp_path):
+        """Verify process-pool results (memmap klines) equal inline results."""
+        from core.backtest.data_loader import generate_synthetic_klines
+        from core.backtest.sweep import build_grid, run_sweep
+
+        klines_map = {
+            (sym, "15m"): generate_synthetic_klines(symbol=sym, candle_count=200, seed=seed)
+            for seed, sym in enumerate(["BTCUSDT", "ETHUSDT"])
+        }
+        tasks = build_grid(
+            symbols=["BTCUSDT", "ETHUSDT"],
+            timeframes=["15m"],
+            strategies=["momentum", "mean_reversion"],
+            config_grid={"position_size_pct": [0.01, 0.02]},
+        )
+
+        jsonl = tmp_path / "sweep.jsonl"
+        parallel = run_sweep(klines_map, tasks, max_workers=2, jsonl_path=jsonl)
+        inline = run_sweep(klines_map, tasks, max_workers=1)
+
+        assert len(parallel) == len(tasks)
+        assert all(r.ok for r in parallel)
+        by_id = {r.task_id: r for r in inline}
+        for r in parallel:
+            assert r.total_trades == by_id[r.task_id].total_trades
+            assert r.final_equity == by_id[r.task_id].final_equity
+        assert len(jsonl.read_text().splitlines()) == len(tasks)
+
+        # Ranked best-first by Sharpe
+        sharpes = [r.sharpe_ratio for r in parallel]
+        assert sharpes == sorted(sharpes, reverse=True)
+
+    def test_worker_crash_is_recorded(self, tmp_path, monkeypatch):
+        """Verify a dead worker becomes a failed result instead of aborting the sweep."""
+        from concurrent.futures import Future
+        from concurrent.futures.process import BrokenProcessPool
+
+        from core.backtest import sweep
+        from core.backtest.data_loader import generate_synthetic_klines
+
+        class CrashingPool:
+            def __init__(self, max_workers):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def submit(self, fn, task, path, base_config):
+                future = Future()
+                if task.task_id == 0:
+                    future.set_exception(BrokenProcessPool("worker died"))
+                else:
+                    future.set_result(fn(task, path, base_config))
+                return future
+
+        monkeypatch.setattr(sweep, "ProcessPoolExecutor", CrashingPool)
+        klines_map = {("BTCUSDT", "15m"): generate_synthetic_klines(symbol="BTCUSDT", candle_count=200, seed=1)}
+        tasks = sweep.build_grid(["BTCUSDT"], ["15m"], ["momentum"],
+                                 config_grid={"position_size_pct": [0.01, 0.02]})
+
+        results = sweep.run_sweep(klines_map, tasks, max_workers=2, share_dir=tmp_path)
+        assert len(results) == 2
+        failed = [r for r in results if not r.ok]
+        assert [r.task_id for r in failed] == [0]
+        assert failed[0].error.startswith("BrokenProcessPool")
+        assert results[-1] is failed[0]  # failed tasks rank last
+
+    def test_parse_grid_args(self):
+        """Verify CLI grid spec parsing."""
+        from core.backtest.cli import parse_grid_args
+
+        strategy_grid, config_grid = parse_grid_args([
+            "momentum.rsi_oversold=25,30",
+            "position_size_pct=0.01,0.02",
+            "use_stop_loss=true,false",
+        ])
+
+        assert strategy_grid == {"momentum": {"rsi_oversold": [25, 30]}}
+        assert config_grid["position_size_pct"] == [0.01, 0.02]
+        assert config_grid["use_stop_loss"] == [True, False]
+
+
+class TestKlinesStore:
+    """Tests for columnar klines store."""
+
+    def test_append_is_idempotent_and_loads_memmap(self, tmp_path):
+        """Verify overlapping appends write only new candles and loads are read-only views."""
+        from core.backtest import KlinesStore, generate_synthetic_klines
+
+        store = KlinesStore(tmp_path)
+        klines = generate_synthetic_klines(symbol="BTCUSDT", timeframe="1m", candle_count=500, seed=3)
+
+        assert store.append(klines) == 500
+        assert store.append(klines) == 0
+
+        loaded = store.load("BTCUSDT", "1m")
+        assert loaded.candle_count == 500
+        assert np.array_equal(loaded.closes, klines.closes)
+        assert np.array_equal(loaded.candle_times, klines.candle_times)
+        assert loaded.from_cache
+        with pytest.raises(ValueError):
+            loaded.closes[0] = 1.0
+
+        part = store.load("BTCUSDT", "1m", klines.candle_times[100], klines.candle_times[199])
+        assert part.candle_count == 100
+        assert part.candle_times[0] == klines.candle_times[100]
+        assert store.list_datasets() == [("BTCUSDT", "1m")]
+
+    def test_ranges_track_gaps(self, tmp_path):
+        """Verify covered ranges split on missing candles."""
+        from core.backtest import KlinesStore, generate_synthetic_klines
+        from core.market.klines_provider import KlinesResult
+
+        store = KlinesStore(tmp_path)
+        klines = generate_synthetic_klines(timeframe="1m", candle_count=300, seed=4)
+        head = slice(0, 100)
+        tail = slice(200, 300)
+        for part in (head, tail):
+            store.append(KlinesResult(
+                symbol=klines.symbol, timeframe="1m", timestamp=0.0,
+                opens=klines.opens[part], highs=klines.highs[part], lows=klines.lows[part],
+                closes=klines.closes[part], volumes=klines.volumes[part],
+                candle_times=klines.candle_times[part],
+            ))
+
+        times = klines.candle_times
+        assert len(store.get_index(klines.symbol, "1m").ranges) == 2
+        assert store.covers(klines.symbol, "1m", times[10], times[90])
+        assert not store.covers(klines.symbol, "1m", times[50], times[250])
+        assert store.load(klines.symbol, "1m").candle_count == 200
+
+    def test_truncates_interrupted_append(self, tmp_path):
+        """Verify bytes past the committed count are dropped on next append."""
+        from core.backtest import KlinesStore, generate_synthetic_klines
+        from core.market.klines_provider import KlinesResult
+
+        store = KlinesStore(tmp_path)
+        klines = generate_synthetic_klines(timeframe="1m", candle_count=200, seed=5)
+        first = KlinesResult(
+            symbol=klines.symbol, timeframe="1m", timestamp=0.0,
+            opens=klines.opens[:100], highs=klines.highs[:100], lows=klines.lows[:100],
+            closes=klines.closes[:100], volumes=klines.volumes[:100],
+            candle_times=klines.candle_times[:100],
+        )
+        store.append(first)
+
+        # Simulate a crash after writing column bytes but before the index commit
+        with open(tmp_path / klines.symbol / "1m" / "closes.f64", "ab") as f:
+            f.write(b"\x00" * 24)
+
+        assert store.append(klines) == 100
+        loaded = store.load(klines.symbol, "1m")
+        assert np.array_equal(loaded.closes, klines.closes)
+
+    def test_backfill_merges_by_open_time(self, tmp_path):
+        """Verify candles older than the stored tail fill gaps instead of being dropped."""
+        from core.backtest import KlinesStore, generate_synthetic_klines
+        from core.market.klines_provider import KlinesResult
+
+        store = KlinesStore(tmp_path)
+        klines = generate_synthetic_klines(timeframe="1m", candle_count=300, seed=6)
+
+        def part(sl):
+            return KlinesResult(
+                symbol=klines.symbol, timeframe="1m", timestamp=0.0,
+                opens=klines.opens[sl], highs=klines.highs[sl], lows=klines.lows[sl],
+                closes=klines.closes[sl], volumes=klines.volumes[sl],
+                candle_times=klines.candle_times[sl],
+            )
+
+        store.append(part(slice(200, 300)))
+        store.append(part(slice(0, 50)))
+        times = klines.candle_times
+        assert store.get_index(klines.symbol, "1m").ranges == [[times[0], times[49]], [times[200], times[299]]]
+
+        # Overlapping backfill: only the 150 missing candles are written
+        assert store.append(part(slice(30, 220))) == 150
+        assert store.append(part(slice(0, 300))) == 0
+        index = store.get_index(klines.symbol, "1m")
+        assert index.ranges == [[times[0], times[299]]]
+        assert index.count == 300
+
+        loaded = store.load(klines.symbol, "1m")
+        assert np.array_equal(loaded.candle_times, times)
+        assert np.array_equal(loaded.closes, klines.closes)
+
+        # Tail appends keep working on the merged generation
+        prices = np.full(10, 100.0)
+        more = KlinesResult(
+            symbol=klines.symbol, timeframe="1m", timestamp=0.0,
+            opens=prices, highs=prices, lows=prices, closes=prices, volumes=prices,
+            candle_times=times[-1] + 60 * np.arange(1, 11, dtype=float),
+        )
+        assert store.append(more) == 10
+        assert store.load(klines.symbol, "1m").candle_count == 310
+
+    def test_fetch_range_ending_now_is_covered(self, tmp_path):
+        """Verify a range ending today is served from the store once all closed candles are stored."""
+        import asyncio
+        import time as time_module
+        from datetime import datetime, date
+        from core.backtest import KlinesStore
+        from core.backtest.data_loader import fetch_historical_klines
+        from core.market.klines_provider import KlinesResult
+
+        today = date.today()
+        start = datetime.combine(today, datetime.min.time()).timestamp()
+        last_closed = (time_module.time() // 900 - 1) * 900
+        times = np.arange(start, last_closed + 1, 900, dtype=float)
+        if len(times) == 0:
+            pytest.skip("No closed 15m candle yet today")
+        prices = np.linspace(100, 110, len(times))
+        store = KlinesStore(tmp_path)
+        store.append(KlinesResult(
+            symbol="BTCUSDT", timeframe="15m", timestamp=0.0,
+            opens=prices, highs=prices + 1, lows=prices - 1, closes=prices,
+            volumes=np.ones(len(times)), candle_times=times,
+        ))
+        provider = Mock()
+
+        result = asyncio.run(fetch_historical_klines("BTCUSDT", "15m", today, today, provider=provider, store=store))
+        assert provider.get_klines.call_count == 0
+        assert result.candle_count == len(times)
+
+    def test_fetch_uses_store(self, tmp_path):
+        """Verify fetch_historical_klines serves covered ranges without the provider."""
+        import asyncio
+        from datetime import datetime
+        from core.backtest import KlinesStore
+        from core.backtest.data_loader import fetch_historical_klines
+        from core.market.klines_provider import KlinesResult
+
+        day = datetime(2026, 1, 5)
+        count = 96
+        times = np.array([day.timestamp() + i * 900 for i in range(count)], dtype=float)
+        prices = np.linspace(100, 110, count)
+        fetched = KlinesResult(
+            symbol="BTCUSDT", timeframe="15m", timestamp=0.0,
+            opens=prices, highs=prices + 1, lows=prices - 1, closes=prices,
+            volumes=np.ones(count), candle_times=times,
+        )
+        provider = Mock()
+        provider.get_klines.return_value = fetched
+        store = KlinesStore(tmp_path)
+
+        first = asyncio.run(fetch_historical_klines("BTCUSDT", "15m", day.date(), day.date(), provider=provider, store=store))
+        assert first.candle_count == count
+        assert provider.get_klines.call_count == 1
+
+        second = asyncio.run(fetch_historical_klines("BTCUSDT", "15m", day.date(), day.date(), provider=provider, store=store))
+        assert provider.get_klines.call_count == 1
+        assert second.from_cache
+        assert np.array_equal(second.closes, prices)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -558,5 +558,88 @@ class TestReproducibility:
             assert report1.best_result.config == report2.best_result.config
 
 
+class TestParallelTuning:
+    """Tests for parallel / successive-halving / resumable tuning."""
+
+    @staticmethod
+    def _space():
+        from core.analytics.auto_tuner import SearchSpace, ParameterRange
+
+        space = SearchSpace(strategy_name="momentum")
+        space.add_param(ParameterRange(name="rsi_oversold", param_type="float", low=20.0, high=40.0, step=5.0))
+        space.add_param(ParameterRange(name="rsi_overbought", param_type="float", low=60.0, high=80.0, step=10.0))
+        return space
+
+    @staticmethod
+    def _factory():
+        from core.analytics.auto_tuner import ConfigStrategyFactory
+        from core.strategy.momentum import MomentumStrategy, MomentumConfig
+
+        return ConfigStrategyFactory(MomentumStrategy, MomentumConfig)
+
+    def test_shared_indicator_stream_matches_fresh_run(self):
+        """Verify a rewound shared IndicatorStream gives identical backtests."""
+        from core.ai.indicator_stream import IndicatorStream
+        from core.backtest import BacktestEngine, generate_synthetic_klines
+        from core.strategy.orchestrator import StrategyOrchestrator
+        from core.strategy.momentum import MomentumStrategy
+
+        klines = generate_synthetic_klines(candle_count=300, trend=0.001, seed=7)
+        stream = IndicatorStream(klines.opens, klines.highs, klines.lows, klines.closes, klines.volumes)
+
+        fresh = BacktestEngine(StrategyOrchestrator([MomentumStrategy()])).run(klines)
+        for _ in range(2):
+            shared = BacktestEngine(StrategyOrchestrator([MomentumStrategy()])).run(klines, indicators=stream)
+            assert shared.equity_curve == fresh.equity_curve
+            assert shared.total_trades == fresh.total_trades
+
+    def test_successive_halving_prunes(self):
+        """Verify rungs promote only the top fraction to full data."""
+        from core.analytics.auto_tuner import AutoTuner, AutoTuneConfig
+        from core.backtest import generate_synthetic_klines
+
+        klines = generate_synthetic_klines(candle_count=600, trend=0.001, seed=42)
+        config = AutoTuneConfig(
+            search_method="grid",
+            successive_halving=True,
+            min_data_fraction=0.3,
+            reduction_factor=3,
+        )
+        tuner = AutoTuner(self._space(), self._factory(), config)
+        assert tuner._rung_sizes(600) == [180, 540, 600]
+
+        report = tuner.tune(klines)
+
+        assert report.n_trials == 15
+        assert report.trials_pruned > 0
+        assert len(report.all_results) <= 2
+
+    def test_ledger_resumes_and_parallel_matches_inline(self, tmp_path):
+        """Verify ledger skips finished trials and workers give inline results."""
+        from core.analytics.auto_tuner import AutoTuner, AutoTuneConfig
+        from core.backtest import generate_synthetic_klines
+
+        klines = generate_synthetic_klines(candle_count=300, trend=0.001, seed=42)
+        ledger = tmp_path / "ledger.jsonl"
+
+        inline = AutoTuner(self._space(), self._factory(), AutoTuneConfig(
+            search_method="grid", ledger_path=ledger,
+        )).tune(klines)
+        assert len(ledger.read_text().splitlines()) == 15
+
+        resumed = AutoTuner(self._space(), self._factory(), AutoTuneConfig(
+            search_method="grid", ledger_path=ledger,
+        )).tune(klines)
+        assert resumed.trials_resumed == 15
+        assert len(ledger.read_text().splitlines()) == 15
+
+        parallel = AutoTuner(self._space(), self._factory(), AutoTuneConfig(
+            search_method="grid", max_workers=2,
+        )).tune(klines)
+
+        for report in (resumed, parallel):
+            assert [r.to_dict() for r in report.all_results] == [r.to_dict() for r in inline.all_results]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
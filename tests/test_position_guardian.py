@@ -0,0 +1,136 @@
+# === AI SIGNATURE ===
+# Created by: Claude (opus-4)
+# Created at (UTC): 2026-02-05T21:00:00Z
+# Purpose: Tests for PositionGuardian batched price polling and single-pass exit evaluation
+# === END SIGNATURE ===
+"""Tests for hope_core/guardian/position_guardian.py."""
+
+import asyncio
+import importlib.util
+import sys
+import time
+from pathlib import Path
+
+# Loaded from file like hope_core.HopeCore does (package __init__ pulls runtime state)
+_PATH = Path(__file__).resolve().parent.parent / "hope_core" / "guardian" / "position_guardian.py"
+_spec = importlib.util.spec_from_file_location("position_guardian", _PATH)
+pg = importlib.util.module_from_spec(_spec)
+sys.modules["position_guardian"] = pg
+_spec.loader.exec_module(pg)
+
+
+class _BatchClient:
+    def __init__(self, prices, batch_fails=False):
+        self.prices = prices
+        self.batch_fails = batch_fails
+        self.calls = []
+        self.single_calls = []
+
+    def get_prices(self, symbols):
+        # Like Binance: one unknown symbol rejects the whole batch
+        self.calls.append(sorted(symbols))
+        if self.batch_fails or any(s not in self.prices for s in symbols):
+            raise RuntimeError("batch price request failed")
+        return {s: self.prices[s] for s in symbols}
+
+    def get_price(self, symbol):
+        self.single_calls.append(symbol)
+        return self.prices.get(symbol, 0.0)
+
+    def create_order(self, symbol, side, type, quantity):
+        return {"orderId": len(self.calls), "status": "FILLED"}
+
+
+class _Feed:
+    def __init__(self, prices):
+        self.prices = prices
+
+    def get_all_prices(self):
+        return dict(self.prices)
+
+
+def _guardian(tmp_path, client, feed=None, **overrides):
+    config = pg.GuardianConfig(state_dir=tmp_path, enable_ai=False, enable_partial_profits=False, **overrides)
+    return pg.PositionGuardian(config, binance_client=client, price_feed=feed)
+
+
+def test_prices_come_from_feed_then_one_batched_call(tmp_path):
+    client = _BatchClient({"AUSDT": 1.0, "BUSDT": 2.0, "BTCUSDT": 50000.0})
+    guardian = _guardian(tmp_path, client, feed=_Feed({"AUSDT": 1.01, "BTCUSDT": 50100.0}))
+    guardian.track_position("AUSDT", 10, 1.0)
+    guardian.track_position("BUSDT", 5, 2.0)
+
+    asyncio.run(guardian.update_prices())
+
+    assert client.calls == [["BUSDT"]]
+    assert guardian.positions["AUSDT"].current_price == 1.01
+    assert guardian.positions["BUSDT"].current_price == 2.0
+    assert list(guardian.btc_prices)[-1][1] == 50100.0
+
+
+def test_failed_batch_falls_back_to_single_prices(tmp_path):
+    client = _BatchClient({"AUSDT": 1.0, "BUSDT": 2.0}, batch_fails=True)
+    guardian = _guardian(tmp_path, client)
+    guardian.track_position("AUSDT", 10, 1.0)
+    guardian.track_position("BUSDT", 5, 2.0)
+
+    prices = asyncio.run(guardian._get_prices_rest(["AUSDT", "BUSDT"]))
+    assert prices == {"AUSDT": 1.0, "BUSDT": 2.0}
+    assert client.single_calls == ["AUSDT", "BUSDT"]
+
+    # Unknown symbol fails the batch; the others still resolve one by one
+    client.batch_fails = False
+    client.single_calls.clear()
+    prices = asyncio.run(guardian._get_prices_rest(["AUSDT", "GONEUSDT"]))
+    assert prices == {"AUSDT": 1.0}
+    assert client.single_calls == ["AUSDT", "GONEUSDT"]
+
+
+def test_btc_ring_buffer_and_change(tmp_path):
+    guardian = _guardian(tmp_path, _BatchClient({}), btc_history_minutes=30, btc_lookback_minutes=15)
+    now = time.time()
+    for i in range(60):  # one sample per minute for an hour
+        guardian._record_btc_price(now - (59 - i) * 60, 100.0 + i)
+
+    assert len(guardian.btc_prices) == 30  # horizon enforced
+    assert guardian.btc_prices[0][1] == 130.0
+    assert round(guardian._get_btc_change(now), 4) == round((159 - 130) / 130 * 100, 4)
+
+
+def test_evaluate_positions_single_pass(tmp_path):
+    client = _BatchClient({})
+    guardian = _guardian(tmp_path, client, enable_trailing=True, max_hold_minutes=240)
+    now = time.time()
+    sl = guardian.track_position("SLUSDT", 1, 100.0)
+    tp = guardian.track_position("TPUSDT", 1, 100.0)
+    trail = guardian.track_position("TRUSDT", 1, 100.0)
+    old = guardian.track_position("OLDUSDT", 1, 100.0, entry_time=now - 300 * 60)
+    hold = guardian.track_position("HOLDUSDT", 1, 100.0)
+
+    sl.update_price(97.0)
+    tp.update_price(102.0)
+    trail.update_price(101.2)
+    trail.update_price(100.5)
+    old.update_price(100.1)
+    hold.update_price(100.2)
+
+    positions = [sl, tp, trail, old, hold]
+    decisions = asyncio.run(guardian.evaluate_positions(positions))
+    reasons = [reason if close else None for close, reason, _ in decisions]
+    assert reasons == [
+        pg.ExitReason.STOP_LOSS,
+        pg.ExitReason.TAKE_PROFIT,
+        pg.ExitReason.TRAILING_STOP,
+        pg.ExitReason.TIME_DECAY,
+        None,
+    ]
+    # Single-position API is the same pass
+    assert asyncio.run(guardian.evaluate_position(tp)) == decisions[1]
+
+    results = asyncio.run(guardian.run_once())
+    assert results["checked"] == 5
+    assert results["closed"] == 4
+    assert list(guardian.positions) == ["HOLDUSDT"]
+    latency = guardian.get_status()["cycle_latency"]
+    assert latency["cycles"] == 1
+    assert latency["p50_ms"] == latency["max_ms"] >= 0
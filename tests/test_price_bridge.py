@@ -157,6 +157,53 @@ class TestOutcomeTrackerIntegration:
             # Check MAE
             assert tracked.mae < 0  # Should be negative for adverse move
 
+    def test_horizon_captured_at_crossing_and_resumed(self):
+        """Test horizon price is the first tick past it and state survives reload."""
+        from unittest.mock import patch
+        from ai_gateway.modules.self_improver import outcome_tracker as ot
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            clock = [1_000_000.0]
+            with patch.object(ot.time, "time", lambda: clock[0]):
+                tracker = ot.OutcomeTracker(state_dir=Path(tmpdir))
+                signal_id = tracker.register_signal(
+                    {"symbol": "ETHUSDT", "price": 100.0, "direction": "Short"}
+                )
+
+                for minutes, price in [(0.5, 98.0), (1.5, 103.0), (3.0, 99.0)]:
+                    clock[0] = 1_000_000.0 + minutes * 60
+                    tracker.update_prices({"ETHUSDT": price})
+                tracker._save_pending()
+
+                tracked = tracker._active[signal_id]
+                assert tracked.outcomes[1]["exit_price"] == 103.0
+                assert tracked.mfe == pytest.approx(2.0)
+                assert tracked.mae == pytest.approx(-3.0)
+
+                # Reload: running state comes back without rescanning history
+                reloaded = ot.OutcomeTracker(state_dir=Path(tmpdir))._active[signal_id]
+                assert reloaded.entry_ts == 1_000_000.0
+                assert reloaded.outcomes[1]["exit_price"] == 103.0
+                assert (reloaded.mfe, reloaded.mae) == (tracked.mfe, tracked.mae)
+
+    def test_price_history_is_bounded(self):
+        """Test per-signal price history stays bounded."""
+        from ai_gateway.modules.self_improver import outcome_tracker as ot
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tracker = ot.OutcomeTracker(state_dir=Path(tmpdir))
+            signal_id = tracker.register_signal(
+                {"symbol": "BTCUSDT", "price": 100.0, "direction": "Long"}
+            )
+
+            for i in range(ot.MAX_PRICE_HISTORY * 5):
+                tracker.update_prices({"BTCUSDT": 100.0 + (i % 7)})
+
+            tracked = tracker._active[signal_id]
+            assert len(tracked.prices) < ot.MAX_PRICE_HISTORY * 2
+            assert len(tracked.prices) == len(tracked.timestamps)
+            assert tracked.mfe == pytest.approx(6.0)
+
 
 class TestEventBusIntegration:
     """Test EventBus integration."""
@@ -0,0 +1,115 @@
+# === AI SIGNATURE ===
+# Created by: Claude (opus-4)
+# Created at (UTC): 2026-02-06T00:00:00Z
+# Purpose: Tests for dashboard PriceBroadcaster fan-out, slow-consumer dropping and metrics
+# === END SIGNATURE ===
+"""Tests for dashboard/price_broadcaster.py."""
+
+import asyncio
+import threading
+
+from dashboard.price_broadcaster import PriceBroadcaster
+
+
+class _WS:
+    def __init__(self, block: bool = False):
+        self.messages = []
+        self.closed = False
+        self._gate = asyncio.Event()
+        if not block:
+            self._gate.set()
+
+    async def send_json(self, message):
+        await self._gate.wait()
+        self.messages.append(message)
+
+    async def close(self):
+        self.closed = True
+
+
+def test_single_fetch_fans_out_to_all_clients():
+    calls = []
+
+    def fetch(symbol):
+        calls.append(threading.current_thread() is threading.main_thread())
+        return 1.25
+
+    async def scenario():
+        broadcaster = PriceBroadcaster(lambda: "SENTUSDT", fetch, interval=0.01)
+        clients = [_WS() for _ in range(5)]
+        handles = [broadcaster.register(ws) for ws in clients]
+        await asyncio.sleep(0.055)
+        metrics = broadcaster.get_metrics()
+        for handle in handles:
+            await broadcaster.unregister(handle)
+        await asyncio.sleep(0.03)
+        return broadcaster, clients, metrics
+
+    broadcaster, clients, metrics = asyncio.run(scenario())
+    ticks = metrics["published"]
+    assert ticks >= 3
+    assert ticks <= len(calls) <= ticks + 1  # one fetch per tick (+1 in flight), not per client
+    assert not any(calls)  # blocking fetch ran off the event loop thread
+    assert all(len(ws.messages) >= ticks - 1 for ws in clients)
+    assert clients[0].messages[0] == {**clients[0].messages[0], "type": "price", "symbol": "SENTUSDT", "price": 1.25}
+    assert metrics["clients"] == 5
+    assert metrics["latency_ms"]["samples"] > 0
+    assert broadcaster.get_metrics()["producer_running"] is False  # idle without clients
+
+
+def test_slow_consumer_drops_oldest_then_disconnects():
+    async def scenario():
+        broadcaster = PriceBroadcaster(lambda: None, queue_size=2, max_consecutive_drops=3)
+        fast, slow = _WS(), _WS(block=True)
+        broadcaster.register(fast)
+        broadcaster.register(slow)
+        await asyncio.sleep(0)
+
+        for i in range(3):
+            broadcaster.publish({"n": i})
+            await asyncio.sleep(0)
+        # slow: one message in flight, queue holds the 2 latest
+        metrics = broadcaster.get_metrics()
+
+        for i in range(3, 6):
+            broadcaster.publish({"n": i})
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.01)
+        return broadcaster, fast, slow, metrics
+
+    broadcaster, fast, slow, metrics = asyncio.run(scenario())
+    assert [m["n"] for m in fast.messages] == list(range(6))
+    assert metrics["dropped"] == 0
+    assert slow.closed
+    final = broadcaster.get_metrics()
+    assert final["clients"] == 1
+    assert final["clients_disconnected_slow"] == 1
+    assert final["dropped"] == 3
+
+
+class _Feed:
+    def __init__(self):
+        self.subscribed = set()
+        self.subscribe_calls = 0
+
+    def get_price(self, symbol):
+        return None
+
+    async def subscribe(self, symbols):
+        self.subscribe_calls += 1
+        self.subscribed.update(s.upper() for s in symbols)
+
+    def is_subscribed(self, symbol):
+        return symbol.upper() in self.subscribed
+
+
+def test_feed_miss_subscribes_once_then_uses_rest():
+    feed = _Feed()
+    broadcaster = PriceBroadcaster(lambda: "sentusdt", lambda symbol: 2.5, price_feed=feed)
+
+    async def scenario():
+        return [await broadcaster._get_price("sentusdt") for _ in range(3)]
+
+    assert asyncio.run(scenario()) == [2.5, 2.5, 2.5]
+    assert feed.subscribe_calls == 1
+    assert broadcaster.get_metrics()["rest_fetches"] == 3
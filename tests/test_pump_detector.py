@@ -0,0 +1,101 @@
+# === AI SIGNATURE ===
+# Created by: Claude (opus-4)
+# Created at (UTC): 2026-02-06T04:00:00Z
+# Purpose: Tests for pump detector rolling windows (bucketed sums, price snapshots)
+# === END SIGNATURE ===
+"""Tests for scripts.pump_detector RollingWindow / PriceSnapshots."""
+
+import random
+import sys
+import types
+
+import pytest
+
+# The module pip-installs httpx/websockets at import time when missing
+for _name in ("httpx", "websockets"):
+    try:
+        __import__(_name)
+    except ImportError:
+        sys.modules[_name] = types.ModuleType(_name)
+
+from scripts.pump_detector import PriceSnapshots, RollingWindow  # noqa: E402
+
+
+def test_rolling_window_matches_brute_force():
+    rng = random.Random(11)
+    window = RollingWindow(60)
+    accepted = []  # (second, value) of trades the window kept
+    head = None
+    ts = 1_700_000_000.0
+
+    for i in range(5000):
+        # Mostly forward, occasional gaps past the window and late trades
+        r = rng.random()
+        if r < 0.01:
+            ts += rng.uniform(60, 200)  # gap longer than the window
+            trade_ts = ts
+        elif r < 0.1:
+            trade_ts = ts - rng.uniform(0, 90)  # out-of-order
+        else:
+            ts += rng.uniform(0, 0.5)
+            trade_ts = ts
+        value = rng.uniform(1, 1000)
+        window.add(trade_ts, value)
+
+        second = int(trade_ts)
+        head = second if head is None else max(head, second)
+        if second > head - 60:
+            accepted.append((second, value))
+
+        if i % 50 == 0:
+            live = [v for s, v in accepted if s > head - 60]
+            assert window.head == head
+            assert window.count == len(live)
+            assert window.total == pytest.approx(sum(live), abs=1e-6)
+
+    # Advancing alone expires buckets
+    window.advance(head + 30)
+    live = [v for s, v in accepted if s > head + 30 - 60]
+    assert window.count == len(live)
+    window.advance(head + 1000)
+    assert window.count == 0 and window.total == 0.0
+
+
+def test_price_snapshots_match_brute_force():
+    rng = random.Random(5)
+    snaps = PriceSnapshots(horizon_sec=300, bucket_sec=10)
+    accepted = []  # (bucket, price) in arrival order
+    head = None
+    first = None
+    ts = 1_700_000_000.0
+
+    for i in range(3000):
+        r = rng.random()
+        if r < 0.02:
+            ts += rng.uniform(30, 400)  # gap (sometimes longer than the horizon)
+            trade_ts = ts
+        elif r < 0.1:
+            trade_ts = ts - rng.uniform(0, 40)  # late trade
+        else:
+            ts += rng.uniform(0, 2)
+            trade_ts = ts
+        price = rng.uniform(90, 110)
+        snaps.update(trade_ts, price)
+
+        bucket = int(trade_ts // 10)
+        if head is None:
+            head = first = bucket
+            accepted.append((bucket, price))
+        elif bucket >= head:
+            head = bucket
+            accepted.append((bucket, price))
+
+        if i % 25 == 0:
+            for seconds in (0, 10, 60, 120, 300, 310):
+                n = seconds // 10
+                target = head - n
+                if n > 30 or target < first:
+                    expected = 0
+                else:
+                    expected = [p for b, p in accepted if b <= target][-1]
+                assert snaps.price_ago(seconds) == expected, (i, seconds)
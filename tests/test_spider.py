@@ -458,6 +458,37 @@ class TestDedupStore(unittest.TestCase):
         store.add("item2", "source1")
         self.assertEqual(store.count(), 2)
 
+    def test_sealed_segments_indexed_and_expired_wholesale(self):
+        """Past-day segments are answered from their index; expired days are dropped."""
+        from core.io.atomic import atomic_append_sha256_jsonl
+
+        seg_dir = self.store_path.with_suffix(".d")
+        now = datetime.now(timezone.utc)
+        for days_ago, item_id in ((1, "recent"), (30, "ancient")):
+            day = (now - timedelta(days=days_ago)).strftime("%Y%m%d")
+            atomic_append_sha256_jsonl(seg_dir / f"seg_{day}.jsonl", {"item_id": item_id})
+
+        store = DedupStore(store_path=self.store_path)
+        self.assertTrue(store.contains("recent"))
+        self.assertFalse(store.contains("ancient"))
+        self.assertEqual(store.count(), 1)
+        self.assertEqual(len(list(seg_dir.glob("seg_*.jsonl"))), 1)
+        self.assertEqual(len(list(seg_dir.glob("seg_*.idx"))), 1)
+
+        # Cold start answers sealed days from the persisted index
+        self.assertTrue(DedupStore(store_path=self.store_path).add("new", "s"))
+        self.assertFalse(DedupStore(store_path=self.store_path).add("recent", "s"))
+
+    def test_legacy_file_migrated_to_segments(self):
+        """A legacy single-file store is split into segments once."""
+        legacy = {"item_id": "old1", "source_id": "s", "first_seen_utc": datetime.now(timezone.utc).isoformat()}
+        self.store_path.write_text(json.dumps(legacy) + "\n", encoding="utf-8")
+
+        store = DedupStore(store_path=self.store_path)
+        self.assertTrue(store.contains("old1"))
+        self.assertFalse(self.store_path.exists())
+        self.assertTrue(DedupStore(store_path=self.store_path).contains("old1"))
+
 
 class TestCollectorResult(unittest.TestCase):
     """Tests for collector result."""
@@ -605,6 +636,111 @@ class TestNewsCollector(unittest.TestCase):
         self.assertIsNotNone(result.fatal_error)
         self.assertIn("test1", result.fatal_error)
 
+    @patch('core.spider.collector.http_get')
+    def test_concurrent_collect_merges_in_priority_order(self, mock_http):
+        """Concurrent mode overlaps downloads, merges by priority and honours the deadline."""
+        import time as _time
+        from core.spider.health import HealthTracker
+
+        delays = {"slow": 0.2, "fast": 0.0, "stuck": 1.0}
+
+        def fake_get(url, **kwargs):
+            _time.sleep(delays[url.rsplit("/", 1)[1]])
+            body = (
+                '<?xml version="1.0"?><rss version="2.0"><channel>'
+                '<item><title>Shared</title><link>https://example.com/shared</link></item>'
+                f'<item><title>Own</title><link>{url}/item</link></item>'
+                '</channel></rss>'
+            )
+            return (200, body.encode(), url)
+
+        mock_http.side_effect = fake_get
+        sources = [
+            SourceConfig(
+                id=name, name=name, source_type=SourceType.RSS,
+                url=f"https://example.com/{name}", host="example.com",
+                enabled=True, priority=priority,
+            )
+            for name, priority in (("stuck", 3), ("slow", 1), ("fast", 2))
+        ]
+
+        health = HealthTracker(state_path=Path(self.temp_dir) / "health.json")
+        collector = NewsCollector(
+            mode=CollectorMode.LENIENT,
+            dedup_store=DedupStore(store_path=Path(self.temp_dir) / "dedup.jsonl"),
+            health_tracker=health,
+            max_workers=3,
+            cycle_deadline_sec=0.5,
+        )
+        started = _time.monotonic()
+        result = collector.collect(sources=sources, dry_run=True)
+
+        self.assertLess(_time.monotonic() - started, 0.9)
+        self.assertEqual([r.source_id for r in result.source_results], ["slow", "fast", "stuck"])
+        # Shared item is attributed to the highest-priority source
+        self.assertEqual([r.new_items_count for r in result.source_results[:2]], [2, 1])
+        self.assertIn("deadline", result.source_results[2].error)
+        self.assertEqual(result.sources_failed, 1)
+        self.assertEqual(health.get_health("stuck").consecutive_failures, 1)
+        self.assertEqual(sum(result.latency_histograms["fast"].values()), 1)
+
+    @patch('core.spider.collector.http_get')
+    def test_conditional_get_and_unchanged_body_skip_parsing(self, mock_http):
+        """Cached validators are sent; 304 and identical bodies are not re-parsed."""
+        from core.spider.fetch_cache import SourceFetchCache
+        from core.spider.health import HealthTracker
+
+        rss = (
+            b'<?xml version="1.0"?><rss version="2.0"><channel>'
+            b'<item><title>A</title><link>https://example.com/a</link></item>'
+            b'</channel></rss>'
+        )
+        responses = [
+            (200, rss, {"ETag": '"v1"', "Last-Modified": "Tue, 03 Feb 2026 10:00:00 GMT"}),
+            (304, b"", {}),
+            (200, rss, {}),
+        ]
+        sent_headers = []
+
+        def fake_get(url, extra_headers=None, response_headers=None, **kwargs):
+            sent_headers.append(dict(extra_headers or {}))
+            status, body, headers = responses[len(sent_headers) - 1]
+            response_headers.update(headers)
+            return (status, body, url)
+
+        mock_http.side_effect = fake_get
+        sources = [
+            SourceConfig(
+                id="feed", name="Feed", source_type=SourceType.RSS,
+                url="https://example.com/feed", host="example.com", enabled=True
+            )
+        ]
+        cache_path = Path(self.temp_dir) / "fetch_cache.json"
+
+        def run():
+            collector = NewsCollector(
+                mode=CollectorMode.STRICT,
+                dedup_store=DedupStore(store_path=Path(self.temp_dir) / "dedup.jsonl"),
+                output_path=Path(self.temp_dir) / "items.jsonl",
+                health_tracker=HealthTracker(state_path=Path(self.temp_dir) / "health.json"),
+                fetch_cache=SourceFetchCache(state_path=cache_path),
+            )
+            return collector.collect(sources=sources).source_results[0]
+
+        first = run()
+        self.assertEqual((first.items_count, first.new_items_count, first.cache), (1, 1, None))
+        self.assertTrue(cache_path.exists())
+
+        with patch('core.spider.collector.parse_rss_xml') as mock_parse:
+            second = run()
+            third = run()
+            mock_parse.assert_not_called()
+
+        self.assertEqual(sent_headers[1]["If-None-Match"], '"v1"')
+        self.assertEqual(sent_headers[1]["If-Modified-Since"], "Tue, 03 Feb 2026 10:00:00 GMT")
+        self.assertEqual((second.success, second.items_count, second.cache), (True, 1, "not_modified"))
+        self.assertEqual((third.success, third.new_items_count, third.cache), (True, 0, "unchanged"))
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
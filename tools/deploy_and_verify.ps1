@@ -21,6 +21,8 @@ Write-Host "=======================================" -ForegroundColor Cyan
 # Step 1: SCP files
 Write-Host "`n[1/4] Uploading files to VPS..." -ForegroundColor Yellow
 scp -i $SSH_KEY "$LOCAL_PATH\dashboard_server.py" "${VPS_USER}@${VPS_HOST}:/opt/hope/minibot/dashboard/"
+scp -i $SSH_KEY "$LOCAL_PATH\price_broadcaster.py" "${VPS_USER}@${VPS_HOST}:/opt/hope/minibot/dashboard/"
+scp -i $SSH_KEY "$LOCAL_PATH\outcomes_view.py" "${VPS_USER}@${VPS_HOST}:/opt/hope/minibot/dashboard/"
 scp -i $SSH_KEY "$LOCAL_PATH\dashboard_v3_8k.html" "${VPS_USER}@${VPS_HOST}:/opt/hope/minibot/dashboard/hope_dashboard_8k.html"
 Write-Host "  OK Files uploaded" -ForegroundColor Green
 